@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+수집 데이터 → OBI 온톨로지 ABox (N-Triples / Turtle) 스트리밍 생성기
+
+docs/files/OBI_SPARQL질의.rq가 대상으로 하는 통합 그래프를 연도별 디렉토리에서 만든다.
+    covers/bestseller_data.json            → obi:Work, obi:Manifestation, foaf:Person(저자), foaf:Organization(출판사)
+    covers/*.jpg, back_covers/*_back.jpg   → obi:Image (obi:frontImage, obi:backImage, obi:bestRank, obi:collectionDate)
+    belly_bands/*_belly_band.json          → obi:Obi (obi:rawText, obi:extractedFrom), 없으면 기존 *_belly.json
+    belly_bands/*_back_belly_band.json     → obi:BCover (뒷표지 문단: obi:hasEndorsement / obi:hasTextExcerpt 공노드)
+    띠지·뒷표지 문구 (band_mentions.py)     → 수상·선정·추천·영상화·미디어·언론·판매 언급 공노드
+
+그래프를 메모리에 모으지 않고 주어(subject) 묶음 단위로 바로 직렬화한다.
+묶음(이미지: 연도·ItemId, 판본: ItemId, 작품, 인물·기관·직함 개념)마다 원본 레코드 해시와
+조각 파일을 {출력}.parts/에 두고, 해시가 바뀐 묶음만 다시 만든 뒤 조각을 이어 붙여 출력한다.
+
+IRI 규칙은 질의 파일을 따른다: obi:Person_한강, obi:Org_문학동네, obi:Work_{제목}_{저자},
+obi:Manifestation_{ItemId}, obi:Image_{연도}_{ItemId}, obi:Obi_{연도}_{ItemId}, obi:BCover_{연도}_{ItemId}.
+collectionDate는 연간 베스트 목록 기준일({연도}-12-31)이다.
+
+사용 예:
+    python abox_generator.py --output OBI_통합그래프_전수.ttl
+    python abox_generator.py --output OBI_통합그래프_전수.nt --years 2023 2024
+    python abox_generator.py --snapshot      # 출력이 바뀌었으면 이진 스냅샷(graph_snapshot.py)도 다시 컴파일
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from band_mentions import LEXICON_VERSION, MentionExtractor
+from catalog import CATALOG_FILE, IMAGE_NAME_PATTERN, YEAR_DIR_PATTERN, Catalog, book_isbn13
+
+ABOX_VERSION = "2"
+BASE_DIR = "yearly_bestsellers"
+GRAPH_FILE = "OBI_통합그래프_전수.ttl"
+SCHEMA_FILE = "docs/files/OBI_온톨로지_스키마.owl"
+KOREAN_NOVEL = True  # 수집 대상이 알라딘 한국소설 분류
+
+PREFIXES = {
+    'obi': "http://aks.ac.kr/ontologies/obi#",
+    'rdf': "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    'rdfs': "http://www.w3.org/2000/01/rdf-schema#",
+    'xsd': "http://www.w3.org/2001/XMLSchema#",
+    'dcterms': "http://purl.org/dc/terms/",
+    'bibo': "http://purl.org/ontology/bibo/",
+    'foaf': "http://xmlns.com/foaf/0.1/",
+    'skos': "http://www.w3.org/2004/02/skos/core#",
+}
+
+CREATOR_ROLES = ('지은이', '지음', '글', '원작')
+EDITION_WORDS = ('에디션', '리커버', '양장', '양장본', '합본', '세트')
+MENTION_PROPERTIES = {'award': 'hasAwardMention', 'selection': 'hasSelectionMention', 'endorsement': 'hasEndorsement',
+                      'adaptation': 'hasAdaptationMention', 'media': 'hasMediaMention', 'press': 'hasPressCitation',
+                      'sales': 'hasSalesRecord'}
+# 공유 개념: 종류 → (IRI 접두, 분류 체계)
+CONCEPT_SCHEMES = {'role': ('Role', 'EndorserRoleScheme'), 'adaptation': ('AdaptType', 'AdaptationTypeScheme'),
+                   'award_status': ('AwardStatus', 'AwardStatusScheme')}
+SHARED_KINDS = ('person', 'org') + tuple(CONCEPT_SCHEMES)
+_AUTHOR_GROUP = re.compile(r'([^()]+)\(([^)]+)\)')
+_PARENTHESES = re.compile(r'\s*[\(\[][^)\]]*[\)\]]')
+_EDITION_SUFFIX = re.compile(r'\S*(?:개정|리마스터|특별|한정|기념)판')
+_PUBDATE = re.compile(r'(\d{4})년\s*(\d{1,2})월')
+_LOCAL_UNSAFE = re.compile(r'[^\w-]+')
+
+
+# ---------------------------------------------------------------- 항(term)
+
+def iri(prefix, local):
+    return ('iri', prefix, local)
+
+
+def obi(kind, *parts):
+    """obi:{kind}_{parts...} (IRI에 쓸 수 없는 문자는 _로)"""
+    local = '_'.join([kind] + [_LOCAL_UNSAFE.sub('_', str(part)).strip('_') for part in parts])
+    return iri('obi', local)
+
+
+def literal(value, datatype=None, lang=None):
+    return ('literal', str(value), datatype, lang)
+
+
+def bnode(label):
+    return ('bnode', _LOCAL_UNSAFE.sub('_', label))
+
+
+RDF_TYPE = iri('rdf', 'type')
+
+
+def _escape(text):
+    return (text.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def format_nt(term):
+    if term[0] == 'iri':
+        return f"<{PREFIXES[term[1]]}{term[2]}>"
+    if term[0] == 'bnode':
+        return f"_:{term[1]}"
+    _, value, datatype, lang = term
+    if lang:
+        return f'"{_escape(value)}"@{lang}'
+    if datatype:
+        return f'"{_escape(value)}"^^{format_nt(datatype)}'
+    return f'"{_escape(value)}"'
+
+
+def format_ttl(term):
+    if term[0] == 'iri':
+        return 'a' if term == RDF_TYPE else f"{term[1]}:{term[2]}"
+    if term[0] == 'bnode':
+        return f"_:{term[1]}"
+    _, value, datatype, lang = term
+    if lang:
+        return f'"{_escape(value)}"@{lang}'
+    if datatype == iri('xsd', 'integer') and re.fullmatch(r'-?\d+', value):
+        return value
+    if datatype == iri('xsd', 'boolean') and value in ('true', 'false'):
+        return value
+    if datatype:
+        return f'"{_escape(value)}"^^{format_ttl(datatype)}'
+    return f'"{_escape(value)}"'
+
+
+def serialize_blocks(blocks, fmt):
+    """[(주어, [(술어, 목적어), ...]), ...] → 문자열"""
+    lines = []
+    for subject, pairs in blocks:
+        if not pairs:
+            continue
+        if fmt == 'nt':
+            s = format_nt(subject)
+            lines.extend(f"{s} {format_nt(p)} {format_nt(o)} ." for p, o in pairs)
+        else:
+            body = ' ;\n    '.join(f"{format_ttl(p)} {format_ttl(o)}" for p, o in pairs)
+            lines.append(f"{format_ttl(subject)} {body} .\n")
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def turtle_header():
+    return ''.join(f"@prefix {name}: <{uri}> .\n" for name, uri in PREFIXES.items()) + '\n'
+
+
+# ---------------------------------------------------------------- 원본 레코드 해석
+
+def parse_author_field(author):
+    """'A,B(지은이),C(그림) |출판사| 2023년 8월' → (저자 목록, 기타 기여자, 출판사, 'YYYY-MM' 또는 None)"""
+    fields = [field.strip() for field in (author or '').split('|')]
+    creators, contributors = [], []
+    for names, role in _AUTHOR_GROUP.findall(fields[0]):
+        target = creators if role.strip() in CREATOR_ROLES else contributors
+        target.extend(name.strip() for name in names.strip(' ,').split(',') if name.strip())
+    if not creators and not contributors and fields[0]:
+        creators = [name.strip() for name in fields[0].split(',') if name.strip()]
+
+    publisher = fields[1] if len(fields) > 1 and fields[1] else None
+    match = _PUBDATE.search(fields[2]) if len(fields) > 2 else None
+    pubdate = f"{match.group(1)}-{int(match.group(2)):02d}" if match else None
+    return creators, contributors, publisher, pubdate
+
+
+def work_title(title):
+    """판본 표시(괄호, 리마스터판·개정판, ○○ 에디션 등)를 뗀 작품 제목"""
+    words = _PARENTHESES.sub('', title or '').split()
+    while len(words) > 1 and (words[-1] in EDITION_WORDS or _EDITION_SUFFIX.fullmatch(words[-1])):
+        dropped = words.pop()
+        if dropped == '에디션' and len(words) > 1:
+            words.pop()
+    return ' '.join(words)
+
+
+def record_hash(*parts):
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else json.dumps(part, ensure_ascii=False,
+                                                                        sort_keys=True).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def year_dirs(years=None, base_dir=BASE_DIR):
+    """(연도, 디렉토리) 목록"""
+    found = []
+    for path in sorted(Path('.').glob(f"{base_dir}_*")):
+        match = YEAR_DIR_PATTERN.fullmatch(path.name)
+        if match and path.is_dir() and (years is None or int(match.group(1)) in years):
+            found.append((int(match.group(1)), path))
+    return found
+
+
+def load_books(year_dir):
+    for json_file in (year_dir / "covers" / "bestseller_data.json", year_dir / "bestseller_data.json"):
+        if json_file.exists():
+            with open(json_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    return []
+
+
+def images_by_item(directory):
+    """디렉토리의 {ItemId: 이미지 경로} (파일명 {순위:03d}_{ItemId}_...)"""
+    found = {}
+    for path in sorted(directory.glob("*.jpg")) if directory.is_dir() else []:
+        match = IMAGE_NAME_PATTERN.match(path.name)
+        if match:
+            found.setdefault(match.group(2), path)
+    return found
+
+
+def band_file(belly_dir, image_file):
+    """이미지의 띠지 검출 결과 파일 (belly_band_detector 출력 우선, 없으면 기존 *_belly.json)"""
+    if image_file is None:
+        return None
+    for name in (f"{image_file.stem}_belly_band.json", f"{image_file.stem}_belly.json"):
+        if (belly_dir / name).exists():
+            return belly_dir / name
+    return None
+
+
+# ---------------------------------------------------------------- 묶음별 트리플
+
+def mention_pairs(mention, refs):
+    """band_mentions 언급 레코드 → 공노드 (속성, 값) 목록"""
+    pairs = [(iri('obi', 'contentText'), literal(mention['text']))]
+    kind = mention['type']
+    issuers = mention.get('issuers') or ([mention['outlet']] if mention.get('outlet') else [])
+    if kind == 'award':
+        pairs.append((iri('obi', 'awardName'), literal(mention['award'])))
+        if mention['edition']:
+            pairs.append((iri('obi', 'awardEdition'), literal(mention['edition'], iri('xsd', 'positiveInteger'))))
+        if mention['year']:
+            pairs.append((iri('obi', 'awardYear'), literal(mention['year'], iri('xsd', 'gYear'))))
+        if mention['status']:
+            refs['award_status'].add(mention['status'])
+            pairs.append((iri('obi', 'awardStatus'), obi('AwardStatus', mention['status'])))
+    elif kind == 'selection':
+        pairs.append((iri('obi', 'selectionCategory'), literal(mention['category'])))
+        if mention['scope']:
+            pairs.append((iri('obi', 'selectionScope'), literal(mention['scope'])))
+        if mention['year']:
+            pairs.append((iri('obi', 'selectionYear'), literal(mention['year'], iri('xsd', 'gYear'))))
+    elif kind == 'endorsement':
+        refs['role'].add(mention['endorser_role'])
+        pairs.append((iri('obi', 'endorserRole'), obi('Role', mention['endorser_role'])))
+        if mention['endorser']:
+            refs['person'].add(mention['endorser'])
+            pairs.append((iri('obi', 'endorsedBy'), obi('Person', mention['endorser'])))
+    elif kind == 'adaptation':
+        if mention['adaptation_type']:
+            refs['adaptation'].add(mention['adaptation_type'])
+            pairs.append((iri('obi', 'adaptationType'), obi('AdaptType', mention['adaptation_type'])))
+    elif kind == 'press':
+        if mention['year']:
+            pairs.append((iri('obi', 'citationYear'), literal(mention['year'], iri('xsd', 'gYear'))))
+    elif kind == 'sales':
+        pairs.append((iri('obi', 'salesMilestone'), literal(mention['milestone'])))
+    for issuer in issuers:
+        refs['org'].add(issuer)
+        pairs.append((iri('obi', 'issuedBy'), obi('Org', issuer)))
+    return pairs
+
+
+def image_blocks(year, item_id, rank, front, back, band, back_band):
+    """
+    이미지 묶음: Image, 판본→Image 연결, Obi, BCover(+ 문단 공노드)
+
+    Returns:
+        (blocks, refs) refs: 참조하는 공유 개체 {'person': [...], 'org': [...], 'role': [...], ...}
+    """
+    image = obi('Image', year, item_id)
+    manifestation = obi('Manifestation', item_id)
+    collected = literal(f"{year}-12-31", iri('xsd', 'date'))
+    refs = {kind: set() for kind in SHARED_KINDS}
+    extractor = MentionExtractor.default()
+
+    pairs = [(RDF_TYPE, iri('obi', 'Image')), (iri('obi', 'collectionDate'), collected)]
+    if rank is not None:
+        pairs.append((iri('obi', 'bestRank'), literal(int(rank), iri('xsd', 'integer'))))
+    if front is not None:
+        pairs.append((iri('obi', 'frontImage'), literal(front.as_posix(), iri('xsd', 'anyURI'))))
+    if back is not None:
+        pairs.append((iri('obi', 'backImage'), literal(back.as_posix(), iri('xsd', 'anyURI'))))
+    blocks = [(manifestation, [(iri('obi', 'hasImage'), image)]), (image, pairs)]
+
+    data = band[1] if band else None
+    if data and data.get('has_belly_band'):
+        text = (data.get('belly_band') or {}).get('text') if 'belly_band' in data else data.get('belly_band_text')
+        node = obi('Obi', year, item_id)
+        pairs.append((iri('obi', 'hasObi'), node))
+        obi_pairs = [(RDF_TYPE, iri('obi', 'Obi')), (iri('obi', 'extractedFrom'), image),
+                     (iri('obi', 'collectionDate'), collected), (iri('obi', 'isEphemeral'),
+                                                                 literal('true', iri('xsd', 'boolean')))]
+        blocks.append((node, obi_pairs))
+        if text:
+            obi_pairs.append((iri('obi', 'rawText'), literal(text)))
+        if data.get('timestamp'):
+            obi_pairs.append((iri('obi', 'ocrExtractedAt'), literal(data['timestamp'], iri('xsd', 'dateTime'))))
+        for i, mention in enumerate(extractor.extract(text)):
+            block = bnode(f"m{year}_{item_id}_{i}")
+            obi_pairs.append((iri('obi', MENTION_PROPERTIES[mention['type']]), block))
+            blocks.append((block, mention_pairs(mention, refs) +
+                           [(iri('obi', 'printedOn'), iri('obi', 'Surface_띠지'))]))
+
+    data = back_band[1] if back_band else None
+    paragraphs = [paragraph for paragraph in (data or {}).get('paragraphs', []) if paragraph['type'] != 'other']
+    if paragraphs:
+        node = obi('BCover', year, item_id)
+        pairs.append((iri('obi', 'hasBCover'), node))
+        cover_pairs = [(RDF_TYPE, iri('obi', 'BCover')), (iri('obi', 'extractedFrom'), image),
+                       (iri('obi', 'isEphemeral'), literal('false', iri('xsd', 'boolean'))),
+                       (iri('obi', 'rawText'), literal('\n'.join(p['text'] for p in data['paragraphs'])))]
+        if data.get('timestamp'):
+            cover_pairs.append((iri('obi', 'ocrExtractedAt'), literal(data['timestamp'], iri('xsd', 'dateTime'))))
+        blocks.append((node, cover_pairs))
+
+        for i, paragraph in enumerate(paragraphs):
+            block = bnode(f"b{year}_{item_id}_{i}")
+            prop = 'hasEndorsement' if paragraph['type'] == 'endorsement' else 'hasTextExcerpt'
+            cover_pairs.append((iri('obi', prop), block))
+            block_pairs = [(iri('obi', 'contentText'), literal(paragraph['text'])),
+                           (iri('obi', 'printedOn'), iri('obi', 'Surface_뒷표지'))]
+            if paragraph.get('endorser'):
+                refs['person'].add(paragraph['endorser'])
+                block_pairs.append((iri('obi', 'endorsedBy'), obi('Person', paragraph['endorser'])))
+            if paragraph.get('endorser_role'):
+                refs['role'].add(paragraph['endorser_role'])
+                block_pairs.append((iri('obi', 'endorserRole'), obi('Role', paragraph['endorser_role'])))
+            blocks.append((block, block_pairs))
+
+            # 추천사는 back_cover_text 분류를 따르고, 문단 안의 나머지 언급만 덧붙인다
+            mentions = [mention for mention in extractor.extract(paragraph['text'])
+                        if mention['type'] != 'endorsement']
+            for j, mention in enumerate(mentions):
+                block = bnode(f"m{year}_{item_id}_b{i}_{j}")
+                cover_pairs.append((iri('obi', MENTION_PROPERTIES[mention['type']]), block))
+                blocks.append((block, mention_pairs(mention, refs) +
+                               [(iri('obi', 'printedOn'), iri('obi', 'Surface_뒷표지'))]))
+
+    return blocks, {kind: sorted(names) for kind, names in refs.items()}
+
+
+def manifestation_blocks(item_id, book, isbn13=None):
+    """판본 묶음: Manifestation (ItemId, 표지 제목, 출판사, 발행월, ISBN-13)"""
+    _, _, publisher, pubdate = parse_author_field(book.get('author'))
+    publisher = book.get('publisher') or publisher
+
+    pairs = [(RDF_TYPE, iri('obi', 'Manifestation')),
+             (iri('obi', 'aladinItemId'), literal(item_id)),
+             (iri('obi', 'coverTitle'), literal(book.get('title', ''))),
+             (iri('obi', 'aladinURL'), literal(f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}",
+                                               iri('xsd', 'anyURI'))),
+             (iri('obi', 'isKoreanNovel'), literal('true' if KOREAN_NOVEL else 'false', iri('xsd', 'boolean')))]
+    if isbn13:
+        pairs.append((iri('bibo', 'isbn13'), literal(isbn13)))
+    if publisher:
+        pairs.append((iri('dcterms', 'publisher'), obi('Org', publisher)))
+    if pubdate:
+        pairs.append((iri('dcterms', 'issued'), literal(pubdate, iri('xsd', 'gYearMonth'))))
+    return [(obi('Manifestation', item_id), pairs)]
+
+
+def work_blocks(work, title, creators, contributors, item_ids):
+    """작품 묶음: Work (제목, 저자, 판본 목록)"""
+    pairs = [(RDF_TYPE, iri('obi', 'Work')), (iri('rdfs', 'label'), literal(title, lang='ko'))]
+    pairs.extend((iri('dcterms', 'creator'), obi('Person', name)) for name in creators)
+    pairs.extend((iri('dcterms', 'contributor'), obi('Person', name)) for name in contributors)
+    pairs.extend((iri('obi', 'hasManifestation'), obi('Manifestation', item_id)) for item_id in item_ids)
+    return [(work, pairs)]
+
+
+def shared_blocks(kind, name):
+    """인물·기관과 분류 체계 개념(추천인 직함, 영상화 유형, 수상 상태)"""
+    if kind == 'person':
+        return [(obi('Person', name), [(RDF_TYPE, iri('foaf', 'Person')), (iri('foaf', 'name'), literal(name))])]
+    if kind == 'org':
+        return [(obi('Org', name), [(RDF_TYPE, iri('foaf', 'Organization')), (iri('foaf', 'name'), literal(name))])]
+    prefix, scheme = CONCEPT_SCHEMES[kind]
+    return [(obi(prefix, name), [(RDF_TYPE, iri('skos', 'Concept')),
+                                 (iri('skos', 'inScheme'), iri('obi', scheme)),
+                                 (iri('skos', 'prefLabel'), literal(name, lang='ko'))])]
+
+
+# ---------------------------------------------------------------- 증분 생성기
+
+class ABoxGenerator:
+    def __init__(self, output, fmt=None, catalog=None, base_dir=BASE_DIR):
+        """
+        ABox 생성기
+
+        Args:
+            output (str): 출력 파일 (.nt 또는 .ttl)
+            fmt (str): 'nt' / 'ttl' (기본: 출력 확장자)
+            catalog (Catalog): 주어지면 books 테이블의 ISBN-13을 판본에 기록
+        """
+        self.output = Path(output)
+        self.fmt = fmt or ('nt' if self.output.suffix == '.nt' else 'ttl')
+        self.catalog = catalog
+        self.base_dir = base_dir
+        self.parts_dir = self.output.with_name(self.output.name + '.parts')
+        self.state_file = self.parts_dir / "state.json"
+        self.stats = {'groups': 0, 'written': 0, 'reused': 0, 'removed': 0, 'triples': 0}
+
+    @classmethod
+    def with_catalog(cls, output=GRAPH_FILE, fmt=None):
+        """카탈로그가 있으면 그 ISBN-13을 쓰는 생성기 (없으면 카탈로그를 만들지 않음)"""
+        return cls(output, fmt=fmt, catalog=Catalog.default() if Path(CATALOG_FILE).exists() else None)
+
+    def load_state(self):
+        state = {'version': ABOX_VERSION, 'format': self.fmt, 'groups': {}}
+        if self.state_file.exists():
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('version') == ABOX_VERSION and saved.get('format') == self.fmt:
+                state['groups'] = saved.get('groups', {})
+        return state
+
+    def part_file(self, key):
+        return self.parts_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.{self.fmt}"
+
+    def emit(self, state, seen, key, source_hash, build):
+        """
+        묶음 하나: 원본 해시가 같고 조각 파일이 있으면 재사용, 아니면 build()로 다시 직렬화
+
+        build() → (blocks, refs)
+        """
+        seen.append(key)
+        self.stats['groups'] += 1
+        previous = state['groups'].get(key)
+        part_file = self.part_file(key)
+        if previous and previous['hash'] == source_hash and part_file.exists():
+            self.stats['reused'] += 1
+            return previous.get('refs', {})
+
+        blocks, refs = build()
+        text = serialize_blocks(blocks, self.fmt)
+        tmp_file = part_file.with_suffix(part_file.suffix + '.tmp')
+        tmp_file.write_text(text, encoding='utf-8')
+        os.replace(tmp_file, part_file)
+
+        state['groups'][key] = {'hash': source_hash, 'refs': refs,
+                                'triples': sum(len(pairs) for _, pairs in blocks)}
+        self.stats['written'] += 1
+        return refs
+
+    def isbn13_for(self, item_id, book):
+        """실제 ISBN-13: API 레코드 → 카탈로그(상품 페이지·ItemLookUp으로 채운 books.isbn13) 순"""
+        isbn13 = book_isbn13(book)
+        if isbn13:
+            return isbn13
+        if self.catalog is not None:
+            return (self.catalog.book(item_id) or {}).get('isbn13')
+        return None
+
+    def generate(self, years=None):
+        """연도 디렉토리를 훑어 바뀐 묶음만 다시 만들고 출력 파일을 조립"""
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+        state = self.load_state()
+        seen = []
+        refs = defaultdict(set)
+        latest_books = {}
+
+        # 1. 이미지 묶음 (연도별 스트리밍)
+        for year, year_dir in year_dirs(years, self.base_dir):
+            books = load_books(year_dir)
+            fronts = images_by_item(year_dir / "covers")
+            backs = images_by_item(year_dir / "back_covers")
+            belly_dir = year_dir / "belly_bands"
+
+            year_items = set()
+            for book in sorted(books, key=lambda book: book.get('rank') or 0):
+                # 같은 책이 목록에 두 번 오른 경우 최고 순위만 (obi:bestRank)
+                item_id = str(book.get('item_id') or book.get('isbn13') or '')
+                if not item_id or item_id in year_items:
+                    continue
+                year_items.add(item_id)
+                latest_books[item_id] = book
+                front, back = fronts.get(item_id), backs.get(item_id)
+                sources = [band_file(belly_dir, front), band_file(belly_dir, back)]
+                raw = [path.read_bytes() if path else b'' for path in sources]
+                source_hash = record_hash(year, item_id, book.get('rank'),
+                                          front.as_posix() if front else None, back.as_posix() if back else None,
+                                          LEXICON_VERSION, *raw)
+
+                def build(year=year, item_id=item_id, rank=book.get('rank'), front=front, back=back, raw=raw,
+                          sources=sources):
+                    band, back_band = ((path, json.loads(data)) if path else None
+                                       for path, data in zip(sources, raw))
+                    return image_blocks(year, item_id, rank, front, back, band, back_band)
+
+                for kind, names in self.emit(state, seen, f"image:{year}:{item_id}", source_hash, build).items():
+                    refs[kind].update(names)
+
+        # 2. 판본 묶음 (가장 최근 연도 레코드 기준)과 작품 묶음
+        works = {}
+        for item_id, book in latest_books.items():
+            isbn13 = self.isbn13_for(item_id, book)
+            self.emit(state, seen, f"manifestation:{item_id}", record_hash(book, isbn13),
+                      lambda item_id=item_id, book=book, isbn13=isbn13:
+                      (manifestation_blocks(item_id, book, isbn13), {}))
+
+            creators, contributors, publisher, _ = parse_author_field(book.get('author'))
+            publisher = book.get('publisher') or publisher
+            if publisher:
+                refs['org'].add(publisher)
+            refs['person'].update(creators + contributors)
+
+            title = work_title(book.get('title'))
+            work = obi('Work', title, *creators[:1])
+            entry = works.setdefault(work[2], {'work': work, 'title': title, 'creators': creators,
+                                               'contributors': contributors, 'item_ids': []})
+            entry['item_ids'].append(item_id)
+
+        for key, entry in sorted(works.items()):
+            entry['item_ids'].sort()
+            self.emit(state, seen, f"work:{key}", record_hash(entry['title'], entry['creators'],
+                                                              entry['contributors'], entry['item_ids']),
+                      lambda entry=entry: (work_blocks(entry['work'], entry['title'], entry['creators'],
+                                                       entry['contributors'], entry['item_ids']), {}))
+
+        # 3. 공유 개체 (참조되는 것만)
+        for kind in SHARED_KINDS:
+            for name in sorted(refs[kind]):
+                self.emit(state, seen, f"{kind}:{name}", record_hash(kind, name),
+                          lambda kind=kind, name=name: (shared_blocks(kind, name), {}))
+
+        # 사라진 묶음 제거
+        current = set(seen)
+        for key in [key for key in state['groups'] if key not in current]:
+            self.part_file(key).unlink(missing_ok=True)
+            del state['groups'][key]
+            self.stats['removed'] += 1
+
+        self.assemble(seen)
+        self.stats['triples'] = sum(state['groups'][key].get('triples', 0) for key in seen)
+
+        tmp_file = self.state_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_file, self.state_file)
+        return self.stats
+
+    def assemble(self, keys):
+        """조각 파일을 순서대로 이어 붙여 출력 (임시 파일 후 교체)"""
+        tmp_file = self.output.with_name(self.output.name + '.tmp')
+        with open(tmp_file, 'wb') as out:
+            if self.fmt == 'ttl':
+                out.write(turtle_header().encode('utf-8'))
+            for key in keys:
+                with open(self.part_file(key), 'rb') as part:
+                    while True:
+                        chunk = part.read(1 << 16)
+                        if not chunk:
+                            break
+                        out.write(chunk)
+        os.replace(tmp_file, self.output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집 데이터 → OBI ABox 생성")
+    parser.add_argument('--output', default=GRAPH_FILE, help="출력 파일 (.ttl 또는 .nt)")
+    parser.add_argument('--format', choices=['ttl', 'nt'], help="기본: 출력 확장자")
+    parser.add_argument('--years', type=int, nargs='+', help="대상 연도 (기본: 모든 연도 디렉토리)")
+    parser.add_argument('--full', action='store_true', help="조각을 모두 다시 생성")
+    parser.add_argument('--snapshot', nargs='?', const=SCHEMA_FILE, metavar='SCHEMA',
+                        help="출력+스키마 이진 스냅샷 갱신 (기본 스키마: %(const)s)")
+    args = parser.parse_args()
+
+    # 카탈로그가 있으면 상품 페이지·ItemLookUp으로 채운 ISBN-13 사용
+    generator = ABoxGenerator.with_catalog(args.output, fmt=args.format)
+    if args.full and generator.state_file.exists():
+        generator.state_file.unlink()
+
+    stats = generator.generate(years=set(args.years) if args.years else None)
+    print(f"ABox 생성: {generator.output} ({generator.fmt}), 트리플 {stats['triples']}개")
+    print(f"묶음 {stats['groups']}개 중 재생성 {stats['written']}개, 재사용 {stats['reused']}개, "
+          f"삭제 {stats['removed']}개")
+
+    if args.snapshot:
+        from graph_snapshot import ensure_snapshot
+
+        snapshot = ensure_snapshot([generator.output, args.snapshot])
+        print(f"스냅샷: {snapshot}")
+
+
+if __name__ == "__main__":
+    main()
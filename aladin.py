@@ -5,6 +5,8 @@ from urllib.parse import urlparse, urljoin
 from pathlib import Path
 import logging
 
+from aladin_api import AladinApiClient, book_from_item
+
 class AladinCoverScraper:
     def __init__(self, ttb_key, download_dir="covers"):
         """
@@ -17,7 +19,6 @@ class AladinCoverScraper:
         self.ttb_key = ttb_key
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(exist_ok=True)
-        self.base_url = "http://www.aladin.co.kr/ttb/api/ItemSearch.aspx"
 
         # 로깅 설정
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -29,6 +30,9 @@ class AladinCoverScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
 
+        # Open API 클라이언트 (페이지 넘김, 일일 호출 한도 기록)
+        self.api = AladinApiClient(ttb_key)
+
     def search_books(self, query, max_results=10, query_type="Keyword", search_target="Book",
                      recent_publish_filter=0, category_id=0):
         """
@@ -36,7 +40,7 @@ class AladinCoverScraper:
 
         Args:
             query (str): 검색어
-            max_results (int): 최대 결과 수
+            max_results (int): 최대 결과 수 (페이지를 넘겨 가며 수집, 쿼리당 최대 200개)
             query_type (str): 검색 타입 (Keyword, Title, Author, Publisher)
             search_target (str): 검색 대상 (Book, Foreign, Music, DVD, eBook)
             recent_publish_filter (int): 출간일 필터 (0-60, 최근 몇 개월)
@@ -45,51 +49,12 @@ class AladinCoverScraper:
         Returns:
             list: 검색된 도서 정보 리스트
         """
-        params = {
-            'ttbkey': self.ttb_key,
-            'Query': query,
-            'QueryType': query_type,
-            'MaxResults': min(max_results, 50),  # API 제한: 최대 50개
-            'start': 1,
-            'SearchTarget': search_target,
-            'output': 'JS',  # JSON 형식
-            'Version': '20131101',
-            'Cover': 'Big'  # 큰 크기 표지 이미지
-        }
-
-        # 출간일 필터 추가 (0이 아닌 경우만)
-        if recent_publish_filter > 0:
-            params['RecentPublishFilter'] = recent_publish_filter
-
-        # 카테고리 ID 추가 (0이 아닌 경우만)
-        if category_id > 0:
-            params['CategoryId'] = category_id
-
         try:
-            response = self.session.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-
-            # JSON 응답 파싱 (JSONP 형식이므로 앞뒤 제거)
-            json_text = response.text
-            if json_text.startswith('callback(') and json_text.endswith(');'):
-                json_text = json_text[9:-2]
-
-            data = response.json() if not json_text else eval(json_text)
-
-            books = []
-            if 'item' in data:
-                for item in data['item']:
-                    book_info = {
-                        'title': item.get('title', ''),
-                        'author': item.get('author', ''),
-                        'isbn': item.get('isbn', ''),
-                        'isbn13': item.get('isbn13', ''),
-                        'cover_url': item.get('cover', ''),
-                        'publisher': item.get('publisher', ''),
-                        'pubdate': item.get('pubDate', ''),
-                        'link': item.get('link', '')
-                    }
-                    books.append(book_info)
+            items = self.api.item_search(query, query_type=query_type, search_target=search_target,
+                                         category_id=category_id,
+                                         recent_publish_filter=recent_publish_filter,
+                                         max_results=max_results)
+            books = [book_from_item(item) for item in items]
 
             self.logger.info(f"검색 완료: {len(books)}개 도서 발견")
             return books
@@ -230,41 +195,44 @@ class AladinCoverScraper:
         """
         ISBN 리스트로 표지 이미지 스크래핑
 
+        ItemLookUp을 동시에 보내(일일 한도 안에서) 조회되는 대로 표지를 받는다.
+
         Args:
             isbn_list (list): ISBN 리스트
-            delay (float): 요청 간 대기 시간
+            delay (float): 이미지 다운로드 간 대기 시간
 
         Returns:
             dict: 다운로드 결과 통계
         """
-        self.logger.info(f"ISBN 기반 표지 이미지 스크래핑 시작: {len(isbn_list)}개")
+        self.logger.info(f"ISBN 기반 표지 이미지 스크래핑 시작: {len(isbn_list)}개 "
+                         f"(남은 API 호출 {self.api.quota.remaining}회)")
 
         success_count = 0
         failed_count = 0
 
-        for isbn in isbn_list:
-            books = self.search_books(isbn, max_results=1, query_type="Keyword")
-
-            if books:
-                book = books[0]
-                title = book['title'].strip()
-                safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
-
-                cover_url = book['cover_url']
-                if cover_url:
-                    ext = os.path.splitext(urlparse(cover_url).path)[1] or '.jpg'
-                    filename = f"{isbn}_{safe_title[:50]}{ext}"
-
-                    if self.download_cover_image(cover_url, filename):
-                        success_count += 1
-                    else:
-                        failed_count += 1
-                else:
-                    self.logger.warning(f"표지 이미지 URL이 없습니다: {isbn}")
-                    failed_count += 1
-            else:
+        for isbn, item in self.api.lookup_many(isbn_list):
+            if item is None:
                 self.logger.warning(f"도서를 찾을 수 없습니다: {isbn}")
                 failed_count += 1
+                continue
+
+            book = book_from_item(item)
+            title = book['title'].strip()
+            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
+
+            cover_url = book['cover_url']
+            if not cover_url:
+                self.logger.warning(f"표지 이미지 URL이 없습니다: {isbn}")
+                failed_count += 1
+                continue
+
+            ext = os.path.splitext(urlparse(cover_url).path)[1] or '.jpg'
+            filename = f"{isbn}_{safe_title[:50]}{ext}"
+
+            if self.download_cover_image(cover_url, filename):
+                success_count += 1
+            else:
+                failed_count += 1
 
             time.sleep(delay)
 
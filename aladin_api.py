@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+알라딘 Open API (TTB) 클라이언트
+
+1. ItemList / ItemSearch 페이지를 끝까지 넘기는 제너레이터 (Start는 페이지 번호,
+   한 페이지 최대 50개, 쿼리당 최대 200개)
+2. ItemLookUp은 한 번에 상품 하나만 조회하므로 ISBN 목록은 스레드로 동시에 조회
+3. TTB 키 일일 호출 한도 기록 (aladin_quota.json, 날짜가 바뀌면 초기화)
+   - 호출 전에 한도를 예약하므로 동시 요청이 여러 개여도 한도를 넘지 않음
+   - 디스크 캐시(http_cache)에서 나온 응답은 호출 수에서 제외
+
+사용 예:
+    api = AladinApiClient(os.environ["ALADIN_TTB_KEY"])
+    for item in api.item_list('Bestseller', category_id=50993, max_results=100):
+        print(item['title'])
+    for isbn, item in api.lookup_many(isbn_list):
+        ...
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+from aladin_json import decode_response, stream_response
+from fetch_engine import create_session, write_atomic
+
+API_BASE = "http://www.aladin.co.kr/ttb/api/"
+API_VERSION = "20131101"
+PAGE_SIZE = 50          # 한 페이지 최대 상품 수
+MAX_QUERY_RESULTS = 200  # 쿼리 하나로 받을 수 있는 최대 상품 수
+DAILY_QUOTA = 5000      # TTB 키 일일 호출 한도
+QUOTA_FILE = "aladin_quota.json"
+
+
+# 상품 하나가 없다는 오류 메시지 — TTB 키·인증·한도 오류는 모든 조회가 함께 실패하므로 여기에 넣지 않는다
+NOT_FOUND_MESSAGES = ('존재하지 않는 상품', '없는 상품', '상품이 없', '상품을 찾을 수 없', '찾을 수 없는 상품',
+                      'not found', 'no item')
+ACCOUNT_MESSAGES = ('ttbkey', 'ttb key', '키', '인증', '권한', '한도', '초과', 'quota', 'limit')
+
+
+class AladinApiError(RuntimeError):
+    def __init__(self, code, message):
+        super().__init__(f"알라딘 API 오류 {code}: {message}")
+        self.code = code
+        self.message = message
+
+    @property
+    def not_found(self):
+        """상품 하나를 찾지 못한 오류인지 (키·인증·한도 오류면 False)"""
+        message = str(self.message).lower()
+        if any(word in message for word in ACCOUNT_MESSAGES):
+            return False
+        return any(word in message for word in NOT_FOUND_MESSAGES)
+
+
+class QuotaExceeded(RuntimeError):
+    pass
+
+
+class QuotaTracker:
+    def __init__(self, daily_quota=DAILY_QUOTA, quota_file=QUOTA_FILE):
+        """
+        TTB 키 일일 호출 수 기록 (quota_file이 None이면 메모리에만 기록)
+        """
+        self.daily_quota = daily_quota
+        self.quota_file = Path(quota_file) if quota_file else None
+        self._lock = threading.Lock()
+        self.day = date.today().isoformat()
+        self.calls = 0
+
+        if self.quota_file and self.quota_file.exists():
+            with open(self.quota_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('date') == self.day:
+                self.calls = data.get('calls', 0)
+
+    def _roll_over(self):
+        today = date.today().isoformat()
+        if today != self.day:
+            self.day = today
+            self.calls = 0
+
+    def _save(self):
+        if self.quota_file:
+            content = json.dumps({'date': self.day, 'calls': self.calls, 'quota': self.daily_quota})
+            write_atomic(self.quota_file, content.encode('utf-8'))
+
+    @property
+    def remaining(self):
+        with self._lock:
+            self._roll_over()
+            return max(0, self.daily_quota - self.calls)
+
+    def reserve(self):
+        """호출 1회 예약 (한도를 다 쓰면 QuotaExceeded)"""
+        with self._lock:
+            self._roll_over()
+            if self.calls >= self.daily_quota:
+                raise QuotaExceeded(f"알라딘 API 일일 호출 한도 소진 ({self.calls}/{self.daily_quota})")
+            self.calls += 1
+            self._save()
+
+    def release(self):
+        """네트워크를 쓰지 않은 호출(캐시 응답)의 예약 취소"""
+        with self._lock:
+            if self.calls > 0:
+                self.calls -= 1
+                self._save()
+
+
+class RateLimiter:
+    def __init__(self, rate):
+        """스레드 공용 초당 요청 수 제한 (요청 간 최소 간격)"""
+        self.interval = 1.0 / rate if rate else 0
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AladinApiClient:
+    def __init__(self, ttb_key, session=None, concurrency=4, rate=5.0, timeout=10,
+                 daily_quota=DAILY_QUOTA, quota_file=QUOTA_FILE, cover='Big'):
+        """
+        알라딘 Open API 클라이언트
+
+        Args:
+            ttb_key (str): 알라딘 API TTB Key
+            session: 공유할 requests 세션 (없으면 디스크 캐시가 붙은 공용 세션 생성)
+            concurrency (int): ItemLookUp 동시 요청 수
+            rate (float): 초당 API 호출 수 상한
+            timeout (float): 요청 타임아웃 (초)
+            daily_quota (int): 일일 호출 한도
+            quota_file (str): 호출 수 기록 파일 (None이면 기록 안 함)
+            cover (str): 표지 이미지 크기 (Big, MidBig, Mid, Small, Mini, None)
+        """
+        self.ttb_key = ttb_key
+        self.session = session or create_session(pool_size=max(concurrency, 4))
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.cover = cover
+        self.quota = QuotaTracker(daily_quota, quota_file)
+        self.limiter = RateLimiter(rate)
+        self.stats = {'calls': 0, 'cached': 0, 'items': 0}
+
+    def _request(self, endpoint, params, stream=False):
+        """한도를 예약하고 API 요청 (캐시 응답이면 예약 취소)"""
+        query = {
+            'ttbkey': self.ttb_key,
+            'output': 'JS',
+            'Version': API_VERSION,
+            'Cover': self.cover,
+        }
+        query.update({key: value for key, value in params.items() if value is not None})
+
+        self.quota.reserve()
+        self.limiter.wait()
+        try:
+            response = self.session.get(f"{API_BASE}{endpoint}.aspx", params=query,
+                                        timeout=self.timeout, stream=stream)
+            response.raise_for_status()
+        except Exception:
+            self.quota.release()
+            raise
+
+        if response.headers.get('X-Cache') in ('HIT', 'STALE'):
+            self.quota.release()
+            self.stats['cached'] += 1
+        else:
+            self.stats['calls'] += 1
+        return response
+
+    def call(self, endpoint, **params):
+        """
+        API 한 번 호출 (endpoint: 'ItemList', 'ItemSearch', 'ItemLookUp')
+
+        Returns:
+            dict: 응답 JSON (item은 aladin_json.ITEM_SCHEMA 타입으로 검증됨)
+        """
+        data = decode_response(self._request(endpoint, params).text)
+        if 'errorCode' in data:
+            raise AladinApiError(data['errorCode'], data.get('errorMessage', ''))
+        return data
+
+    def iter_pages(self, endpoint, max_results=None, **params):
+        """
+        검색/리스트 결과를 페이지를 넘기며 상품 단위로 yield
+
+        응답 본문은 aladin_json.ItemStream으로 읽어 item이 디코딩되는 대로 돌려준다.
+        max_results: 최대 상품 수 (None이면 API가 주는 만큼, 쿼리당 최대 200개)
+        """
+        limit = min(max_results or MAX_QUERY_RESULTS, MAX_QUERY_RESULTS)
+        page_size = min(PAGE_SIZE, limit)
+        yielded = 0
+        page = 1
+
+        while yielded < limit:
+            # 소비자가 중간에 멈추거나(GeneratorExit) 오류가 나도 풀 연결을 돌려주도록 with로 닫음
+            with self._request(endpoint, dict(params, Start=page, MaxResults=page_size), stream=True) as response:
+                items = stream_response(response)
+                header = items.read_header()
+                if 'errorCode' in header:
+                    raise AladinApiError(header['errorCode'], header.get('errorMessage', ''))
+
+                for item in items:
+                    yielded += 1
+                    self.stats['items'] += 1
+                    yield item
+                    if yielded >= limit:
+                        break
+
+            total = min(header.get('totalResults') or 0, limit)
+            if items.count < page_size or page * page_size >= total:
+                break
+            page += 1
+
+    def item_list(self, query_type='Bestseller', category_id=0, year=None, month=None, week=None,
+                  search_target='Book', max_results=None, **params):
+        """
+        상품 리스트 (ItemList) 제너레이터
+
+        query_type: ItemNewAll, ItemNewSpecial, ItemEditorChoice, Bestseller, BlogBest
+        year/month/week: Bestseller인 경우 조회할 주간 (생략하면 현재 주간)
+        """
+        return self.iter_pages('ItemList', max_results=max_results, QueryType=query_type,
+                               CategoryId=category_id or None, SearchTarget=search_target,
+                               Year=year, Month=month, Week=week, **params)
+
+    def item_search(self, query, query_type='Keyword', search_target='Book', category_id=0,
+                    recent_publish_filter=0, sort=None, max_results=None, **params):
+        """
+        상품 검색 (ItemSearch) 제너레이터
+
+        query_type: Keyword, Title, Author, Publisher
+        """
+        return self.iter_pages('ItemSearch', max_results=max_results, Query=query,
+                               QueryType=query_type, SearchTarget=search_target,
+                               CategoryId=category_id or None,
+                               RecentPublishFilter=recent_publish_filter or None,
+                               Sort=sort, **params)
+
+    def bestseller_weeks(self, year, category_id=0, months=range(1, 13), weeks=range(1, 6)):
+        """
+        한 해의 주간 베스트셀러를 차례로 조회해 처음 나온 상품만 yield
+
+        쿼리당 200개 제한을 넘어 한 분야를 넓게 훑을 때 사용한다.
+        """
+        seen = set()
+        for month in months:
+            for week in weeks:
+                for item in self.item_list('Bestseller', category_id=category_id,
+                                           year=year, month=month, week=week):
+                    if item.get('itemId') in seen:
+                        continue
+                    seen.add(item.get('itemId'))
+                    yield item
+
+    def item_lookup(self, item_id, id_type='ISBN13', **params):
+        """
+        상품 조회 (ItemLookUp) - 상품 정보 dict, 없으면 None
+
+        id_type: ISBN, ISBN13, ItemId
+        """
+        data = self.call('ItemLookUp', ItemId=item_id, ItemIdType=id_type, **params)
+        items = data.get('item', [])
+        return items[0] if items else None
+
+    def lookup_many(self, item_ids, id_type=None, **params):
+        """
+        여러 상품을 동시에 조회해 (입력 ID, 상품 또는 None)을 입력 순서대로 yield
+
+        id_type이 None이면 ID마다 자릿수로 ISBN13 / ISBN / ItemId를 고른다.
+
+        동시 요청 수는 남은 일일 한도를 넘지 않게 줄이고, 한도를 다 쓰면
+        이미 보낸 요청까지만 돌려준 뒤 QuotaExceeded를 올린다. 없는 상품만 None이 되고,
+        TTB 키·인증·한도 같은 나머지 AladinApiError는 그대로 올린다. 입력 ID가 None이면 요청 없이 None.
+        """
+        item_ids = iter(item_ids)
+        end = object()
+        workers = max(1, min(self.concurrency, self.quota.remaining))
+        pending = deque()
+
+        def lookup(item_id):
+            if item_id is None:
+                return None
+            try:
+                return self.item_lookup(item_id, id_type=id_type or id_type_for(item_id), **params)
+            except AladinApiError as e:
+                if e.not_found:
+                    return None
+                raise
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            def submit():
+                item_id = next(item_ids, end)
+                if item_id is end:
+                    return False
+                pending.append((item_id, executor.submit(lookup, item_id)))
+                return True
+
+            # 입력을 전부 쌓지 않고 동시 요청 수만큼만 앞서 보냄
+            for _ in range(workers):
+                if not submit():
+                    break
+
+            while pending:
+                item_id, future = pending.popleft()
+                item = future.result()
+                self.stats['items'] += item is not None
+                yield item_id, item
+                submit()
+
+
+def id_type_for(item_id):
+    """ItemLookUp ItemIdType 추정 (13자리 ISBN13, 10자리 ISBN, 그 외 알라딘 ItemId)"""
+    item_id = str(item_id).replace('-', '')
+    if len(item_id) == 13 and item_id.isdigit():
+        return 'ISBN13'
+    if len(item_id) == 10 and item_id[:9].isdigit():
+        return 'ISBN'
+    return 'ItemId'
+
+
+def book_from_item(item):
+    """API 상품 정보를 스크래퍼 도서 dict로 변환"""
+    return {
+        'title': item.get('title', ''),
+        'author': item.get('author', ''),
+        'isbn': item.get('isbn', ''),
+        'isbn13': item.get('isbn13', ''),
+        'item_id': str(item.get('itemId', '')),
+        'cover_url': item.get('cover', ''),
+        'publisher': item.get('publisher', ''),
+        'pubdate': item.get('pubDate', ''),
+        'link': item.get('link', '')
+    }
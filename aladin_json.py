@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+알라딘 Open API output=JS 응답 디코더
+
+1. JSONP 래퍼(callback(...);)와 끝의 ';' 제거
+2. JSON 표준이 아닌 이스케이프(\\', \\xHH 등)와 문자열 안의 줄바꿈·탭 허용
+   - 표준 응답은 json.loads 한 번으로 처리하고, 실패할 때만 이스케이프를 고친다
+3. 응답 헤더(totalResults 등)와 item 필드를 ITEM_SCHEMA 타입으로 검증·변환
+   ("123" → 123, "true" → True 등, 필수 필드가 없으면 ResponseSchemaError)
+4. ItemStream: 응답 본문을 조각(chunk) 단위로 읽으며 item을 하나씩 디코딩
+
+사용 예:
+    data = decode_response(response.text)
+    for item in stream_response(response):
+        ...
+"""
+
+import json
+import re
+
+# 필드: (타입, 필수 여부) — 스키마에 없는 필드는 그대로 둔다
+HEADER_SCHEMA = {
+    'version': (str, False),
+    'title': (str, False),
+    'link': (str, False),
+    'pubDate': (str, False),
+    'totalResults': (int, False),
+    'startIndex': (int, False),
+    'itemsPerPage': (int, False),
+    'query': (str, False),
+    'searchCategoryId': (int, False),
+    'searchCategoryName': (str, False),
+    'errorCode': (int, False),
+    'errorMessage': (str, False),
+}
+
+ITEM_SCHEMA = {
+    'itemId': (int, True),
+    'title': (str, True),
+    'link': (str, False),
+    'author': (str, False),
+    'pubDate': (str, False),
+    'description': (str, False),
+    'isbn': (str, False),
+    'isbn13': (str, False),
+    'priceSales': (int, False),
+    'priceStandard': (int, False),
+    'mallType': (str, False),
+    'stockStatus': (str, False),
+    'mileage': (int, False),
+    'cover': (str, False),
+    'categoryId': (int, False),
+    'categoryName': (str, False),
+    'publisher': (str, False),
+    'salesPoint': (int, False),
+    'adult': (bool, False),
+    'fixedPrice': (bool, False),
+    'customerReviewRank': (int, False),
+    'bestRank': (int, False),
+}
+
+_DECODER = json.JSONDecoder(strict=False)
+_ESCAPE = re.compile(r'\\(["\\/bfnrt]|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)', re.S)
+_ITEM_ARRAY = re.compile(r'"item"\s*:\s*\[')
+_WHITESPACE = ' \t\r\n,'
+
+
+class ResponseSchemaError(ValueError):
+    pass
+
+
+def _fix_escape(match):
+    escape = match.group(1)
+    if len(escape) > 1 and escape[0] == 'x':
+        return '\\u00' + escape[1:]
+    if len(escape) > 1 or escape in '"\\/bfnrt':
+        return match.group(0)
+    # \' 처럼 JSON에 없는 이스케이프는 문자만 남김
+    return escape
+
+
+def fix_escapes(text):
+    """JSON 표준이 아닌 백슬래시 이스케이프를 표준 형태로 변환"""
+    return _ESCAPE.sub(_fix_escape, text)
+
+
+def strip_jsonp(text):
+    """callback({...}); 형태의 래퍼와 BOM·끝의 ';' 제거"""
+    text = text.strip().lstrip('\ufeff')
+    if text.endswith(';'):
+        text = text[:-1].rstrip()
+    if text and text[0] not in '{[':
+        start = text.find('(')
+        if start != -1 and text.endswith(')'):
+            text = text[start + 1:-1].strip()
+    return text
+
+
+def loads(text):
+    """JSON 디코딩 (표준이 아닌 이스케이프가 있을 때만 고쳐서 다시 시도)"""
+    try:
+        return _DECODER.decode(text)
+    except json.JSONDecodeError:
+        return _DECODER.decode(fix_escapes(text))
+
+
+def coerce(value, kind, field):
+    """값을 스키마 타입으로 변환 (변환할 수 없으면 ResponseSchemaError)"""
+    if value is None or (type(value) is kind):
+        return value
+
+    try:
+        if kind is int:
+            if isinstance(value, bool):
+                raise ValueError
+            if isinstance(value, str):
+                value = value.strip().replace(',', '')
+                return int(value) if value else None
+            if isinstance(value, float) and value.is_integer():
+                return int(value)
+        elif kind is bool:
+            if isinstance(value, str) and value.lower() in ('true', 'false', '1', '0', 'y', 'n'):
+                return value.lower() in ('true', '1', 'y')
+            if isinstance(value, int):
+                return bool(value)
+        elif kind is str:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return str(value)
+    except ValueError:
+        pass
+
+    raise ResponseSchemaError(f"{field}: {kind.__name__} 아님 ({value!r})")
+
+
+def validate(record, schema, where):
+    """record 필드를 스키마 타입으로 변환 (제자리 수정 후 반환)"""
+    if not isinstance(record, dict):
+        raise ResponseSchemaError(f"{where}: 객체가 아님 ({type(record).__name__})")
+
+    for field, (kind, required) in schema.items():
+        if field not in record:
+            if required:
+                raise ResponseSchemaError(f"{where}: 필수 필드 {field} 없음")
+            continue
+        record[field] = coerce(record[field], kind, f"{where}.{field}")
+    return record
+
+
+def validate_item(item, index=0):
+    return validate(item, ITEM_SCHEMA, f"item[{index}]")
+
+
+def decode_response(text, validate_items=True):
+    """
+    output=JS 응답 본문 전체를 dict로 디코딩
+
+    오류 응답(errorCode)은 item 검증 없이 그대로 돌려준다.
+    """
+    data = loads(strip_jsonp(text))
+    validate(data, HEADER_SCHEMA, "response")
+
+    if validate_items and 'errorCode' not in data:
+        items = data.get('item', [])
+        if not isinstance(items, list):
+            raise ResponseSchemaError(f"response.item: 배열이 아님 ({type(items).__name__})")
+        for index, item in enumerate(items):
+            validate_item(item, index)
+    return data
+
+
+class ItemStream:
+    def __init__(self, chunks, validate_items=True):
+        """
+        응답 본문 조각(str)을 읽으며 item을 하나씩 돌려주는 반복자
+
+        item 배열 앞의 헤더(totalResults 등)는 첫 item을 읽기 전에 self.header에 채워지고,
+        배열 뒤에 필드가 더 있으면 반복이 끝날 때 합쳐진다.
+        item 배열이 없는 응답(오류 응답 등)은 전체를 디코딩해 header에 넣는다.
+        """
+        self._chunks = iter(chunks)
+        self.validate_items = validate_items
+        self.header = None
+        self.count = 0
+        self._buffer = ''
+        self._pos = 0
+        self._exhausted = False
+
+    def _read(self):
+        """다음 조각을 버퍼에 추가 (더 없으면 False)"""
+        if self._exhausted:
+            return False
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += chunk
+                return True
+        self._exhausted = True
+        return False
+
+    def read_header(self):
+        """item 배열 시작 위치까지 읽고 헤더 반환"""
+        if self.header is not None:
+            return self.header
+
+        search_from = 0
+        while True:
+            match = _ITEM_ARRAY.search(self._buffer, search_from)
+            if match:
+                break
+            search_from = max(0, len(self._buffer) - 16)
+            if not self._read():
+                # item 배열 없는 응답
+                self.header = decode_response(self._buffer, validate_items=False)
+                self._pos = len(self._buffer)
+                return self.header
+
+        prefix = self._buffer[:match.start()]
+        prefix = prefix[prefix.find('{'):].rstrip().rstrip(',')
+        self.header = validate(loads(prefix + '}'), HEADER_SCHEMA, "response")
+        self._buffer = self._buffer[match.end():]
+        self._pos = 0
+        return self.header
+
+    def _skip_separators(self):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._read():
+                return self._pos < len(self._buffer)
+
+    def _decode_next(self):
+        """버퍼의 현재 위치에서 item 하나 디코딩 (필요하면 조각을 더 읽음)"""
+        while True:
+            try:
+                item, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if e.msg.startswith('Invalid \\'):
+                    # \u 오류는 e.pos가 백슬래시 다음 글자를 가리킴
+                    start = e.pos if self._buffer[e.pos:e.pos + 1] == '\\' else e.pos - 1
+                    fixed = self._fix_buffer(start)
+                    if fixed or self._read():
+                        continue
+                    raise
+                if self._read():
+                    continue
+                raise
+            self._buffer = self._buffer[end:]
+            self._pos = 0
+            return item
+
+    def _fix_buffer(self, start):
+        """
+        버퍼의 start 이후 이스케이프를 한 번에 표준 형태로 변환 (바뀐 것이 있으면 True)
+
+        조각 끝에서 잘렸을 수 있는 마지막 6글자 안의 이스케이프(\\u00, \\x4)는
+        다음 조각을 읽은 뒤에 고친다.
+        """
+        limit = len(self._buffer) if self._exhausted else len(self._buffer) - 6
+        parts = []
+        last = start
+        for match in _ESCAPE.finditer(self._buffer, start):
+            if match.start() >= limit:
+                break
+            replacement = _fix_escape(match)
+            if replacement != match.group(0):
+                parts.append(self._buffer[last:match.start()])
+                parts.append(replacement)
+                last = match.end()
+
+        if not parts:
+            return False
+        self._buffer = self._buffer[:start] + ''.join(parts) + self._buffer[last:]
+        return True
+
+    def _read_tail(self):
+        """item 배열 뒤에 남은 필드를 헤더에 합침"""
+        while self._read():
+            pass
+        tail = strip_jsonp(self._buffer[self._pos + 1:]).strip()
+        if tail.startswith(','):
+            tail = tail[1:]
+        if tail.endswith(')'):
+            tail = tail[:-1].rstrip()
+        if tail.rstrip('} \t\r\n'):
+            extra = loads('{' + tail)
+            self.header.update(validate(extra, HEADER_SCHEMA, "response"))
+
+    def __iter__(self):
+        self.read_header()
+        if self._pos >= len(self._buffer) and self._exhausted:
+            return
+
+        while self._skip_separators():
+            if self._buffer[self._pos] == ']':
+                self._read_tail()
+                return
+
+            item = self._decode_next()
+            if self.validate_items:
+                validate_item(item, self.count)
+            self.count += 1
+            yield item
+
+        raise ResponseSchemaError("response.item: 배열이 끝나지 않음")
+
+
+def stream_response(response, chunk_size=64 * 1024, validate_items=True):
+    """requests 응답을 ItemStream으로 감쌈 (stream=True로 받은 응답도 가능)"""
+    if response.encoding is None:
+        response.encoding = 'utf-8'
+    return ItemStream(response.iter_content(chunk_size=chunk_size, decode_unicode=True),
+                      validate_items=validate_items)
@@ -8,6 +8,8 @@ import json
 import time
 import os
 
+from fetch_engine import create_session
+
 class BackCoverScraper:
     def __init__(self, download_dir="back_covers"):
         """
@@ -21,15 +23,17 @@ class BackCoverScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
+        # 상품 페이지는 디스크 캐시가 장착된 공용 세션으로 요청
+        self.session = create_session()
+
     def get_product_page_html(self, product_url):
         """
         상품 상세 페이지 HTML 가져오기
         """
         try:
-            request = urllib.request.Request(product_url, headers=self.headers)
-            with urllib.request.urlopen(request, timeout=15) as response:
-                html = response.read().decode('utf-8', errors='ignore')
-            return html
+            response = self.session.get(product_url, timeout=15)
+            response.raise_for_status()
+            return response.content.decode('utf-8', errors='ignore')
         except Exception as e:
             print(f"페이지 로드 실패: {e}")
             return None
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+뒷표지 OCR 결과 문단 분할·분류
+
+뒷표지 텍스트는 가로 띠가 아니라 여러 줄짜리 문단(추천사, 본문 발췌, 소개글)이다.
+EasyOCR 형식 결과 [(bbox 4점, text, confidence), ...]를
+1. 줄: 세로 범위가 겹치고 가로로 가까운 블록을 왼쪽부터 이어 붙임
+2. 문단: 줄 간격이 줄 높이의 para_gap배 이하이고 가로 범위가 겹치는 줄을 묶음
+3. 분류 (온톨로지 CoverCopy 블록)
+   - endorsement: "…—신형철(문학평론가)"처럼 끝에 추천인·직함이 붙은 문단 (obi:hasEndorsement)
+     추천인만 있는 짧은 문단은 바로 위 문단의 추천인으로 붙인다
+   - excerpt: 따옴표로 시작하거나 추천인이 없는 긴 문단 (obi:hasTextExcerpt)
+   - other: ISBN·가격·출판사 주소·짧은 문구 (추천인 검사보다 먼저 걸러 "서울 마포구 - 문학동네"를
+     추천사로 보지 않음)
+로 나눈다.
+
+직함 없이 대시 뒤 이름만 있는 추천인은 이름 모양(is_person_name: 성+이름, 띄어 쓴 외국 이름,
+로마자 이름)일 때만 받는다.
+"""
+
+import re
+
+import numpy as np
+
+ENDORSER_ROLES = ('문학평론가', '평론가', '소설가', '시인', '작가', '교수', '기자', '번역가', '북튜버', '유튜버',
+                  '배우', '가수', '감독', '영화감독', 'PD', '아나운서', '방송인', '철학자', '의사', '변호사',
+                  '편집자', '서평가', '칼럼니스트', '정신과 전문의', '뮤지션', '에세이스트', '만화가', '웹툰작가')
+
+_ROLE = '|'.join(sorted((re.escape(role) for role in ENDORSER_ROLES), key=len, reverse=True))
+# 문단 끝 추천인: "— 신형철(문학평론가)", "_정세랑 (소설가)", "- 김영하, 소설가"
+_ATTRIBUTION = re.compile(
+    r'(?:^|[\s\"”’」』.!?…])[-_–—―~]+\s*(?P<name>[가-힣A-Za-z·\s]{2,15}?)\s*'
+    r'(?:[\(（\[]\s*(?P<role>[^)）\]]{1,25})\s*[\)）\]]|[,，]\s*(?P<role2>[가-힣A-Za-z\s]{1,15}))?\s*$')
+# 대시 없이 끝나는 "이름(직함)" — 직함이 알려진 단어일 때만
+_NAME_ROLE = re.compile(rf'(?P<name>[가-힣]{{2,5}})\s*[\(（]\s*(?P<role>[^)）]*(?:{_ROLE})[^)）]*)\s*[\)）]\s*$')
+_QUOTE_START = re.compile(r'^[\"“‘\'「『<《]')
+_PROVINCES = '서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주'
+_OTHER = re.compile(r'ISBN|[0-9]{3}-?[0-9]{2}-?[0-9]{3,}|값\s*[0-9,]+|[0-9,]+\s*원|www\.|https?://|\.co\.kr|\.com'
+                    rf'|(?:{_PROVINCES})[가-힣]*\s+[가-힣]+(?:시|군|구)(?![가-힣])|[가-힣0-9]+(?:로|길)\s*[0-9]+',
+                    re.I)
+
+# 이름 모양: 흔한 성 + 이름 1~2자, 복성 + 이름 1~2자
+SURNAMES = frozenset('김이박최정강조윤장임한오서신권황안송류유전홍고문양손배백허남심노하곽성차주우구민진나지엄채원천'
+                     '방공현함변염여추도소석선설마길연위표명기반왕금옥육인맹제탁국어은편용예경봉')
+COMPOUND_SURNAMES = ('남궁', '황보', '제갈', '선우', '독고', '사공', '서문')
+# 성으로 시작해 이름 모양이지만 이름이 아닌 어절
+NOT_NAMES = frozenset(('이번', '이제', '이미', '이런', '이상', '이야기', '정말', '정도', '한번', '한국', '한국인', '오늘',
+                       '하나', '하루', '모든', '많은', '수많은', '최고', '최초', '최근', '전부', '전세계', '고전', '문학',
+                       '문장', '소설', '작품', '신작', '장편', '단편', '독자', '우리', '시대', '시대의', '세계', '세상',
+                       '주인공', '진짜', '지금', '지난', '나의', '나는', '연말', '올해', '반드시', '기적', '출판사',
+                       '편집부', '마음', '사랑', '가장', '성장', '인생'))
+_PLACE_SUFFIXES = ('시', '군', '구', '동', '로', '길', '출판', '북스', '문고', '동네')
+_LATIN_NAME = re.compile(r"[A-Z][A-Za-z'\-]+(?:[ ·][A-Z][A-Za-z'\-\.]*){1,2}")
+
+MIN_EXCERPT_CHARS = 30
+
+
+def _boxes(results):
+    """결과별 (x_min, y_min, x_max, y_max) 배열"""
+    if not results:
+        return np.zeros((0, 4))
+    points = np.array([result[0] for result in results], dtype=np.float64).reshape(-1, 4, 2)
+    return np.stack([points[:, :, 0].min(axis=1), points[:, :, 1].min(axis=1),
+                     points[:, :, 0].max(axis=1), points[:, :, 1].max(axis=1)], axis=1)
+
+
+def segment_lines(results, max_gap=3.0):
+    """
+    OCR 블록을 줄로 묶기
+
+    Returns:
+        list: [{'box': [x0, y0, x1, y1], 'text', 'confidences': [...]}] (위→아래)
+    """
+    boxes = _boxes(results)
+    lines = []
+    for i in np.lexsort((boxes[:, 0], (boxes[:, 1] + boxes[:, 3]) / 2)):
+        x0, y0, x1, y1 = boxes[i]
+        height = y1 - y0
+        _, text, confidence = results[i]
+
+        # 세로 겹침이 작은 쪽 높이의 절반 이상이고 가로 간격이 글자 높이의 max_gap배 이하인 줄에 붙임
+        target = None
+        for line in reversed(lines[-4:]):
+            lx0, ly0, lx1, ly1 = line['box']
+            overlap = min(y1, ly1) - max(y0, ly0)
+            gap = max(x0 - lx1, lx0 - x1)
+            if overlap >= 0.5 * min(height, ly1 - ly0) and gap <= max_gap * max(height, ly1 - ly0):
+                target = line
+                break
+
+        if target is None:
+            lines.append({'box': [x0, y0, x1, y1], 'parts': [(x0, text)], 'confidences': [confidence]})
+        else:
+            box = target['box']
+            target['box'] = [min(box[0], x0), min(box[1], y0), max(box[2], x1), max(box[3], y1)]
+            target['parts'].append((x0, text))
+            target['confidences'].append(confidence)
+
+    for line in lines:
+        line['text'] = ' '.join(text.strip() for _, text in sorted(line.pop('parts'), key=lambda p: p[0]))
+    lines.sort(key=lambda line: (line['box'][1], line['box'][0]))
+    return lines
+
+
+def segment_paragraphs(results, para_gap=0.8, height_ratio=1.6):
+    """
+    OCR 블록을 문단으로 묶기
+
+    Args:
+        para_gap (float): 줄 사이 세로 간격이 줄 높이의 이 배수 이하이면 같은 문단
+        height_ratio (float): 글자 높이가 이 비율 이상 다르면 다른 문단 (제목·본문 구분)
+
+    Returns:
+        list: [{'text', 'lines', 'bbox' (4점), 'confidence'}] (위→아래)
+    """
+    paragraphs = []
+    for line in segment_lines(results):
+        x0, y0, x1, y1 = line['box']
+        height = y1 - y0
+
+        current = paragraphs[-1] if paragraphs else None
+        if current is not None:
+            px0, py0, px1, py1 = current['box']
+            line_height = current['line_height']
+            gap = y0 - py1
+            horizontal = min(x1, px1) - max(x0, px0)
+            similar = max(height, line_height) <= height_ratio * max(1.0, min(height, line_height))
+            if gap <= para_gap * max(height, line_height) and horizontal > 0 and similar:
+                current['box'] = [min(px0, x0), py0, max(px1, x1), max(py1, y1)]
+                current['lines'].append(line['text'])
+                current['confidences'].extend(line['confidences'])
+                current['line_height'] = (line_height * (len(current['lines']) - 1) + height) / len(current['lines'])
+                continue
+
+        paragraphs.append({'box': [x0, y0, x1, y1], 'lines': [line['text']],
+                           'confidences': list(line['confidences']), 'line_height': height})
+
+    result = []
+    for paragraph in paragraphs:
+        x0, y0, x1, y1 = (float(v) for v in paragraph['box'])
+        result.append({
+            'text': ' '.join(paragraph['lines']),
+            'lines': paragraph['lines'],
+            'bbox': [[x0, y0], [x1, y0], [x1, y1], [x0, y1]],
+            'confidence': float(np.mean(paragraph['confidences'])),
+        })
+    return result
+
+
+def is_person_name(name):
+    """
+    추천인 이름 모양인지: "정세랑"·"남궁인"(성+이름), "무라카미 하루키"(띄어 쓴 한글 두 어절),
+    "Kazuo Ishiguro"(로마자). 주소·출판사 이름·흔한 낱말은 아님
+    """
+    parts = name.split()
+    if not parts or any(part in NOT_NAMES for part in parts):
+        return False
+    if _LATIN_NAME.fullmatch(' '.join(parts)):
+        return True
+    if not all(re.fullmatch(r'[가-힣]+', part) for part in parts):
+        return False
+    if len(parts) == 1:
+        word = parts[0]
+        if word[:2] in COMPOUND_SURNAMES:
+            return 3 <= len(word) <= 4
+        return word[0] in SURNAMES and 2 <= len(word) <= 3
+    return len(parts) == 2 and all(2 <= len(part) <= 5 and not part.endswith(_PLACE_SUFFIXES) for part in parts)
+
+
+def split_role(name):
+    """직함이 이름 앞뒤에 띄어 붙은 "소설가 김영하"·"김영하 소설가" → ('김영하', '소설가'), 없으면 (name, None)"""
+    parts = name.split()
+    for role in ENDORSER_ROLES:
+        if len(parts) > 1 and parts[0] == role:
+            return ' '.join(parts[1:]), role
+        if len(parts) > 1 and parts[-1] == role:
+            return ' '.join(parts[:-1]), role
+    return name, None
+
+
+def parse_attribution(text):
+    """
+    문단 끝 추천인 (이름, 직함, 추천인 앞 본문) — 없으면 None
+
+    "…눈부신 소설이다. —신형철(문학평론가)" → ('신형철', '문학평론가', '…눈부신 소설이다.')
+    """
+    text = text.strip()
+    match = _ATTRIBUTION.search(text)
+    if match:
+        name = ' '.join(match.group('name').split())
+        role = (match.group('role') or match.group('role2') or '').strip() or None
+        if role is None:
+            name, role = split_role(name)
+        # 대시 뒤가 문장(조사·서술어로 끝남)이거나, 직함 없이 이름 모양도 아니면 추천인이 아님
+        if (len(name.replace(' ', '')) <= 10 or _LATIN_NAME.fullmatch(name)) and not name.endswith(('다', '요', '까')) \
+                and (role is not None or is_person_name(name)):
+            return name, role, text[:match.start()].strip(' -_–—―~')
+
+    match = _NAME_ROLE.search(text)
+    if match:
+        return match.group('name'), match.group('role').strip(), text[:match.start()].strip(' -_–—―~')
+    return None
+
+
+def classify_paragraphs(paragraphs, min_excerpt_chars=MIN_EXCERPT_CHARS):
+    """
+    문단 목록에 type('endorsement' / 'excerpt' / 'other'), endorser, endorser_role 추가
+
+    본문 없이 추천인만 있는 문단은 바로 위 문단에 합친다.
+
+    Returns:
+        list: 분류된 문단 (제자리 수정, 합쳐진 추천인 문단은 빠짐)
+    """
+    classified = []
+    for paragraph in paragraphs:
+        text = paragraph['text'].strip()
+        paragraph.update(type='other', endorser=None, endorser_role=None)
+        # 주소·ISBN·가격 줄은 대시가 있어도 추천인으로 보지 않음
+        if _OTHER.search(text) and len(text) < 80:
+            classified.append(paragraph)
+            continue
+        attribution = parse_attribution(text)
+
+        if attribution is not None:
+            name, role, body = attribution
+            previous = classified[-1] if classified else None
+            if len(body) < 4 and previous is not None and \
+                    (previous['type'] != 'other' or len(previous['text']) >= min_excerpt_chars):
+                # 추천인만 있는 줄 → 위 문단의 추천인
+                previous.update(type='endorsement', endorser=name, endorser_role=role)
+                x0 = min(previous['bbox'][0][0], paragraph['bbox'][0][0])
+                x1 = max(previous['bbox'][1][0], paragraph['bbox'][1][0])
+                y0, y1 = previous['bbox'][0][1], paragraph['bbox'][2][1]
+                previous['bbox'] = [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+                previous['text'] = f"{previous['text']} {text}"
+                previous['lines'] = previous['lines'] + paragraph['lines']
+                continue
+            if len(body) >= 4:
+                paragraph.update(type='endorsement', endorser=name, endorser_role=role)
+                classified.append(paragraph)
+                continue
+
+        if _QUOTE_START.match(text) or len(text) >= min_excerpt_chars:
+            paragraph['type'] = 'excerpt'
+        classified.append(paragraph)
+    return classified
+
+
+def back_cover_paragraphs(results, para_gap=0.8):
+    """OCR 결과 → 분류된 문단 목록"""
+    return classify_paragraphs(segment_paragraphs(results, para_gap=para_gap))
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+띠지·뒷표지 문구에서 수상·선정·추천·영상화·미디어·언론·판매 언급 추출
+
+"2023 교보문고 소설가 50인이 뽑은 올해의 소설 2위 문학동네" 같은 원문 문자열을
+온톨로지 마케팅카피 공노드로 바꿀 수 있는 언급 레코드로 나눈다.
+    award       → obi:hasAwardMention      (awardName, awardEdition, awardYear, awardStatus)
+    selection   → obi:hasSelectionMention  (selectionCategory, selectionScope, selectionYear, issuedBy)
+    endorsement → obi:hasEndorsement       (endorsedBy, endorserRole)
+    adaptation  → obi:hasAdaptationMention (adaptationType, issuedBy)
+    media       → obi:hasMediaMention      (issuedBy)
+    press       → obi:hasPressCitation     (issuedBy, citationYear)
+    sales       → obi:hasSalesRecord       (salesMilestone)
+
+문구마다 공백을 지우고 소문자로 바꾼 문자열을 한 번만 훑는다:
+1. 수상명·언론사·방송/플랫폼·서점·기관·직함·선정 범주·영상화 어휘 전체를 하나의
+   Aho–Corasick 오토마톤으로 (pyahocorasick이 있으면 사용, 없으면 순수 파이썬 구현)
+2. 회차·순위·연도·부수·쇄·개국·연속 주·인원과 사전에 없는 "…문학상"을 하나로 묶은 정규식으로
+3. 구두점·줄바꿈으로 나눈 절(clause) 단위로 토큰을 모아 언급 레코드 조립
+OCR 잡음으로 띄어쓰기가 틀린 문구("올해의책", "종합베스트Top 1O")도 공백 제거 후 같은 토큰이 된다.
+
+사용 예:
+    python band_mentions.py                      # 전 연도 띠지·뒷표지 문구 추출 통계
+    python band_mentions.py --text "2023 교보문고 소설가 50인이 뽑은 올해의 소설 2위"
+    python band_mentions.py --years 2023 2024 --output mentions.json
+"""
+
+import argparse
+import json
+import re
+import time
+from bisect import bisect_right
+from collections import Counter, deque
+from pathlib import Path
+
+from back_cover_text import ENDORSER_ROLES, NOT_NAMES, is_person_name
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 오토마톤 어휘나 조립 규칙이 바뀌면 올려서 ABox 이미지 묶음을 다시 만들게 한다
+LEXICON_VERSION = "2"
+
+AWARDS = ('노벨문학상', '부커상', '맨부커상', '인터내셔널 부커상', '공쿠르상', '페미나상', '메디치상', '퓰리처상',
+          '전미도서상', '휴고상', '네뷸러상', '로커스상', '아쿠타가와상', '나오키상', '서점대상', '카프카상',
+          '에밀 기메 아시아문학상', '말라파르테 문학상', '산클레멘테 문학상', '이상문학상', '젊은작가상',
+          '동인문학상', '현대문학상', '황순원문학상', '김승옥문학상', '김유정문학상', '이효석문학상', '대산문학상',
+          '만해문학상', '신동엽문학상', '한국일보문학상', '박경리문학상', '문지문학상', '오늘의 작가상',
+          '한겨레문학상', '혼불문학상', '세계문학상', '문학동네소설상', '문학동네작가상', '문학동네 젊은작가상',
+          '창비장편소설상', '창비청소년문학상', '사계절문학상', '블루픽션상', '한국과학문학상', '황금드래곤문학상',
+          '교보문고 스토리공모전', '카카오페이지 공모전', '브런치북 대상', '중앙장편문학상', '제주4·3평화문학상',
+          '조선일보 신춘문예', '동아일보 신춘문예', '신춘문예')
+AWARD_STATUS = {'수상': '수상', '수상작': '수상', '대상': '수상', '최종후보': '최종후보', '최종심': '최종후보',
+                '쇼트리스트': '최종후보', '숏리스트': '최종후보', '후보': '후보', '롱리스트': '후보',
+                '노미네이트': '후보'}
+RETAILERS = {'교보문고': '교보문고', '예스24': '예스24', 'YES24': '예스24', '알라딘': '알라딘',
+             '인터파크': '인터파크', '영풍문고': '영풍문고', '반디앤루니스': '반디앤루니스', '리디북스': '리디북스',
+             '밀리의 서재': '밀리의 서재', '아마존': '아마존', 'Amazon': '아마존', '주요 서점': '주요 서점'}
+PRESS = {'뉴욕타임스': '뉴욕타임스', '뉴욕 타임스': '뉴욕타임스', 'NYT': '뉴욕타임스', 'New York Times': '뉴욕타임스',
+         '워싱턴포스트': '워싱턴포스트', '가디언': '가디언', '타임지': '타임', 'TIME': '타임', '르몽드': '르몽드',
+         '퍼블리셔스 위클리': '퍼블리셔스 위클리', '커커스 리뷰': '커커스 리뷰', '조선일보': '조선일보',
+         '중앙일보': '중앙일보', '동아일보': '동아일보', '한겨레': '한겨레', '경향신문': '경향신문',
+         '한국일보': '한국일보', '서울신문': '서울신문', '문화일보': '문화일보', '국민일보': '국민일보',
+         '세계일보': '세계일보', '매일경제': '매일경제', '한국경제': '한국경제', '연합뉴스': '연합뉴스',
+         '시사IN': '시사IN', '씨네21': '씨네21', '채널예스': '채널예스'}
+BROADCAST = {'넷플릭스': '넷플릭스', 'NETFLIX': '넷플릭스', '디즈니+': '디즈니+', '디즈니플러스': '디즈니+',
+             '왓챠': '왓챠', '웨이브': '웨이브', '티빙': '티빙', 'TVING': '티빙', '쿠팡플레이': '쿠팡플레이',
+             'KBS': 'KBS', 'MBC': 'MBC', 'SBS': 'SBS', 'JTBC': 'JTBC', 'tvN': 'tvN', 'EBS': 'EBS', 'OCN': 'OCN',
+             '유튜브': '유튜브', '알쓸신잡': 'tvN', '유 퀴즈': 'tvN', '책읽아웃': '채널예스',
+             '요즘책방': 'tvN', '책을 보다': 'EBS', '라디오': '라디오', '팟캐스트': '팟캐스트'}
+INSTITUTIONS = {'공공도서관': '공공도서관', '국립중앙도서관': '국립중앙도서관', '서울도서관': '서울도서관',
+                '한국출판문화산업진흥원': '한국출판문화산업진흥원', '문화체육관광부': '문화체육관광부',
+                '한국문학번역원': '한국문학번역원', '책읽는사회문화재단': '책읽는사회문화재단'}
+ROLES = ENDORSER_ROLES + ('서점인', '서점원', 'MD', '사서', '교사', '독자', '문학기자', '출판인')
+SELECTION_CATEGORIES = ('올해의 책', '올해의 소설', '올해의 한국소설', '올해의 작가', '올해의 문학', '올해의 한 책',
+                        '이달의 책', '이주의 책', '이달의 읽을 만한 책', '한 도시 한 책', '추천도서', '권장도서',
+                        '청소년 권장도서', '필독서', '최다 대출 도서', '최다 대출', '세종도서', '우수출판콘텐츠',
+                        '우수문학도서', '주목할 만한 책', '주목할 만한 작가', 'MD의 선택', '작가들이 뽑은 책')
+SELECTION_TRIGGERS = ('선정', '선정작', '선정 도서', '뽑은', '꼽은', '선택한')
+ENDORSE_TRIGGERS = ('추천', '강력 추천', '강추', '추천사', '극찬', '찬사', '격찬', '호평')
+ADAPTATIONS = {'드라마화': '드라마', '드라마 원작': '드라마', '드라마 방영': '드라마', '드라마 제작': '드라마',
+               '오리지널 시리즈': '드라마', '영화화': '영화', '영화 원작': '영화', '영화 개봉': '영화',
+               '영화 제작': '영화', '극장 개봉': '영화', '웹툰화': '웹툰', '웹툰 원작': '웹툰', '웹툰 연재': '웹툰',
+               '뮤지컬화': '뮤지컬', '뮤지컬 원작': '뮤지컬', '뮤지컬 초연': '뮤지컬', '애니메이션화': '애니메이션',
+               '애니메이션 원작': '애니메이션', '영상화': '', '원작 소설': '', '원작': ''}
+# "JTBC 드라마 <…> 원작"처럼 유형이 따로 적힌 경우
+ADAPTATION_MEDIA = ('드라마', '영화', '웹툰', '뮤지컬', '애니메이션')
+SALES_MILESTONES = ('베스트셀러', '밀리언셀러', '스테디셀러', '판권 수출', '번역 출간')
+SALES_WORDS = SALES_MILESTONES + ('수출', '판매', '돌파')
+SCOPES = ('전국', '전 세계', '전세계', '국내', '해외', '세계')
+
+# 절 단위 조립에 쓰는 경계 문자 (공백 제거 뒤에도 남는다)
+CLAUSE_BREAKS = frozenset(',，.。!?;·|/\n')
+QUOTED = re.compile(r'[\'‘"“「『<《]([^\'’"”」』>》]{2,30})[\'’"”」』>》]')
+# 직함 앞뒤에 붙지만 이름이 아닌 어절 ("수많은 작가", "이 시대의 작가", "유명 작가", "작가 강력 추천")
+NOT_ENDORSERS = NOT_NAMES | frozenset((
+    '수많은', '모든', '많은', '여러', '이', '그', '이 시대의', '시대의', '당대의', '사나', '유명', '유명한', '국내', '국내외',
+    '해외', '현직', '전직', '원로', '신인', '인기', '천재', '명사', '석학', '지성', '대표', '세계적', '최고의', '강력', '정의'))
+
+# 정규식 토큰 (공백 제거·소문자 문자열 기준, 한 번의 finditer로 모두 찾는다)
+NUMERIC = re.compile(
+    r'(?P<edition>제\d{1,3}회)'
+    r'|(?P<weeks>\d{1,3}주연속)'
+    r'|(?P<countries>\d{1,3}개(?:국|나라|언어))'
+    r'|(?P<places>\d{1,4}개(?:도시|지역|서점|도서관))'
+    r'|(?P<copies>\d+(?:[.,]\d+)?(?:백만|만|천)(?:부|권)(?:판매|돌파)?)'
+    r'|(?P<printing>\d{1,4}쇄)'
+    r'|(?P<rank>top\d{1,3}|\d{1,3}위)'
+    r'|(?P<people>\d{1,4}(?:인|명))'
+    r'|(?<!\d)(?P<year>(?:19|20)\d{2})(?!\d)'
+    r'|(?P<award>[가-힣]{2,6}(?:문학상|작가상|소설상|문학대상))')
+AWARD_NAME = re.compile(r'[가-힣]{2,6}(?:문학상|작가상|소설상|문학대상)')
+SALES_KINDS = frozenset(('weeks', 'countries', 'copies', 'printing', 'sales'))
+
+
+def compact(text):
+    """
+    공백을 지우고 소문자로 바꾼 문자열
+
+    Returns:
+        (compacted, positions, breaks) positions[i]: compacted[i]의 원문 위치,
+        breaks: 절 경계의 compacted 위치 (정렬됨)
+    """
+    chars, positions, breaks = [], [], []
+    for i, ch in enumerate(text):
+        if ch in CLAUSE_BREAKS:
+            breaks.append(len(chars))
+        if ch.isspace():
+            # "2018 2017"이 한 숫자로 붙지 않게 숫자 사이 공백은 하나 남김
+            if chars and chars[-1].isdigit() and text[i + 1:i + 2].isdigit():
+                chars.append(' ')
+                positions.append(i)
+            continue
+        chars.append(ch.lower())
+        positions.append(i)
+    return ''.join(chars), positions, breaks
+
+
+class AhoCorasick:
+    """pyahocorasick.Automaton과 같은 인터페이스(add_word / make_automaton / iter)의 순수 파이썬 구현"""
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+    def add_word(self, key, value):
+        node = 0
+        for ch in key:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] = (value,)
+
+    def make_automaton(self):
+        """BFS로 실패 링크를 만들고 출력 목록에 실패 경로의 출력을 합침"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+                queue.append(nxt)
+
+    def iter(self, text):
+        """(끝 위치, 값) — 겹치는 일치도 모두"""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for value in out[node]:
+                yield i, value
+
+
+def new_automaton():
+    return ahocorasick.Automaton() if ahocorasick is not None else AhoCorasick()
+
+
+def lexicon_entries():
+    """(표면형, 종류, 대표형) 목록"""
+    entries = []
+
+    def add(kind, words):
+        items = words.items() if isinstance(words, dict) else ((word, word) for word in words)
+        entries.extend((surface, kind, canonical) for surface, canonical in items)
+
+    add('award', AWARDS)
+    add('status', AWARD_STATUS)
+    add('retailer', RETAILERS)
+    add('press', PRESS)
+    add('broadcast', BROADCAST)
+    add('institution', INSTITUTIONS)
+    add('role', ROLES)
+    add('category', SELECTION_CATEGORIES)
+    add('select', SELECTION_TRIGGERS)
+    add('endorse', ENDORSE_TRIGGERS)
+    add('adaptation', ADAPTATIONS)
+    add('medium', ADAPTATION_MEDIA)
+    add('sales', SALES_WORDS)
+    add('scope', SCOPES)
+    return entries
+
+
+class MentionExtractor:
+    _default = None
+
+    def __init__(self, entries=None):
+        """
+        언급 추출기 (오토마톤은 생성 시 한 번만 만든다)
+
+        Args:
+            entries (list): (표면형, 종류, 대표형) 목록 (기본: lexicon_entries())
+        """
+        merged = {}
+        for surface, kind, canonical in entries or lexicon_entries():
+            key = compact(surface)[0]
+            merged.setdefault(key, {})[kind] = canonical
+        self.automaton = new_automaton()
+        for key, kinds in merged.items():
+            self.automaton.add_word(key, (len(key), tuple(sorted(kinds.items()))))
+        self.automaton.make_automaton()
+        self.size = len(merged)
+
+    @classmethod
+    def default(cls):
+        """프로세스 공용 추출기"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def tokens(self, text, compacted, positions):
+        """
+        사전·정규식 토큰 [(시작, 끝, 종류, 값), ...] (compacted 위치, 시작 순)
+
+        더 긴 토큰에 완전히 포함된 토큰("젊은작가상" 안의 "작가")은 버린다.
+        """
+        found = []
+        for end, (length, kinds) in self.automaton.iter(compacted):
+            for kind, canonical in kinds:
+                found.append((end + 1 - length, end + 1, kind, canonical))
+        lexicon_awards = [(start, end) for start, end, kind, _ in found if kind == 'award']
+        for match in NUMERIC.finditer(compacted):
+            kind = match.lastgroup
+            start, end = match.span()
+            # 사전에 있는 상 이름이 걸리면 "…문학상" 정규식 결과는 버림
+            if kind == 'award':
+                if any(start < e and s < end for s, e in lexicon_awards):
+                    continue
+                # "한국 최초 노벨문학상" → 원문에서 상 이름이 붙은 마지막 어절만
+                name = text[positions[start]:positions[end - 1] + 1].split()[-1]
+                if not AWARD_NAME.fullmatch(name):
+                    continue
+                start = end - len(name)
+                found.append((start, end, kind, name))
+                continue
+            found.append((start, end, kind, match.group()))
+
+        found.sort(key=lambda token: (token[0], token[0] - token[1]))
+        kept = []
+        cover = (-1, -1)
+        for token in found:
+            start, end = token[0], token[1]
+            if end < cover[1] or (end == cover[1] and start > cover[0]):
+                continue
+            kept.append(token)
+            if end > cover[1]:
+                cover = (start, end)
+        return kept
+
+    def extract(self, text):
+        """문구 하나의 언급 레코드 목록"""
+        if not text:
+            return []
+        compacted, positions, breaks = compact(text)
+        clauses = {}
+        for token in self.tokens(text, compacted, positions):
+            clauses.setdefault(bisect_right(breaks, token[0]), []).append(token)
+
+        mentions = []
+        for index, tokens in sorted(clauses.items()):
+            start = breaks[index - 1] if index else 0
+            end = breaks[index] if index < len(breaks) else len(compacted)
+            if start >= end:
+                continue
+            clause = text[positions[start]:positions[end - 1] + 1].strip(' ,.·|/;')
+            mentions.extend(assemble(text, positions, clause, tokens))
+        return mentions
+
+
+def span_text(text, positions, tokens):
+    """토큰 묶음이 걸친 원문 부분 문자열"""
+    return text[positions[tokens[0][0]]:positions[tokens[-1][1] - 1] + 1]
+
+
+def runs_text(text, positions, tokens, gap=2):
+    """붙어 있는(사이 gap자 이하) 토큰끼리 묶은 원문 조각을 공백으로 이음"""
+    runs = []
+    for token in tokens:
+        if runs and token[0] - runs[-1][-1][1] <= gap:
+            runs[-1].append(token)
+        else:
+            runs.append([token])
+    return ' '.join(span_text(text, positions, run) for run in runs)
+
+
+def nearest(tokens, kind, position, before=True):
+    """position 앞(또는 뒤)의 가장 가까운 kind 토큰"""
+    candidates = [token for token in tokens if token[2] == kind and
+                  (token[1] <= position if before else token[0] >= position)]
+    if not candidates:
+        return None
+    return candidates[-1] if before else candidates[0]
+
+
+def endorser_name(text, positions, role):
+    """
+    직함 바로 뒤(또는 앞) 어절이 추천인 이름이면 그 이름 ("소설가 김영하", "정세랑 소설가", "김영하의 극찬")
+
+    back_cover_text.is_person_name의 이름 모양(성+이름, 복성+이름)이어야 하고 NOT_ENDORSERS가 아니어야 한다.
+    "수많은 작가", "이 시대의 작가"처럼 이름이 없으면 None — 언급은 endorserRole만 가진다.
+    """
+    after = text[positions[role[1] - 1] + 1:]
+    before = text[:positions[role[0]]]
+    # "작가들의 찬사"처럼 직함에 조사가 붙은 경우는 이름 없음
+    candidates = (after.split()[:1] if after[:1].isspace() else [],
+                  before.split()[-1:] if before[-1:].isspace() else [])
+    for words in candidates:
+        if not words:
+            continue
+        word = words[0][:-1] if words[0].endswith('의') and len(words[0]) > 2 else words[0]
+        if word in NOT_ENDORSERS or any(trigger.startswith(word) or trigger in word
+                                        for trigger in ENDORSE_TRIGGERS + SELECTION_TRIGGERS):
+            continue
+        if is_person_name(word):
+            return word
+    return None
+
+
+def assemble(text, positions, clause, tokens):
+    """절 하나의 토큰으로 언급 레코드 조립"""
+    kinds = Counter(token[2] for token in tokens)
+    mentions = []
+    years = [token for token in tokens if token[2] == 'year']
+    issuers = [token[3] for token in tokens if token[2] in ('retailer', 'press', 'institution', 'broadcast')]
+
+    # 수상: 상 이름마다 한 건, 앞의 회차·연도와 뒤의 상태를 붙인다
+    awards = [token for token in tokens if token[2] == 'award']
+    for i, award in enumerate(awards):
+        limit = awards[i + 1][0] if i + 1 < len(awards) else len(text)
+        edition = nearest(tokens, 'edition', award[0])
+        status = nearest([token for token in tokens if token[0] < limit], 'status', award[1], before=False)
+        year = nearest(tokens, 'year', award[0]) or (years[0] if years else None)
+        mentions.append({'type': 'award', 'text': clause, 'award': award[3],
+                         'edition': int(re.sub(r'\D', '', edition[3])) if edition else None,
+                         'status': status[3] if status else None, 'year': year[3] if year else None})
+
+    # 선정: 범주 어휘, 또는 "선정·뽑은" + 따옴표 범주
+    category = next((token[3] for token in tokens if token[2] == 'category'), None)
+    if category is None and kinds['select']:
+        quoted = QUOTED.search(clause)
+        category = quoted.group(1).strip() if quoted else None
+    if category is not None:
+        scope = [span_text(text, positions, [token]) for token in tokens if token[2] in ('scope', 'places')]
+        role = next((token for token in tokens if token[2] == 'role'), None)
+        people = next((token for token in tokens if token[2] == 'people'), None)
+        if role and people:
+            scope.append(span_text(text, positions, [role, people]))
+        rank = next((token[3] for token in tokens if token[2] == 'rank'), None)
+        mentions.append({'type': 'selection', 'text': clause, 'category': category,
+                         'scope': ' '.join(scope) or None, 'year': years[0][3] if years else None,
+                         'rank': rank, 'issuers': sorted(set(issuers))})
+
+    # 추천: 직함 + 추천·극찬 어휘 (선정 주체인 "소설가 50인"은 제외)
+    if kinds['role'] and kinds['endorse'] and category is None:
+        for role in (token for token in tokens if token[2] == 'role'):
+            mentions.append({'type': 'endorsement', 'text': clause, 'endorser_role': role[3],
+                             'endorser': endorser_name(text, positions, role)})
+
+    # 영상화: 유형 어휘, 방송·플랫폼은 제작·공개 주체
+    adaptations = [token for token in tokens if token[2] == 'adaptation']
+    if adaptations:
+        kind = next((token[3] for token in adaptations if token[3]),
+                    next((token[3] for token in tokens if token[2] == 'medium'), None))
+        mentions.append({'type': 'adaptation', 'text': clause, 'adaptation_type': kind,
+                         'issuers': sorted({token[3] for token in tokens if token[2] == 'broadcast'})})
+    elif kinds['broadcast'] and category is None:
+        for outlet in sorted({token[3] for token in tokens if token[2] == 'broadcast'}):
+            mentions.append({'type': 'media', 'text': clause, 'outlet': outlet})
+
+    # 언론: 선정 주체가 아닌 언론사 이름
+    if kinds['press'] and category is None:
+        for outlet in sorted({token[3] for token in tokens if token[2] == 'press'}):
+            mentions.append({'type': 'press', 'text': clause, 'outlet': outlet,
+                             'year': years[0][3] if years else None})
+
+    # 판매: 부수·쇄·개국·연속 주·판매 어휘, 선정이 아니면 서점 순위도
+    sales = [token for token in tokens if token[2] in SALES_KINDS or
+             (token[2] == 'rank' and category is None and (kinds['retailer'] or kinds['sales']))]
+    if any(token[2] != 'sales' or token[3] in SALES_MILESTONES for token in sales):
+        mentions.append({'type': 'sales', 'text': clause, 'milestone': runs_text(text, positions, sales)})
+    return mentions
+
+
+# ---------------------------------------------------------------- 말뭉치
+
+def band_texts(years=None):
+    """(연도, ItemId, 면, 문구) — 앞표지 띠지 텍스트와 뒷표지 문단"""
+    from abox_generator import band_file, images_by_item, year_dirs
+
+    for year, year_dir in year_dirs(years):
+        belly_dir = year_dir / "belly_bands"
+        for surface, directory in (('front', "covers"), ('back', "back_covers")):
+            for item_id, image_file in sorted(images_by_item(year_dir / directory).items()):
+                path = band_file(belly_dir, image_file)
+                if path is None:
+                    continue
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('has_belly_band'):
+                    text = (data.get('belly_band') or {}).get('text') if 'belly_band' in data \
+                        else data.get('belly_band_text')
+                    if text:
+                        yield year, item_id, surface, text
+                for paragraph in data.get('paragraphs', []):
+                    if paragraph['type'] != 'other':
+                        yield year, item_id, surface, paragraph['text']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="띠지·뒷표지 문구 언급 추출")
+    parser.add_argument('--years', nargs='+', type=int, help="대상 연도 (기본: 전체)")
+    parser.add_argument('--text', help="문구 하나만 추출해 출력")
+    parser.add_argument('--output', help="언급 레코드 JSON 저장 파일")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    extractor = MentionExtractor.default()
+    build_time = time.perf_counter() - started
+    print(f"오토마톤: 어휘 {extractor.size}개, 생성 {build_time * 1000:.1f}ms "
+          f"({'pyahocorasick' if ahocorasick is not None else '순수 파이썬'})")
+
+    if args.text:
+        for mention in extractor.extract(args.text):
+            print(json.dumps(mention, ensure_ascii=False))
+        return
+
+    texts = list(band_texts(args.years))
+    started = time.perf_counter()
+    results = [(year, item_id, surface, text, extractor.extract(text)) for year, item_id, surface, text in texts]
+    elapsed = time.perf_counter() - started
+
+    counts = Counter(mention['type'] for *_, mentions in results for mention in mentions)
+    chars = sum(len(text) for _, _, _, text, _ in results)
+    print(f"문구 {len(results)}개 ({chars:,}자), 언급 {sum(counts.values())}개: {elapsed * 1000:.1f}ms "
+          f"({chars / max(elapsed, 1e-9) / 1e6:.2f}M자/s)")
+    for kind, count in counts.most_common():
+        print(f"  {kind:<12} {count}")
+
+    if args.output:
+        records = [{'year': year, 'item_id': item_id, 'surface': surface, 'text': text, 'mentions': mentions}
+                   for year, item_id, surface, text, mentions in results if mentions]
+        Path(args.output).write_text(json.dumps(records, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
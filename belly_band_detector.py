@@ -9,21 +9,297 @@
 2. 배경색이 주변과 다른 경우가 많음
 3. 텍스트 밀도가 높음
 4. 보통 하단 1/3 또는 중앙에 위치
+
+뒷표지(back_covers, *_back.jpg)는 띠지 영역 제안 없이 전체 이미지를 같은 배치 OCR에 넣고,
+추천사·본문 발췌 문단을 back_cover_text로 나눠 결과에 함께 저장한다.
+
+image_ingest가 만든 정규화 파생본(팩 normalized/{kind}.pack, 없으면 파생본 파일)이 있으면
+원본 대신 그것을 디코딩한다. 원본과 내용 해시·크기가 같은 파생본만 쓰므로 좌표는 원본 기준 그대로다.
 """
 
+import argparse
 import cv2
 import numpy as np
-import easyocr
 from pathlib import Path
 import json
+import hashlib
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+from back_cover_text import back_cover_paragraphs
+from catalog import Catalog, parse_image_path
+from image_index import ImageHashIndex
+from image_ingest import NORMALIZED_DIR, ImagePack, pack_index_path
+from ocr_backends import create_backend, load_backend_config
+from ocr_store import STORE_FILE, OcrStore
+
+# 검출 로직/출력 형식이 바뀌면 올려서 증분 처리 manifest를 무효화
+DETECTOR_VERSION = "1.3"
+MANIFEST_FILE = "belly_band_manifest.json"
+PROPOSAL_WIDTH = 320  # 띠지 영역 제안 시 축소 너비 (px)
+CROP_EDGE_TOLERANCE = 2  # 영역 OCR 띠지가 잘린 가장자리에 이만큼(px) 붙어 있으면 잘린 것으로 봄
+SURFACE_DIRS = {'front': "covers", 'back': "back_covers"}
+PARAGRAPH_COLORS = {'endorsement': (255, 0, 255), 'excerpt': (255, 128, 0), 'other': (160, 160, 160)}
+
+# 프로세스 풀 워커별 검출기 (워커마다 OCR 백엔드 1개 유지)
+_worker_detector = None
+
+
+def _init_worker(threads, params):
+    """프로세스 풀 워커 초기화: CPU 전용 검출기 생성"""
+    global _worker_detector
+    _worker_detector = BellyBandDetector(use_gpu=False, **params)
+    _worker_detector.reader.limit_threads(threads)
+
+
+def file_sha256(path):
+    """이미지 파일 내용 해시"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def image_surface(path):
+    """이미지 경로의 표지 면 ('front' / 'back')"""
+    return parse_image_path(path)['kind']
+
+
+def results_to_arrays(results):
+    """EasyOCR 결과 목록을 (N,4,2) bbox 배열과 (N,) 신뢰도 배열로 변환"""
+    bboxes = np.array([result[0] for result in results], dtype=np.float64).reshape(-1, 4, 2)
+    confidences = np.array([result[2] for result in results], dtype=np.float64)
+    return bboxes, confidences
+
+
+def score_ocr_batch(shapes, offsets, bboxes, confidences, y_threshold=30, min_aspect_ratio=2.0,
+                    min_width_ratio=0.3):
+    """
+    여러 이미지의 OCR 결과를 한 번에 그룹화·점수화 (벡터화)
+
+    Args:
+        shapes: (M, 2+) 이미지별 (높이, 너비)
+        offsets: (M+1,) 이미지 i의 블록 = offsets[i]:offsets[i+1]
+        bboxes: (N, 4, 2) 블록 bbox
+        confidences: (N,) 블록 신뢰도
+
+    Returns:
+        dict: order (N,) 이미지·중심 y 순 블록 인덱스,
+              group_start/group_size/group_image (G,) order 상의 그룹 범위와 이미지,
+              group_bbox (G, 4) [x_min, y_min, x_max, y_max],
+              group_confidence/group_position (G,), is_candidate (G,),
+              best_group (M,) 이미지별 최선 후보 그룹 (없으면 -1)
+    """
+    shapes = np.asarray(shapes)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4, 2)
+    confidences = np.asarray(confidences, dtype=np.float64)
+    n_images = len(offsets) - 1
+    n_blocks = len(bboxes)
+
+    empty_groups = np.zeros(0, dtype=np.int64)
+    if n_blocks == 0:
+        return {
+            'order': empty_groups, 'group_start': empty_groups, 'group_size': empty_groups,
+            'group_image': empty_groups, 'group_bbox': np.zeros((0, 4)),
+            'group_confidence': np.zeros(0), 'group_position': np.zeros(0),
+            'is_candidate': np.zeros(0, dtype=bool), 'best_group': np.full(n_images, -1, dtype=np.int64)
+        }
+
+    # 블록 중심 y, 이미지 번호 — 이미지별로 y 안정 정렬
+    image_of = np.repeat(np.arange(n_images), np.diff(offsets))
+    center_y = bboxes[:, :, 1].mean(axis=1)
+    order = np.lexsort((center_y, image_of))
+    sorted_y = center_y[order]
+    sorted_image = image_of[order]
+
+    # 그룹 시작 = 직전 그룹 시작점에서 y_threshold 이상 떨어진 첫 블록.
+    # 이미지마다 충분히 큰 y 오프셋을 더해 하나의 정렬 배열에서 searchsorted로 다음 시작점 계산
+    span = sorted_y.max() - sorted_y.min() + y_threshold + 1
+    keyed_y = sorted_y + sorted_image * span
+    next_start = np.searchsorted(keyed_y, keyed_y + y_threshold, side='left')
+
+    is_start = np.zeros(n_blocks + 1, dtype=bool)
+    frontier = np.unique(np.searchsorted(sorted_image, np.arange(n_images)))
+    frontier = frontier[frontier < n_blocks]
+    while len(frontier):
+        is_start[frontier] = True
+        frontier = next_start[frontier]
+        frontier = frontier[(frontier < n_blocks) & ~is_start[frontier]]
+
+    group_start = np.flatnonzero(is_start[:n_blocks])
+    group_size = np.diff(np.append(group_start, n_blocks))
+    group_image = sorted_image[group_start]
+
+    # 그룹 bbox·신뢰도·위치 reduce
+    sorted_boxes = bboxes[order]
+    x_min = np.minimum.reduceat(sorted_boxes[:, :, 0].min(axis=1), group_start)
+    y_min = np.minimum.reduceat(sorted_boxes[:, :, 1].min(axis=1), group_start)
+    x_max = np.maximum.reduceat(sorted_boxes[:, :, 0].max(axis=1), group_start)
+    y_max = np.maximum.reduceat(sorted_boxes[:, :, 1].max(axis=1), group_start)
+    group_confidence = np.add.reduceat(confidences[order], group_start) / group_size
+
+    heights = shapes[group_image, 0].astype(np.float64)
+    widths = shapes[group_image, 1].astype(np.float64)
+    group_position = (y_min + y_max) / 2 / heights
+
+    # 최소 2개 블록 + 가로 띠 형태 (너비 ≥ 높이×비율, 너비 ≥ 이미지 너비×비율)
+    band_width = x_max - x_min
+    band_height = y_max - y_min
+    is_candidate = ((group_size >= 2)
+                    & (band_width >= band_height * min_aspect_ratio)
+                    & (band_width >= widths * min_width_ratio))
+
+    # 이미지별 최선 후보: 블록 수 × 평균 신뢰도 최대 (동점이면 위쪽 그룹)
+    best_group = np.full(n_images, -1, dtype=np.int64)
+    candidates = np.flatnonzero(is_candidate)
+    if len(candidates):
+        score = group_size[candidates] * group_confidence[candidates]
+        ranked = candidates[np.lexsort((candidates, -score, group_image[candidates]))]
+        first = np.unique(group_image[ranked], return_index=True)[1]
+        best_group[group_image[ranked[first]]] = ranked[first]
+
+    return {
+        'order': order,
+        'group_start': group_start,
+        'group_size': group_size,
+        'group_image': group_image,
+        'group_bbox': np.stack([x_min, y_min, x_max, y_max], axis=1),
+        'group_confidence': group_confidence,
+        'group_position': group_position,
+        'is_candidate': is_candidate,
+        'best_group': best_group
+    }
+
+
+def group_texts(scored, texts, group):
+    """score_ocr_batch 그룹의 블록 텍스트를 y 순서대로 연결"""
+    start = scored['group_start'][group]
+    indices = scored['order'][start:start + scored['group_size'][group]]
+    return ' '.join(texts[i] for i in indices)
+
+
+def bbox_corners(box):
+    """[x_min, y_min, x_max, y_max] → 4개 꼭짓점 bbox"""
+    x_min, y_min, x_max, y_max = (float(v) for v in box)
+    return [[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]
+
+
+def _same_size(entry, width, height):
+    return entry.get('width') == width and entry.get('height') == height
+
+
+def derivative_sources(input_paths, hashes, catalog):
+    """
+    원본 대신 읽을 정규화 파생본 {파일명: (팩 경로, 항목 이름) 또는 (None, 파생본 경로)}
+
+    image_meta의 내용 해시가 현재 원본과 같고 축소되지 않은(bbox 좌표가 원본과 같은) 파생본만 고른다.
+    """
+    sources = {}
+    for input_path in input_paths:
+        pack_path = input_path.parent / NORMALIZED_DIR / f"{input_path.name}.pack"
+        if not (pack_path.exists() and pack_index_path(pack_path).exists()):
+            continue
+        with open(pack_index_path(pack_path), 'r', encoding='utf-8') as f:
+            entries = json.load(f)['entries']
+        for entry in entries:
+            if entry['sha256'] and entry['sha256'] == hashes.get(entry['name']) \
+                    and _same_size(entry, entry['original_width'], entry['original_height']):
+                sources[entry['name']] = (str(pack_path), entry['name'])
+
+    for input_path in input_paths:
+        for path in catalog.image_files(input_path):
+            if path.name in sources or path.name not in hashes:
+                continue
+            meta = catalog.image_meta(path)
+            if not meta or meta['status'] != 'ok' or meta['sha256'] != hashes[path.name] \
+                    or not meta['normalized_path'] or not Path(meta['normalized_path']).exists():
+                continue
+            if meta['normalized_width'] == meta['width'] and meta['normalized_height'] == meta['height']:
+                sources[path.name] = (None, meta['normalized_path'])
+    return sources
+
+
+_open_packs = {}
+
+
+def read_image(image_file, sources=None):
+    """원본 또는 정규화 파생본(팩 버퍼·파일)에서 BGR 이미지 읽기"""
+    source = (sources or {}).get(Path(image_file).name)
+    if source is None:
+        return cv2.imread(str(image_file))
+    pack_path, name = source
+    if pack_path is None:
+        return cv2.imread(name)
+    if pack_path not in _open_packs:
+        _open_packs[pack_path] = ImagePack(pack_path)
+    return _open_packs[pack_path].image(name)
+
+
+def close_packs():
+    while _open_packs:
+        _open_packs.popitem()[1].close()
+
+
+def _process_chunk(image_files, output_dir, batch_size, hashes, sources):
+    """프로세스 풀 워커에서 이미지 묶음 처리 (요약 항목, OCR 저장소 반환)"""
+    ocr_store = OcrStore()
+    try:
+        summary = _worker_detector.process_files(image_files, Path(output_dir), batch_size=batch_size,
+                                                 ocr_store=ocr_store, hashes=hashes, sources=sources)
+    finally:
+        close_packs()
+    return summary, ocr_store
+
 class BellyBandDetector:
-    def __init__(self, use_gpu=True):
-        """띠지 검출기 초기화"""
-        print("EasyOCR 초기화 중...")
-        self.reader = easyocr.Reader(['ko', 'en'], gpu=use_gpu)
-        print("초기화 완료!")
+    def __init__(self, use_gpu=None, y_threshold=30, min_aspect_ratio=2.0, min_width_ratio=0.3,
+                 propose_regions=False, crop_min_confidence=0.6, ocr_backend='easyocr', ocr_options=None):
+        """
+        띠지 검출기 초기화
+
+        Args:
+            use_gpu (bool): EasyOCR GPU 사용 여부 (None이면 CUDA 사용 가능 여부로 자동 결정)
+            y_threshold (float): 같은 줄로 묶을 텍스트 중심 y 거리 (px)
+            min_aspect_ratio (float): 띠지 그룹 최소 가로/세로 비
+            min_width_ratio (float): 띠지 그룹 최소 너비 (이미지 너비 대비)
+            propose_regions (bool): OCR 전에 띠지 후보 가로 영역만 잘라 OCR (crop 재현율이 아직 낮아 기본 끔)
+            crop_min_confidence (float): 영역 OCR의 최선 띠지 후보가 이 신뢰도보다 낮거나 영역 경계에 잘려 있으면
+                                         전체 이미지로 다시 OCR
+            ocr_backend (str): OCR 백엔드 이름 (ocr_backends.BACKENDS: easyocr, tesseract)
+            ocr_options (dict): 백엔드 생성 옵션
+        """
+        self.use_gpu = use_gpu
+        self.y_threshold = y_threshold
+        self.min_aspect_ratio = min_aspect_ratio
+        self.min_width_ratio = min_width_ratio
+        self.propose_regions = propose_regions
+        self.crop_min_confidence = crop_min_confidence
+        self.ocr_backend = ocr_backend
+        self.ocr_options = dict(ocr_options or {})
+        self._reader = None
+        self.ocr_stats = {'images': 0, 'cropped': 0, 'fallback': 0, 'ocr_pixels': 0, 'full_pixels': 0}
+
+    @property
+    def reader(self):
+        """OCR 백엔드 (모델은 처음 OCR할 때 로드, re-score 모드에서는 로드하지 않음)"""
+        if self._reader is None:
+            options = dict(self.ocr_options)
+            if self.ocr_backend == 'easyocr':
+                options.setdefault('gpu', self.use_gpu)
+            self._reader = create_backend(self.ocr_backend, **options)
+        return self._reader
+
+    def params(self):
+        """결과에 영향을 주는 검출 파라미터 (manifest 비교용)"""
+        return {
+            'y_threshold': self.y_threshold,
+            'min_aspect_ratio': self.min_aspect_ratio,
+            'min_width_ratio': self.min_width_ratio,
+            'propose_regions': self.propose_regions,
+            'crop_min_confidence': self.crop_min_confidence,
+            'ocr_backend': self.ocr_backend,
+            'ocr_options': self.ocr_options
+        }
 
     def detect_text_regions(self, image_path):
         """이미지에서 모든 텍스트 영역 검출"""
@@ -31,101 +307,198 @@ class BellyBandDetector:
         if image is None:
             return None, []
 
-        # OCR로 텍스트 검출
-        results = self.reader.readtext(str(image_path))
+        # 디코드한 배열을 그대로 OCR에 전달 (파일을 두 번 읽지 않음)
+        if self.propose_regions:
+            results = self.ocr_images([image], surfaces=[image_surface(image_path)])[0]
+        else:
+            results = self.reader.readtext(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
 
         return image, results
 
-    def is_horizontal_band(self, bbox, image_shape):
-        """바운딩 박스가 가로 띠 형태인지 판단"""
-        # bbox: [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
-        points = np.array(bbox)
+    def detect_text_regions_batch(self, images, batch_size=8):
+        """
+        디코드된 이미지 목록을 배치로 OCR
 
-        # 너비와 높이 계산
-        width = np.linalg.norm(points[1] - points[0])
-        height = np.linalg.norm(points[2] - points[1])
+        크기가 다른 이미지는 오른쪽/아래에 여백을 덧대 같은 크기로 맞추므로
+        bbox 좌표는 원본 이미지 좌표 그대로 유지된다.
+        """
+        if not images:
+            return []
 
-        # 가로가 세로보다 충분히 긴지 확인
-        if width < height * 2:
-            return False
+        max_h = max(image.shape[0] for image in images)
+        max_w = max(image.shape[1] for image in images)
 
-        # 이미지 너비의 일정 비율 이상인지 확인
-        img_width = image_shape[1]
-        if width < img_width * 0.3:  # 이미지 너비의 30% 이상
-            return False
+        padded = []
+        for image in images:
+            h, w = image.shape[:2]
+            rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            if (h, w) != (max_h, max_w):
+                rgb = cv2.copyMakeBorder(rgb, 0, max_h - h, 0, max_w - w,
+                                         cv2.BORDER_CONSTANT, value=(255, 255, 255))
+            padded.append(rgb)
 
-        return True
+        return self.reader.readtext_batched(padded, batch_size=batch_size)
 
-    def group_nearby_texts(self, results, image_shape, y_threshold=30):
-        """가까운 텍스트들을 그룹화하여 띠지 후보 찾기"""
-        if not results:
-            return []
+    def propose_band_regions(self, image, width=PROPOSAL_WIDTH, top_k=3, line_gap=0.03, padding=0.02,
+                             max_coverage=0.6):
+        """
+        OCR 없이 띠지가 있을 만한 가로 영역 제안 (OpenCV만 사용, 수 ms)
 
-        # y 좌표 기준으로 정렬
-        sorted_results = sorted(results, key=lambda x: np.mean([p[1] for p in x[0]]))
+        1. 축소 이미지의 형태학적 그래디언트를 이진화하고 가로로 닫아 글자를 줄 단위로 연결
+        2. 텍스트 줄 모양(높이·가로세로비·채움 비율)의 연결 요소만 남김
+        3. 행 방향으로 가까운 줄을 가로 띠(strip)로 묶고, 너비 점유율·줄 수·하단 1/3 가중치로 점수화
+        4. 상위 top_k개 띠를 여백을 붙여 원본 좌표로 변환
 
-        groups = []
-        current_group = [sorted_results[0]]
-        current_y = np.mean([p[1] for p in sorted_results[0][0]])
+        Returns:
+            list: [(y_start, y_end), ...] 원본 이미지 행 범위, 제안이 없거나
+                  전체 이미지의 max_coverage를 넘으면 빈 목록 (전체 이미지 OCR)
+        """
+        h, w = image.shape[:2]
+        small_h = max(1, round(h * width / w))
+        small = cv2.resize(image, (width, small_h), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
 
-        for result in sorted_results[1:]:
-            result_y = np.mean([p[1] for p in result[0]])
+        gradient = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT,
+                                    cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
+        _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE,
+                                  cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1)))
 
-            # y 좌표가 비슷하면 같은 그룹
-            if abs(result_y - current_y) < y_threshold:
-                current_group.append(result)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        x, y, comp_w, comp_h, area = stats[1:].T
+        is_line = ((comp_h >= 0.008 * small_h) & (comp_h <= 0.12 * small_h)
+                   & (comp_w >= comp_h * 1.2) & (area >= 0.4 * comp_w * comp_h))
+        order = np.argsort(y[is_line], kind='stable')
+        x, y, comp_w, comp_h = (v[is_line][order] for v in (x, y, comp_w, comp_h))
+
+        # 행 방향으로 가까운 텍스트 줄을 가로 띠로 묶음
+        strips = []
+        for x0, y0, cw, ch in zip(x, y, comp_w, comp_h):
+            if strips and y0 <= strips[-1]['end'] + line_gap * small_h:
+                strips[-1]['end'] = max(strips[-1]['end'], y0 + ch)
+                strips[-1]['columns'][x0:x0 + cw] = True
+                strips[-1]['lines'] += 1
             else:
-                if len(current_group) >= 2:  # 최소 2개 이상의 텍스트
-                    groups.append(current_group)
-                current_group = [result]
-                current_y = result_y
+                columns = np.zeros(width, dtype=bool)
+                columns[x0:x0 + cw] = True
+                strips.append({'start': y0, 'end': y0 + ch, 'columns': columns, 'lines': 1})
+
+        scored = []
+        for strip in strips:
+            coverage = strip['columns'].mean()
+            if coverage < 0.2:
+                continue
+            center = (strip['start'] + strip['end']) / 2
+            score = coverage * np.sqrt(strip['lines']) * (1.5 if center > small_h * 2 / 3 else 1.0)
+            scored.append((score, strip['start'], strip['end']))
+        scored.sort(key=lambda item: -item[0])
+
+        pad = max(1, round(padding * small_h))
+        scale = h / small_h
+        regions = []
+        for _, start, end in sorted(scored[:top_k], key=lambda item: item[1]):
+            start, end = max(0, start - pad), min(small_h, end + pad)
+            if regions and start <= regions[-1][1]:
+                regions[-1][1] = max(regions[-1][1], end)
+            else:
+                regions.append([start, end])
+
+        regions = [(int(start * scale), min(h, int(np.ceil(end * scale)))) for start, end in regions]
+        if sum(end - start for start, end in regions) > max_coverage * h:
+            return []
+        return regions
+
+    def ocr_images(self, images, batch_size=8, surfaces=None):
+        """
+        제안 영역만 잘라 배치 OCR하고, 영역 결과를 믿을 수 없으면 전체 이미지로 다시 OCR
+        (띠지 후보 없음, 최선 후보 신뢰도가 crop_min_confidence 미만, 최선 후보가 영역 경계에 잘림)
+
+        뒷표지(surfaces[i] == 'back')는 문단 전체가 필요하므로 영역 제안 없이
+        전체 이미지 배치에 바로 넣는다. bbox는 원본 이미지 좌표로 되돌려 반환한다.
+        """
+        if not self.propose_regions:
+            return self.detect_text_regions_batch(images, batch_size=batch_size)
+
+        surfaces = surfaces or ['front'] * len(images)
+        all_results = [None] * len(images)
+        crops, owners, full = [], [], []
+        proposed = {}
+        for i, image in enumerate(images):
+            regions = self.propose_band_regions(image) if surfaces[i] != 'back' else []
+            if not regions:
+                full.append(i)
+            proposed[i] = regions
+            for start, end in regions:
+                crops.append(image[start:end])
+                owners.append((i, start))
+
+        if crops:
+            for (i, start), results in zip(owners, self.detect_text_regions_batch(crops, batch_size=batch_size)):
+                shifted = [([[x, y + start] for x, y in bbox], text, confidence)
+                           for bbox, text, confidence in results]
+                all_results[i] = (all_results[i] or []) + shifted
 
-        # 마지막 그룹 추가
-        if len(current_group) >= 2:
-            groups.append(current_group)
+        cropped = {i for i, _ in owners}
+        fallback = [i for i in sorted(cropped)
+                    if not self.accept_crop_results(images[i].shape, proposed[i], all_results[i])]
+        full.extend(fallback)
 
-        return groups
+        if full:
+            for i, results in zip(full, self.detect_text_regions_batch([images[i] for i in full],
+                                                                       batch_size=batch_size)):
+                all_results[i] = results
 
-    def calculate_group_bbox(self, group):
-        """그룹의 전체 바운딩 박스 계산"""
-        all_points = []
-        for result in group:
-            all_points.extend(result[0])
+        self.ocr_stats['images'] += len(images)
+        self.ocr_stats['cropped'] += len(cropped)
+        self.ocr_stats['fallback'] += len(fallback)
+        self.ocr_stats['full_pixels'] += sum(image.shape[0] * image.shape[1] for image in images)
+        self.ocr_stats['ocr_pixels'] += (sum(crop.shape[0] * crop.shape[1] for crop in crops)
+                                         + sum(images[i].shape[0] * images[i].shape[1] for i in full))
 
-        all_points = np.array(all_points)
-        x_min = all_points[:, 0].min()
-        y_min = all_points[:, 1].min()
-        x_max = all_points[:, 0].max()
-        y_max = all_points[:, 1].max()
+        return all_results
+
+    def accept_crop_results(self, image_shape, regions, results):
+        """영역 OCR 결과의 최선 띠지 후보가 충분히 믿을 만하고 잘리지 않았는지"""
+        candidates = self.find_belly_band_candidates(image_shape, results)
+        if not candidates:
+            return False
+        best = max(candidates, key=lambda candidate: candidate['text_count'] * candidate['confidence'])
+        if best['confidence'] < self.crop_min_confidence:
+            return False
 
-        return [[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]
+        ys = [point[1] for point in best['bbox']]
+        top, bottom = min(ys), max(ys)
+        for start, end in regions:
+            if start <= top and bottom <= end:
+                return ((start == 0 or top - start > CROP_EDGE_TOLERANCE)
+                        and (end == image_shape[0] or end - bottom > CROP_EDGE_TOLERANCE))
+        return False
 
-    def find_belly_band_candidates(self, image, results):
+    def score_results(self, image_shape, results, y_threshold=None):
+        """이미지 1장의 OCR 결과를 score_ocr_batch로 그룹화·점수화"""
+        bboxes, confidences = results_to_arrays(results)
+        return score_ocr_batch([image_shape[:2]], [0, len(results)], bboxes, confidences,
+                               y_threshold=self.y_threshold if y_threshold is None else y_threshold,
+                               min_aspect_ratio=self.min_aspect_ratio,
+                               min_width_ratio=self.min_width_ratio)
+
+    def find_belly_band_candidates(self, image_shape, results):
         """띠지 후보 영역 찾기"""
         if not results:
             return []
 
-        # 텍스트 그룹화
-        groups = self.group_nearby_texts(results, image.shape)
+        scored = self.score_results(image_shape, results)
+        texts = [result[1] for result in results]
 
         candidates = []
-        for group in groups:
-            # 그룹의 전체 바운딩 박스
-            bbox = self.calculate_group_bbox(group)
-
-            # 가로 띠 형태인지 확인
-            if self.is_horizontal_band(bbox, image.shape):
-                # 그룹의 모든 텍스트 합치기
-                text = ' '.join([result[1] for result in group])
-                confidence = np.mean([result[2] for result in group])
-
-                candidates.append({
-                    'bbox': bbox,
-                    'text': text,
-                    'confidence': confidence,
-                    'text_count': len(group),
-                    'position': np.mean([p[1] for p in bbox]) / image.shape[0]  # 상대적 y 위치
-                })
+        for group in np.flatnonzero(scored['is_candidate']):
+            candidates.append({
+                'bbox': bbox_corners(scored['group_bbox'][group]),
+                'text': group_texts(scored, texts, group),
+                'confidence': float(scored['group_confidence'][group]),
+                'text_count': int(scored['group_size'][group]),
+                'position': float(scored['group_position'][group])  # 상대적 y 위치
+            })
 
         return candidates
 
@@ -136,8 +509,17 @@ class BellyBandDetector:
         if image is None:
             return None
 
+        return self.analyze_results(image, results, visualize=visualize, surface=image_surface(image_path))
+
+    def select_belly_band(self, image_shape, results):
+        """
+        OCR 결과에서 띠지 선택 (픽셀 없이 이미지 크기만 사용)
+
+        Returns:
+            (결과 dict, 후보 목록, 최선 후보 또는 None)
+        """
         # 띠지 후보 찾기
-        candidates = self.find_belly_band_candidates(image, results)
+        candidates = self.find_belly_band_candidates(image_shape, results)
 
         if not candidates:
             return {
@@ -145,7 +527,7 @@ class BellyBandDetector:
                 'belly_band_text': None,
                 'confidence': 0,
                 'all_text': [{'text': r[1], 'confidence': r[2]} for r in results]
-            }
+            }, [], None
 
         # 가장 가능성 높은 띠지 선택 (텍스트 개수와 신뢰도 고려)
         best_candidate = max(candidates,
@@ -161,10 +543,27 @@ class BellyBandDetector:
             'all_text': [{'text': r[1], 'confidence': r[2]} for r in results]
         }
 
+        return result, candidates, best_candidate
+
+    def analyze_results(self, image, results, visualize=True, surface='front'):
+        """OCR 결과에서 띠지 선택(뒷표지는 문단 분류 포함) 및 시각화"""
+        result, candidates, best_candidate = self.select_belly_band(image.shape, results)
+        if surface == 'back':
+            result['surface'] = 'back'
+            result['paragraphs'] = back_cover_paragraphs(results)
+
         # 시각화
-        if visualize:
-            vis_image = image.copy()
+        if not visualize or (best_candidate is None and not result.get('paragraphs')):
+            return result
 
+        vis_image = image.copy()
+
+        # 뒷표지 문단 (추천사: 자홍, 발췌: 파랑, 기타: 회색)
+        for paragraph in result.get('paragraphs', []):
+            bbox = np.array(paragraph['bbox'], dtype=np.int32)
+            cv2.polylines(vis_image, [bbox], True, PARAGRAPH_COLORS[paragraph['type']], 2)
+
+        if best_candidate is not None:
             # 띠지 영역 표시
             bbox = np.array(best_candidate['bbox'], dtype=np.int32)
             cv2.polylines(vis_image, [bbox], True, (0, 255, 0), 3)
@@ -181,101 +580,448 @@ class BellyBandDetector:
                 bbox = np.array(candidate['bbox'], dtype=np.int32)
                 cv2.polylines(vis_image, [bbox], True, (0, 255, 255), 2)
 
-            result['visualization'] = vis_image
+        result['visualization'] = vis_image
 
         return result
 
-    def process_directory(self, input_dir, output_dir, file_pattern="*.jpg"):
-        """디렉토리 내 모든 이미지 처리"""
-        input_path = Path(input_dir)
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
+    def save_result(self, image_file, result, output_path):
+        """검출 결과를 JSON/시각화/텍스트 파일로 저장하고 요약 항목 반환"""
+        base_name = image_file.stem
 
-        image_files = sorted(input_path.glob(file_pattern))
+        # JSON 저장
+        json_file = output_path / f"{base_name}_belly_band.json"
+        save_result = {k: v for k, v in result.items() if k != 'visualization'}
+        save_result['timestamp'] = datetime.now().isoformat()
+        save_result['image_file'] = image_file.name
 
-        print(f"\n{len(image_files)}개 이미지 처리 시작...\n")
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(save_result, f, ensure_ascii=False, indent=2, default=float)
 
-        results_summary = []
-        belly_band_count = 0
+        # 시각화 이미지 저장
+        if 'visualization' in result:
+            vis_file = output_path / f"{base_name}_belly_band_viz.jpg"
+            cv2.imwrite(str(vis_file), result['visualization'])
+
+        # 텍스트 파일 저장
+        txt_file = output_path / f"{base_name}_belly_band.txt"
+        with open(txt_file, 'w', encoding='utf-8') as f:
+            if result['has_belly_band']:
+                f.write(f"띠지 발견: {result['belly_band_text']}\n")
+                f.write(f"신뢰도: {result['confidence']:.2f}\n")
+                f.write(f"위치: {result['position']:.1%}\n")
+            else:
+                f.write("띠지 없음\n")
+
+            if result.get('paragraphs'):
+                f.write(f"\n=== 뒷표지 문단 ===\n")
+                for paragraph in result['paragraphs']:
+                    endorser = f" — {paragraph['endorser']}" if paragraph['endorser'] else ""
+                    role = f"({paragraph['endorser_role']})" if paragraph['endorser_role'] else ""
+                    f.write(f"[{paragraph['type']}]{endorser}{role} {paragraph['text']}\n")
+
+            f.write(f"\n=== 전체 텍스트 ===\n")
+            for text_info in result['all_text']:
+                f.write(f"{text_info['text']} (신뢰도: {text_info['confidence']:.2f})\n")
+
+        entry = {
+            'file': image_file.name,
+            'has_belly_band': result['has_belly_band'],
+            'text': result['belly_band_text'] if result['has_belly_band'] else None,
+            'confidence': float(result['confidence']),
+            'position': result.get('position'),
+            'bbox': result.get('bbox')
+        }
+        if result.get('surface') == 'back':
+            entry['surface'] = 'back'
+            entry['paragraphs'] = [{key: paragraph[key] for key in ('type', 'text', 'endorser', 'endorser_role')}
+                                   for paragraph in result['paragraphs']]
+        return entry
+
+    def process_files(self, image_files, output_path, batch_size=8, ocr_store=None, hashes=None, sources=None):
+        """
+        이미지 목록을 디코드 → 배치 OCR → 결과 저장 파이프라인으로 처리
+
+        디코드 스레드(생산자)와 저장 스레드(소비자)가 OCR과 겹쳐 실행된다.
+        ocr_store가 주어지면 OCR 원본 결과를 이미지 내용 해시(hashes: 파일명 → sha256)와 함께 기록한다.
+        sources(derivative_sources)에 있는 이미지는 원본 대신 정규화 파생본을 디코딩한다.
 
-        for idx, image_file in enumerate(image_files, 1):
-            print(f"[{idx}/{len(image_files)}] {image_file.name}")
+        Returns:
+            list: 이미지별 요약 항목
+        """
+        decoded = queue.Queue(maxsize=batch_size * 2)
+        finished = queue.Queue(maxsize=batch_size * 2)
+        results_summary = []
+        total = len(image_files)
 
-            try:
-                result = self.detect_belly_band(str(image_file), visualize=True)
+        def decode_worker():
+            for image_file in image_files:
+                decoded.put((image_file, read_image(image_file, sources)))
+            decoded.put(None)
 
-                if result is None:
-                    print(f"  [!] 이미지 로드 실패")
+        def write_worker():
+            while True:
+                item = finished.get()
+                if item is None:
+                    break
+                image_file, result = item
+                try:
+                    entry = self.save_result(image_file, result, output_path)
+                except Exception as e:
+                    print(f"  [X] {image_file.name} 저장 오류: {e}")
                     continue
 
-                # 결과 저장
-                base_name = image_file.stem
-
-                # JSON 저장
-                json_file = output_path / f"{base_name}_belly_band.json"
-                save_result = {k: v for k, v in result.items() if k != 'visualization'}
-                save_result['timestamp'] = datetime.now().isoformat()
-                save_result['image_file'] = image_file.name
-
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(save_result, f, ensure_ascii=False, indent=2)
-
-                # 시각화 이미지 저장
-                if 'visualization' in result:
-                    vis_file = output_path / f"{base_name}_belly_band_viz.jpg"
-                    cv2.imwrite(str(vis_file), result['visualization'])
-
-                # 텍스트 파일 저장
-                txt_file = output_path / f"{base_name}_belly_band.txt"
-                with open(txt_file, 'w', encoding='utf-8') as f:
-                    if result['has_belly_band']:
-                        f.write(f"띠지 발견: {result['belly_band_text']}\n")
-                        f.write(f"신뢰도: {result['confidence']:.2f}\n")
-                        f.write(f"위치: {result['position']:.1%}\n")
-                        belly_band_count += 1
-                        print(f"  [O] 띠지: {result['belly_band_text'][:50]}")
-                    else:
-                        f.write("띠지 없음\n")
-                        print(f"  [-] 띠지 없음")
-
-                    f.write(f"\n=== 전체 텍스트 ===\n")
-                    for text_info in result['all_text']:
-                        f.write(f"{text_info['text']} (신뢰도: {text_info['confidence']:.2f})\n")
-
-                results_summary.append({
-                    'file': image_file.name,
-                    'has_belly_band': result['has_belly_band'],
-                    'text': result['belly_band_text'] if result['has_belly_band'] else None
-                })
-
-            except Exception as e:
-                print(f"  [X] 오류: {e}")
+                results_summary.append(entry)
+                if entry['has_belly_band']:
+                    print(f"  [O] {image_file.name} 띠지: {entry['text'][:50]}")
+                else:
+                    print(f"  [-] {image_file.name} 띠지 없음")
+                if entry.get('paragraphs'):
+                    types = [paragraph['type'] for paragraph in entry['paragraphs']]
+                    print(f"      뒷표지 문단 {len(types)}개 (추천사 {types.count('endorsement')}, "
+                          f"발췌 {types.count('excerpt')})")
+
+        decoder = threading.Thread(target=decode_worker, daemon=True)
+        writer = threading.Thread(target=write_worker, daemon=True)
+        decoder.start()
+        writer.start()
+
+        done = 0
+        batch = []
+        end_of_input = False
+        while not end_of_input:
+            item = decoded.get()
+            if item is None:
+                end_of_input = True
+            else:
+                image_file, image = item
+                if image is None:
+                    print(f"  [!] {image_file.name} 이미지 로드 실패")
+                else:
+                    batch.append(item)
+
+            if batch and (len(batch) >= batch_size or end_of_input):
+                done += len(batch)
+                print(f"[{done}/{total}] {len(batch)}개 배치 OCR")
+                try:
+                    batch_results = self.ocr_images([image for _, image in batch], batch_size=batch_size,
+                                                    surfaces=[image_surface(image_file) for image_file, _ in batch])
+                except Exception as e:
+                    print(f"  [X] 배치 OCR 오류: {e}")
+                    batch_results = [None] * len(batch)
+
+                for (image_file, image), results in zip(batch, batch_results):
+                    if results is None:
+                        continue
+                    if ocr_store is not None:
+                        ocr_store.add(image_file.name, image.shape, results,
+                                      sha256=(hashes or {}).get(image_file.name) or file_sha256(image_file))
+                    try:
+                        finished.put((image_file, self.analyze_results(image, results, visualize=True,
+                                                                       surface=image_surface(image_file))))
+                    except Exception as e:
+                        print(f"  [X] {image_file.name} 오류: {e}")
+                batch = []
+
+        finished.put(None)
+        decoder.join()
+        writer.join()
+
+        stats = self.ocr_stats
+        if self.propose_regions and stats['full_pixels']:
+            print(f"OCR 영역: 전체 픽셀의 {stats['ocr_pixels'] / stats['full_pixels'] * 100:.1f}% "
+                  f"(영역 OCR {stats['cropped']}개, 전체 이미지 재OCR {stats['fallback']}개)")
+
+        return results_summary
+
+    def load_manifest(self, output_path):
+        """
+        증분 처리 manifest 로드
+
+        검출기 버전이나 파라미터가 다르면 기존 항목을 모두 무효화한다.
+        항목 형식: {파일명: {'sha256': 내용 해시, 'summary': 요약 항목}}
+        """
+        manifest_file = output_path / MANIFEST_FILE
+        manifest = {'detector_version': DETECTOR_VERSION, 'params': self.params(), 'entries': {}}
+
+        if manifest_file.exists():
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('detector_version') == DETECTOR_VERSION and saved.get('params') == self.params():
+                manifest['entries'] = saved.get('entries', {})
+
+        return manifest
+
+    def save_manifest(self, output_path, manifest):
+        """manifest 저장 (임시 파일 후 교체)"""
+        manifest_file = output_path / MANIFEST_FILE
+        tmp_file = manifest_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, manifest_file)
+
+    def reuse_results(self, reused, output_path, ocr_store=None, hashes=None, sources=None):
+        """
+        같은 이미지의 저장된 OCR 결과로 띠지 선택·저장만 실행 (OCR 없음)
+
+        Args:
+            reused (dict): 이미지 경로 → EasyOCR 형식 결과
+            hashes (dict): 파일명 → 이미지 내용 해시 (OCR 저장소 기록용)
+            sources (dict): 원본 대신 읽을 정규화 파생본 (derivative_sources)
+
+        Returns:
+            list: 이미지별 요약 항목
+        """
+        results_summary = []
+        for image_file, results in reused.items():
+            image = read_image(image_file, sources)
+            if image is None:
+                print(f"  [!] {image_file.name} 이미지 로드 실패")
                 continue
+            if ocr_store is not None:
+                ocr_store.add(image_file.name, image.shape, results,
+                              sha256=(hashes or {}).get(image_file.name) or file_sha256(image_file))
+            result = self.analyze_results(image, results, visualize=True, surface=image_surface(image_file))
+            entry = self.save_result(image_file, result, output_path)
+            results_summary.append(entry)
+            print(f"  [=] {image_file.name} 같은 이미지의 OCR 결과 재사용")
+        return results_summary
+
+    def process_directory(self, input_dir, output_dir, file_pattern="*.jpg", batch_size=8, workers=None,
+                          force=False, catalog=None, dedupe_index=None):
+        """
+        디렉토리 내 새로 추가되거나 바뀐 이미지만 처리
+
+        Args:
+            input_dir: 이미지 디렉토리 또는 디렉토리 목록 (앞표지 covers와 뒷표지 back_covers를
+                       한 번에 주면 같은 배치 파이프라인에서 함께 처리, 결과는 output_dir 하나에 저장)
+            catalog (Catalog): 주어지면 이미지 목록·해시를 카탈로그에서 읽고 띠지 결과를 기록하며,
+                               image_ingest 정규화 파생본(팩)이 있으면 원본 대신 읽음
+            dedupe_index (ImageHashIndex): 주어지면 다른 연도·파일명의 같은 이미지는 저장된 OCR 결과 재사용
+            batch_size (int): OCR 배치 크기
+            workers (int): 프로세스 풀 크기 (기본: GPU면 1, CPU 전용이면 코어 수의 절반, 최대 4)
+            force (bool): manifest를 무시하고 전체 재처리
+        """
+        input_paths = [Path(input_dir)] if isinstance(input_dir, (str, Path)) else [Path(d) for d in input_dir]
+        output_path = Path(output_dir)
+        output_path.mkdir(exist_ok=True)
+
+        # 뒷표지 파일명은 _back으로 끝나므로 면이 섞여도 파일명이 겹치지 않음
+        all_files = []
+        for input_path in input_paths:
+            if catalog is None:
+                all_files.extend(input_path.glob(file_pattern))
+            else:
+                if not catalog.image_files(input_path):
+                    catalog.register_directory(input_path, file_pattern)
+                all_files.extend(path for path in catalog.image_files(input_path) if path.match(file_pattern))
+        all_files.sort(key=lambda path: path.name)
+        paths = {image_file.name: image_file for image_file in all_files}
+        sha256 = catalog.file_sha256 if catalog is not None else file_sha256
+
+        # 내용 해시가 같고 결과 파일이 남아 있는 이미지는 이전 결과 재사용
+        manifest = self.load_manifest(output_path)
+        if force:
+            manifest['entries'] = {}
+
+        hashes = {image_file.name: sha256(image_file) for image_file in all_files}
+        image_files = []
+        for image_file in all_files:
+            entry = manifest['entries'].get(image_file.name)
+            if (entry is None or entry['sha256'] != hashes[image_file.name]
+                    or not (output_path / f"{image_file.stem}_belly_band.json").exists()):
+                image_files.append(image_file)
+
+        print(f"\n전체 {len(all_files)}개 중 변경 없음 {len(all_files) - len(image_files)}개 재사용")
+
+        # 다른 연도·순위 파일명으로 이미 OCR한 같은 이미지
+        reused = {}
+        if dedupe_index is not None:
+            for image_file in image_files:
+                results = dedupe_index.ocr_results(image_file)
+                if results is not None:
+                    reused[image_file] = results
+            image_files = [image_file for image_file in image_files if image_file not in reused]
+            if reused:
+                print(f"같은 이미지 OCR 결과 재사용 {len(reused)}개")
+
+        if workers is None:
+            workers = 1 if self.reader.device != 'cpu' else max(1, min(4, (os.cpu_count() or 1) // 2))
+        workers = min(workers, len(image_files)) or 1
+
+        print(f"{len(image_files)}개 이미지 처리 시작... (배치 {batch_size}, 워커 {workers})\n")
+
+        sources = derivative_sources(input_paths, hashes, catalog) if catalog is not None else {}
+        if sources:
+            print(f"정규화 파생본에서 읽기 {len(sources)}개")
+
+        ocr_store = OcrStore.load(output_path / STORE_FILE)
+        reused_summary = self.reuse_results(reused, output_path, ocr_store, hashes, sources)
+
+        if not image_files:
+            results_summary = []
+        elif workers > 1:
+            # CPU 전용: 워커마다 자체 OCR 백엔드를 두고 이미지 묶음을 나눠 처리
+            chunks = [image_files[i::workers] for i in range(workers)]
+            threads = max(1, (os.cpu_count() or 1) // workers)
+            results_summary = []
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(threads, self.params())) as pool:
+                for chunk_summary, chunk_store in pool.map(_process_chunk, chunks,
+                                                           [str(output_path)] * workers, [batch_size] * workers,
+                                                           [hashes] * workers, [sources] * workers):
+                    results_summary.extend(chunk_summary)
+                    ocr_store.merge(chunk_store)
+            results_summary.sort(key=lambda entry: entry['file'])
+        else:
+            results_summary = self.process_files(image_files, output_path, batch_size=batch_size,
+                                                 ocr_store=ocr_store, hashes=hashes, sources=sources)
+        close_packs()
+        results_summary = reused_summary + results_summary
+
+        # 사라진 이미지만 제거 (이번에 처리하지 않은 면의 결과는 유지)
+        surfaces = {'back' if path.name == SURFACE_DIRS['back'] else 'front' for path in input_paths}
+        keep = set(hashes) | {name for name in set(manifest['entries']) | set(ocr_store.records)
+                              if image_surface(name) not in surfaces}
+
+        # OCR 원본 결과 저장 (re-score 모드 입력)
+        ocr_store.retain(keep)
+        ocr_store.save(output_path / STORE_FILE)
+
+        # manifest 갱신 (처리된 이미지 추가, 사라진 이미지 제거)
+        for entry in results_summary:
+            manifest['entries'][entry['file']] = {'sha256': hashes[entry['file']], 'summary': entry}
+        manifest['entries'] = {name: entry for name, entry in manifest['entries'].items() if name in keep}
+        self.save_manifest(output_path, manifest)
+
+        if catalog is not None:
+            for entry in results_summary:
+                catalog.put_belly_band(paths[entry['file']], entry, DETECTOR_VERSION, self.params())
+
+        # 전체 요약은 manifest 항목으로 재구성
+        results_summary = [manifest['entries'][image_file.name]['summary']
+                           for image_file in all_files if image_file.name in manifest['entries']]
+        belly_band_count = sum(1 for entry in results_summary if entry['has_belly_band'])
 
         # 전체 요약 저장
         summary_file = output_path / "belly_band_summary.json"
         with open(summary_file, 'w', encoding='utf-8') as f:
             json.dump({
-                'total_images': len(image_files),
+                'total_images': len(all_files),
                 'belly_bands_found': belly_band_count,
-                'percentage': belly_band_count / len(image_files) * 100 if image_files else 0,
+                'percentage': belly_band_count / len(all_files) * 100 if all_files else 0,
                 'results': results_summary
             }, f, ensure_ascii=False, indent=2)
 
         print(f"\n완료!")
-        print(f"총 {len(image_files)}개 중 {belly_band_count}개 띠지 발견 ({belly_band_count/len(image_files)*100:.1f}%)")
+        print(f"총 {len(all_files)}개 중 {belly_band_count}개 띠지 발견 ({belly_band_count/len(all_files)*100 if all_files else 0:.1f}%)")
         print(f"결과 저장: {output_path}")
 
+    def rescore_store(self, ocr_store, output_file=None):
+        """
+        저장된 OCR 결과로 띠지 후보 선택만 다시 실행 (OCR 없음)
+
+        Returns:
+            dict: 띠지 검출 수와 이미지별 결과
+        """
+        files, shapes, offsets, bboxes, confidences, texts = ocr_store.arrays()
+        scored = score_ocr_batch(shapes, offsets, bboxes, confidences,
+                                 y_threshold=self.y_threshold,
+                                 min_aspect_ratio=self.min_aspect_ratio,
+                                 min_width_ratio=self.min_width_ratio)
+
+        # 전체 이미지를 한 번에 그룹화·점수화한 뒤 이미지별 최선 그룹만 꺼냄
+        results = []
+        for file_name, group in zip(files, scored['best_group']):
+            if group < 0:
+                results.append({'file': file_name, 'has_belly_band': False, 'text': None,
+                                'confidence': 0.0, 'bbox': None, 'position': None})
+                continue
+
+            results.append({
+                'file': file_name,
+                'has_belly_band': True,
+                'text': group_texts(scored, texts, group),
+                'confidence': float(scored['group_confidence'][group]),
+                'bbox': bbox_corners(scored['group_bbox'][group]),
+                'position': float(scored['group_position'][group])
+            })
+
+        found = sum(1 for result in results if result['has_belly_band'])
+        rescored = {
+            'params': self.params(),
+            'total_images': len(results),
+            'belly_bands_found': found,
+            'percentage': found / len(results) * 100 if results else 0,
+            'results': results
+        }
+
+        if output_file:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(rescored, f, ensure_ascii=False, indent=2, default=float)
+
+        return rescored
+
+
 def main():
     """메인 실행 함수"""
-    detector = BellyBandDetector(use_gpu=True)
+    parser = argparse.ArgumentParser(description="띠지 검출")
+    parser.add_argument('--rescore', metavar='BELLY_DIR',
+                        help="OCR 없이 BELLY_DIR의 ocr_store.npz(없으면 *_belly.json)로 후보 선택만 재실행")
+    parser.add_argument('--covers-dir', help="--rescore에서 *_belly.json을 읽을 때 원본 표지 디렉토리")
+    parser.add_argument('--year', type=int, default=2024, help="검출할 연도 (yearly_bestsellers_{year})")
+    parser.add_argument('--surfaces', nargs='+', choices=list(SURFACE_DIRS), default=list(SURFACE_DIRS),
+                        help="처리할 표지 면 (기본: 앞·뒷표지 함께)")
+    parser.add_argument('--y-threshold', type=float, default=30)
+    parser.add_argument('--min-aspect-ratio', type=float, default=2.0)
+    parser.add_argument('--min-width-ratio', type=float, default=0.3)
+    parser.add_argument('--propose', action='store_true',
+                        help="띠지 후보 영역만 잘라 OCR (믿을 수 없는 결과는 전체 이미지로 재OCR)")
+    parser.add_argument('--ocr-backend', default='easyocr', help="OCR 백엔드 (easyocr, tesseract)")
+    parser.add_argument('--ocr-config', help="OCR 백엔드 설정 JSON ({\"backend\": ..., \"options\": {...}})")
+    args = parser.parse_args()
+
+    ocr_backend, ocr_options = args.ocr_backend, {}
+    if args.ocr_config:
+        ocr_backend, ocr_options = load_backend_config(args.ocr_config)
+
+    params = {
+        'y_threshold': args.y_threshold,
+        'min_aspect_ratio': args.min_aspect_ratio,
+        'min_width_ratio': args.min_width_ratio,
+        'propose_regions': args.propose,
+        'ocr_backend': ocr_backend,
+        'ocr_options': ocr_options
+    }
+
+    if args.rescore:
+        belly_dir = Path(args.rescore)
+        ocr_store = OcrStore.load(belly_dir / STORE_FILE)
+        if not len(ocr_store):
+            covers_dir = Path(args.covers_dir) if args.covers_dir else belly_dir.parent / "covers"
+            ocr_store = OcrStore.from_belly_json(belly_dir, covers_dir)
+            ocr_store.save(belly_dir / STORE_FILE)
+
+        detector = BellyBandDetector(**params)
+        rescored = detector.rescore_store(ocr_store, output_file=belly_dir / "belly_band_rescore.json")
+        print(f"re-score 완료: {rescored['total_images']}개 중 {rescored['belly_bands_found']}개 띠지 "
+              f"({rescored['percentage']:.1f}%), 파라미터 {params}")
+        return
+
+    detector = BellyBandDetector(**params)
 
-    # 2024년 앞표지 띠지 검출
-    print("\n=== 2024년 앞표지 띠지 검출 ===")
+    # 앞표지 띠지 + 뒷표지 문단을 한 번에 검출
+    year_dir = Path(f"yearly_bestsellers_{args.year}")
+    names = {'front': "앞표지", 'back': "뒷표지"}
+    print(f"\n=== {args.year}년 {'·'.join(names[surface] for surface in args.surfaces)} 띠지 검출 ===")
+    # 다른 연도에 같은 표지가 있으면 OCR 결과 재사용 (image_ingest로 해시를 기록한 이미지)
+    catalog = Catalog.default()
     detector.process_directory(
-        input_dir="yearly_bestsellers_2024/covers",
-        output_dir="yearly_bestsellers_2024/belly_bands",
-        file_pattern="*.jpg"
+        input_dir=[year_dir / SURFACE_DIRS[surface] for surface in args.surfaces
+                   if (year_dir / SURFACE_DIRS[surface]).is_dir()],
+        output_dir=year_dir / "belly_bands",
+        file_pattern="*.jpg",
+        catalog=catalog,
+        dedupe_index=ImageHashIndex(catalog)
     )
 
 if __name__ == "__main__":
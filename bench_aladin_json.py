@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+알라딘 Open API output=JS 응답 디코딩 벤치마크
+
+응답 fixture에 대해
+1. 기존 방식: callback( 제거 후 eval
+2. json.loads (표준 JSON만 가능, 비표준 이스케이프가 있으면 실패)
+3. aladin_json.decode_response (JSONP·비표준 이스케이프 처리 + 스키마 검증)
+4. aladin_json.ItemStream (64KB 조각 단위 스트리밍 + 스키마 검증)
+의 응답당 시간·items/sec·최대 메모리를 비교하고 결과가 같은지 확인한다.
+
+fixture는 .http_cache에 기록된 Open API 응답(/ttb/api/)을 쓰고,
+없으면 연도별 bestseller_data.json 도서로 같은 형식의 응답을 만든다.
+
+사용 예:
+    python bench_aladin_json.py --repeat 20 --large 5000
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+import tracemalloc
+from pathlib import Path
+
+from aladin_json import ItemStream, decode_response
+
+
+def legacy_decode(text):
+    """기존 AladinCoverScraper.search_books의 파싱 (비교 기준)"""
+    json_text = text
+    if json_text.startswith('callback(') and json_text.endswith(');'):
+        json_text = json_text[9:-2]
+    # 원래 코드는 true/false/null에서 NameError가 났으므로 이름만 채워 둠
+    return eval(json_text, {'true': True, 'false': False, 'null': None})
+
+
+def recorded_fixtures(cache_dir):
+    """HttpCache에 저장된 Open API 응답 본문"""
+    index = Path(cache_dir) / "index.sqlite"
+    if not index.exists():
+        return []
+
+    db = sqlite3.connect(str(index))
+    rows = db.execute("SELECT key FROM entries WHERE url LIKE '%/ttb/api/%' AND url LIKE '%output=JS%'").fetchall()
+    db.close()
+
+    fixtures = []
+    for (key,) in rows:
+        body_file = Path(cache_dir) / key[:2] / key
+        if body_file.exists():
+            fixtures.append(body_file.read_bytes().decode('utf-8'))
+    return fixtures
+
+
+def aladin_js(items, callback=True):
+    """Open API output=JS 형식 응답 문자열 (작은따옴표를 \\'로 이스케이프)"""
+    response = {
+        'version': '20131101', 'title': '알라딘 베스트셀러 리스트 - 한국소설',
+        'link': 'http://www.aladin.co.kr/shop/common/wbest.aspx', 'pubDate': 'Mon, 01 Jan 2024 00:00:00 GMT',
+        'totalResults': len(items), 'startIndex': 1, 'itemsPerPage': len(items), 'query': 'QueryType=BESTSELLER',
+        'searchCategoryId': 50993, 'searchCategoryName': '한국소설', 'item': items,
+    }
+    text = json.dumps(response, ensure_ascii=False).replace("'", "\\'")
+    return f"callback({text});" if callback else text
+
+
+def synthetic_fixtures(page_size=50):
+    """연도별 bestseller_data.json 도서로 만든 페이지 응답"""
+    items = []
+    for data_file in sorted(Path('.').glob("yearly_bestsellers_*/covers/bestseller_data.json")):
+        with open(data_file, 'r', encoding='utf-8') as f:
+            books = json.load(f)
+        for book in books:
+            item_id = int(''.join(c for c in str(book.get('isbn13', '')) if c.isdigit()) or 0)
+            items.append({
+                'title': book.get('title', ''), 'link': f"http://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}",
+                'author': book.get('author', ''), 'pubDate': '2023-08-01',
+                'description': f"'{book.get('title', '')}' 작가의 신작. \"올해의 소설\"\n수상작",
+                'isbn': '', 'isbn13': f"979{item_id:010d}", 'itemId': item_id,
+                'priceSales': 15120, 'priceStandard': 16800, 'mallType': 'BOOK', 'stockStatus': '',
+                'mileage': 840, 'cover': book.get('cover_url', ''), 'categoryId': 50993,
+                'categoryName': '국내도서>소설/시/희곡>한국소설>2000년대 이후 한국소설',
+                'publisher': book.get('publisher', ''), 'salesPoint': 123456, 'adult': False,
+                'fixedPrice': True, 'customerReviewRank': 9, 'bestRank': book.get('rank', 0),
+            })
+    return [aladin_js(items[i:i + page_size]) for i in range(0, len(items), page_size)], items
+
+
+def timed(decode, fixtures, repeat):
+    """(응답당 ms, items/sec, 실패 수)"""
+    failures = items = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in fixtures:
+            try:
+                items += len(decode(text))
+            except Exception:
+                failures += 1
+    elapsed = time.perf_counter() - started
+    return elapsed / (repeat * len(fixtures)) * 1000, items / elapsed if elapsed else 0, failures // repeat
+
+
+def chunks(text, size=64 * 1024):
+    return (text[i:i + size] for i in range(0, len(text), size))
+
+
+def peak_memory(decode, text):
+    tracemalloc.start()
+    decode(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def consume_stream(text):
+    count = 0
+    for _ in ItemStream(chunks(text)):
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open API 응답 디코딩 벤치마크")
+    parser.add_argument('--cache-dir', default=".http_cache")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--large', type=int, default=5000, help="스트리밍 메모리 비교용 큰 응답의 상품 수")
+    args = parser.parse_args()
+
+    fixtures = recorded_fixtures(args.cache_dir)
+    source = "기록된 응답"
+    synthetic_items = None
+    if not fixtures:
+        fixtures, synthetic_items = synthetic_fixtures()
+        source = "bestseller_data.json 기반 합성 응답"
+    print(f"fixture: {source} {len(fixtures)}개, {sum(len(text) for text in fixtures) / 1024:.0f}KB")
+    print("=" * 60)
+
+    # 결과 일치 확인
+    mismatches = 0
+    for text in fixtures:
+        expected = decode_response(text)['item']
+        if list(ItemStream(chunks(text, 4096))) != expected:
+            mismatches += 1
+        try:
+            legacy = legacy_decode(text).get('item', [])
+        except Exception:
+            continue
+        if [item.get('title') for item in legacy] != [item['title'] for item in expected]:
+            mismatches += 1
+    print(f"결과 불일치: {mismatches}개 응답")
+
+    decoders = [
+        ("기존 eval", lambda text: legacy_decode(text).get('item', [])),
+        ("json.loads", lambda text: json.loads(text).get('item', [])),
+        ("decode_response", lambda text: decode_response(text)['item']),
+        ("ItemStream", lambda text: list(ItemStream(chunks(text)))),
+    ]
+    for name, decode in decoders:
+        ms, items_per_sec, failures = timed(decode, fixtures, args.repeat)
+        note = f", 실패 {failures}개" if failures else ""
+        print(f"{name:16s}: 응답당 {ms:.2f}ms, {items_per_sec:,.0f} items/sec{note}")
+
+    # 큰 응답 하나: 전체 디코딩 vs 스트리밍 최대 메모리
+    if synthetic_items is None:
+        synthetic_items = [item for text in fixtures for item in decode_response(text)['item']]
+    large_items = (synthetic_items * (args.large // max(1, len(synthetic_items)) + 1))[:args.large]
+    large = aladin_js(large_items)
+    print("=" * 60)
+    print(f"큰 응답 ({len(large_items)}개, {len(large) / 1024 / 1024:.1f}MB) 최대 메모리:")
+    print(f"  decode_response: {peak_memory(decode_response, large):.1f}MB")
+    print(f"  ItemStream     : {peak_memory(consume_stream, large):.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+띠지·뒷표지 언급 추출 벤치마크
+
+기존 띠지·뒷표지 문구를 --copies배로 복제한 말뭉치에서
+1. 어휘마다 str.find로 훑는 방식 (어휘 수 × 문구 길이)
+2. band_mentions의 Aho–Corasick 오토마톤 한 번 훑기
+의 어휘 토큰 탐색 시간과 결과 일치, 언급 조립까지 포함한 전체 추출 시간(문구/s, 자/s)을 출력한다.
+
+--check는 시간을 재지 않고 fixtures/band_mentions/endorsements.json의 문구마다 추천 언급의
+(직함, 추천인)을 기대값과 비교해 하나라도 다르면 종료 코드 1로 끝난다. "수많은 작가", "번역가 사나"처럼
+이름이 아닌 어절은 추천인 없이 직함만 나와야 한다.
+
+사용 예:
+    python bench_band_mentions.py --copies 20
+    python bench_band_mentions.py --check
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from band_mentions import MentionExtractor, ahocorasick, band_texts, compact, lexicon_entries
+
+FIXTURE_FILE = Path(__file__).parent / "fixtures" / "band_mentions" / "endorsements.json"
+
+
+def naive_matches(compacted, keys):
+    """어휘마다 str.find로 모든 (시작, 끝) 위치"""
+    found = []
+    for key in keys:
+        start = compacted.find(key)
+        while start >= 0:
+            found.append((start, start + len(key)))
+            start = compacted.find(key, start + 1)
+    return sorted(found)
+
+
+def automaton_matches(compacted, automaton):
+    return sorted((end + 1 - length, end + 1) for end, (length, _) in automaton.iter(compacted))
+
+
+def run_check(extractor):
+    """fixture 문구별 추천 언급 (직함, 추천인)을 기대값과 비교, 불일치가 있으면 1"""
+    cases = json.loads(FIXTURE_FILE.read_text(encoding='utf-8'))
+    mismatches = 0
+    for case in cases:
+        found = [[mention['endorser_role'], mention['endorser']]
+                 for mention in extractor.extract(case['text']) if mention['type'] == 'endorsement']
+        if found != case['endorsements']:
+            mismatches += 1
+            print(f"  ✗ {case['text']!r}: {found} != {case['endorsements']}")
+    print(f"추천 fixture {len(cases)}개, 불일치 {mismatches}건")
+    return 1 if mismatches else 0
+
+
+def timed(func, items):
+    started = time.perf_counter()
+    results = [func(item) for item in items]
+    return time.perf_counter() - started, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="띠지·뒷표지 언급 추출 벤치마크")
+    parser.add_argument('--years', nargs='+', type=int, help="대상 연도 (기본: 전체)")
+    parser.add_argument('--copies', type=int, default=10, help="말뭉치 복제 배수")
+    parser.add_argument('--check', action='store_true', help="추천인 fixture 결과만 비교 (불일치 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    extractor = MentionExtractor()
+    if args.check:
+        sys.exit(run_check(extractor))
+
+    texts = [text for _, _, _, text in band_texts(args.years)] * args.copies
+    chars = sum(len(text) for text in texts)
+    keys = sorted({compact(surface)[0] for surface, _, _ in lexicon_entries()})
+    print(f"문구 {len(texts)}개 ({chars:,}자), 어휘 {len(keys)}개, "
+          f"오토마톤 {'pyahocorasick' if ahocorasick is not None else '순수 파이썬'}")
+    print("=" * 72)
+
+    compacted = [compact(text)[0] for text in texts]
+    naive_time, naive = timed(lambda text: naive_matches(text, keys), compacted)
+    automaton_time, found = timed(lambda text: automaton_matches(text, extractor.automaton), compacted)
+    print(f"어휘 탐색  str.find {naive_time * 1000:8.1f}ms   오토마톤 {automaton_time * 1000:8.1f}ms "
+          f"({naive_time / max(automaton_time, 1e-9):.1f}배)  결과 {'일치' if naive == found else '불일치'}")
+
+    extract_time, mentions = timed(extractor.extract, texts)
+    total = sum(len(found) for found in mentions)
+    print(f"전체 추출  {extract_time * 1000:8.1f}ms  언급 {total}개  "
+          f"{len(texts) / max(extract_time, 1e-9):,.0f} 문구/s, {chars / max(extract_time, 1e-9) / 1e6:.2f}M자/s")
+
+
+if __name__ == "__main__":
+    main()
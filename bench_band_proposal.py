@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+띠지 영역 제안(OCR 전 crop) 재현율·OCR 절감 리포트
+
+기존 *_belly.json에서 띠지로 선택된 bbox를 정답으로 보고
+1. 제안 영역이 띠지 bbox를 모두 포함하는 비율 (crop 재현율)
+2. OCR 대상 픽셀 비율 (제안 없음 → 전체 이미지로 계산)
+3. 영역 제안 자체의 소요 시간
+을 연도별로 출력한다. --ocr N을 주면 이미지 N장에 대해 실제 EasyOCR을
+전체 이미지 / 영역 제안(+전체 재OCR) 두 방식으로 돌려 시간과 결과 일치를 비교한다.
+
+사용 예:
+    python bench_band_proposal.py --years 2020 2021 2022 2023 2024
+    python bench_band_proposal.py --years 2023 --ocr 20 --cpu
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import cv2
+
+from belly_band_detector import BellyBandDetector
+
+
+def load_ground_truth(year):
+    """(이미지 경로, 띠지 bbox 또는 None) 목록"""
+    base_dir = Path(f"yearly_bestsellers_{year}")
+    cases = []
+    for json_file in sorted((base_dir / "belly_bands").glob("*_belly.json")):
+        image_file = base_dir / "covers" / (json_file.name[:-len("_belly.json")] + ".jpg")
+        if not image_file.exists():
+            continue
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        bbox = data['belly_band']['bbox'] if data.get('has_belly_band') else None
+        cases.append((image_file, bbox))
+    return cases
+
+
+def covers(regions, bbox, tolerance=2):
+    """제안 영역 중 하나가 띠지 bbox의 세로 범위를 모두 포함하는지"""
+    ys = [point[1] for point in bbox]
+    return any(start <= min(ys) + tolerance and end >= max(ys) - tolerance for start, end in regions)
+
+
+def report_year(detector, year):
+    cases = load_ground_truth(year)
+    if not cases:
+        print(f"{year}: 데이터 없음")
+        return None
+
+    bands = hits = no_proposal = 0
+    elapsed = 0.0
+    ocr_pixels = full_pixels = 0
+    for image_file, bbox in cases:
+        image = cv2.imread(str(image_file))
+        started = time.perf_counter()
+        regions = detector.propose_band_regions(image)
+        elapsed += time.perf_counter() - started
+
+        h, w = image.shape[:2]
+        full_pixels += h * w
+        ocr_pixels += sum(end - start for start, end in regions) * w if regions else h * w
+        no_proposal += not regions
+
+        if bbox is not None:
+            bands += 1
+            hits += covers(regions, bbox)
+
+    print(f"{year}: 이미지 {len(cases)}개, 띠지 {bands}개 | crop 재현율 {hits / max(bands, 1) * 100:.1f}% | "
+          f"OCR 픽셀 {ocr_pixels / full_pixels * 100:.1f}% | 제안 없음 {no_proposal}개 | "
+          f"제안 {elapsed / len(cases) * 1000:.1f}ms/장")
+    return {'images': len(cases), 'bands': bands, 'hits': hits,
+            'ocr_pixels': ocr_pixels, 'full_pixels': full_pixels}
+
+
+def compare_ocr(year, count, use_gpu):
+    """실제 OCR: 전체 이미지 vs 영역 제안 시간·띠지 텍스트 일치"""
+    images = [cv2.imread(str(image_file)) for image_file, _ in load_ground_truth(year)[:count]]
+    if not images:
+        return
+
+    full_detector = BellyBandDetector(use_gpu=use_gpu, propose_regions=False)
+    crop_detector = BellyBandDetector(use_gpu=use_gpu, propose_regions=True)
+    crop_detector._reader = full_detector.reader  # 모델 한 번만 로드
+
+    timings, selections = {}, {}
+    for name, detector in (('전체 이미지', full_detector), ('영역 제안', crop_detector)):
+        started = time.perf_counter()
+        results = [detector.ocr_images([image])[0] for image in images]
+        timings[name] = time.perf_counter() - started
+        selections[name] = [detector.select_belly_band(image.shape, result)[0]['belly_band_text']
+                            for image, result in zip(images, results)]
+
+    same = sum(a == b for a, b in zip(selections['전체 이미지'], selections['영역 제안']))
+    print(f"\n실제 OCR ({len(images)}장, {year})")
+    for name, elapsed in timings.items():
+        print(f"  {name}: {elapsed:.1f}s ({elapsed / len(images):.2f}s/장)")
+    print(f"  시간 절감: {(1 - timings['영역 제안'] / timings['전체 이미지']) * 100:.1f}%, "
+          f"띠지 텍스트 일치 {same}/{len(images)}, 전체 이미지 재OCR {crop_detector.ocr_stats['fallback']}개")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="띠지 영역 제안 재현율·OCR 절감 리포트")
+    parser.add_argument('--years', type=int, nargs='+', default=[2020, 2021, 2022, 2023, 2024])
+    parser.add_argument('--ocr', type=int, default=0, metavar='N', help="실제 OCR 비교 이미지 수 (0이면 생략)")
+    parser.add_argument('--cpu', action='store_true', help="실제 OCR 비교를 CPU로 실행")
+    args = parser.parse_args()
+
+    detector = BellyBandDetector(use_gpu=False)
+    totals = [report_year(detector, year) for year in args.years]
+    totals = [total for total in totals if total]
+
+    if totals:
+        bands = sum(total['bands'] for total in totals)
+        hits = sum(total['hits'] for total in totals)
+        ratio = sum(total['ocr_pixels'] for total in totals) / sum(total['full_pixels'] for total in totals)
+        print("=" * 60)
+        print(f"전체: crop 재현율 {hits / max(bands, 1) * 100:.1f}% ({hits}/{bands}), "
+              f"OCR 픽셀 {ratio * 100:.1f}% → 전체 재OCR 전 기준 약 {(1 - ratio) * 100:.0f}% 절감")
+        print("crop에서 띠지 후보가 없거나, 최선 후보 신뢰도가 crop_min_confidence 미만이거나, 후보가 영역 "
+              "경계에 잘리면 전체 이미지로 다시 OCR하므로 최종 재현율은 crop 재현율보다 높다.")
+
+    if args.ocr:
+        compare_ocr(args.years[0], args.ocr, use_gpu=not args.cpu)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+띠지 후보 그룹화·점수화 마이크로벤치마크
+
+기존 *_belly.json의 OCR 결과(all_texts)를 이미지 수천 장 규모로 복제해
+1. 기존 방식: 이미지마다 파이썬 루프 (정렬 → 그룹화 → bbox → 가로 띠 판정)
+2. score_ocr_batch: 전체 이미지를 연결 배열 하나로 벡터화 처리
+의 처리 시간을 비교하고, 두 방식의 선택 결과가 같은지 확인한다.
+
+사용 예:
+    python bench_band_scoring.py --year 2023 --images 5000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from belly_band_detector import bbox_corners, group_texts, score_ocr_batch
+from ocr_store import OcrStore
+
+
+def legacy_select(image_shape, results, y_threshold, min_aspect_ratio, min_width_ratio):
+    """벡터화 이전 BellyBandDetector의 후보 선택 (비교 기준)"""
+    if not results:
+        return None
+
+    sorted_results = sorted(results, key=lambda x: np.mean([p[1] for p in x[0]]))
+
+    groups = []
+    current_group = [sorted_results[0]]
+    current_y = np.mean([p[1] for p in sorted_results[0][0]])
+    for result in sorted_results[1:]:
+        result_y = np.mean([p[1] for p in result[0]])
+        if abs(result_y - current_y) < y_threshold:
+            current_group.append(result)
+        else:
+            if len(current_group) >= 2:
+                groups.append(current_group)
+            current_group = [result]
+            current_y = result_y
+    if len(current_group) >= 2:
+        groups.append(current_group)
+
+    candidates = []
+    for group in groups:
+        all_points = np.array([p for result in group for p in result[0]])
+        x_min, y_min = all_points.min(axis=0)
+        x_max, y_max = all_points.max(axis=0)
+        bbox = [[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]
+
+        width = np.linalg.norm(np.array(bbox[1]) - np.array(bbox[0]))
+        height = np.linalg.norm(np.array(bbox[2]) - np.array(bbox[1]))
+        if width < height * min_aspect_ratio or width < image_shape[1] * min_width_ratio:
+            continue
+
+        candidates.append({
+            'bbox': bbox,
+            'text': ' '.join([result[1] for result in group]),
+            'confidence': np.mean([result[2] for result in group]),
+            'text_count': len(group),
+            'position': np.mean([p[1] for p in bbox]) / image_shape[0]
+        })
+
+    if not candidates:
+        return None
+    return max(candidates, key=lambda x: x['text_count'] * x['confidence'])
+
+
+def replicate(store, images):
+    """저장소 항목을 images개가 될 때까지 복제"""
+    names = store.files()
+    replicated = OcrStore()
+    for i in range(images):
+        name = names[i % len(names)]
+        replicated.records[f"{i:06d}_{name}"] = store.records[name]
+    return replicated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="띠지 후보 그룹화·점수화 벤치마크")
+    parser.add_argument('--year', type=int, default=2023, help="OCR 결과를 가져올 연도")
+    parser.add_argument('--images', type=int, default=5000, help="복제할 이미지 수")
+    parser.add_argument('--y-threshold', type=float, default=30)
+    parser.add_argument('--min-aspect-ratio', type=float, default=2.0)
+    parser.add_argument('--min-width-ratio', type=float, default=0.3)
+    args = parser.parse_args()
+
+    base_dir = f"yearly_bestsellers_{args.year}"
+    source = OcrStore.from_belly_json(f"{base_dir}/belly_bands", f"{base_dir}/covers")
+    if not len(source):
+        print(f"OCR 결과 없음: {base_dir}/belly_bands")
+        return
+
+    store = replicate(source, args.images)
+    files, shapes, offsets, bboxes, confidences, texts = store.arrays()
+    params = (args.y_threshold, args.min_aspect_ratio, args.min_width_ratio)
+
+    print(f"원본 {len(source)}장 → {len(files)}장, 텍스트 블록 {len(texts):,}개")
+    print("=" * 60)
+
+    # 1. 기존 루프
+    per_image = [store.results_for(name) for name in files]
+    started = time.perf_counter()
+    legacy = [legacy_select(store.get(name)[0], results, *params)
+              for name, results in zip(files, per_image)]
+    legacy_elapsed = time.perf_counter() - started
+
+    # 2. 벡터화 배치
+    started = time.perf_counter()
+    scored = score_ocr_batch(shapes, offsets, bboxes, confidences, *params)
+    batch_elapsed = time.perf_counter() - started
+
+    print(f"기존 루프:    {legacy_elapsed:.3f}s → {len(files) / legacy_elapsed:,.0f} images/sec")
+    print(f"벡터화 배치:  {batch_elapsed:.3f}s → {len(files) / batch_elapsed:,.0f} images/sec")
+    print(f"속도 향상:    {legacy_elapsed / batch_elapsed:.1f}x")
+
+    # 결과 일치 확인
+    mismatches = 0
+    for name, expected, group in zip(files, legacy, scored['best_group']):
+        if expected is None or group < 0:
+            same = expected is None and group < 0
+        else:
+            same = (expected['text'] == group_texts(scored, texts, group)
+                    and expected['text_count'] == scored['group_size'][group]
+                    and np.isclose(expected['confidence'], scored['group_confidence'][group])
+                    and np.allclose(expected['bbox'], bbox_corners(scored['group_bbox'][group])))
+        if not same:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"  불일치: {name}")
+
+    found = int((scored['best_group'] >= 0).sum())
+    print(f"띠지 검출: {found}/{len(files)}, 불일치 {mismatches}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+띠지 검출기 단계별 성능·정확도 벤치마크
+
+2020~2024 covers에서 연도별로 고정 간격 표본을 뽑아 BellyBandDetector를 실행하고
+1. 단계별 지연시간 (decode / ocr(영역 제안 포함) / grouping / write, 평균·p95 ms/장)
+2. 처리량 (단계를 순서대로 실행한 images/sec, --pipeline이면 process_files 겹침 실행 포함)
+3. 최대 RSS (모델 로드 후 / 전체)
+4. 기존 *_belly.json 결과와의 일치
+   띠지 유무 일치율, precision/recall, 띠지 텍스트 일치(유사도 0.6 이상), bbox IoU
+를 출력한다. --stored-ocr이면 OCR 대신 *_belly.json의 all_texts를 써서 grouping만 비교한다.
+
+--output으로 리포트를 저장하고, 다음 실행에서 --baseline으로 넘기면 일치 지표가
+--tolerance보다 떨어졌을 때 종료 코드 1로 끝난다 (성능 변경의 품질 회귀 확인).
+
+사용 예:
+    python bench_belly_band.py --per-year 20 --output belly_bench.json
+    python bench_belly_band.py --per-year 20 --baseline belly_bench.json
+    python bench_belly_band.py --stored-ocr --per-year 200
+"""
+
+import argparse
+import json
+import resource
+import sys
+import tempfile
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from belly_band_detector import BellyBandDetector
+
+STAGES = ('decode', 'ocr', 'grouping', 'write')
+QUALITY_KEYS = ('accuracy', 'precision', 'recall', 'text_match', 'mean_iou')
+TEXT_SIMILARITY = 0.6
+
+
+def peak_rss_mb():
+    """현재 프로세스 최대 RSS (MB, Linux ru_maxrss는 KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load_expected(json_file):
+    """기존 *_belly.json → {'has_belly_band', 'text', 'bbox', 'results' (EasyOCR 형식)}"""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    band = data.get('belly_band') if data.get('has_belly_band') else None
+    return {
+        'has_belly_band': band is not None,
+        'text': band['text'] if band else None,
+        'bbox': band['bbox'] if band else None,
+        'results': [(text['bbox'], text['text'], text['confidence']) for text in data.get('all_texts', [])]
+    }
+
+
+def sample_covers(years, per_year):
+    """연도별로 *_belly.json이 있는 표지를 고정 간격으로 per_year장씩 (이미지 경로, 기존 결과)"""
+    samples = []
+    for year in years:
+        base_dir = Path(f"yearly_bestsellers_{year}")
+        cases = []
+        for json_file in sorted((base_dir / "belly_bands").glob("*_belly.json")):
+            image_file = base_dir / "covers" / (json_file.name[:-len("_belly.json")] + ".jpg")
+            if image_file.exists():
+                cases.append((image_file, json_file))
+        if not cases:
+            print(f"{year}: 데이터 없음")
+            continue
+
+        count = min(per_year, len(cases))
+        picked = sorted({int(i * len(cases) / count) for i in range(count)})
+        samples.extend((cases[i][0], load_expected(cases[i][1])) for i in picked)
+    return samples
+
+
+def bbox_iou(a, b):
+    """4점 bbox 두 개의 IoU (축 정렬 외접 사각형 기준)"""
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    ax0, ay0, ax1, ay1 = a[:, 0].min(), a[:, 1].min(), a[:, 0].max(), a[:, 1].max()
+    bx0, by0, bx1, by1 = b[:, 0].min(), b[:, 1].min(), b[:, 0].max(), b[:, 1].max()
+    inter = max(0.0, min(ax1, bx1) - max(ax0, bx0)) * max(0.0, min(ay1, by1) - max(ay0, by0))
+    union = (ax1 - ax0) * (ay1 - ay0) + (bx1 - bx0) * (by1 - by0) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def agreement(pairs):
+    """(기존 결과, 검출 결과) 목록 → 일치 지표"""
+    tp = fp = fn = tn = text_match = 0
+    ious = []
+    for expected, result in pairs:
+        detected = result['has_belly_band']
+        if expected['has_belly_band'] and detected:
+            tp += 1
+            similarity = SequenceMatcher(None, expected['text'] or '', result['belly_band_text'] or '').ratio()
+            text_match += similarity >= TEXT_SIMILARITY
+            ious.append(bbox_iou(expected['bbox'], result['bbox']))
+        elif detected:
+            fp += 1
+        elif expected['has_belly_band']:
+            fn += 1
+        else:
+            tn += 1
+
+    total = len(pairs)
+    return {
+        'images': total, 'tp': tp, 'fp': fp, 'fn': fn, 'tn': tn,
+        'accuracy': (tp + tn) / total if total else 0.0,
+        'precision': tp / (tp + fp) if tp + fp else 0.0,
+        'recall': tp / (tp + fn) if tp + fn else 0.0,
+        'text_match': text_match / (tp + fn) if tp + fn else 0.0,
+        'mean_iou': float(np.mean(ious)) if ious else 0.0
+    }
+
+
+def run_stages(detector, samples, batch_size, stored_ocr, output_path):
+    """배치 단위로 단계를 순서대로 실행하며 이미지별 단계 시간 측정"""
+    timings = {stage: [] for stage in STAGES}
+    pairs = []
+
+    for i in range(0, len(samples), batch_size):
+        batch = samples[i:i + batch_size]
+
+        images = []
+        for image_file, _ in batch:
+            started = time.perf_counter()
+            images.append(cv2.imread(str(image_file)))
+            timings['decode'].append(time.perf_counter() - started)
+
+        # 배치 OCR 시간은 이미지 수로 나눠 기록
+        started = time.perf_counter()
+        if stored_ocr:
+            batch_results = [expected['results'] for _, expected in batch]
+        else:
+            batch_results = detector.ocr_images(images, batch_size=batch_size)
+        elapsed = time.perf_counter() - started
+        timings['ocr'].extend([elapsed / len(batch)] * len(batch))
+
+        for (image_file, expected), image, results in zip(batch, images, batch_results):
+            started = time.perf_counter()
+            result = detector.analyze_results(image, results, visualize=True)
+            timings['grouping'].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            detector.save_result(image_file, result, output_path)
+            timings['write'].append(time.perf_counter() - started)
+            result.pop('visualization', None)
+            pairs.append((expected, result))
+
+        print(f"  [{min(i + batch_size, len(samples))}/{len(samples)}]", end='\r')
+
+    print()
+    return timings, pairs
+
+
+def compare_baseline(report, baseline_file, tolerance):
+    """기준 리포트보다 일치 지표가 tolerance 넘게 떨어진 항목 목록"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    if baseline.get('stored_ocr') != report['stored_ocr'] or baseline.get('years') != report['years']:
+        print("주의: 기준 리포트와 OCR 방식·연도가 달라 비교가 정확하지 않음")
+
+    regressions = []
+    for key in QUALITY_KEYS:
+        before, after = baseline['agreement'][key], report['agreement'][key]
+        if after < before - tolerance:
+            regressions.append(f"{key}: {before:.3f} → {after:.3f}")
+
+    before, after = baseline['images_per_sec'], report['images_per_sec']
+    print(f"기준 대비 처리량: {before:.2f} → {after:.2f} images/sec ({(after / before - 1) * 100:+.1f}%)"
+          if before else "기준 처리량 없음")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="띠지 검출기 단계별 성능·정확도 벤치마크")
+    parser.add_argument('--years', type=int, nargs='+', default=[2020, 2021, 2022, 2023, 2024])
+    parser.add_argument('--per-year', type=int, default=20, help="연도별 표본 수 (고정 간격)")
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--stored-ocr', action='store_true', help="OCR 대신 *_belly.json의 all_texts 사용")
+    parser.add_argument('--propose', action='store_true', help="띠지 후보 영역만 잘라 OCR")
+    parser.add_argument('--pipeline', action='store_true', help="process_files(디코드·저장 스레드 겹침) 처리량도 측정")
+    parser.add_argument('--cpu', action='store_true', help="EasyOCR을 CPU로 실행")
+    parser.add_argument('--ocr-backend', default='easyocr')
+    parser.add_argument('--output', help="리포트 JSON 저장 파일")
+    parser.add_argument('--baseline', help="비교할 이전 리포트 JSON")
+    parser.add_argument('--tolerance', type=float, default=0.02, help="허용할 일치 지표 하락 폭")
+    args = parser.parse_args()
+
+    samples = sample_covers(args.years, args.per_year)
+    if not samples:
+        print("표본 없음")
+        return
+    print(f"표본 {len(samples)}장 ({', '.join(map(str, args.years))}), 배치 {args.batch_size}"
+          f"{', 저장된 OCR 결과 사용' if args.stored_ocr else ''}")
+    print("=" * 60)
+
+    detector = BellyBandDetector(use_gpu=False if args.cpu else None, propose_regions=args.propose,
+                                 ocr_backend=args.ocr_backend)
+    started = time.perf_counter()
+    if not args.stored_ocr:
+        detector.reader.engine
+    load_time = time.perf_counter() - started
+    rss_loaded = peak_rss_mb()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        started = time.perf_counter()
+        timings, pairs = run_stages(detector, samples, args.batch_size, args.stored_ocr, Path(tmp_dir))
+        elapsed = time.perf_counter() - started
+
+        pipeline_rate = None
+        if args.pipeline and not args.stored_ocr:
+            pipeline_dir = Path(tmp_dir) / "pipeline"
+            pipeline_dir.mkdir()
+            started = time.perf_counter()
+            detector.process_files([image_file for image_file, _ in samples], pipeline_dir,
+                                   batch_size=args.batch_size)
+            pipeline_rate = len(samples) / (time.perf_counter() - started)
+
+    report = {
+        'params': detector.params(),
+        'stored_ocr': args.stored_ocr,
+        'years': args.years,
+        'images': len(samples),
+        'model_load_sec': load_time,
+        'stages': {stage: {'mean_ms': float(np.mean(values) * 1000),
+                           'p95_ms': float(np.percentile(values, 95) * 1000),
+                           'total_sec': float(np.sum(values))}
+                   for stage, values in timings.items()},
+        'images_per_sec': len(samples) / elapsed,
+        'pipeline_images_per_sec': pipeline_rate,
+        'peak_rss_mb': {'after_load': rss_loaded, 'total': peak_rss_mb()},
+        'agreement': agreement(pairs)
+    }
+
+    print(f"모델 로드 {load_time:.1f}s")
+    for stage, stats in report['stages'].items():
+        print(f"  {stage:<9} 평균 {stats['mean_ms']:8.1f}ms  p95 {stats['p95_ms']:8.1f}ms  "
+              f"합계 {stats['total_sec']:.2f}s")
+    print(f"처리량: {report['images_per_sec']:.2f} images/sec"
+          + (f", 파이프라인 {pipeline_rate:.2f} images/sec" if pipeline_rate else ""))
+    print(f"최대 RSS: 모델 로드 후 {rss_loaded:.0f}MB, 전체 {report['peak_rss_mb']['total']:.0f}MB")
+
+    result = report['agreement']
+    print(f"기존 결과 일치: 띠지 유무 {result['accuracy'] * 100:.1f}% "
+          f"(TP {result['tp']}, FP {result['fp']}, FN {result['fn']}, TN {result['tn']}) | "
+          f"precision {result['precision']:.3f}, recall {result['recall']:.3f} | "
+          f"텍스트 일치 {result['text_match'] * 100:.1f}% | bbox IoU {result['mean_iou']:.3f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        regressions = compare_baseline(report, args.baseline, args.tolerance)
+        if regressions:
+            print("품질 회귀:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"품질 회귀 없음 (허용 폭 {args.tolerance})")
+
+
+if __name__ == "__main__":
+    main()
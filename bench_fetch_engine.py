@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+fetch 엔진 처리량 벤치마크
+
+로컬 스텁 HTTP 서버(응답 지연 시뮬레이션)를 띄우고
+1. 기존 방식: requests 순차 루프 + 고정 time.sleep
+2. fetch_engine: 호스트별 동시 요청 + 토큰 버킷
+의 images/sec를 비교한다.
+
+사용 예:
+    python bench_fetch_engine.py --count 200 --latency 0.08
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+from fetch_engine import download_all
+
+
+def start_stub_server(latency, image_size):
+    """지연 후 가짜 JPEG 바이트를 돌려주는 로컬 서버 시작"""
+    body = b'\xff\xd8' + os.urandom(image_size - 4) + b'\xff\xd9'
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/jpeg')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_sequential(urls, target_dir, delay):
+    """기존 스크립트와 같은 순차 다운로드 루프"""
+    session = requests.Session()
+    started = time.monotonic()
+
+    for i, url in enumerate(urls):
+        response = session.get(url, timeout=30)
+        response.raise_for_status()
+        (target_dir / f"seq_{i:04d}.jpg").write_bytes(response.content)
+        time.sleep(delay)
+
+    return time.monotonic() - started
+
+
+def run_engine(urls, target_dir, concurrency, rate):
+    """fetch 엔진으로 동시 다운로드"""
+    jobs = [{'path': target_dir / f"engine_{i:04d}.jpg", 'url': url, 'label': url}
+            for i, url in enumerate(urls)]
+    result = download_all(jobs, on_result=lambda job: None,
+                          per_host_concurrency=concurrency, per_host_rate=rate)
+    if result['downloaded'] != len(urls):
+        raise RuntimeError(f"다운로드 누락: {result}")
+    return result['elapsed']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fetch 엔진 처리량 벤치마크")
+    parser.add_argument('--count', type=int, default=200, help="엔진 다운로드 이미지 수")
+    parser.add_argument('--baseline-count', type=int, default=20, help="순차 방식 다운로드 이미지 수")
+    parser.add_argument('--latency', type=float, default=0.08, help="스텁 서버 응답 지연 (초)")
+    parser.add_argument('--image-size', type=int, default=60_000, help="이미지 크기 (bytes)")
+    parser.add_argument('--delay', type=float, default=0.5, help="순차 방식 요청 간 sleep (초)")
+    parser.add_argument('--concurrency', type=int, default=8, help="엔진 호스트별 동시 요청 수")
+    parser.add_argument('--rate', type=float, default=50.0, help="엔진 호스트별 초당 요청 수")
+    args = parser.parse_args()
+
+    server = start_stub_server(args.latency, args.image_size)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"스텁 서버: {base_url} (지연 {args.latency * 1000:.0f}ms, {args.image_size:,} bytes)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        target_dir = Path(tmp)
+
+        urls = [f"{base_url}/seq/{i}.jpg" for i in range(args.baseline_count)]
+        elapsed = run_sequential(urls, target_dir, args.delay)
+        print(f"순차 + sleep({args.delay}s): {len(urls)}개 {elapsed:.2f}s → {len(urls) / elapsed:.1f} images/sec")
+
+        urls = [f"{base_url}/engine/{i}.jpg" for i in range(args.count)]
+        elapsed = run_engine(urls, target_dir, args.concurrency, args.rate)
+        print(f"fetch 엔진 (동시 {args.concurrency}, {args.rate:.0f} req/s): "
+              f"{len(urls)}개 {elapsed:.2f}s → {len(urls) / elapsed:.1f} images/sec")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+목록·상품 페이지 HTML 추출 벤치마크
+
+페이지 종류(wbest 목록 / wproduct 상품)별로 html_extract 파서마다
+1. 페이지당 파싱 시간 (평균, p95)
+2. BeautifulSoup(html.parser) 결과와 추출 필드가 같은지
+를 출력한다. 상품 페이지는 정규식 fast path(letslook/cover500)도 함께 잰다.
+
+fixture는 .http_cache에 저장된 wbest.aspx / wproduct.aspx 응답을 쓰고,
+없으면 알라딘 페이지 구조를 흉내 낸 HTML을 만든다.
+
+--check는 시간을 재지 않고 fixtures/html/의 익명화한 목록·상품 페이지
+(와 .http_cache 응답)에서 각 파서·정규식 fast path 결과를 bs4와 비교해
+하나라도 다르면 종료 코드 1로 끝난다.
+
+사용 예:
+    python bench_html_extract.py --repeat 20
+    python bench_html_extract.py --check
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from html_extract import BESTSELLER_ITEMS, PRODUCT_IMAGES, available_parsers
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "html"
+
+
+def recorded_fixtures(cache_dir, pattern):
+    """HttpCache에 저장된 응답 중 URL이 pattern을 포함하는 본문"""
+    index = Path(cache_dir) / "index.sqlite"
+    if not index.exists():
+        return []
+
+    db = sqlite3.connect(str(index))
+    rows = db.execute("SELECT key FROM entries WHERE url LIKE ? AND status = 200", (f"%{pattern}%",)).fetchall()
+    db.close()
+
+    fixtures = []
+    for (key,) in rows:
+        body_file = Path(cache_dir) / key[:2] / key
+        if body_file.exists():
+            fixtures.append(body_file.read_bytes().decode('utf-8', errors='replace'))
+    return fixtures
+
+
+def committed_fixtures(prefix):
+    """저장소에 넣어 둔 익명화 페이지 {파일명: HTML}"""
+    return {path.name: path.read_text(encoding='utf-8') for path in sorted(FIXTURE_DIR.glob(f"{prefix}*.html"))}
+
+
+def page_chrome(body):
+    """헤더·스크립트·메뉴 등 실제 페이지의 부가 마크업"""
+    menu = ''.join(f'<li><a href="/shop/wbrowse.aspx?CID={i}"><img src="//image.aladin.co.kr/img/menu/{i}.gif" alt=""> 분야 {i}</a></li>'
+                   for i in range(120))
+    script = ('<script type="text/javascript">var banner = "<img src=\\"//image.aladin.co.kr/banner.jpg\\">";'
+              + 'function f(a, b) { return a < b && b > 0; }' * 50 + '</script>')
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>알라딘</title>{script}</head>'
+            f'<body><div id="header"><ul class="menu">{menu}</ul></div>'
+            f'<!-- <img src="//image.aladin.co.kr/old_banner.jpg"> -->{body}'
+            f'<div id="footer">{script}</div></body></html>')
+
+
+def synthetic_bestseller_page(page, count=50):
+    boxes = []
+    for i in range(1, count + 1):
+        item_id = 320000000 + page * 1000 + i
+        rank = (page - 1) * count + i
+        boxes.append(
+            f'<div class="ss_book_box" itemid="{item_id}"><table><tr>'
+            f'<td valign="top"><div class="ss_f_g2">{rank}.</div></td>'
+            f'<td><a href="/shop/wproduct.aspx?ItemId={item_id}"><img class="i_cover front_cover" '
+            f'src="//image.aladin.co.kr/product/{item_id // 10000}/{item_id % 100:02d}/cover150/{item_id}_1.jpg"></a></td>'
+            f'<td><div class="ss_book_list"><ul>'
+            f'<li><span class="ss_ht1">[국내도서]</span><a href="/shop/wproduct.aspx?ItemId={item_id}" class="bo3">'
+            f'<b>소설 제목 {rank} - 특별판</b></a></li>'
+            f'<li><a href="/author/{i}">작가{i}</a> (지은이) | <a href="/pub/{i}">문학동네</a> | 2023년 8월</li>'
+            f'<li><span class="ss_p2">15,120원</span> (10%, 1,680원 할인) &amp; 마일리지</li>'
+            f'</ul></div></td></tr></table></div>')
+    return page_chrome(''.join(boxes))
+
+
+def synthetic_product_page(item_id):
+    path = f"//image.aladin.co.kr/product/{item_id // 10000}/{item_id % 100:02d}"
+    body = (f'<div class="prd_img"><img id="CoverMainImage" class="cover_image" src="{path}/cover500/{item_id}_1.jpg"></div>'
+            + ''.join(f'<img src="{path}/letslook/{item_id}_{suffix}.jpg" alt="">' for suffix in ('f', 'b', 't1', 't2'))
+            + ''.join(f'<div class="review"><img src="//image.aladin.co.kr/img/star{i % 5}.gif"></div>' for i in range(80)))
+    return page_chrome(body)
+
+
+def bench(extract, fixtures, repeat):
+    """페이지당 시간 목록(초)과 첫 번째 실행 결과"""
+    results = [extract(html) for html in fixtures]
+    times = []
+    for _ in range(repeat):
+        for html in fixtures:
+            started = time.perf_counter()
+            extract(html)
+            times.append(time.perf_counter() - started)
+    return np.array(times), results
+
+
+def report(kind, fixtures, parsers, repeat):
+    print(f"\n[{kind}] fixture {len(fixtures)}개, 평균 {np.mean([len(html) for html in fixtures]) / 1024:.0f}KB")
+    reference = None
+    for name, extract in parsers:
+        times, results = bench(extract, fixtures, repeat)
+        if reference is None:
+            reference = results
+        same = sum(result == expected for result, expected in zip(results, reference))
+        print(f"  {name:10s}: 평균 {times.mean() * 1000:6.2f}ms, p95 {np.percentile(times, 95) * 1000:6.2f}ms, "
+              f"bs4와 같은 결과 {same}/{len(fixtures)}")
+
+
+def check(kind, fixtures, parsers):
+    """각 파서 결과를 bs4와 비교해 다른 fixture 수"""
+    mismatches = 0
+    for name, html in fixtures.items():
+        expected = parsers['bs4'](html)
+        for parser_name, extract in parsers.items():
+            if parser_name == 'bs4':
+                continue
+            result = extract(html)
+            if result != expected:
+                mismatches += 1
+                print(f"  ✗ [{kind}] {name} {parser_name}: {result} != bs4 {expected}")
+    print(f"[{kind}] fixture {len(fixtures)}개 × 파서 {len(parsers) - 1}개, 불일치 {mismatches}건")
+    return mismatches
+
+
+def run_check(cache_dir, names):
+    list_pages = committed_fixtures('wbest')
+    list_pages.update((f"cache:{i}", html) for i, html in enumerate(recorded_fixtures(cache_dir, 'wbest.aspx')))
+    product_pages = committed_fixtures('wproduct')
+    product_pages.update((f"cache:{i}", html) for i, html in enumerate(recorded_fixtures(cache_dir, 'wproduct.aspx')))
+
+    mismatches = check("wbest 목록", list_pages, {name: BESTSELLER_ITEMS[name] for name in names}) \
+        + check("wproduct 상품", product_pages, {name: PRODUCT_IMAGES[name] for name in names + ['regex']})
+    return 1 if mismatches else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 추출 벤치마크")
+    parser.add_argument('--cache-dir', default=".http_cache")
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--pages', type=int, default=10, help="합성 fixture 수")
+    parser.add_argument('--check', action='store_true', help="fixture별 결과만 bs4와 비교 (불일치 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    names = ['bs4'] + [name for name in available_parsers() if name != 'bs4']
+    print(f"사용 가능한 파서: {', '.join(available_parsers())}")
+    if args.check:
+        sys.exit(run_check(args.cache_dir, names))
+
+    list_pages = recorded_fixtures(args.cache_dir, 'wbest.aspx') \
+        or [synthetic_bestseller_page(page) for page in range(1, args.pages + 1)]
+    report("wbest 목록", list_pages, [(name, BESTSELLER_ITEMS[name]) for name in names], args.repeat)
+
+    product_pages = recorded_fixtures(args.cache_dir, 'wproduct.aspx') \
+        or [synthetic_product_page(321294005 + i) for i in range(args.pages)]
+    report("wproduct 상품", product_pages, [(name, PRODUCT_IMAGES[name]) for name in names + ['regex']], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
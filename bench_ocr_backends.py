@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OCR 백엔드별 지연시간·처리량 벤치마크
+
+연도별 covers 이미지에 대해 백엔드마다
+1. 초기화(모델 로드) 시간
+2. 한 장씩 readtext 지연시간 (평균, p95)
+3. 배치 처리량 (images/sec, BellyBandDetector 배치 경로)
+4. 기존 *_belly.json 띠지 텍스트와 같은 띠지를 고른 비율
+을 출력한다. 설치되지 않은 백엔드는 건너뛴다.
+
+사용 예:
+    python bench_ocr_backends.py --year 2023 --count 30 --backends easyocr tesseract
+"""
+
+import argparse
+import json
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from belly_band_detector import BellyBandDetector
+
+
+def load_covers(year, count):
+    """(이미지, 기존 띠지 텍스트 또는 None) 목록"""
+    base_dir = Path(f"yearly_bestsellers_{year}")
+    samples = []
+    for image_file in sorted((base_dir / "covers").glob("*.jpg"))[:count]:
+        image = cv2.imread(str(image_file))
+        if image is None:
+            continue
+
+        expected = None
+        json_file = base_dir / "belly_bands" / f"{image_file.stem}_belly.json"
+        if json_file.exists():
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('has_belly_band'):
+                expected = data['belly_band']['text']
+        samples.append((image, expected))
+    return samples
+
+
+def bench_backend(name, samples, batch_size, use_gpu):
+    detector = BellyBandDetector(use_gpu=use_gpu, propose_regions=False, ocr_backend=name)
+    backend = detector.reader
+
+    started = time.perf_counter()
+    try:
+        backend.engine
+    except Exception as e:
+        print(f"{name}: 건너뜀 ({e})")
+        return
+    load_time = time.perf_counter() - started
+
+    latencies = []
+    for image, _ in samples:
+        started = time.perf_counter()
+        backend.readtext(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        latencies.append(time.perf_counter() - started)
+
+    images = [image for image, _ in samples]
+    started = time.perf_counter()
+    results = []
+    for i in range(0, len(images), batch_size):
+        results.extend(detector.detect_text_regions_batch(images[i:i + batch_size], batch_size=batch_size))
+    batch_time = time.perf_counter() - started
+
+    # 기존 띠지 텍스트와 비슷한(유사도 0.6 이상) 띠지를 골랐는지
+    expected_count = agreed = 0
+    for (image, expected), result in zip(samples, results):
+        if expected is None:
+            continue
+        expected_count += 1
+        selected = detector.select_belly_band(image.shape, result)[0]['belly_band_text']
+        if selected and SequenceMatcher(None, expected, selected).ratio() >= 0.6:
+            agreed += 1
+
+    print(f"{name} ({backend.device}): 초기화 {load_time:.1f}s | "
+          f"readtext 평균 {np.mean(latencies) * 1000:.0f}ms, p95 {np.percentile(latencies, 95) * 1000:.0f}ms | "
+          f"배치 {len(images) / batch_time:.2f} images/sec | "
+          f"기존 띠지 일치 {agreed}/{expected_count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 백엔드 벤치마크")
+    parser.add_argument('--year', type=int, default=2023)
+    parser.add_argument('--count', type=int, default=30, help="사용할 표지 수")
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--backends', nargs='+', default=['easyocr', 'tesseract'])
+    parser.add_argument('--cpu', action='store_true', help="EasyOCR을 CPU로 실행")
+    args = parser.parse_args()
+
+    samples = load_covers(args.year, args.count)
+    print(f"{args.year}년 표지 {len(samples)}장")
+    print("=" * 60)
+
+    for name in args.backends:
+        bench_backend(name, samples, args.batch_size, use_gpu=False if args.cpu else None)
+
+
+if __name__ == "__main__":
+    main()
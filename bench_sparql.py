@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OBI SPARQL 질의 지연시간 벤치마크
+
+5개 연도 통합 그래프로 docs/files/OBI_SPARQL질의.rq의 질의별로
+1. 로드 시간 (rdflib 기본 Memory 저장소 vs SPO/POS/OSP 색인 SimpleMemory vs graph_snapshot 이진 스냅샷 mmap)
+2. 매번 질의 문자열 파싱 (graph.query(text)) vs 준비된 계획 (ObiQueryService.run, 색인·스냅샷) 평균·p95 ms
+3. 로컬 HTTP 엔드포인트 왕복 (/query/NN, JSON 결과 직렬화 포함 — 02·03·05·07은 엔드포인트 기본대로 사전 집계)
+4. 결과 행 수 (저장소 사이 결과가 다르면 표시)
+5. graph_materialize.py 사전 집계(02·03·05·07) 읽기 시간과 SPARQL 결과 일치 (--no-aggregates면 생략)
+를 출력한다.
+
+결과가 0행인 질의도 시간을 그대로 보고하고(빈 결과도 유효한 지연시간) "결과 없음"으로 표시한다.
+--fail-empty면 빈 결과 질의가 하나라도 있을 때 종료 코드 1로 끝난다.
+
+사용 예:
+    python bench_sparql.py --repeat 20
+    python bench_sparql.py --graph OBI_통합그래프_전수.nt --output sparql_bench.json
+"""
+
+import argparse
+import gc
+import json
+import sys
+import threading
+import time
+from urllib.request import urlopen
+
+import numpy as np
+
+from graph_materialize import AGGREGATES, aggregate, materialize
+from graph_snapshot import ensure_snapshot
+from sparql_endpoint import GRAPH_FILE, QUERY_FILE, SCHEMA_FILE, ObiQueryService, ensure_graph, make_server
+
+STORES = ('Memory', 'SimpleMemory')
+
+
+def measure(func, repeat):
+    """
+    func를 repeat번 실행한 시간(ms) 목록과 마지막 반환값
+
+    첫 실행은 예열로 버리고(스냅샷 블록·용어 캐시, 질의 계획), timeit처럼 측정 중에는 GC를 끈다 —
+    앞서 읽은 그래프들 때문에 도는 전체 수집이 우연히 걸린 질의의 시간에 얹히지 않게.
+    """
+    timings = []
+    value = func()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            value = func()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+    return timings, value
+
+
+def summarize(timings):
+    return {'mean_ms': float(np.mean(timings)), 'p95_ms': float(np.percentile(timings, 95))}
+
+
+def result_rows(result):
+    """결과 비교용 정렬된 행 목록"""
+    if result.type == 'SELECT':
+        return sorted(tuple('' if value is None else str(value) for value in row) for row in result)
+    if result.type == 'ASK':
+        return [result.askAnswer]
+    return sorted(tuple(str(term) for term in triple) for triple in result.graph)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OBI SPARQL 질의 지연시간 벤치마크")
+    parser.add_argument('--graph', nargs='+', help=f"ABox 파일 (기본: {GRAPH_FILE}를 생성·갱신해 사용)")
+    parser.add_argument('--schema', default=SCHEMA_FILE)
+    parser.add_argument('--queries', default=QUERY_FILE)
+    parser.add_argument('--repeat', type=int, default=10, help="질의별 반복 횟수")
+    parser.add_argument('--no-http', action='store_true', help="HTTP 왕복 측정 생략")
+    parser.add_argument('--no-aggregates', action='store_true', help="사전 집계 없이 모든 질의를 SPARQL로 측정")
+    parser.add_argument('--fail-empty', action='store_true', help="결과 없는 질의가 있으면 종료 코드 1")
+    parser.add_argument('--output', help="리포트 JSON 저장 파일")
+    args = parser.parse_args()
+
+    graph_files = args.graph or [ensure_graph()]
+    services = {}
+    for store in STORES:
+        services[store] = ObiQueryService(graph_files, schema_file=args.schema, query_file=args.queries, store=store)
+        print(f"{store:<12} 로드 {services[store].load_time:.2f}s, 트리플 {len(services[store])}개")
+    snapshot = ensure_snapshot(list(graph_files) + ([args.schema] if args.schema else []))
+    services['snapshot'] = ObiQueryService(graph_files, schema_file=args.schema, query_file=args.queries,
+                                           snapshot=snapshot)
+    print(f"{'snapshot':<12} 열기 {services['snapshot'].load_time * 1000:.1f}ms, 트리플 {len(services['snapshot'])}개")
+    service = services['SimpleMemory']
+    aggregates = None if args.no_aggregates else materialize(graph_files[0], args.schema)[1]
+    service.aggregates = aggregates
+    print(f"질의 준비 {len(service.canned)}개: {service.prepare_time * 1000:.0f}ms")
+    print("=" * 72)
+
+    server = None
+    if not args.no_http:
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    report = {'graph': [str(path) for path in graph_files], 'triples': len(service), 'repeat': args.repeat,
+              'load_sec': {store: other.load_time for store, other in services.items()},
+              'prepare_ms': service.prepare_time * 1000, 'queries': {}}
+
+    print(f"{'질의':<4} {'행':>5} {'Memory+파싱':>12} {'색인+파싱':>10} {'색인+계획':>10} {'p95':>8} "
+          f"{'스냅샷+계획':>10} {'HTTP':>8}")
+    for name, query in service.canned.items():
+        entry = {'title': query['title']}
+        rows = {}
+        for store in STORES:
+            graph = services[store].graph
+            timings, result = measure(lambda: result_rows(graph.query(query['text'])), args.repeat)
+            entry[f"{store}_text"] = summarize(timings)
+            rows[store] = result
+
+        timings, _ = measure(lambda: result_rows(service.run(name=name)), args.repeat)
+        entry['prepared'] = summarize(timings)
+        timings, result = measure(lambda: result_rows(services['snapshot'].run(name=name)), args.repeat)
+        entry['snapshot'] = summarize(timings)
+        rows['snapshot'] = result
+        entry['rows'] = len(rows['SimpleMemory'])
+        # 공노드 이름은 저장소마다 달라 행 수만 비교
+        entry['same_rows'] = rows['Memory'] == rows['SimpleMemory'] and len(rows['snapshot']) == entry['rows']
+        entry['empty'] = not entry['rows']
+
+        if server is not None:
+            timings, _ = measure(lambda: urlopen(f"{base_url}/query/{name}").read(), args.repeat)
+            entry['http'] = summarize(timings)
+
+        if aggregates is not None and name in AGGREGATES:
+            timings, (_, values) = measure(lambda: aggregate(aggregates, name), args.repeat)
+            entry['aggregate'] = summarize(timings)
+            entry['aggregate_same_rows'] = rows['SimpleMemory'] == sorted(
+                tuple('' if value is None else str(value) for value in row) for row in values)
+
+        report['queries'][name] = entry
+        http = f"{entry['http']['mean_ms']:8.1f}" if server is not None else f"{'-':>8}"
+        print(f"{name:<4} {entry['rows']:>5} {entry['Memory_text']['mean_ms']:12.1f} "
+              f"{entry['SimpleMemory_text']['mean_ms']:10.1f} {entry['prepared']['mean_ms']:10.1f} "
+              f"{entry['prepared']['p95_ms']:8.1f} {entry['snapshot']['mean_ms']:10.1f} {http}"
+              f"{'' if entry['same_rows'] else '  (저장소별 결과 다름)'}  {query['title']}"
+              f"{'  (결과 없음)' if entry['empty'] else ''}")
+        if 'aggregate' in entry:
+            print(f"     사전 집계 {entry['aggregate']['mean_ms']:.2f}ms"
+                  f"{'' if entry['aggregate_same_rows'] else ' (SPARQL 결과와 다름)'}")
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+    empty = [name for name, entry in report['queries'].items() if entry['empty']]
+    total = {key: sum(entry[key]['mean_ms'] for entry in report['queries'].values())
+             for key in ('Memory_text', 'SimpleMemory_text', 'prepared', 'snapshot')}
+    report['total_ms'] = total
+    report['empty'] = empty
+    print("=" * 72)
+    print(f"질의 {len(report['queries'])}개 평균 합계: Memory+파싱 {total['Memory_text']:.1f}ms, "
+          f"색인+파싱 {total['SimpleMemory_text']:.1f}ms, 색인+계획 {total['prepared']:.1f}ms, "
+          f"스냅샷+계획 {total['snapshot']:.1f}ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if empty:
+        print(f"결과 없는 질의: {', '.join(empty)} (그래프에 해당 데이터가 없음)")
+        if args.fail_empty:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
 import urllib.request
 import urllib.parse
 import os
 import time
 from pathlib import Path
 
+from aladin_api import AladinApiClient
+
 class BestsellerCoverScraper:
     def __init__(self, ttb_key, download_dir="bestseller_covers", year=2024):
         """
@@ -17,6 +18,7 @@ class BestsellerCoverScraper:
         self.year = year
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(exist_ok=True)
+        self.api = AladinApiClient(ttb_key)
 
         print(f"다운로드 디렉토리: {self.download_dir}")
         print(f"대상 연도: {self.year}년")
@@ -27,58 +29,19 @@ class BestsellerCoverScraper:
         """
         print(f"{self.year}년 한국소설 베스트셀러 데이터 수집 중...")
 
-        all_books = []
-
-        # 1페이지 (1-50위)
-        books_page1 = self._get_bestseller_page(1, 50, year=self.year)
-        all_books.extend(books_page1)
-
-        # 2페이지 (51-100위)
-        books_page2 = self._get_bestseller_page(51, 50, year=self.year)
-        all_books.extend(books_page2)
-
-        # 100위까지만 제한
-        bestsellers = all_books[:max_results]
-
-        print(f"총 {len(bestsellers)}개 베스트셀러 수집 완료")
-        return bestsellers
-
-    def _get_bestseller_page(self, start, max_results, year=2024):
-        """
-        베스트셀러 특정 페이지 가져오기
-        """
-        base_url = "http://www.aladin.co.kr/ttb/api/ItemList.aspx"
-
-        params = {
-            'ttbkey': self.ttb_key,
-            'QueryType': 'Bestseller',  # 베스트셀러
-            'MaxResults': max_results,
-            'start': start,
-            'SearchTarget': 'Book',
-            'output': 'JS',
-            'Version': '20131101',
-            'Cover': 'Big',
-            'CategoryId': 50993  # 한국소설 (2000년대 이후)
-        }
-
-        query_string = urllib.parse.urlencode(params)
-        url = f"{base_url}?{query_string}"
-
+        # 50개씩 페이지를 넘기며 필요한 만큼만 요청
+        items = self.api.item_list('Bestseller', category_id=50993,  # 한국소설 (2000년대 이후)
+                                   max_results=max_results)
+        bestsellers = []
         try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                content = response.read().decode('utf-8')
-
-            data = json.loads(content)
-            books = data.get('item', [])
-
-            print(f"페이지 {start}~{start+max_results-1}: {len(books)}개 수집")
-            time.sleep(1)  # API 호출 제한
-
-            return books
-
+            for item in items:
+                bestsellers.append(item)
         except Exception as e:
-            print(f"페이지 {start} 수집 오류: {e}")
-            return []
+            print(f"베스트셀러 {len(bestsellers) + 1}위부터 수집 오류: {e}")
+
+        print(f"총 {len(bestsellers)}개 베스트셀러 수집 완료 "
+              f"(API 호출 {self.api.stats['calls']}회, 오늘 남은 호출 {self.api.quota.remaining}회)")
+        return bestsellers
 
     def download_cover_image(self, cover_url, filename, retry_count=3):
         """
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+베스트셀러 통합 카탈로그 (SQLite)
+
+연도별 bestseller_data.json(연도 루트 또는 covers/ 아래)과
+{rank:03d}_{item_id}_{제목}_{저자}.jpg 파일명 재구성 대신
+도서·연도별 순위·이미지 파일·띠지 결과를 한 DB에서 관리한다.
+
+테이블:
+    books       item_id(PK), isbn13, title, author, publisher, pubdate, cover_url
+    rankings    (year, category_id, rank) → item_id
+    images      path(PK) → item_id, year, kind(front/back), sha256, size, mtime
+    belly_bands image_path(PK) → has_belly_band, text, confidence, position, bbox
+    image_meta  path(PK) → 검증 상태, 원본 크기, pHash·dHash, 정규화 파생본 경로·크기 (image_ingest)
+
+목록 레코드의 'isbn13' 필드는 실제로 알라딘 ItemId이므로, books.isbn13에는 상품 페이지
+(product_images.json 레코드의 isbn13)나 TTB ItemLookUp 응답의 실제 ISBN-13을 채운다.
+
+사용 예:
+    python catalog.py import              # 기존 JSON·이미지·띠지 결과·상품 페이지 ISBN 가져오기
+    python catalog.py isbn                # ISBN-13이 빈 도서를 ItemLookUp으로 채우기 (ALADIN_TTB_KEY)
+    python catalog.py stats
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+CATALOG_FILE = "catalog.sqlite"
+KOREAN_NOVEL_CID = 50917
+BASE_DIR = "yearly_bestsellers"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    item_id TEXT PRIMARY KEY,
+    isbn13 TEXT,
+    title TEXT NOT NULL,
+    author TEXT,
+    publisher TEXT,
+    pubdate TEXT,
+    cover_url TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_books_isbn13 ON books(isbn13);
+
+CREATE TABLE IF NOT EXISTS rankings (
+    year INTEGER NOT NULL,
+    category_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    item_id TEXT NOT NULL REFERENCES books(item_id),
+    PRIMARY KEY (year, category_id, rank)
+);
+CREATE INDEX IF NOT EXISTS idx_rankings_item ON rankings(item_id);
+
+CREATE TABLE IF NOT EXISTS images (
+    path TEXT PRIMARY KEY,
+    item_id TEXT,
+    year INTEGER,
+    kind TEXT NOT NULL,
+    sha256 TEXT,
+    size INTEGER,
+    mtime REAL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_images_item ON images(item_id);
+CREATE INDEX IF NOT EXISTS idx_images_year_kind ON images(year, kind);
+
+CREATE TABLE IF NOT EXISTS belly_bands (
+    image_path TEXT PRIMARY KEY REFERENCES images(path),
+    has_belly_band INTEGER NOT NULL,
+    text TEXT,
+    confidence REAL,
+    position REAL,
+    bbox TEXT,
+    detector_version TEXT,
+    params TEXT,
+    detected_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS image_meta (
+    path TEXT PRIMARY KEY REFERENCES images(path),
+    item_id TEXT,
+    sha256 TEXT,
+    status TEXT NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    phash TEXT,
+    dhash TEXT,
+    normalized_path TEXT,
+    normalized_width INTEGER,
+    normalized_height INTEGER,
+    params TEXT,
+    ingested_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_image_meta_sha256 ON image_meta(sha256);
+"""
+
+IMAGE_NAME_PATTERN = re.compile(r'^(\d{3})_([^_]+)_')
+YEAR_DIR_PATTERN = re.compile(r'yearly_bestsellers_(\d{4})')
+ISBN13_PATTERN = re.compile(r'^97[89]\d{10}$')
+
+
+def book_isbn13(book):
+    """도서 dict의 실제 ISBN-13 (API 레코드 isbn13·isbn 중 ISBN-13 형식인 값, 없으면 None)"""
+    for key in ('isbn13', 'isbn'):
+        value = str(book.get(key) or '').replace('-', '')
+        if ISBN13_PATTERN.match(value):
+            return value
+    return None
+
+
+def parse_years(values):
+    """['2010-2014', '2020'] → [2010, ..., 2014, 2020]"""
+    years = []
+    for value in values:
+        if '-' in value:
+            start, end = (int(part) for part in value.split('-'))
+            years.extend(range(min(start, end), max(start, end) + 1))
+        else:
+            years.append(int(value))
+    return sorted(set(years))
+
+
+def image_key(path):
+    """이미지 경로를 카탈로그 키로 정규화 (Windows 구분자 포함)"""
+    return Path(str(path).replace('\\', '/')).as_posix()
+
+
+def parse_image_path(path):
+    """경로에서 (연도, 종류, 순위, item_id) 추출, 알 수 없으면 None"""
+    path = Path(image_key(path))
+    year_match = YEAR_DIR_PATTERN.search(path.as_posix())
+    name_match = IMAGE_NAME_PATTERN.match(path.name)
+
+    kind = 'back' if path.parent.name == 'back_covers' or path.stem.endswith('_back') else 'front'
+    return {
+        'year': int(year_match.group(1)) if year_match else None,
+        'kind': kind,
+        'rank': int(name_match.group(1)) if name_match else None,
+        'item_id': name_match.group(2) if name_match else None
+    }
+
+
+class Catalog:
+    _default = None
+
+    def __init__(self, db_file=CATALOG_FILE):
+        """
+        카탈로그 DB 열기 (없으면 생성)
+        """
+        self.db_file = Path(db_file)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    @classmethod
+    def default(cls):
+        """프로세스 공용 카탈로그 인스턴스"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def close(self):
+        self._db.close()
+
+    # ----- 도서 / 순위 -----
+
+    def upsert_books(self, year, books, category_id=KOREAN_NOVEL_CID):
+        """
+        스크래퍼 도서 목록 저장 (기존 bestseller_data.json 레코드 형식)
+
+        레코드의 'isbn13' 필드에는 실제로 알라딘 ItemId가 들어 있으므로
+        item_id로 저장하고, ISBN-13 형식일 때만(API 레코드) isbn13 컬럼에도 기록한다.
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            for book in books:
+                rank = book.get('rank')
+                item_id = str(book.get('item_id') or book.get('isbn13') or f"book_{year}_{rank}")
+                isbn13 = book_isbn13(book)
+
+                self._db.execute("""
+                    INSERT INTO books (item_id, isbn13, title, author, publisher, pubdate, cover_url, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(item_id) DO UPDATE SET
+                        isbn13 = COALESCE(excluded.isbn13, books.isbn13),
+                        title = excluded.title,
+                        author = COALESCE(NULLIF(excluded.author, ''), books.author),
+                        publisher = COALESCE(NULLIF(excluded.publisher, ''), books.publisher),
+                        pubdate = COALESCE(NULLIF(excluded.pubdate, ''), books.pubdate),
+                        cover_url = COALESCE(NULLIF(excluded.cover_url, ''), books.cover_url),
+                        updated_at = excluded.updated_at
+                """, (item_id, isbn13, book.get('title', ''), book.get('author', ''),
+                      book.get('publisher', ''), book.get('pubdate', ''), book.get('cover_url', ''), now))
+
+                if rank is not None:
+                    self._db.execute("INSERT OR REPLACE INTO rankings VALUES (?, ?, ?, ?)",
+                                     (year, category_id, int(rank), item_id))
+            self._db.commit()
+
+    def books_for_year(self, year, category_id=KOREAN_NOVEL_CID, import_legacy=True):
+        """
+        연도별 순위 순 도서 목록 (bestseller_data.json과 같은 dict 형식)
+
+        카탈로그에 해당 연도가 없으면 기존 JSON에서 먼저 가져온다.
+        """
+        rows = self._query("""
+            SELECT r.rank, b.title, b.author, b.item_id, b.cover_url, b.publisher, b.pubdate
+            FROM rankings r JOIN books b ON b.item_id = r.item_id
+            WHERE r.year = ? AND r.category_id = ?
+            ORDER BY r.rank
+        """, (year, category_id))
+
+        if not rows and import_legacy and self.import_legacy_year(year)['books']:
+            return self.books_for_year(year, category_id, import_legacy=False)
+
+        return [{
+            'rank': row['rank'],
+            'title': row['title'],
+            'author': row['author'] or '',
+            'isbn13': row['item_id'],
+            'cover_url': row['cover_url'] or '',
+            'publisher': row['publisher'] or '',
+            'pubdate': row['pubdate'] or ''
+        } for row in rows]
+
+    def book(self, item_id):
+        rows = self._query("SELECT * FROM books WHERE item_id = ?", (str(item_id),))
+        return dict(rows[0]) if rows else None
+
+    def find_by_isbn(self, isbn13):
+        return [dict(row) for row in self._query("SELECT * FROM books WHERE isbn13 = ?", (isbn13,))]
+
+    def set_isbn13(self, item_id, isbn13):
+        """상품 페이지·ItemLookUp에서 확인한 ISBN-13 기록 (형식이 아니면 무시, 기록했으면 True)"""
+        isbn13 = str(isbn13 or '').replace('-', '')
+        if not ISBN13_PATTERN.match(isbn13):
+            return False
+        with self._lock:
+            updated = self._db.execute("UPDATE books SET isbn13 = ?, updated_at = ? WHERE item_id = ?",
+                                       (isbn13, datetime.now().isoformat(), str(item_id))).rowcount
+            self._db.commit()
+        return bool(updated)
+
+    def missing_isbn13(self):
+        """ISBN-13이 비어 있는 알라딘 ItemId 목록"""
+        rows = self._query("SELECT item_id FROM books WHERE isbn13 IS NULL OR isbn13 = '' ORDER BY item_id")
+        return [row['item_id'] for row in rows if row['item_id'].isdigit()]
+
+    def fill_isbn13(self, api):
+        """
+        ISBN-13이 빈 도서를 TTB ItemLookUp(ItemIdType=ItemId)으로 채우기
+
+        Args:
+            api (AladinApiClient): 일일 한도를 기록하는 API 클라이언트
+
+        Returns:
+            dict: filled, missing (조회했지만 ISBN-13이 없는 상품)
+        """
+        stats = {'filled': 0, 'missing': 0}
+        for item_id, item in api.lookup_many(self.missing_isbn13(), id_type='ItemId'):
+            if item is not None and self.set_isbn13(item_id, item.get('isbn13')):
+                stats['filled'] += 1
+            else:
+                stats['missing'] += 1
+        return stats
+
+    # ----- 이미지 -----
+
+    def register_image(self, path, item_id=None, year=None, kind=None, sha256=None):
+        """이미지 파일 등록/갱신 (item_id·연도·종류는 없으면 경로에서 추출)"""
+        key = image_key(path)
+        parsed = parse_image_path(key)
+        stat = Path(key).stat() if Path(key).exists() else None
+
+        with self._lock:
+            self._db.execute("""
+                INSERT INTO images (path, item_id, year, kind, sha256, size, mtime, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    item_id = COALESCE(excluded.item_id, images.item_id),
+                    year = COALESCE(excluded.year, images.year),
+                    kind = excluded.kind,
+                    sha256 = CASE WHEN excluded.size IS images.size AND excluded.mtime IS images.mtime
+                                  THEN COALESCE(excluded.sha256, images.sha256) ELSE excluded.sha256 END,
+                    size = excluded.size,
+                    mtime = excluded.mtime,
+                    updated_at = excluded.updated_at
+            """, (key, item_id or parsed['item_id'], year or parsed['year'], kind or parsed['kind'], sha256,
+                  stat.st_size if stat else None, stat.st_mtime if stat else None, datetime.now().isoformat()))
+            self._db.commit()
+
+    def register_jobs(self, jobs, year, kind):
+        """fetch_engine 다운로드 작업 중 파일이 있는 항목 등록"""
+        count = 0
+        for job in jobs:
+            if job.get('status') in ('ok', 'exists'):
+                self.register_image(job['path'], item_id=job.get('item_id'), year=year, kind=kind)
+                count += 1
+        return count
+
+    def register_directory(self, directory, pattern="*.jpg"):
+        """디렉토리의 이미지를 파일명·경로 규칙으로 등록 (기존 데이터 가져오기용)"""
+        files = sorted(Path(directory).glob(pattern))
+        for image_file in files:
+            self.register_image(image_file)
+        return len(files)
+
+    def image_files(self, directory, kind=None):
+        """디렉토리에 등록된 이미지 경로 목록 (디스크에 없는 항목 제외)"""
+        prefix = image_key(directory).rstrip('/') + '/'
+        query = "SELECT path FROM images WHERE substr(path, 1, ?) = ?"
+        params = [len(prefix), prefix]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+
+        paths = [Path(row['path']) for row in self._query(query + " ORDER BY path", params)]
+        return [path for path in paths if '/' not in path.as_posix()[len(prefix):] and path.exists()]
+
+    def images(self, year=None, kind=None):
+        """이미지 + 도서 + 순위 정보"""
+        query = """
+            SELECT i.path, i.item_id, i.year, i.kind, i.sha256, b.title, b.author, r.rank
+            FROM images i
+            LEFT JOIN books b ON b.item_id = i.item_id
+            LEFT JOIN rankings r ON r.item_id = i.item_id AND r.year = i.year
+            WHERE 1 = 1
+        """
+        params = []
+        if year is not None:
+            query += " AND i.year = ?"
+            params.append(year)
+        if kind:
+            query += " AND i.kind = ?"
+            params.append(kind)
+        return [dict(row) for row in self._query(query + " ORDER BY i.year, r.rank, i.path", params)]
+
+    def item_images(self, item_id, kind='front'):
+        """ItemId·종류의 모든 연도 이미지 + image_meta (status, 크기, pHash, 수집 시 해시), 최근 연도 순"""
+        rows = self._query("""
+            SELECT i.path, i.year, i.sha256, i.size, m.status, m.width, m.height, m.phash,
+                   m.sha256 AS meta_sha256
+            FROM images i LEFT JOIN image_meta m ON m.path = i.path
+            WHERE i.item_id = ? AND i.kind = ?
+            ORDER BY i.year DESC, i.path
+        """, (str(item_id), kind))
+        return [dict(row) for row in rows]
+
+    def file_sha256(self, path):
+        """이미지 내용 해시 (크기·수정 시각이 같으면 저장된 값 재사용)"""
+        key = image_key(path)
+        stat = Path(key).stat()
+        rows = self._query("SELECT sha256, size, mtime FROM images WHERE path = ?", (key,))
+        if rows and rows[0]['sha256'] and rows[0]['size'] == stat.st_size and rows[0]['mtime'] == stat.st_mtime:
+            return rows[0]['sha256']
+
+        sha256 = hashlib.sha256(Path(key).read_bytes()).hexdigest()
+        self.register_image(key, sha256=sha256)
+        return sha256
+
+    # ----- 띠지 결과 -----
+
+    def put_belly_band(self, image_path, entry, detector_version=None, params=None):
+        """띠지 검출 요약 항목 저장 (has_belly_band, text, confidence, position, bbox)"""
+        key = image_key(image_path)
+        with self._lock:
+            self._db.execute("INSERT OR IGNORE INTO images (path, kind, updated_at) VALUES (?, ?, ?)",
+                             (key, parse_image_path(key)['kind'], datetime.now().isoformat()))
+            self._db.execute("INSERT OR REPLACE INTO belly_bands VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", (
+                key, int(bool(entry.get('has_belly_band'))), entry.get('text'),
+                entry.get('confidence'), entry.get('position'),
+                json.dumps(entry.get('bbox'), default=float) if entry.get('bbox') is not None else None,
+                detector_version, json.dumps(params, ensure_ascii=False) if params else None,
+                entry.get('detected_at') or datetime.now().isoformat()))
+            self._db.commit()
+
+    def belly_band(self, image_path):
+        rows = self._query("SELECT * FROM belly_bands WHERE image_path = ?", (image_key(image_path),))
+        if not rows:
+            return None
+        result = dict(rows[0])
+        result['has_belly_band'] = bool(result['has_belly_band'])
+        result['bbox'] = json.loads(result['bbox']) if result['bbox'] else None
+        return result
+
+    def belly_bands(self, year=None):
+        query = """
+            SELECT i.year, r.rank, b.title, bb.*
+            FROM belly_bands bb
+            JOIN images i ON i.path = bb.image_path
+            LEFT JOIN books b ON b.item_id = i.item_id
+            LEFT JOIN rankings r ON r.item_id = i.item_id AND r.year = i.year
+        """
+        params = []
+        if year is not None:
+            query += " WHERE i.year = ?"
+            params.append(year)
+        return [dict(row) for row in self._query(query + " ORDER BY i.year, r.rank", params)]
+
+    # ----- 이미지 검증·정규화 결과 -----
+
+    def put_image_meta(self, image_path, meta, params=None):
+        """image_ingest 결과 저장 (status, width, height, phash, dhash, normalized_*)"""
+        key = image_key(image_path)
+        with self._lock:
+            self._db.execute("""
+                INSERT OR REPLACE INTO image_meta (path, item_id, sha256, status, width, height, phash, dhash,
+                    normalized_path, normalized_width, normalized_height, params, ingested_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, meta.get('item_id'), meta.get('sha256'), meta['status'], meta.get('width'),
+                  meta.get('height'), meta.get('phash'), meta.get('dhash'), meta.get('normalized_path'),
+                  meta.get('normalized_width'), meta.get('normalized_height'),
+                  json.dumps(params, sort_keys=True) if params else None, datetime.now().isoformat()))
+            self._db.commit()
+
+    def image_meta(self, image_path):
+        rows = self._query("SELECT * FROM image_meta WHERE path = ?", (image_key(image_path),))
+        return self._image_meta_row(rows[0]) if rows else None
+
+    def image_metas(self, year=None, kind=None, status=None):
+        """image_meta + 이미지 연도·종류"""
+        query = """
+            SELECT m.*, i.year, i.kind
+            FROM image_meta m LEFT JOIN images i ON i.path = m.path
+            WHERE 1 = 1
+        """
+        params = []
+        for column, value in (('i.year', year), ('i.kind', kind), ('m.status', status)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+        return [self._image_meta_row(row) for row in self._query(query + " ORDER BY m.path", params)]
+
+    def mark_placeholders(self, sha256s):
+        """주어진 내용 해시의 정상 이미지를 자리표시(placeholder)로 표시, 새로 표시한 수 반환"""
+        count = 0
+        with self._lock:
+            for sha256 in sha256s:
+                count += self._db.execute("UPDATE image_meta SET status = 'placeholder' "
+                                          "WHERE sha256 = ? AND status = 'ok'", (sha256,)).rowcount
+            self._db.commit()
+        return count
+
+    @staticmethod
+    def _image_meta_row(row):
+        result = dict(row)
+        result['params'] = json.loads(result['params']) if result['params'] else None
+        return result
+
+    # ----- 기존 데이터 가져오기 -----
+
+    def import_legacy_year(self, year, base_dir=BASE_DIR):
+        """연도 디렉토리의 bestseller_data.json·이미지·*_belly.json 가져오기"""
+        year_dir = Path(f"{base_dir}_{year}")
+        stats = {'books': 0, 'images': 0, 'belly_bands': 0, 'isbn13': 0}
+
+        for json_file in (year_dir / "bestseller_data.json", year_dir / "covers" / "bestseller_data.json"):
+            if json_file.exists():
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    books = json.load(f)
+                self.upsert_books(year, books)
+                stats['books'] = max(stats['books'], len(books))
+
+        # 상품 페이지에서 읽은 실제 ISBN-13
+        product_file = year_dir / "product_images.json"
+        if product_file.exists():
+            with open(product_file, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+            stats['isbn13'] += sum(self.set_isbn13(item_id, record.get('isbn13'))
+                                   for item_id, record in records.items())
+
+        for directory in (year_dir, year_dir / "covers", year_dir / "back_covers"):
+            stats['images'] += self.register_directory(directory)
+
+        belly_dir = year_dir / "belly_bands"
+        for json_file in sorted(belly_dir.glob("*_belly.json")):
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            band = data.get('belly_band') or {}
+            image_path = year_dir / "covers" / (json_file.name[:-len("_belly.json")] + ".jpg")
+            self.put_belly_band(image_path, {
+                'has_belly_band': data.get('has_belly_band', False),
+                'text': band.get('text'),
+                'confidence': band.get('confidence'),
+                'position': band.get('position'),
+                'bbox': band.get('bbox'),
+                'detected_at': data.get('timestamp')
+            }, detector_version='legacy')
+            stats['belly_bands'] += 1
+
+        return stats
+
+    def import_legacy(self, years=None, base_dir=BASE_DIR):
+        """모든(또는 지정한) 연도 디렉토리 가져오기"""
+        if years is None:
+            years = sorted(int(match.group(1)) for match in
+                           (YEAR_DIR_PATTERN.fullmatch(path.name) for path in Path('.').glob(f"{base_dir}_*"))
+                           if match)
+        return {year: self.import_legacy_year(year, base_dir) for year in years}
+
+    def stats(self):
+        counts = {table: self._query(f"SELECT COUNT(*) AS n FROM {table}")[0]['n']
+                  for table in ('books', 'rankings', 'images', 'belly_bands')}
+        counts['years'] = [row['year'] for row in self._query("SELECT DISTINCT year FROM rankings ORDER BY year")]
+        return counts
+
+    def _query(self, query, params=()):
+        with self._lock:
+            return self._db.execute(query, params).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="베스트셀러 통합 카탈로그")
+    parser.add_argument('command', choices=['import', 'isbn', 'stats'])
+    parser.add_argument('--years', type=int, nargs='+', help="가져올 연도 (기본: 모든 연도 디렉토리)")
+    parser.add_argument('--db', default=CATALOG_FILE)
+    args = parser.parse_args()
+    ttb_key = os.environ.get("ALADIN_TTB_KEY")
+    if args.command == 'isbn' and not ttb_key:
+        parser.error("isbn 명령에는 알라딘 TTB 키가 필요합니다 (환경 변수 ALADIN_TTB_KEY)")
+
+    catalog = Catalog(args.db)
+
+    if args.command == 'import':
+        for year, stats in catalog.import_legacy(args.years).items():
+            print(f"{year}년: 도서 {stats['books']}개, 이미지 {stats['images']}개, 띠지 결과 {stats['belly_bands']}개, "
+                  f"ISBN-13 {stats['isbn13']}개")
+    elif args.command == 'isbn':
+        from aladin_api import AladinApiClient
+
+        stats = catalog.fill_isbn13(AladinApiClient(ttb_key))
+        print(f"ISBN-13 채움 {stats['filled']}개, 찾지 못함 {stats['missing']}개, "
+              f"남은 빈 ISBN-13 {len(catalog.missing_isbn13())}개")
+
+    stats = catalog.stats()
+    print(f"카탈로그 {args.db}: 도서 {stats['books']}개, 순위 {stats['rankings']}개, "
+          f"이미지 {stats['images']}개, 띠지 결과 {stats['belly_bands']}개, 연도 {stats['years']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,291 +1,320 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import requests
+"""
+여러 연도 베스트셀러 동시 수집
+
+(연도, 목록 페이지) 조회 → 도서별 상품 페이지 해석 → 앞/뒷표지 다운로드를
+작업 단위 의존 관계(DAG)로 연결해 하나의 fetch 엔진 위에서 동시에 실행한다.
+호스트별 동시성·속도 제한과 전체 요청 속도 상한은 모든 연도가 공유하므로
+연도 범위가 넓어도 서버에 주는 부하는 같고, 전체 소요 시간은 가장 느린
+연도 하나에 가깝다.
+
+모든 작업 상태는 work_queue.sqlite에 기록되므로 중간에 죽은 수집을
+다시 실행하면 끝난 목록·상품 페이지·이미지는 요청하지 않고 이어서 진행한다.
+아직 끝나지 않은 올해 목록은 바뀌므로 LIST_TTL(기본 하루)이 지난 올해 목록 작업은 다시 받고,
+--refresh-lists면 모든 연도의 목록을 다시 받는다.
+
+상품 페이지는 cover_url_resolver가 학습한 이미지 URL 패턴으로 앞/뒷표지를
+찾지 못한 도서만 받는다.
+
+사용 예:
+    python collect_all_years.py --years 2010-2024
+    python collect_all_years.py --years 2020 2022 --rate 8
+    python collect_all_years.py --years 2026 --refresh-lists
+"""
+
+import argparse
+import asyncio
 import json
+import re
 import time
+from datetime import date
 from pathlib import Path
-from bs4 import BeautifulSoup
-import re
-
-def collect_year_data(year):
-    """특정 연도의 베스트셀러 데이터 수집 및 이미지 다운로드"""
-
-    print(f"\n{'='*80}")
-    print(f"{year}년 한국소설 연간 베스트셀러 수집 시작")
-    print(f"{'='*80}\n")
-
-    download_dir = Path(f"yearly_bestsellers_{year}")
-    covers_dir = download_dir / "covers"
-    back_covers_dir = download_dir / "back_covers"
-    covers_dir.mkdir(parents=True, exist_ok=True)
-    back_covers_dir.mkdir(parents=True, exist_ok=True)
-
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    })
-
-    # 1단계: 베스트셀러 목록 수집
-    print(f"[1/3] 베스트셀러 목록 수집 중...")
-    all_books = []
-
-    for page in range(1, 3):  # 2페이지 (100개)
-        url = f"https://www.aladin.co.kr/shop/common/wbest.aspx?BestType=YearlyBest&BranchType=1&Year={year}&CID=50917&page={page}"
 
+from catalog import Catalog, parse_years
+from cover_url_resolver import CoverUrlResolver, derived_record
+from fetch_engine import FetchEngine, absolute_url
+from html_extract import extract_bestseller_items
+from image_index import reuse_previous_image
+from product_page import ProductPageStore, front_cover_url
+from work_queue import WorkQueue
+
+LIST_TTL = 24 * 3600    # 올해 목록 작업 결과를 다시 쓰는 기간 (초)
+
+LIST_URL = "https://www.aladin.co.kr/shop/common/wbest.aspx?BestType=YearlyBest&BranchType=1&Year={year}&CID=50917&page={page}"
+BOOKS_PER_PAGE = 50
+
+def image_filename(book, suffix=""):
+    """{rank:03d}_{item_id}_{제목}_{저자}{suffix}.jpg 파일명"""
+    rank = book['rank']
+    title = book['title']
+    author = book.get('author', '').split('|')[0].strip()
+    item_id = book.get('isbn13', '') or f"book_{rank}"
+
+    safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()[:30]
+    safe_author = "".join(c for c in author if c.isalnum() or c in (' ', '-', '_')).strip()[:20]
+
+    if not safe_title:
+        safe_title = f"title_{rank}"
+    if not safe_author:
+        safe_author = f"author_{rank}"
+
+    return f"{rank:03d}_{item_id}_{safe_title}_{safe_author}{suffix}.jpg"
+
+def parse_bestseller_page(html, page):
+    """연간 베스트 목록 페이지 HTML에서 도서 목록 추출"""
+    books = []
+
+    for idx, item in enumerate(extract_bestseller_items(html), 1):
+        title = item['title'] or "제목 없음"
+        if ' - ' in title:
+            title = title.split(' - ')[0].strip()
+
+        item_id = item['item_id']
+        itemid_match = re.search(r'ItemId=(\d+)', item['href'] or '')
+        if itemid_match:
+            item_id = itemid_match.group(1)
+
+        books.append({
+            'rank': (page - 1) * BOOKS_PER_PAGE + idx,
+            'title': title,
+            'author': item['author'],
+            'isbn13': item_id,
+            'cover_url': absolute_url(item['cover_src']) if item['cover_src'] else "",
+            'publisher': "",
+            'pubdate': ""
+        })
+
+    return books
+
+class CollectionOrchestrator:
+    def __init__(self, years, pages=2, progress_interval=5.0, queue=None, resolver=None, list_ttl=LIST_TTL,
+                 refresh_lists=False, **engine_options):
+        """
+        여러 연도 동시 수집기
+
+        Args:
+            years (list): 수집할 연도
+            pages (int): 연도별 목록 페이지 수 (페이지당 50권)
+            progress_interval (float): 진행 상황 출력 간격 (초)
+            queue (WorkQueue): 작업 상태 영속 큐 (기본: work_queue.sqlite)
+            resolver (CoverUrlResolver): 표지 URL 유도 해석기 (기본: cover_url_patterns.json)
+            list_ttl (float): 올해 목록 작업 결과를 다시 쓰는 기간 (초, None이면 계속)
+            refresh_lists (bool): 큐에 끝난 목록 작업이 있어도 모든 연도 목록을 다시 받음
+            engine_options: FetchEngine 생성 인자 (per_host_concurrency, per_host_rate, global_rate 등)
+        """
+        self.years = list(years)
+        self.pages = pages
+        self.progress_interval = progress_interval
+        self.list_ttl = list_ttl
+        self.refresh_lists = refresh_lists
+        self.queue = queue or WorkQueue()
+        self.engine_options = dict(engine_options, queue=self.queue)
+        self.catalog = Catalog.default()
+        self.resolver = resolver or CoverUrlResolver.default()
+
+        self.books = {year: [] for year in self.years}
+        self.stores = {year: ProductPageStore.for_year(year) for year in self.years}
+        self.jobs = {year: {'front': [], 'back': []} for year in self.years}
+        self.progress = {'lists': 0, 'list_failed': 0, 'books': 0, 'pages': 0, 'book_failed': 0,
+                         'images': 0, 'downloaded': 0, 'bytes': 0, 'resumed': 0, 'derived': 0}
+
+    def year_dir(self, year):
+        return Path(f"yearly_bestsellers_{year}")
+
+    async def run(self):
+        """모든 작업을 실행하고 연도별 결과 목록 반환"""
+        for year in self.years:
+            (self.year_dir(year) / "covers").mkdir(parents=True, exist_ok=True)
+            (self.year_dir(year) / "back_covers").mkdir(parents=True, exist_ok=True)
+
+        self.started = time.monotonic()
+        engine = FetchEngine(**self.engine_options)
+        reporter = asyncio.create_task(self._report_progress())
         try:
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            items = soup.select('div.ss_book_box')
-
-            for idx, item in enumerate(items, 1):
-                try:
-                    rank = (page - 1) * 50 + idx
-
-                    title_elem = item.select_one('a.bo3')
-                    title = title_elem.get_text(strip=True) if title_elem else "제목 없음"
-                    if ' - ' in title:
-                        title = title.split(' - ')[0].strip()
-
-                    book_list = item.select_one('div.ss_book_list')
-                    author = ""
-                    if book_list:
-                        lines = book_list.find_all(['li', 'span', 'div'])
-                        for line in lines:
-                            txt = line.get_text(strip=True)
-                            if '지은이' in txt or '저자' in txt or '지음' in txt:
-                                author = txt.replace('지은이:', '').replace('저자:', '').replace('지음', '').strip()
-                                break
-
-                    item_id = item.get('itemid', '')
-                    link_elem = item.select_one('a')
-                    if link_elem and 'href' in link_elem.attrs:
-                        href = link_elem['href']
-                        itemid_match = re.search(r'ItemId=(\d+)', href)
-                        if itemid_match:
-                            item_id = itemid_match.group(1)
-
-                    cover_elem = item.select_one('img.i_cover')
-                    cover_url = ""
-                    if cover_elem and 'src' in cover_elem.attrs:
-                        cover_url = cover_elem['src']
-                        if cover_url.startswith('//'):
-                            cover_url = 'https:' + cover_url
-                        elif cover_url.startswith('/'):
-                            cover_url = 'https://www.aladin.co.kr' + cover_url
-
-                    book_info = {
-                        'rank': rank,
-                        'title': title,
-                        'author': author,
-                        'isbn13': item_id,
-                        'cover_url': cover_url,
-                        'publisher': "",
-                        'pubdate': ""
-                    }
-
-                    all_books.append(book_info)
-
-                except Exception as e:
-                    print(f"  아이템 파싱 오류: {e}")
-                    continue
-
-            time.sleep(1)
-
-        except Exception as e:
-            print(f"  페이지 {page} 수집 오류: {e}")
-            break
-
-    print(f"  총 {len(all_books)}개 베스트셀러 수집 완료")
-
-    # JSON 저장
-    json_file = covers_dir / "bestseller_data.json"
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(all_books, f, ensure_ascii=False, indent=2)
-
-    # 2단계: 앞표지 다운로드
-    print(f"\n[2/3] 앞표지 이미지 다운로드 중...")
-    front_success = 0
-    front_failed = 0
-
-    for book in all_books:
-        rank = book['rank']
-        title = book['title']
-        author = book.get('author', '').split('|')[0].strip()
-        item_id = book.get('isbn13', '') or f"book_{rank}"
-
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()[:30]
-        safe_author = "".join(c for c in author if c.isalnum() or c in (' ', '-', '_')).strip()[:20]
-
-        if not safe_title:
-            safe_title = f"title_{rank}"
-        if not safe_author:
-            safe_author = f"author_{rank}"
-
-        filename = f"{rank:03d}_{item_id}_{safe_title}_{safe_author}.jpg"
-        file_path = covers_dir / filename
-
-        if file_path.exists():
-            front_success += 1
-            continue
-
-        if not item_id or item_id.startswith('book_'):
-            front_failed += 1
-            continue
-
-        # 상품 페이지에서 표지 추출
-        product_url = f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}"
-
+            # 목록 페이지 작업이 도서 작업을, 도서 작업이 이미지 작업을 기다리므로
+            # 목록 작업이 모두 끝나면 전체 DAG가 끝난 것
+            await asyncio.gather(*(self._list_task(engine, year, page)
+                                   for year in self.years for page in range(1, self.pages + 1)))
+        finally:
+            reporter.cancel()
+            engine.close()
+            self.resolver.save()
+
+        return [self._finish_year(year) for year in self.years]
+
+    async def _list_task(self, engine, year, page):
+        """(연도, 페이지) 목록 조회 → 도서별 작업 생성"""
+        key = f"list:{year}:{page}"
+        max_age = self.list_ttl if year >= date.today().year else None
+        if not self.refresh_lists and self.queue.is_done(key, max_age=max_age):
+            books = self.queue.result(key)
+            self.progress['resumed'] += 1
+        else:
+            self.queue.start(key, 'list')
+            try:
+                html = await engine.fetch_text(LIST_URL.format(year=year, page=page), timeout=10)
+            except Exception as e:
+                self.queue.fail(key, e)
+                self.progress['list_failed'] += 1
+                print(f"  {year}년 페이지 {page} 수집 오류: {e}")
+                return
+
+            books = parse_bestseller_page(html, page)
+            self.queue.complete(key, books)
+
+        self.progress['lists'] += 1
+        self.progress['books'] += len(books)
+        self.books[year].extend(books)
+
+        await asyncio.gather(*(self._book_task(engine, year, book) for book in books))
+
+    async def _book_task(self, engine, year, book):
+        """상품 페이지 해석 → 앞/뒷표지 다운로드 (한 도서의 오류는 큐에 기록하고 나머지는 계속)"""
+        key = f"page:{book.get('isbn13', '')}"
         try:
-            response = session.get(product_url, timeout=15)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            cover_url = None
-            images = soup.find_all('img')
-            for img in images:
-                src = img.get('src', '')
-                if 'letslook' in src and '_f.jpg' in src:
-                    cover_url = src
-                    break
-
-            if not cover_url:
-                for img in images:
-                    src = img.get('src', '')
-                    if 'cover500' in src or '/cover/' in src:
-                        cover_url = src.replace('cover200', 'cover500') if 'cover200' in src else src
-                        break
-
-            if not cover_url:
-                api_cover = book.get('cover_url', '')
-                if api_cover:
-                    cover_url = api_cover.replace('cover200', 'cover500')
-
-            if not cover_url:
-                front_failed += 1
-                continue
-
-            if cover_url.startswith('//'):
-                cover_url = 'https:' + cover_url
-            elif cover_url.startswith('/'):
-                cover_url = 'https://www.aladin.co.kr' + cover_url
-
-            img_response = session.get(cover_url, timeout=30)
-            img_response.raise_for_status()
-
-            with open(file_path, 'wb') as f:
-                f.write(img_response.content)
-
-            front_success += 1
-            time.sleep(0.5)
-
-        except Exception:
-            front_failed += 1
-            time.sleep(1)
-
-    print(f"  앞표지 다운로드: 성공 {front_success}개, 실패 {front_failed}개")
-
-    # 3단계: 뒷표지 다운로드
-    print(f"\n[3/3] 뒷표지 이미지 다운로드 중...")
-    back_success = 0
-    back_failed = 0
-    back_not_found = 0
-
-    for book in all_books:
-        rank = book['rank']
-        title = book['title']
-        author = book.get('author', '').split('|')[0].strip()
-        item_id = book.get('isbn13', '') or f"book_{rank}"
-
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()[:30]
-        safe_author = "".join(c for c in author if c.isalnum() or c in (' ', '-', '_')).strip()[:20]
-
-        if not safe_title:
-            safe_title = f"title_{rank}"
-        if not safe_author:
-            safe_author = f"author_{rank}"
-
-        filename = f"{rank:03d}_{item_id}_{safe_title}_{safe_author}_back.jpg"
-        file_path = back_covers_dir / filename
-
-        if file_path.exists():
-            back_success += 1
-            continue
-
-        if not item_id or item_id.startswith('book_'):
-            back_failed += 1
-            continue
-
-        product_url = f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}"
-
-        try:
-            response = session.get(product_url, timeout=15)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            back_cover_url = None
-            images = soup.find_all('img')
-            for img in images:
-                src = img.get('src', '')
-                if 'letslook' in src and '_b.jpg' in src:
-                    back_cover_url = src
-                    break
-
-            if not back_cover_url:
-                back_not_found += 1
-                continue
-
-            if back_cover_url.startswith('//'):
-                back_cover_url = 'https:' + back_cover_url
-            elif back_cover_url.startswith('/'):
-                back_cover_url = 'https://www.aladin.co.kr' + back_cover_url
-
-            img_response = session.get(back_cover_url, timeout=30)
-            img_response.raise_for_status()
-
-            with open(file_path, 'wb') as f:
-                f.write(img_response.content)
-
-            back_success += 1
-            time.sleep(0.5)
-
-        except Exception:
-            back_failed += 1
-            time.sleep(1)
+            await self._collect_book(engine, year, book, key)
+        except Exception as e:
+            if self.queue.state(key) == 'in_flight':
+                self.queue.fail(key, str(e))
+            self.progress['book_failed'] += 1
+            print(f"  [{year} {book.get('rank')}위] {book.get('title')}: 오류 - {e}")
+
+    async def _collect_book(self, engine, year, book, key):
+        store = self.stores[year]
+        item_id = book.get('isbn13', '')
+
+        # product_images.json은 연도 단위로 저장되므로 중단 시 큐에 남은 레코드로 복원
+        if item_id not in store and self.queue.is_done(key):
+            store.put(self.queue.result(key))
+            self.progress['resumed'] += 1
+        if item_id and item_id not in store:
+            self.queue.start(key, 'page')
+            # 학습한 URL 패턴으로 앞/뒷표지를 먼저 확인하고, 둘 다 있거나 뒷표지가 이미
+            # (이전 확인·상품 페이지에서) 없다고 확인된 도서면 상품 페이지는 받지 않음
+            back_missed = self.resolver.has_missed(item_id, 'back')
+            urls = await self.resolver.resolve(engine, item_id, book)
+            if (urls['front'] or urls['cover500']) and (urls['back'] or back_missed):
+                store.put(derived_record(item_id, urls))
+                self.progress['derived'] += 1
+            else:
+                await store.resolve(engine, [item_id])
+            if item_id in store:
+                self.queue.complete(key, store.get(item_id))
+            else:
+                self.queue.fail(key, "상품 페이지 수집 실패")
+        self.progress['pages'] += 1
+
+        record = store.get(item_id)
+        self.resolver.learn_record(record, book)
+        front = {
+            'path': self.year_dir(year) / "covers" / image_filename(book),
+            'url': front_cover_url(record, book),
+            'label': f"[{year} {book['rank']}위] {book['title']}",
+            'item_id': item_id or f"book_{book['rank']}"
+        }
+        back = dict(front, path=self.year_dir(year) / "back_covers" / image_filename(book, "_back"),
+                    url=record['back'] if record else None)
+        self.jobs[year]['front'].append(front)
+        self.jobs[year]['back'].append(back)
+
+        # 순위·연도만 바뀌어 파일명이 달라진 같은 이미지는 다시 받지 않음
+        reuse_previous_image(front, year, 'front', self.catalog)
+        reuse_previous_image(back, year, 'back', self.catalog)
+
+        await asyncio.gather(engine.run_job(front, on_result=self._on_image),
+                             engine.run_job(back, on_result=self._on_image))
+
+    def _on_image(self, job):
+        self.progress['images'] += 1
+        if job['status'] == 'ok':
+            self.progress['downloaded'] += 1
+            self.progress['bytes'] += job['bytes']
+        elif job['status'] == 'failed':
+            print(f"  {job['label']}: 실패 - {job.get('error')}")
+
+    async def _report_progress(self):
+        """주기적으로 진행 상황·처리량 출력"""
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            print(self.progress_line())
+
+    def progress_line(self):
+        elapsed = time.monotonic() - self.started
+        p = self.progress
+        return (f"[진행 {elapsed:5.0f}s] 목록 {p['lists']}/{len(self.years) * self.pages} | "
+                f"상품 페이지 {p['pages']}/{p['books']} (URL 유도 {p['derived']}) | 이미지 {p['images']}/{p['books'] * 2} | "
+                f"다운로드 {p['downloaded']}개 {p['bytes'] / 1024 / 1024:.1f}MB, 재개 {p['resumed']}개, "
+                f"도서 오류 {p['book_failed']}개 "
+                f"({p['downloaded'] / elapsed if elapsed else 0:.1f} images/sec)")
+
+    def _finish_year(self, year):
+        """연도별 목록·상품 페이지·이미지 결과 저장 및 요약"""
+        books = sorted(self.books[year], key=lambda book: book['rank'])
+
+        self.catalog.upsert_books(year, books)
+        # 목록의 'isbn13'은 ItemId이므로 상품 페이지에서 읽은 실제 ISBN-13을 따로 기록
+        for book in books:
+            record = self.stores[year].get(book.get('isbn13', ''))
+            if record and record.get('isbn13'):
+                self.catalog.set_isbn13(book['isbn13'], record['isbn13'])
+        json_file = self.year_dir(year) / "covers" / "bestseller_data.json"
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(books, f, ensure_ascii=False, indent=2)
+        self.stores[year].save()
+
+        self.catalog.register_jobs(self.jobs[year]['front'], year, 'front')
+        self.catalog.register_jobs(self.jobs[year]['back'], year, 'back')
+
+        def count(kind, *statuses):
+            return sum(1 for job in self.jobs[year][kind] if job.get('status') in statuses)
+
+        return {
+            'year': year,
+            'total': len(books),
+            'front_success': count('front', 'ok', 'exists'),
+            'back_success': count('back', 'ok', 'exists'),
+            'back_not_found': count('back', 'not_found'),
+            'failed': count('front', 'failed', 'not_found') + count('back', 'failed')
+        }
+
+def collect_years(years, pages=2, refresh_lists=False, **engine_options):
+    """동기 코드에서 호출하는 여러 연도 수집 진입점"""
+    orchestrator = CollectionOrchestrator(years, pages=pages, refresh_lists=refresh_lists, **engine_options)
+    results = asyncio.run(orchestrator.run())
+
+    elapsed = time.monotonic() - orchestrator.started
+    print(orchestrator.progress_line())
+    print(f"\n{'='*80}")
+    print(f"전체 수집 완료! ({elapsed:.1f}s, {orchestrator.progress['downloaded'] / elapsed if elapsed else 0:.1f} images/sec)")
+    print(f"{'='*80}\n")
+    for result in results:
+        print(f"{result['year']}년: 앞표지 {result['front_success']}/{result['total']}, "
+              f"뒷표지 {result['back_success']}/{result['total']} (뒷표지 없음 {result['back_not_found']}개), "
+              f"실패 {result['failed']}개")
 
-    print(f"  뒷표지 다운로드: 성공 {back_success}개, 뒷표지 없음 {back_not_found}개, 실패 {back_failed}개")
+    return results
 
-    print(f"\n{year}년 수집 완료!")
-    print(f"  - 앞표지: {front_success}/{len(all_books)}")
-    print(f"  - 뒷표지: {back_success}/{len(all_books)}")
-    return {
-        'year': year,
-        'total': len(all_books),
-        'front_success': front_success,
-        'back_success': back_success
-    }
+def collect_year_data(year):
+    """특정 연도의 베스트셀러 데이터 수집 및 이미지 다운로드"""
+    return collect_years([year])[0]
 
 def main():
-    """2022, 2021, 2020년 순차 수집"""
-    years = [2022, 2021, 2020]
-    results = []
-
-    for year in years:
-        result = collect_year_data(year)
-        results.append(result)
-        print(f"\n다음 연도로 이동...\n")
-        time.sleep(2)
-
-    # 최종 요약
-    print(f"\n{'='*80}")
-    print("전체 수집 완료!")
-    print(f"{'='*80}\n")
-    for result in results:
-        print(f"{result['year']}년: 앞표지 {result['front_success']}/{result['total']}, 뒷표지 {result['back_success']}/{result['total']}")
+    """연도 범위 동시 수집 (기본: 2020~2022)"""
+    parser = argparse.ArgumentParser(description="여러 연도 베스트셀러 동시 수집")
+    parser.add_argument('--years', nargs='+', default=['2020-2022'], help="연도 또는 범위 (예: 2010-2024 2026)")
+    parser.add_argument('--pages', type=int, default=2, help="연도별 목록 페이지 수 (페이지당 50권)")
+    parser.add_argument('--concurrency', type=int, default=4, help="호스트별 동시 요청 수")
+    parser.add_argument('--host-rate', type=float, default=5.0, help="호스트별 초당 요청 수")
+    parser.add_argument('--rate', type=float, default=10.0, help="전체 초당 요청 수 상한")
+    parser.add_argument('--refresh-lists', action='store_true', help="큐에 끝난 목록 작업이 있어도 목록을 다시 받음")
+    args = parser.parse_args()
+
+    years = parse_years(args.years)
+    print(f"수집 대상: {years[0]}~{years[-1]}년 {len(years)}개 연도, 연도별 {args.pages}페이지")
+    collect_years(years, pages=args.pages, refresh_lists=args.refresh_lists, per_host_concurrency=args.concurrency,
+                  per_host_rate=args.host_rate, global_rate=args.rate)
 
 if __name__ == "__main__":
     main()
@@ -24,7 +24,7 @@ def main():
     scraper.generate_report(bestsellers)
 
     # 표지 이미지 다운로드
-    result = scraper.scrape_all_covers(bestsellers, delay=0.5)
+    result = scraper.scrape_all_covers(bestsellers)
 
     print(f"\n[*] 2023년 최종 결과:")
     print(f"  - 총 베스트셀러: {result['total']}개")
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+상품 페이지 없이 표지 이미지 URL을 유도하는 해석기
+
+알라딘 이미지 URL은 ItemId에서 디렉토리가 정해진다:
+    https://image.aladin.co.kr/product/{ItemId[:-4]}/{int(ItemId[-4:-2])}/{폴더}/{키}_{접미사}.jpg
+    예: 278770576 → product/27877/5/cover200/8954682154_3.jpg
+
+폴더(letslook, cover500)·키(목록/API 표지 URL의 파일 키, ISBN10, ItemId)·접미사(_f, _b, _1 …)
+조합은 이미 본 URL(상품 페이지 레코드)에서 템플릿으로 학습한다.
+    "letslook/{cover_key}_f.jpg", "cover500/{cover_key}_{cover_suffix}.jpg" …
+
+1. 역할(front/back/cover500)별 템플릿을 ItemId 접두사 단위로 많이 맞은 순서로 정렬
+2. 상위 후보를 HEAD 요청으로 동시에 확인 (HEAD를 거부하면 Range GET 1바이트)
+3. 맞은 템플릿·URL을 cover_url_patterns.json에 저장해 다음 실행에서 재사용
+4. 후보가 모두 빗나간(또는 상품 페이지에 없던) ItemId·역할은 missed로 남겨 다시 확인하지 않음
+
+사용 예:
+    resolver = CoverUrlResolver.default()
+    urls = await resolver.resolve(engine, item_id, book)   # {'front': url, 'back': url, ...}
+    resolver.save()
+"""
+
+import asyncio
+import json
+import re
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+PATTERN_FILE = "cover_url_patterns.json"
+IMAGE_BASE = "https://image.aladin.co.kr/product/"
+ROLES = ('front', 'back', 'cover500')
+
+# 학습 전 기본 후보 (앞쪽이 우선)
+DEFAULT_TEMPLATES = {
+    'front': ["letslook/{cover_key}_f.jpg", "letslook/{isbn10}_f.jpg", "letslook/{item_id}_f.jpg"],
+    'back': ["letslook/{cover_key}_b.jpg", "letslook/{isbn10}_b.jpg", "letslook/{item_id}_b.jpg"],
+    'cover500': ["cover500/{cover_key}_{cover_suffix}.jpg", "cover500/{isbn10}_1.jpg",
+                 "cover500/{item_id}_1.jpg"],
+}
+
+_IMAGE_URL = re.compile(r'image\.aladin\.co\.kr/product/(\d+)/(\d+)/(\w+)/([^/_]+)_([^./]+)\.(\w+)')
+
+
+def image_directory(item_id):
+    """ItemId → 이미지 디렉토리 ('278770576' → '27877/5')"""
+    item_id = str(item_id or '')
+    if len(item_id) < 5 or not item_id.isdigit():
+        return None
+    return f"{item_id[:-4]}/{int(item_id[-4:-2])}"
+
+
+def id_prefix(item_id):
+    """템플릿 통계를 묶는 ItemId 접두사 (100만 단위)"""
+    return str(item_id)[:-6] or '0'
+
+
+def parse_image_url(url):
+    """이미지 URL → {'directory', 'folder', 'key', 'suffix', 'ext'} (형식이 다르면 None)"""
+    match = _IMAGE_URL.search(url or '')
+    if not match:
+        return None
+    first, second, folder, key, suffix, ext = match.groups()
+    return {'directory': f"{first}/{int(second)}", 'folder': folder, 'key': key,
+            'suffix': suffix, 'ext': ext}
+
+
+def isbn13_to_isbn10(isbn13):
+    """978 ISBN13 → ISBN10 (변환할 수 없으면 None)"""
+    isbn13 = str(isbn13 or '').replace('-', '')
+    if len(isbn13) != 13 or not isbn13.isdigit() or not isbn13.startswith('978'):
+        return None
+    body = isbn13[3:12]
+    check = (11 - sum((10 - i) * int(digit) for i, digit in enumerate(body)) % 11) % 11
+    return body + ('X' if check == 10 else str(check))
+
+
+def url_keys(item_id, book=None):
+    """템플릿에 채울 키 (없는 키는 빠짐)"""
+    book = book or {}
+    keys = {'item_id': str(item_id)}
+
+    cover = parse_image_url(book.get('cover_url') or book.get('cover'))
+    if cover:
+        keys['cover_key'] = cover['key']
+        keys['cover_suffix'] = cover['suffix']
+
+    isbn10 = book.get('isbn') or isbn13_to_isbn10(book.get('isbn13'))
+    if isbn10 and len(str(isbn10)) == 10:
+        keys['isbn10'] = str(isbn10)
+    return keys
+
+
+def template_for(url, keys):
+    """실제 URL을 키 이름으로 일반화한 템플릿 (키와 맞지 않으면 None)"""
+    parsed = parse_image_url(url)
+    if not parsed:
+        return None
+
+    source = next((name for name in ('cover_key', 'isbn10', 'item_id') if keys.get(name) == parsed['key']), None)
+    if source is None:
+        return None
+    suffix = '{cover_suffix}' if parsed['suffix'] == keys.get('cover_suffix') and parsed['folder'] != 'letslook' \
+        else parsed['suffix']
+    return f"{parsed['folder']}/{{{source}}}_{suffix}.{parsed['ext']}"
+
+
+class CoverUrlResolver:
+    _default = None
+
+    def __init__(self, pattern_file=PATTERN_FILE, max_candidates=3, min_size=1000):
+        """
+        표지 URL 유도 해석기
+
+        Args:
+            pattern_file (str): 학습한 템플릿 통계·해석 결과 저장 파일
+            max_candidates (int): 역할별로 동시에 확인할 후보 수
+            min_size (int): Content-Length가 이보다 작으면 (자리표시 이미지 등) 실패로 봄
+        """
+        self.pattern_file = Path(pattern_file)
+        self.max_candidates = max_candidates
+        self.min_size = min_size
+
+        # counts[role][prefix][template] = 맞은 횟수 ('*'는 전체)
+        self.counts = {role: defaultdict(lambda: defaultdict(int)) for role in ROLES}
+        self.resolved = {}
+        self.missed = defaultdict(list)
+        self.learned = set()
+        self.stats = {'probes': 0, 'hits': 0, 'misses': 0, 'cached': 0, 'skipped': 0}
+
+        if self.pattern_file.exists():
+            with open(self.pattern_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for role, prefixes in data.get('counts', {}).items():
+                for prefix, templates in prefixes.items():
+                    self.counts[role][prefix].update(templates)
+            self.resolved = data.get('resolved', {})
+            self.missed.update(data.get('missed', {}))
+            self.learned = set(data.get('learned', []))
+
+    @classmethod
+    def default(cls):
+        """프로세스 공용 해석기"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def save(self):
+        data = {
+            'counts': {role: {prefix: dict(templates) for prefix, templates in prefixes.items()}
+                       for role, prefixes in self.counts.items()},
+            'resolved': self.resolved,
+            'missed': {item_id: roles for item_id, roles in self.missed.items() if roles},
+            'learned': sorted(self.learned),
+            'updated_at': datetime.now().isoformat()
+        }
+        with open(self.pattern_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def learn(self, role, item_id, url, keys):
+        """실제 URL 하나에서 템플릿 학습"""
+        if image_directory(item_id) != (parse_image_url(url) or {}).get('directory'):
+            return None
+        template = template_for(url, keys)
+        if template:
+            self.counts[role][id_prefix(item_id)][template] += 1
+            self.counts[role]['*'][template] += 1
+        return template
+
+    def has_missed(self, item_id, role):
+        """이 ItemId의 역할 이미지를 이미 확인했는데 없었는지"""
+        return role in self.missed.get(str(item_id or ''), [])
+
+    def _mark_missed(self, item_id, role):
+        if role not in self.missed[item_id]:
+            self.missed[item_id].append(role)
+
+    def learn_record(self, record, book=None):
+        """
+        상품 페이지 레코드(product_page)의 앞/뒷표지·cover500 URL 학습 (ItemId당 1회)
+
+        상품 페이지에 없는 역할은 missed로 남겨, 다른 연도에서 같은 ItemId를 만나면
+        그 역할은 확인 없이 건너뛴다.
+        """
+        item_id = str((record or {}).get('item_id') or '')
+        if not item_id or item_id in self.learned or record.get('derived'):
+            return
+        self.learned.add(item_id)
+
+        keys = url_keys(item_id, book)
+        for role in ROLES:
+            if record.get(role):
+                self.learn(role, item_id, record[role], keys)
+                self.resolved.setdefault(item_id, {})[role] = record[role]
+                if self.has_missed(item_id, role):
+                    self.missed[item_id].remove(role)
+            else:
+                self._mark_missed(item_id, role)
+
+    def candidates(self, role, item_id, keys):
+        """역할별 후보 URL (같은 접두사에서 많이 맞은 템플릿 → 전체 통계 → 기본 순)"""
+        directory = image_directory(item_id)
+        if directory is None:
+            return []
+
+        local = self.counts[role].get(id_prefix(item_id), {})
+        overall = self.counts[role].get('*', {})
+        defaults = DEFAULT_TEMPLATES[role]
+        templates = sorted(set(local) | set(overall) | set(defaults),
+                           key=lambda t: (-local.get(t, 0), -overall.get(t, 0),
+                                          defaults.index(t) if t in defaults else len(defaults)))
+
+        urls = []
+        for template in templates:
+            try:
+                url = IMAGE_BASE + directory + '/' + template.format(**keys)
+            except KeyError:
+                continue
+            if url not in urls:
+                urls.append(url)
+            if len(urls) >= self.max_candidates:
+                break
+        return urls
+
+    async def probe(self, engine, url):
+        """
+        이미지가 있는지 HEAD로 확인 (HEAD를 거부하면 1바이트 Range GET)
+
+        Returns:
+            bool 또는 None: 있음/없음, 네트워크 오류·5xx처럼 판단할 수 없으면 None
+        """
+        self.stats['probes'] += 1
+        try:
+            try:
+                response = await engine.fetch(url, method='HEAD', timeout=10)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code not in (403, 405, 501):
+                    raise
+                response = await engine.fetch(url, timeout=10, headers={'Range': 'bytes=0-0'})
+        except requests.HTTPError as e:
+            return False if e.response is not None and e.response.status_code < 500 else None
+        except requests.RequestException:
+            return None
+
+        if not response.headers.get('content-type', 'image/').startswith('image/'):
+            return False
+        length = response.headers.get('content-length')
+        if response.status_code == 200 and length and int(length) < self.min_size:
+            return False
+        return True
+
+    async def resolve_role(self, engine, role, item_id, keys):
+        """후보를 동시에 확인해 우선순위가 가장 높은 성공 URL 반환 (없으면 None)"""
+        candidates = self.candidates(role, item_id, keys)
+        if not candidates:
+            return None
+
+        found = await asyncio.gather(*(self.probe(engine, url) for url in candidates))
+        for url, ok in zip(candidates, found):
+            if ok:
+                self.stats['hits'] += 1
+                self.learn(role, item_id, url, keys)
+                return url
+
+        self.stats['misses'] += 1
+        if all(ok is False for ok in found):
+            self._mark_missed(item_id, role)
+        return None
+
+    async def resolve(self, engine, item_id, book=None, roles=('front', 'back')):
+        """
+        ItemId의 역할별 이미지 URL 유도
+
+        front(letslook _f)를 못 찾으면 cover500도 확인한다.
+        이미 빗나간 역할(missed)은 다시 확인하지 않으므로 ItemId·역할당 확인은 한 번뿐이다.
+
+        Returns:
+            dict: {'front': url 또는 None, 'back': ..., 'cover500': ...}
+        """
+        item_id = str(item_id or '')
+        cached = self.resolved.get(item_id, {})
+        wanted = list(roles)
+        if 'front' in wanted and 'cover500' not in wanted:
+            wanted.append('cover500')
+
+        if all(cached.get(role) for role in roles):
+            self.stats['cached'] += 1
+            return {role: cached.get(role) for role in wanted}
+
+        keys = url_keys(item_id, book)
+        results = dict(cached)
+        pending = [role for role in roles if not cached.get(role) and not self.has_missed(item_id, role)]
+        self.stats['skipped'] += sum(1 for role in roles if not cached.get(role) and role not in pending)
+        found = await asyncio.gather(*(self.resolve_role(engine, role, item_id, keys) for role in pending))
+        results.update(zip(pending, found))
+
+        if 'cover500' in wanted and not results.get('front') and not results.get('cover500') \
+                and not self.has_missed(item_id, 'cover500'):
+            results['cover500'] = await self.resolve_role(engine, 'cover500', item_id, keys)
+
+        self.resolved[item_id] = {role: url for role, url in results.items() if url}
+        return {role: results.get(role) for role in wanted}
+
+    async def job_urls(self, engine, job):
+        """FetchEngine.run(resolve=...)용: 작업의 역할 이미지 후보 URL 목록"""
+        role = job.get('role', 'front')
+        urls = await self.resolve(engine, job.get('item_id'), job.get('book'),
+                                  roles=(role,) if role != 'cover500' else ('cover500',))
+        if role == 'front':
+            return [url for url in (urls.get('front'), urls.get('cover500')) if url]
+        return [urls[role]] if urls.get(role) else []
+
+
+def derived_record(item_id, urls):
+    """유도한 URL로 product_page 형식 레코드 구성"""
+    return {
+        'item_id': str(item_id),
+        'front': urls.get('front'),
+        'back': urls.get('back'),
+        'cover500': urls.get('cover500'),
+        'main_cover': None,
+        'letslook': [url for url in (urls.get('front'), urls.get('back')) if url],
+        'derived': True,
+        'fetched_at': datetime.now().isoformat()
+    }
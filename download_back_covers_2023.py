@@ -1,31 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
-import requests
-import time
 from pathlib import Path
-from bs4 import BeautifulSoup
 
-# JSON 파일 읽기
-json_file = Path("yearly_bestsellers_2023/covers/bestseller_data.json")
+from catalog import Catalog
+from fetch_engine import download_all
+from product_page import ProductPageStore
+
+# 카탈로그에서 연도별 도서 목록 읽기 (처음이면 기존 bestseller_data.json 가져오기)
+catalog = Catalog.default()
 download_dir = Path("yearly_bestsellers_2023/back_covers")
 download_dir.mkdir(exist_ok=True)
 
-with open(json_file, 'r', encoding='utf-8') as f:
-    bestsellers = json.load(f)
+bestsellers = catalog.books_for_year(2023)
 
 print(f"\n{len(bestsellers)}개 베스트셀러 뒷표지 이미지 다운로드 시작...\n")
 
-session = requests.Session()
-session.headers.update({
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-})
-
-success_count = 0
-failed_count = 0
-not_found_count = 0
+# 상품 페이지는 ItemId당 한 번만 받아 product_images.json에 저장 (앞/뒷표지 스크립트 공유)
+store = ProductPageStore.for_year(2023)
+page_stats = store.resolve_all([book.get('isbn13', '') for book in bestsellers])
+print(f"상품 페이지: 신규 {page_stats['fetched']}개, 저장분 재사용 {page_stats['cached']}개, 실패 {page_stats['failed']}개\n")
 
+jobs = []
 for book in bestsellers:
     rank = book.get('rank', 0)
     title = book.get('title', '')
@@ -42,71 +38,26 @@ for book in bestsellers:
         safe_author = f"author_{rank}"
 
     filename = f"{rank:03d}_{item_id}_{safe_title[:30]}_{safe_author[:20]}_back.jpg"
-    file_path = download_dir / filename
-
-    # 이미 파일이 존재하면 스킵
-    if file_path.exists():
-        print(f"[{rank}/100] {title}: 이미 존재")
-        success_count += 1
-        continue
-
-    if not item_id:
-        print(f"[{rank}/100] {title}: ItemId 없음")
-        failed_count += 1
-        continue
-
-    # 웹페이지에서 뒷표지 이미지 URL 찾기
-    product_url = f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}"
-
-    try:
-        response = session.get(product_url, timeout=15)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # letslook 이미지 중 _b.jpg로 끝나는 것 찾기
-        back_cover_url = None
-
-        # 모든 이미지에서 _b.jpg 패턴 찾기
-        images = soup.find_all('img')
-        for img in images:
-            src = img.get('src', '')
-            if 'letslook' in src and '_b.jpg' in src:
-                back_cover_url = src
-                break
-
-        if not back_cover_url:
-            print(f"[{rank}/100] {title}: 뒷표지 없음")
-            not_found_count += 1
-            continue
-
-        # 상대 경로를 절대 경로로 변환
-        if back_cover_url.startswith('//'):
-            back_cover_url = 'https:' + back_cover_url
-        elif back_cover_url.startswith('/'):
-            back_cover_url = 'https://www.aladin.co.kr' + back_cover_url
-
-        # 뒷표지 이미지 다운로드
-        img_response = session.get(back_cover_url, timeout=30)
-        img_response.raise_for_status()
 
-        # 파일 저장
-        with open(file_path, 'wb') as f:
-            f.write(img_response.content)
+    record = store.get(item_id)
+    url = record['back'] if record else None
 
-        print(f"[{rank}/100] {title}: OK ({len(img_response.content)} bytes)")
-        success_count += 1
-        time.sleep(0.5)  # 서버 부하 방지
+    jobs.append({
+        'path': download_dir / filename,
+        'item_id': item_id,
+        'url': url,
+        'label': f"[{rank}/100] {title}",
+        'not_found_message': "뒷표지 없음"
+    })
 
-    except Exception as e:
-        print(f"[{rank}/100] {title}: 실패 - {e}")
-        failed_count += 1
-        time.sleep(1)
+result = download_all(jobs)
+catalog.register_jobs(jobs, 2023, 'back')
 
 print(f"\n완료!")
-print(f"성공: {success_count}개")
-print(f"뒷표지 없음: {not_found_count}개")
-print(f"실패: {failed_count}개")
-if success_count + not_found_count + failed_count > 0:
-    print(f"성공률: {success_count/(success_count+not_found_count+failed_count)*100:.1f}%")
+print(f"성공: {result['success']}개")
+print(f"뒷표지 없음: {result['not_found']}개")
+print(f"실패: {result['failed']}개")
+if result['total'] > 0:
+    print(f"성공률: {result['success']/result['total']*100:.1f}%")
+print(f"처리 속도: {result['images_per_sec']:.1f} images/sec")
 print(f"\n저장 위치: {download_dir}")
@@ -1,28 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
-import requests
-import time
 from pathlib import Path
 
-# JSON 파일 읽기
-json_file = Path("yearly_bestsellers_2024/bestseller_data.json")
+from catalog import Catalog
+from fetch_engine import download_all
+
+# 카탈로그에서 연도별 도서 목록 읽기 (처음이면 기존 bestseller_data.json 가져오기)
+catalog = Catalog.default()
 download_dir = Path("yearly_bestsellers_2024")
 
-with open(json_file, 'r', encoding='utf-8') as f:
-    bestsellers = json.load(f)
+bestsellers = catalog.books_for_year(2024)
 
 print(f"\n{len(bestsellers)}개 베스트셀러 표지 이미지 다운로드 시작...\n")
 
-session = requests.Session()
-session.headers.update({
-    'User-Agent': 'Mozilla/5.0'
-})
-
-success_count = 0
-failed_count = 0
-
+jobs = []
 for book in bestsellers:
     rank = book.get('rank', 0)
     title = book.get('title', '')
@@ -48,37 +40,20 @@ for book in bestsellers:
             ext = '.gif'
 
     filename = f"{rank:03d}_{isbn13}_{safe_title[:30]}_{safe_author[:20]}{ext}"
-    file_path = download_dir / filename
-
-    # 이미 파일이 존재하면 스킵
-    if file_path.exists():
-        print(f"[{rank}/100] {title}: 이미 존재")
-        success_count += 1
-        continue
-
-    if not cover_url:
-        print(f"[{rank}/100] {title}: 표지 URL 없음")
-        failed_count += 1
-        continue
-
-    # 이미지 다운로드
-    try:
-        response = session.get(cover_url, timeout=30)
-        response.raise_for_status()
-
-        # 파일 저장
-        with open(file_path, 'wb') as f:
-            f.write(response.content)
 
-        print(f"[{rank}/100] {title}: OK ({len(response.content)} bytes)")
-        success_count += 1
-        time.sleep(0.3)  # 서버 부하 방지
+    jobs.append({
+        'path': download_dir / filename,
+        'item_id': isbn13,
+        'url': cover_url,
+        'label': f"[{rank}/100] {title}",
+        'not_found_message': "표지 URL 없음"
+    })
 
-    except Exception as e:
-        print(f"[{rank}/100] {title}: 실패 - {e}")
-        failed_count += 1
+result = download_all(jobs)
+catalog.register_jobs(jobs, 2024, 'front')
 
 print(f"\n완료!")
-print(f"성공: {success_count}개")
-print(f"실패: {failed_count}개")
-print(f"성공률: {success_count/len(bestsellers)*100:.1f}%")
+print(f"성공: {result['success']}개")
+print(f"실패: {result['failed'] + result['not_found']}개")
+print(f"성공률: {result['success']/len(bestsellers)*100:.1f}%")
+print(f"처리 속도: {result['images_per_sec']:.1f} images/sec")
@@ -1,31 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
-import requests
-import time
 from pathlib import Path
-from bs4 import BeautifulSoup
 
-# JSON 파일 읽기
-json_file = Path("yearly_bestsellers_2023/covers/bestseller_data.json")
+from catalog import Catalog
+from fetch_engine import download_all
+from product_page import ProductPageStore, front_cover_url
+
+# 카탈로그에서 연도별 도서 목록 읽기 (처음이면 기존 bestseller_data.json 가져오기)
+catalog = Catalog.default()
 download_dir = Path("yearly_bestsellers_2023/covers")
 download_dir.mkdir(exist_ok=True)
 
-with open(json_file, 'r', encoding='utf-8') as f:
-    bestsellers = json.load(f)
+bestsellers = catalog.books_for_year(2023)
 
 print(f"\n{len(bestsellers)}개 베스트셀러 표지 이미지 다운로드 시작...\n")
 
-session = requests.Session()
-session.headers.update({
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-})
-
-success_count = 0
-failed_count = 0
-not_found_count = 0
+# 상품 페이지는 ItemId당 한 번만 받아 product_images.json에 저장 (앞/뒷표지 스크립트 공유)
+store = ProductPageStore.for_year(2023)
+page_stats = store.resolve_all([book.get('isbn13', '') for book in bestsellers])
+print(f"상품 페이지: 신규 {page_stats['fetched']}개, 저장분 재사용 {page_stats['cached']}개, 실패 {page_stats['failed']}개\n")
 
+jobs = []
 for book in bestsellers:
     rank = book.get('rank', 0)
     title = book.get('title', '')
@@ -42,88 +38,26 @@ for book in bestsellers:
         safe_author = f"author_{rank}"
 
     filename = f"{rank:03d}_{item_id}_{safe_title[:30]}_{safe_author[:20]}.jpg"
-    file_path = download_dir / filename
-
-    # 이미 파일이 존재하면 스킵
-    if file_path.exists():
-        print(f"[{rank}/100] {title}: 이미 존재")
-        success_count += 1
-        continue
-
-    if not item_id:
-        print(f"[{rank}/100] {title}: ItemId 없음")
-        failed_count += 1
-        continue
-
-    # 웹페이지에서 표지 이미지 URL 찾기
-    product_url = f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}"
-
-    try:
-        response = session.get(product_url, timeout=15)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # 표지 이미지 찾기 - 여러 방법 시도
-        cover_url = None
-
-        # 방법 1: letslook 이미지 중 _f.jpg로 끝나는 것 찾기 (고화질 앞표지)
-        images = soup.find_all('img')
-        for img in images:
-            src = img.get('src', '')
-            if 'letslook' in src and '_f.jpg' in src:
-                cover_url = src
-                break
-
-        # 방법 2: cover500 또는 cover/ 이미지
-        if not cover_url:
-            for img in images:
-                src = img.get('src', '')
-                if 'cover500' in src or '/cover/' in src:
-                    if 'cover200' in src:
-                        cover_url = src.replace('cover200', 'cover500')
-                    else:
-                        cover_url = src
-                    break
-
-        # 방법 3: 기존 API 표지 사용
-        if not cover_url:
-            api_cover = book.get('cover_url', '')
-            if api_cover:
-                cover_url = api_cover.replace('cover200', 'cover500')
-
-        if not cover_url:
-            print(f"[{rank}/100] {title}: 표지 없음")
-            not_found_count += 1
-            continue
-
-        # 상대 경로를 절대 경로로 변환
-        if cover_url.startswith('//'):
-            cover_url = 'https:' + cover_url
-        elif cover_url.startswith('/'):
-            cover_url = 'https://www.aladin.co.kr' + cover_url
-
-        # 표지 이미지 다운로드
-        img_response = session.get(cover_url, timeout=30)
-        img_response.raise_for_status()
 
-        # 파일 저장
-        with open(file_path, 'wb') as f:
-            f.write(img_response.content)
+    record = store.get(item_id)
+    url = front_cover_url(record, book)
 
-        print(f"[{rank}/100] {title}: OK ({len(img_response.content)} bytes)")
-        success_count += 1
-        time.sleep(0.5)  # 서버 부하 방지
+    jobs.append({
+        'path': download_dir / filename,
+        'item_id': item_id,
+        'url': url,
+        'label': f"[{rank}/100] {title}",
+        'not_found_message': "표지 없음"
+    })
 
-    except Exception as e:
-        print(f"[{rank}/100] {title}: 실패 - {e}")
-        failed_count += 1
-        time.sleep(1)
+result = download_all(jobs)
+catalog.register_jobs(jobs, 2023, 'front')
 
 print(f"\n완료!")
-print(f"성공: {success_count}개")
-print(f"표지 없음: {not_found_count}개")
-print(f"실패: {failed_count}개")
-if success_count + not_found_count + failed_count > 0:
-    print(f"성공률: {success_count/(success_count+not_found_count+failed_count)*100:.1f}%")
+print(f"성공: {result['success']}개")
+print(f"표지 없음: {result['not_found']}개")
+print(f"실패: {result['failed']}개")
+if result['total'] > 0:
+    print(f"성공률: {result['success']/result['total']*100:.1f}%")
+print(f"처리 속도: {result['images_per_sec']:.1f} images/sec")
 print(f"\n저장 위치: {download_dir}")
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+알라딘 페이지/이미지 비동기 수집 엔진
+
+모든 표지·뒷표지 다운로드 스크립트가 공유하는 fetch 엔진:
+1. 호스트별 동시 요청 수 제한 (asyncio.Semaphore)
+2. 호스트별 토큰 버킷 속도 제한 (고정 time.sleep 대체)
+3. requests.Session 커넥션 풀 재사용
+4. 페이지 응답 디스크 캐시 (http_cache.HttpCache)
+5. 임시 파일에 쓴 뒤 rename (중단돼도 잘린 파일이 남지 않음), 잘린 JPEG는 다시 받음
+6. 작업 큐(work_queue.WorkQueue)를 주면 이미지 작업 상태를 영속 기록
+
+사용 예:
+    jobs = [{'url': url, 'path': Path('covers/001.jpg'), 'label': '[1/100] 제목'}]
+    stats = download_all(jobs)
+"""
+
+import asyncio
+import functools
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import CachingAdapter, HttpCache
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+def create_session(pool_size=16, cache=True):
+    """
+    커넥션 풀이 설정된 공용 requests 세션 생성
+
+    cache: True면 공용 디스크 캐시(HttpCache.default), HttpCache 인스턴스면 해당 캐시,
+           False면 캐시 없이 네트워크 직접 요청
+    """
+    session = requests.Session()
+    if cache is True:
+        cache = HttpCache.default()
+    if cache:
+        adapter = CachingAdapter(cache, pool_connections=pool_size, pool_maxsize=pool_size)
+    else:
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+
+def absolute_url(url):
+    """상대 경로(//, /)를 알라딘 절대 URL로 변환"""
+    if url.startswith('//'):
+        return 'https:' + url
+    if url.startswith('/'):
+        return 'https://www.aladin.co.kr' + url
+    return url
+
+
+def is_complete_image(path):
+    """
+    이미지 파일이 끝까지 받아졌는지 확인
+
+    JPEG는 SOI(FFD8)로 시작하고 끝부분에 EOI(FFD9)가 있어야 한다.
+    다른 형식은 비어 있지 않으면 완료로 본다.
+    """
+    path = Path(path)
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return False
+    if size == 0:
+        return False
+
+    with open(path, 'rb') as f:
+        if f.read(2) != b'\xff\xd8':
+            return path.suffix.lower() not in ('.jpg', '.jpeg')
+        f.seek(max(0, size - 32))
+        return b'\xff\xd9' in f.read()
+
+
+def write_atomic(file_path, content):
+    """임시 파일에 쓴 뒤 rename (같은 디렉토리 안이라 원자적)"""
+    tmp_path = file_path.with_name(file_path.name + '.part')
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, file_path)
+
+
+def link_or_copy(source, file_path):
+    """이미 받은 파일을 새 경로에 하드 링크 (안 되면 복사), 바이트 수 반환"""
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + '.part')
+    if tmp_path.exists():
+        tmp_path.unlink()
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, file_path)
+    return file_path.stat().st_size
+
+
+class TokenBucket:
+    def __init__(self, rate, burst=1):
+        """
+        초당 rate개 토큰을 채우는 버킷 (최대 burst개 누적)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class FetchEngine:
+    def __init__(self, session=None, per_host_concurrency=4, per_host_rate=5.0, burst=None,
+                 retries=3, timeout=30, max_workers=16, global_rate=None, queue=None):
+        """
+        비동기 fetch 엔진 초기화
+
+        Args:
+            session: 공유할 requests 세션 (없으면 새로 생성)
+            per_host_concurrency (int): 호스트별 최대 동시 요청 수
+            per_host_rate (float): 호스트별 초당 요청 수 (토큰 버킷)
+            burst (int): 토큰 버킷 최대 누적량 (기본: per_host_concurrency)
+            retries (int): 연결 오류/5xx 재시도 횟수
+            timeout (float): 기본 요청 타임아웃 (초)
+            max_workers (int): blocking 요청을 실행할 스레드 수
+            global_rate (float): 모든 호스트 합산 초당 요청 수 상한 (None이면 호스트별 제한만)
+            queue (WorkQueue): 이미지 작업 상태를 기록할 영속 큐
+        """
+        self.session = session or create_session(pool_size=max(max_workers, per_host_concurrency))
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self.burst = burst or per_host_concurrency
+        self.retries = retries
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.queue = queue
+
+        self._semaphores = {}
+        self._buckets = {}
+        self._global_bucket = TokenBucket(global_rate, self.burst) if global_rate else None
+        self._downloads = {}
+        self.stats = {'requests': 0, 'bytes': 0, 'shared': 0}
+
+    def _host_limits(self, url):
+        """호스트별 세마포어와 토큰 버킷 반환"""
+        host = urlparse(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+            self._buckets[host] = TokenBucket(self.per_host_rate, self.burst)
+        return self._semaphores[host], self._buckets[host]
+
+    async def fetch(self, url, method='GET', timeout=None, headers=None):
+        """
+        URL 요청 (4xx는 즉시 예외, 연결 오류/5xx/429는 재시도)
+
+        Returns:
+            requests.Response
+        """
+        loop = asyncio.get_running_loop()
+        request = functools.partial(self.session.request, method, url,
+                                    timeout=timeout or self.timeout, headers=headers)
+
+        # 디스크 캐시에 신선한 응답이 있으면 속도 제한 없이 바로 반환
+        adapter = self.session.get_adapter(url)
+        if isinstance(adapter, CachingAdapter) and adapter.cache.is_fresh(url, method):
+            response = await loop.run_in_executor(self.executor, request)
+            response.raise_for_status()
+            return response
+
+        semaphore, bucket = self._host_limits(url)
+        last_error = None
+
+        for attempt in range(self.retries):
+            await bucket.acquire()
+            if self._global_bucket:
+                await self._global_bucket.acquire()
+            async with semaphore:
+                try:
+                    response = await loop.run_in_executor(self.executor, request)
+                except requests.RequestException as e:
+                    last_error = e
+                else:
+                    self.stats['requests'] += 1
+                    self.stats['bytes'] += len(response.content)
+                    if response.status_code < 500 and response.status_code != 429:
+                        response.raise_for_status()
+                        return response
+                    last_error = requests.HTTPError(f"{response.status_code} Error: {url}", response=response)
+
+            if attempt < self.retries - 1:
+                await asyncio.sleep(2 ** attempt)
+
+        raise last_error
+
+    async def fetch_text(self, url, timeout=None):
+        """페이지 HTML 텍스트 반환"""
+        response = await self.fetch(url, timeout=timeout)
+        return response.text
+
+    async def download(self, url, file_path, min_size=0, require_image=False, timeout=None):
+        """
+        이미지 다운로드 후 저장
+
+        이번 실행에서 같은 URL을 이미 받았으면(여러 연도 목록에 오른 같은 책)
+        요청하지 않고 받아 둔 파일을 연결한다. 받는 중이면 끝날 때까지 기다린다.
+
+        Returns:
+            int: 저장한 바이트 수
+        """
+        loop = asyncio.get_running_loop()
+
+        pending = self._downloads.get(url)
+        if pending is not None:
+            source = await asyncio.shield(pending)
+            if source is not None and source != file_path and is_complete_image(source):
+                size = await loop.run_in_executor(self.executor, link_or_copy, source, file_path)
+                self.stats['shared'] += 1
+                return size
+
+        done = loop.create_future()
+        self._downloads[url] = done
+        try:
+            response = await self.fetch(url, timeout=timeout)
+
+            if require_image and not response.headers.get('content-type', '').startswith('image/'):
+                raise ValueError(f"이미지가 아닌 파일: {url}")
+            if len(response.content) < min_size:
+                raise ValueError(f"이미지 크기 부족 ({len(response.content)} bytes): {url}")
+
+            await loop.run_in_executor(self.executor, write_atomic, file_path, response.content)
+        except BaseException:
+            del self._downloads[url]
+            done.set_result(None)
+            raise
+
+        done.set_result(file_path)
+        return len(response.content)
+
+    async def _run_job(self, job, resolve, on_result):
+        """작업 1개 처리: 완료 확인 → URL 결정 → 다운로드"""
+        file_path = job['path']
+        key = f"image:{Path(file_path).as_posix()}"
+
+        try:
+            # 파일이 있어도 잘린 JPEG면 다시 받음
+            if is_complete_image(file_path):
+                job['status'] = 'exists'
+                if self.queue and not self.queue.is_done(key):
+                    self.queue.add(key, 'image')
+                    self.queue.complete(key, {'status': 'exists'})
+                return job
+            if file_path.exists():
+                job['truncated'] = True
+
+            if self.queue:
+                self.queue.start(key, 'image')
+
+            if resolve:
+                urls = await resolve(self, job)
+            else:
+                urls = job.get('urls') or job.get('url')
+
+            if isinstance(urls, str):
+                urls = [urls]
+            if not urls:
+                job['status'] = 'not_found'
+                if self.queue:
+                    self.queue.complete(key, {'status': 'not_found'})
+                return job
+
+            # 후보 URL을 순서대로 시도 (첫 성공에서 중단)
+            last_error = None
+            for url in urls:
+                try:
+                    job['bytes'] = await self.download(absolute_url(url), file_path,
+                                                       min_size=job.get('min_size', 0),
+                                                       require_image=job.get('require_image', False))
+                    job['url'] = url
+                    job['status'] = 'ok'
+                    if self.queue:
+                        self.queue.complete(key, {'status': 'ok', 'url': url, 'bytes': job['bytes']})
+                    return job
+                except (requests.RequestException, ValueError) as e:
+                    last_error = e
+
+            raise last_error
+
+        except Exception as e:
+            job['status'] = 'failed'
+            job['error'] = e
+            if self.queue:
+                self.queue.fail(key, e)
+            return job
+
+        finally:
+            if on_result:
+                on_result(job)
+
+    async def run_job(self, job, on_result=None):
+        """작업 1개 다운로드 (작업 단위로 의존 관계를 직접 구성할 때 사용)"""
+        return await self._run_job(job, None, on_result)
+
+    async def run(self, jobs, resolve=None, on_result=None):
+        """
+        다운로드 작업 목록을 동시에 처리
+
+        Args:
+            jobs (list): {'path', 'url' | 'urls', 'label', ...} dict 목록
+            resolve: async (engine, job) -> URL 또는 URL 목록 (상품 페이지 조회 등)
+            on_result: 작업 완료 시 호출할 콜백 (기본: report_job)
+
+        Returns:
+            dict: 다운로드 결과 통계
+        """
+        if on_result is None:
+            on_result = report_job
+
+        started = time.monotonic()
+        await asyncio.gather(*(self._run_job(job, resolve, on_result) for job in jobs))
+        elapsed = time.monotonic() - started
+
+        counts = {status: 0 for status in ('ok', 'exists', 'not_found', 'failed')}
+        for job in jobs:
+            counts[job['status']] += 1
+
+        return {
+            'total': len(jobs),
+            'success': counts['ok'] + counts['exists'],
+            'downloaded': counts['ok'],
+            'exists': counts['exists'],
+            'not_found': counts['not_found'],
+            'failed': counts['failed'],
+            'elapsed': elapsed,
+            'images_per_sec': counts['ok'] / elapsed if elapsed > 0 else 0.0
+        }
+
+    def close(self):
+        """스레드 풀 종료"""
+        self.executor.shutdown(wait=True)
+
+
+def report_job(job):
+    """작업 결과 한 줄 출력"""
+    status = job['status']
+    if status == 'exists':
+        message = "이미 존재"
+    elif status == 'ok':
+        message = f"OK ({job['bytes']} bytes)"
+    elif status == 'not_found':
+        message = job.get('not_found_message', "이미지 없음")
+    else:
+        message = f"실패 - {job.get('error')}"
+
+    print(f"{job['label']}: {message}")
+
+
+def download_all(jobs, resolve=None, on_result=None, **engine_options):
+    """
+    동기 코드에서 호출하는 다운로드 진입점
+
+    engine_options는 FetchEngine 생성자 인자로 전달됨
+    """
+    async def _main():
+        engine = FetchEngine(**engine_options)
+        try:
+            return await engine.run(jobs, resolve=resolve, on_result=on_result)
+        finally:
+            engine.close()
+
+    return asyncio.run(_main())
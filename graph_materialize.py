@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OBI 통합 그래프 추론 트리플·질의 집계 사전 계산 (오프라인 materialization)
+
+reasoner 없이 질의할 때마다 다시 계산하는 것들을 미리 만든다.
+1. 스키마 폐포: rdfs:subClassOf / rdfs:subPropertyOf 추이 폐포, skos:prefLabel ⊑ rdfs:label
+2. 추론 트리플: 하위 속성 트리플의 상위 속성 트리플(rdfs7), 하위 클래스 인스턴스의 상위 클래스 타입(rdfs9)
+   → prefLabel만 있는 개념도 rdfs:label로 찾고, hasObi/hasBCover는 hasCoverCopy로 바로 찾는다
+3. 지름길: Work --obi:workObi / obi:workBCover (⊑ obi:workCoverCopy)--> Obi / BCover
+   (obi:hasManifestation/obi:hasImage/obi:hasObi 경로)
+4. 집계 테이블: OBI_SPARQL질의.rq 02(영상화 작품 추천인 직군), 03(출판사별 직군 다양성),
+   05(다년도 띠지 변화), 07(표면별 마케팅 블록)의 전체 그래프 스캔 대신 읽는 행
+   (원래 질의처럼 추론 전 단언 트리플 기준)
+
+그래프를 수집 연도 묶음(Image와 그 CoverCopy·블록 공노드, 판본→Image 연결)과 나머지 공유 묶음,
+스키마 폐포 묶음으로 나누고, 묶음별로 단언 트리플·참조한 주변 트리플(판본의 작품·출판사·ISBN,
+직함 레이블)의 해시를 SQLite에 둔다. 해시가 바뀐 묶음의 추론 트리플·집계 행만 지우고 다시 넣으므로
+새 연도를 추가하면 그 연도와 공유 묶음만 갱신된다. 공노드는 주인 IRI·술어·내용 해시로 이름을 붙여
+실행마다, 다른 연도가 늘어도 같다.
+
+출력: {그래프}.materialized.nt (단언+추론, 스키마와 함께 읽음), {그래프}.materialized.sqlite
+ABox만 읽는 스냅샷은 {그래프}.abox.snap — sparql_endpoint의 ABox+스키마 스냅샷({그래프}.snap)과 경로를
+나눠 서로의 원본 목록을 낡았다고 보고 번갈아 다시 컴파일하지 않게 한다.
+
+사용 예:
+    python graph_materialize.py                         # OBI_통합그래프_전수.ttl
+    python graph_materialize.py --aggregate 03
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef
+from rdflib.namespace import DCTERMS, FOAF, RDF, RDFS, SKOS
+
+from abox_generator import GRAPH_FILE, SCHEMA_FILE
+from graph_snapshot import SNAPSHOT_SUFFIX, GraphSnapshot, ensure_snapshot, guess_format
+
+MATERIALIZE_VERSION = "2"
+OBI = Namespace("http://aks.ac.kr/ontologies/obi#")
+BIBO = Namespace("http://purl.org/ontology/bibo/")
+
+# 스키마에 없는 공리: SKOS 명세의 prefLabel ⊑ rdfs:label, 작품→CoverCopy 지름길 속성
+EXTRA_AXIOMS = [
+    (SKOS.prefLabel, RDFS.subPropertyOf, RDFS.label),
+    (OBI.workObi, RDFS.subPropertyOf, OBI.workCoverCopy),
+    (OBI.workBCover, RDFS.subPropertyOf, OBI.workCoverCopy),
+    (OBI.workCoverCopy, RDFS.domain, OBI.Work),
+    (OBI.workCoverCopy, RDFS.range, OBI.CoverCopy),
+    (OBI.workCoverCopy, RDFS.label, Literal("작품의 표지 카피 (지름길)", lang='ko')),
+    (OBI.workObi, RDFS.label, Literal("작품의 띠지 (hasManifestation/hasImage/hasObi)", lang='ko')),
+    (OBI.workBCover, RDFS.label, Literal("작품의 뒷표지 (hasManifestation/hasImage/hasBCover)", lang='ko')),
+]
+SHORTCUTS = {OBI.Obi: OBI.workObi, OBI.BCover: OBI.workBCover}
+
+# 집계 테이블과 집계 질의 (변수 이름은 OBI_SPARQL질의.rq와 같게)
+AGGREGATE_TABLES = {
+    'q02_roles': "work TEXT, obi TEXT, role TEXT",
+    'q03_publisher_roles': "manifestation TEXT, publisher TEXT, role TEXT",
+    'q05_isbn_obis': "isbn TEXT, obi TEXT",
+    'q07_blocks': "carrier_type TEXT, surface TEXT, n INTEGER",
+}
+AGGREGATES = {
+    '02': ('q02_roles', ('role', 'n'),
+           "SELECT role, COUNT(*) AS n FROM q02_roles GROUP BY role ORDER BY n DESC"),
+    '03': ('q03_publisher_roles', ('publisher', 'role_diversity'),
+           "SELECT publisher, COUNT(DISTINCT role) AS d FROM q03_publisher_roles GROUP BY publisher "
+           "ORDER BY d DESC LIMIT 20"),
+    '05': ('q05_isbn_obis', ('isbn', 'n_obi'),
+           "SELECT isbn, COUNT(DISTINCT obi) AS n FROM q05_isbn_obis GROUP BY isbn HAVING n > 1 ORDER BY n DESC"),
+    '07': ('q07_blocks', ('carrierType', 'surface', 'n'),
+           "SELECT carrier_type, surface, SUM(n) FROM q07_blocks GROUP BY carrier_type, surface"),
+}
+
+TBOX_KEY = "tbox"
+SHARED_KEY = "shared"
+_IMAGE_YEAR = re.compile(r'Image_(\d{4})_')
+
+
+def default_paths(graph_file):
+    graph_file = Path(graph_file)
+    return (graph_file.with_name(graph_file.name + ".materialized.nt"),
+            graph_file.with_name(graph_file.name + ".materialized.sqlite"))
+
+
+def abox_snapshot_path(graph_file):
+    graph_file = Path(graph_file)
+    return graph_file.with_name(graph_file.name + ".abox" + SNAPSHOT_SUFFIX)
+
+
+def _escape(text):
+    return (text.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def closure(graph, predicate, extra=()):
+    """{노드: 자신을 포함한 상위 노드 집합} (IRI 사이 predicate의 추이 폐포)"""
+    parents = defaultdict(set)
+    for s, p, o in list(graph.triples((None, predicate, None))) + [t for t in extra if t[1] == predicate]:
+        if isinstance(s, URIRef) and isinstance(o, URIRef) and s != o:
+            parents[s].add(o)
+
+    ancestors = {}
+    for node in list(parents):
+        seen, stack = {node}, [node]
+        while stack:
+            for parent in parents.get(stack.pop(), ()):
+                if parent not in seen:
+                    seen.add(parent)
+                    stack.append(parent)
+        ancestors[node] = seen
+    return ancestors
+
+
+def descendants(ancestors, node):
+    """node와 그 하위 노드 집합"""
+    return {child for child, parents in ancestors.items() if node in parents} | {node}
+
+
+class Materializer:
+    def __init__(self, graph, schema, db_file):
+        """
+        Args:
+            graph (Graph): ABox (스냅샷 Graph 가능, 읽기만 함)
+            schema (Graph): TBox
+            db_file (str): 묶음 상태·추론 트리플·집계 테이블 SQLite
+        """
+        self.graph = graph
+        self.schema = schema
+        self.conn = sqlite3.connect(str(db_file))
+        self.stats = {'partitions': 0, 'updated': 0, 'reused': 0, 'removed': 0, 'inferred': 0}
+        self._create_tables()
+
+        self.class_ancestors = closure(schema, RDFS.subClassOf, EXTRA_AXIOMS)
+        self.property_ancestors = closure(schema, RDFS.subPropertyOf, EXTRA_AXIOMS)
+        self.cover_props = descendants(self.property_ancestors, OBI.hasCoverCopy)
+        self.marketing_props = descendants(self.property_ancestors, OBI.hasMarketingCopy)
+        self.image_classes = descendants(self.class_ancestors, OBI.Image)
+        self.labels = {}
+
+    def _create_tables(self):
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS partitions (key TEXT PRIMARY KEY, hash TEXT, asserted INTEGER,
+                                                   inferred INTEGER);
+            CREATE TABLE IF NOT EXISTS triples (partition TEXT, line TEXT, inferred INTEGER);
+            CREATE INDEX IF NOT EXISTS triples_partition ON triples (partition);
+        """)
+        for table, columns in AGGREGATE_TABLES.items():
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (partition TEXT, {columns})")
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_partition ON {table} (partition)")
+        version = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if version is None or version[0] != MATERIALIZE_VERSION:
+            # 형식이 바뀌면 모두 다시 계산
+            self.conn.execute("DELETE FROM partitions")
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (MATERIALIZE_VERSION,))
+        self.conn.commit()
+
+    # ----- 용어 직렬화 -----
+
+    def bnode_labels(self):
+        """
+        공노드 → 결정적 이름: (가리키는 주어 IRI·이름, 술어) 목록과 내용 해시로 만든다
+
+        같은 내용의 블록이 여러 Image에 달려도 주인 IRI가 달라 이름이 갈리므로, 집합 순회 순서나
+        다른 연도의 공노드 수에 따라 이름이 바뀌지 않는다. 주인·술어·내용까지 모두 같은 공노드만
+        순번으로 구분하는데, 이들은 서로 바꿔도 출력 줄이 같다.
+        """
+        content = {}
+
+        def digest(node, path=()):
+            if node in content:
+                return content[node]
+            if node in path:
+                return 'cycle'
+            parts = sorted(f"{p} {digest(o, path + (node,)) if isinstance(o, BNode) else o.n3()}"
+                           for p, o in self.graph.predicate_objects(node))
+            content[node] = hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()[:16]
+            return content[node]
+
+        keys = {}
+
+        def key(node, path=()):
+            if node in keys:
+                return keys[node]
+            if node in path:
+                return 'cycle'
+            owners = sorted(f"{key(s, path + (node,)) if isinstance(s, BNode) else s.n3()} {p}"
+                            for s, p in self.graph.subject_predicates(node))
+            keys[node] = hashlib.sha1('\n'.join(owners + [digest(node)]).encode('utf-8')).hexdigest()[:16]
+            return keys[node]
+
+        nodes = {node for triple in self.graph for node in (triple[0], triple[2]) if isinstance(node, BNode)}
+        by_key = defaultdict(list)
+        for node in nodes:
+            by_key[key(node)].append(node)
+
+        labels = {}
+        for value, nodes in by_key.items():
+            for i, node in enumerate(nodes):
+                labels[node] = f"c{value}" if len(nodes) == 1 else f"c{value}_{i}"
+        return labels
+
+    def nt(self, term):
+        if isinstance(term, URIRef):
+            return f"<{term}>"
+        if isinstance(term, BNode):
+            return f"_:{self.labels[term]}"
+        if term.language:
+            return f'"{_escape(str(term))}"@{term.language}'
+        if term.datatype:
+            return f'"{_escape(str(term))}"^^<{term.datatype}>'
+        return f'"{_escape(str(term))}"'
+
+    def line(self, triple):
+        return ' '.join(self.nt(term) for term in triple) + ' .'
+
+    # ----- 묶음 나누기 -----
+
+    def image_year(self, image):
+        for date in self.graph.objects(image, OBI.collectionDate):
+            return str(date)[:4]
+        match = _IMAGE_YEAR.search(str(image))
+        return match.group(1) if match else None
+
+    def partitions(self):
+        """{묶음 키: 단언 트리플 집합} — 'year:YYYY'는 그 해 Image에서 닿는 노드, 나머지는 'shared'"""
+        owner = {}
+        for image_class in self.image_classes:
+            for image in self.graph.subjects(RDF.type, image_class):
+                year = self.image_year(image)
+                if year is None or image in owner:
+                    continue
+                key = f"year:{year}"
+                # Image → CoverCopy → 블록, 그리고 그 아래 공노드까지
+                stack = [image]
+                while stack:
+                    node = stack.pop()
+                    if node in owner:
+                        continue
+                    owner[node] = key
+                    for p, o in self.graph.predicate_objects(node):
+                        if isinstance(o, BNode) or (node == image and p in self.cover_props) or \
+                                p in self.marketing_props:
+                            stack.append(o)
+
+        parts = defaultdict(set)
+        for s, p, o in self.graph:
+            key = owner.get(s)
+            if key is None and p == OBI.hasImage:
+                key = owner.get(o)
+            parts[key or SHARED_KEY].add((s, p, o))
+        return dict(sorted(parts.items()))
+
+    # ----- 추론·집계 -----
+
+    def entail(self, triples):
+        """rdfs7(상위 속성)·rdfs9(상위 클래스) 추론 트리플 (이미 단언된 것 제외)"""
+        inferred = set()
+        for s, p, o in triples:
+            for parent in self.property_ancestors.get(p, ()):
+                if parent != p:
+                    inferred.add((s, parent, o))
+            if p == RDF.type:
+                for parent in self.class_ancestors.get(o, ()):
+                    if parent != o:
+                        inferred.add((s, RDF.type, parent))
+        return {triple for triple in inferred if triple not in self.graph}
+
+    def tbox_triples(self):
+        """스키마 폐포 + 지름길 공리 (스키마에 없는 것만)"""
+        triples = {axiom for axiom in EXTRA_AXIOMS}
+        for predicate, ancestors in ((RDFS.subClassOf, self.class_ancestors),
+                                     (RDFS.subPropertyOf, self.property_ancestors)):
+            for node, parents in ancestors.items():
+                triples.update((node, predicate, parent) for parent in parents if parent != node)
+        return {triple for triple in triples if triple not in self.schema}
+
+    def derive(self, triples):
+        """
+        연도 묶음의 지름길 트리플과 집계 행
+
+        Returns:
+            (shortcuts, rows, context) context: 읽은 묶음 밖 트리플 (해시에 포함)
+        """
+        graph = self.graph
+        context = set()
+
+        def objects(s, p):
+            values = list(graph.objects(s, p))
+            context.update((s, p, o) for o in values)
+            return values
+
+        def subjects(p, o):
+            values = list(graph.subjects(p, o))
+            context.update((s, p, o) for s in values)
+            return values
+
+        shortcuts = set()
+        rows = {table: [] for table in AGGREGATE_TABLES}
+        q07 = defaultdict(int)
+        images = {s for s, p, o in triples if p == RDF.type and o in self.image_classes}
+
+        for image in sorted(images):
+            manifestations = subjects(OBI.hasImage, image)
+            works = {manifestation: subjects(OBI.hasManifestation, manifestation)
+                     for manifestation in manifestations}
+
+            for prop, carrier in graph.predicate_objects(image):
+                if prop not in self.cover_props:
+                    continue
+                types = set(graph.objects(carrier, RDF.type))
+                blocks = [(p, o) for p, o in graph.predicate_objects(carrier) if p in self.marketing_props]
+
+                # 지름길: 하위 클래스 타입도 포함
+                for carrier_type, shortcut in SHORTCUTS.items():
+                    if any(carrier_type in self.class_ancestors.get(t, {t}) for t in types):
+                        for work in (w for ws in works.values() for w in ws):
+                            shortcuts.add((work, shortcut, carrier))
+
+                # 07: ?img ?hasCarrier ?carrier (hasCoverCopy*) . ?carrier a ?type ; ?p ?blk (hasMarketingCopy*)
+                for carrier_type in types & {OBI.Obi, OBI.BCover}:
+                    for _, block in blocks:
+                        for surface in list(graph.objects(block, OBI.printedOn)) or [None]:
+                            q07[(str(carrier_type), None if surface is None else str(surface))] += 1
+
+                if prop != OBI.hasObi:
+                    continue
+                endorsements = [(block, role, label)
+                                for block in graph.objects(carrier, OBI.hasEndorsement)
+                                for role in graph.objects(block, OBI.endorserRole)
+                                for label in objects(role, SKOS.prefLabel)]
+                mentions = list(graph.objects(carrier, OBI.hasAdaptationMention))
+
+                for manifestation in manifestations:
+                    # 02: 영상화 언급이 있는 띠지의 추천인 직군 (해답 하나당 한 행)
+                    for work in works[manifestation]:
+                        for _ in mentions:
+                            rows['q02_roles'].extend((str(work), str(carrier), str(label))
+                                                     for _, _, label in endorsements)
+                    # 03: 판본 출판사 이름별 직군
+                    for publisher in objects(manifestation, DCTERMS.publisher):
+                        for name in objects(publisher, FOAF.name):
+                            rows['q03_publisher_roles'].extend((str(manifestation), str(name), str(label))
+                                                               for _, _, label in endorsements)
+                    # 05: ISBN별 띠지
+                    for isbn in objects(manifestation, BIBO.isbn13):
+                        rows['q05_isbn_obis'].append((str(isbn), str(carrier)))
+
+        rows['q07_blocks'] = [(carrier_type, surface, n) for (carrier_type, surface), n in q07.items()]
+        return shortcuts, rows, context - triples
+
+    # ----- 갱신 -----
+
+    def materialize(self, output):
+        """
+        바뀐 묶음만 다시 추론·집계하고 출력 N-Triples 조립
+
+        Returns:
+            dict: 통계
+        """
+        self.labels = self.bnode_labels()
+        parts = self.partitions()
+        tbox = self.tbox_triples()
+        tbox_hash = self.hash_lines(self.line(triple) for triple in tbox)
+
+        stored = dict(self.conn.execute("SELECT key, hash FROM partitions"))
+        current = {TBOX_KEY: (set(), tbox, {}, set())}
+        for key, triples in parts.items():
+            shortcuts, rows, context = self.derive(triples) if key.startswith('year:') else (set(), {}, set())
+            current[key] = (triples, self.entail(triples | shortcuts) | shortcuts, rows, context)
+
+        for key, (triples, inferred, rows, context) in current.items():
+            self.stats['partitions'] += 1
+            self.stats['inferred'] += len(inferred)
+            source_hash = self.hash_lines([tbox_hash] + [self.line(t) for t in triples]
+                                          + ['#'] + [self.line(t) for t in context])
+            if stored.get(key) == source_hash:
+                self.stats['reused'] += 1
+                continue
+
+            self.delete_partition(key)
+            self.conn.executemany("INSERT INTO triples VALUES (?, ?, ?)",
+                                  [(key, line, 0) for line in sorted(self.line(t) for t in triples)]
+                                  + [(key, line, 1) for line in sorted(self.line(t) for t in inferred)])
+            for table, values in rows.items():
+                if values:
+                    marks = ', '.join('?' * (len(values[0]) + 1))
+                    self.conn.executemany(f"INSERT INTO {table} VALUES ({marks})",
+                                          [(key,) + tuple(value) for value in values])
+            self.conn.execute("INSERT OR REPLACE INTO partitions VALUES (?, ?, ?, ?)",
+                              (key, source_hash, len(triples), len(inferred)))
+            self.stats['updated'] += 1
+
+        for key in set(stored) - set(current):
+            self.delete_partition(key)
+            self.conn.execute("DELETE FROM partitions WHERE key = ?", (key,))
+            self.stats['removed'] += 1
+        self.conn.commit()
+
+        output = Path(output)
+        if self.stats['updated'] or self.stats['removed'] or not output.exists():
+            self.assemble(output)
+        return self.stats
+
+    @staticmethod
+    def hash_lines(lines):
+        digest = hashlib.sha1()
+        for line in sorted(lines):
+            digest.update(line.encode('utf-8') + b'\n')
+        return digest.hexdigest()
+
+    def delete_partition(self, key):
+        for table in ('triples',) + tuple(AGGREGATE_TABLES):
+            self.conn.execute(f"DELETE FROM {table} WHERE partition = ?", (key,))
+
+    def assemble(self, output):
+        """묶음 순서대로 N-Triples 출력 (임시 파일 후 교체)"""
+        tmp_file = output.with_name(output.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for line, in self.conn.execute("SELECT line FROM triples ORDER BY partition, rowid"):
+                f.write(line + '\n')
+        os.replace(tmp_file, output)
+
+
+def aggregate(db_file, name):
+    """
+    사전 집계로 준비된 질의 결과 계산
+
+    Returns:
+        (변수 이름 튜플, 행 목록) — 집계가 없는 질의면 None
+    """
+    if name not in AGGREGATES:
+        return None
+    _, variables, sql = AGGREGATES[name]
+    conn = sqlite3.connect(str(db_file))
+    try:
+        return variables, conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def materialize(graph_file=GRAPH_FILE, schema_file=SCHEMA_FILE, output=None, db_file=None):
+    """그래프 파일 → (출력 N-Triples, SQLite, 통계)"""
+    default_output, default_db = default_paths(graph_file)
+    output, db_file = Path(output or default_output), Path(db_file or default_db)
+
+    graph = GraphSnapshot(ensure_snapshot([graph_file], abox_snapshot_path(graph_file))).graph()
+    schema = Graph()
+    schema.parse(str(schema_file), format=guess_format(schema_file))
+    stats = Materializer(graph, schema, db_file).materialize(output)
+    return output, db_file, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OBI 그래프 추론 트리플·집계 사전 계산")
+    parser.add_argument('--graph', default=GRAPH_FILE, help="ABox 파일")
+    parser.add_argument('--schema', default=SCHEMA_FILE)
+    parser.add_argument('--output', help="단언+추론 N-Triples (기본: {그래프}.materialized.nt)")
+    parser.add_argument('--db', help="상태·집계 SQLite (기본: {그래프}.materialized.sqlite)")
+    parser.add_argument('--full', action='store_true', help="모든 묶음 다시 계산")
+    parser.add_argument('--aggregate', metavar='NAME', choices=sorted(AGGREGATES), help="집계 결과 출력")
+    args = parser.parse_args()
+
+    db_file = Path(args.db or default_paths(args.graph)[1])
+    if args.full and db_file.exists():
+        db_file.unlink()
+
+    output, db_file, stats = materialize(args.graph, args.schema, args.output, db_file)
+    print(f"추론: {output} (추론 트리플 {stats['inferred']}개)")
+    print(f"묶음 {stats['partitions']}개 중 갱신 {stats['updated']}개, 재사용 {stats['reused']}개, "
+          f"삭제 {stats['removed']}개")
+
+    if args.aggregate:
+        variables, rows = aggregate(db_file, args.aggregate)
+        print('\t'.join(variables))
+        for row in rows:
+            print('\t'.join('' if value is None else str(value) for value in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OBI 통합 그래프 이진 스냅샷 (HDT 방식: 용어 사전 + 정렬된 트리플 배열, mmap)
+
+Turtle 파싱이 분석 세션에서 가장 느린 단계라서, abox_generator.py 출력(+ 스키마 OWL)을 한 번
+컴파일해 두고 mmap으로 연다. 여러 프로세스가 같은 파일 페이지를 공유하고, 여는 데는 헤더만 읽는다.
+
+파일 구조 (리틀 엔디언):
+    b'OBISNAP1' | uint64 헤더 길이 | 헤더 JSON | 64바이트 정렬된 섹션들
+    헤더: version, triples, terms, sources([{path, size, sha1}]), namespaces, sections({이름: [오프셋, dtype, 개수]})
+    terms_offsets (uint64, 용어 수+1), terms_blob (uint8)
+        용어는 인코딩한 바이트 순으로 정렬 — ID는 정렬 순번, 이진 탐색으로 용어 → ID
+        'I'+IRI / 'B'+공노드 / 'L'+언어\x1f데이터타입\x1f어휘형
+    spo_0..2, pos_0..2, osp_0..2 (int32, 트리플 수): 세 가지 순서로 정렬한 ID 열
+    spo_start, pos_start, osp_start (int32, 용어 수+1): 첫 열 ID별 시작 위치
+        패턴에서 묶인 위치가 앞에 오는 순서를 골라 첫 열은 시작 위치로, 나머지 열은 searchsorted로
+        범위를 좁힌다
+
+원본 파일 내용(sha1)이 스냅샷을 만들 때와 달라지면 ensure_snapshot이 다시 컴파일한다.
+
+사용 예:
+    python graph_snapshot.py build                      # OBI_통합그래프_전수.ttl + 스키마 → .snap
+    python graph_snapshot.py info OBI_통합그래프_전수.ttl.snap
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+from bisect import bisect_left
+from itertools import repeat
+from pathlib import Path
+
+import numpy as np
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.store import Store
+
+from abox_generator import GRAPH_FILE, SCHEMA_FILE
+
+MAGIC = b'OBISNAP1'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+ALIGN = 64
+ORDERS = {'spo': (0, 1, 2), 'pos': (1, 2, 0), 'osp': (2, 0, 1)}
+# (s, p, o 묶임 여부) → 묶인 위치가 앞에 오는 정렬 순서
+PATTERN_ORDERS = {(True, True, True): 'spo', (True, True, False): 'spo', (True, False, True): 'osp',
+                  (True, False, False): 'spo', (False, True, True): 'pos', (False, True, False): 'pos',
+                  (False, False, True): 'osp', (False, False, False): 'spo'}
+
+
+def encode_term(term):
+    """rdflib 용어 → 사전 바이트"""
+    if isinstance(term, URIRef):
+        return b'I' + str(term).encode('utf-8')
+    if isinstance(term, BNode):
+        return b'B' + str(term).encode('utf-8')
+    if isinstance(term, Literal):
+        return ('L' + (term.language or '') + '\x1f' + (str(term.datatype) if term.datatype else '') + '\x1f'
+                + str(term)).encode('utf-8')
+    raise TypeError(f"스냅샷에 넣을 수 없는 용어: {term!r}")
+
+
+def decode_term(data, datatypes=None):
+    """사전 바이트 → rdflib 용어 (datatypes: 데이터타입 IRI → URIRef 캐시)"""
+    kind, value = data[:1], data[1:].decode('utf-8')
+    if kind == b'I':
+        return URIRef(value)
+    if kind == b'B':
+        return BNode(value)
+    language, datatype, lexical = value.split('\x1f', 2)
+    if datatype:
+        if datatypes is None:
+            datatype = URIRef(datatype)
+        elif datatype in datatypes:
+            datatype = datatypes[datatype]
+        else:
+            datatype = datatypes[datatype] = URIRef(datatype)
+    return Literal(lexical, lang=language or None, datatype=datatype or None)
+
+
+def source_stamp(path):
+    """원본 파일 크기·내용 해시"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return {'path': str(path), 'size': os.path.getsize(path), 'sha1': digest.hexdigest()}
+
+
+def guess_format(path):
+    suffix = Path(path).suffix.lower()
+    return {'.nt': 'nt', '.owl': 'xml', '.rdf': 'xml', '.xml': 'xml'}.get(suffix, 'turtle')
+
+
+def compile_snapshot(sources, output):
+    """
+    RDF 파일들을 읽어 스냅샷 파일 작성 (임시 파일 후 교체)
+
+    Returns:
+        dict: 헤더
+    """
+    graph = Graph(store='SimpleMemory')
+    for path in sources:
+        graph.parse(str(path), format=guess_format(path))
+
+    encoded = {}
+    for triple in graph:
+        for term in triple:
+            if term not in encoded:
+                encoded[term] = encode_term(term)
+
+    terms = sorted(set(encoded.values()))
+    ids = {data: i for i, data in enumerate(terms)}
+    triples = np.array([[ids[encoded[term]] for term in triple] for triple in graph],
+                       dtype='<i4').reshape(-1, 3)
+
+    offsets = np.zeros(len(terms) + 1, dtype='<u8')
+    offsets[1:] = np.cumsum([len(data) for data in terms])
+    sections = {'terms_offsets': offsets, 'terms_blob': np.frombuffer(b''.join(terms), dtype=np.uint8)}
+    for order, columns in ORDERS.items():
+        permuted = triples[:, columns]
+        permuted = permuted[np.lexsort(permuted.T[::-1])]
+        for i in range(3):
+            sections[f"{order}_{i}"] = np.ascontiguousarray(permuted[:, i])
+        # 첫 열 ID별 시작 위치 (ID k의 범위: start[k]..start[k+1])
+        sections[f"{order}_start"] = np.searchsorted(permuted[:, 0], np.arange(len(terms) + 1)).astype('<i4')
+
+    header = {
+        'version': SNAPSHOT_VERSION,
+        'triples': len(triples),
+        'terms': len(terms),
+        'sources': [source_stamp(path) for path in sources],
+        'namespaces': {prefix: str(namespace) for prefix, namespace in graph.namespaces()},
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'sections': {},
+    }
+
+    # 섹션 오프셋은 헤더 길이에 따라 정해지므로 헤더 크기를 넉넉히 잡고 채워 넣는다
+    def layout(header_size):
+        position = _align(len(MAGIC) + 8 + header_size)
+        placed = {}
+        for name, array in sections.items():
+            placed[name] = [position, array.dtype.str, int(array.size)]
+            position = _align(position + array.nbytes)
+        return placed
+
+    header_size = len(json.dumps(header, ensure_ascii=False).encode('utf-8')) + 64 * (len(sections) + 1)
+    header['sections'] = layout(header_size)
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8').ljust(header_size)
+
+    output = Path(output)
+    tmp_file = output.with_name(output.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(MAGIC + struct.pack('<Q', header_size) + header_bytes)
+        for name, array in sections.items():
+            f.write(b'\0' * (header['sections'][name][0] - f.tell()))
+            f.write(array.tobytes())
+    os.replace(tmp_file, output)
+    return header
+
+
+def _align(position):
+    return (position + ALIGN - 1) // ALIGN * ALIGN
+
+
+def read_header(path):
+    """스냅샷 헤더만 읽기 (형식이 다르면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            size, = struct.unpack('<Q', f.read(8))
+            header = json.loads(f.read(size).decode('utf-8'))
+    except (OSError, ValueError, struct.error):
+        return None
+    return header if header.get('version') == SNAPSHOT_VERSION else None
+
+
+def is_stale(snapshot, sources):
+    """스냅샷이 없거나, 원본 목록·크기·내용이 바뀌었는지"""
+    header = read_header(snapshot)
+    if header is None or [entry['path'] for entry in header['sources']] != [str(path) for path in sources]:
+        return True
+    for entry, path in zip(header['sources'], sources):
+        if not Path(path).exists() or os.path.getsize(path) != entry['size']:
+            return True
+        if source_stamp(path)['sha1'] != entry['sha1']:
+            return True
+    return False
+
+
+def ensure_snapshot(sources, snapshot=None):
+    """
+    원본이 바뀌었으면 스냅샷을 다시 컴파일하고 경로 반환
+
+    Args:
+        sources: RDF 파일 목록 (첫 파일 이름 + .snap이 기본 스냅샷 경로)
+    """
+    sources = [Path(path) for path in sources]
+    snapshot = Path(snapshot) if snapshot else sources[0].with_name(sources[0].name + SNAPSHOT_SUFFIX)
+    if is_stale(snapshot, sources):
+        started = time.perf_counter()
+        header = compile_snapshot(sources, snapshot)
+        print(f"스냅샷 컴파일: {snapshot} (트리플 {header['triples']}개, 용어 {header['terms']}개, "
+              f"{time.perf_counter() - started:.2f}s)")
+    return snapshot
+
+
+class _TermTable:
+    """정렬된 용어 사전의 바이트 열 (bisect용 시퀀스)"""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.blob[int(self.offsets[i]):int(self.offsets[i + 1])].tobytes()
+
+
+class GraphSnapshot:
+    def __init__(self, path):
+        """
+        스냅샷 파일을 mmap으로 열기 (배열은 복사하지 않음)
+
+        Args:
+            path (str): .snap 파일
+        """
+        self.path = Path(path)
+        self.header = read_header(self.path)
+        if self.header is None:
+            raise ValueError(f"스냅샷 형식이 아님: {self.path}")
+
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.arrays = {name: np.frombuffer(self._mmap, dtype=np.dtype(dtype), count=count, offset=offset)
+                       for name, (offset, dtype, count) in self.header['sections'].items()}
+        self.terms = _TermTable(self.arrays['terms_offsets'], self.arrays['terms_blob'])
+        # 순서별 (ID 열, 첫 열 시작 위치, 정렬 순서 → (s, p, o) 열 위치)
+        self._orders = {order: ([self.arrays[f"{order}_{i}"] for i in range(3)], self.arrays[f"{order}_start"],
+                                [columns.index(i) for i in range(3)])
+                        for order, columns in ORDERS.items()}
+        self._decoded = {}
+        self._ids = {}
+        # 순서별 {첫 열 ID: {둘째 열 ID: ID 행 목록 또는 해독한 {셋째 열 ID: (s, p, o)}}}
+        self._blocks = {order: {} for order in ORDERS}
+
+    def __len__(self):
+        return self.header['triples']
+
+    def close(self):
+        self.arrays = {}
+        self.terms = None
+        self._orders = {}
+        self._blocks = {order: {} for order in ORDERS}
+        self._mmap.close()
+
+    def term(self, term_id):
+        """ID → rdflib 용어 (해독 결과 캐시)"""
+        term = self._decoded.get(term_id)
+        if term is None:
+            term = self._decoded[term_id] = decode_term(self.terms[term_id])
+            self._ids[term] = term_id
+        return term
+
+    def load_terms(self):
+        """
+        용어 사전 전체를 한 번에 해독해 캐시
+
+        질의 중에 용어를 하나씩 해독하면 첫 실행이 SimpleMemory보다 느려지므로, 오래 도는 서비스는
+        열 때 사전 바이트를 통째로 읽어 해독해 둔다. 해독한 용어 수를 반환한다.
+        """
+        offsets = self.arrays['terms_offsets'].tolist()
+        blob = self.arrays['terms_blob'].tobytes()
+        datatypes = {}
+        for term_id in range(len(offsets) - 1):
+            if term_id not in self._decoded:
+                term = self._decoded[term_id] = decode_term(blob[offsets[term_id]:offsets[term_id + 1]], datatypes)
+                self._ids[term] = term_id
+        return len(self._decoded)
+
+    def term_id(self, term):
+        """rdflib 용어 → ID (사전에 없으면 None)"""
+        term_id = self._ids.get(term, -1)
+        if term_id != -1:
+            return term_id
+        try:
+            data = encode_term(term)
+        except TypeError:
+            return None
+        i = bisect_left(self.terms, data)
+        term_id = self._ids[term] = i if i < len(self.terms) and self.terms[i] == data else None
+        return term_id
+
+    def triple_ids(self, s=None, p=None, o=None):
+        """
+        ID 패턴에 맞는 (s, p, o) ID 튜플 반복자
+
+        묶인 위치가 앞에 오는 정렬 순서를 고른다: s·o만 묶이면 osp, p가 묶이고 s가 없으면 pos
+        """
+        order = PATTERN_ORDERS[s is not None, p is not None, o is not None]
+        columns, start, positions = self._orders[order]
+        pattern = (s, p, o)
+        keys = [pattern[position] for position in ORDERS[order]]
+
+        if keys[0] is None:
+            low, high = 0, len(self)
+        else:
+            low, high = int(start[keys[0]]), int(start[keys[0] + 1])
+        for column, key in zip(columns[1:], keys[1:]):
+            if key is None or low >= high:
+                break
+            segment = column[low:high]
+            low, high = (low + int(np.searchsorted(segment, key, 'left')),
+                         low + int(np.searchsorted(segment, key, 'right')))
+        if low >= high:
+            return
+
+        rows = [column[low:high].tolist() for column in columns]
+        yield from zip(rows[positions[0]], rows[positions[1]], rows[positions[2]])
+
+    def _block(self, order, key):
+        """정렬 순서의 첫 열 ID 하나에 걸린 행을 둘째 열 ID별로 묶어 캐시 (해독은 _group에서)"""
+        block = self._blocks[order].get(key)
+        if block is None:
+            columns, start, _ = self._orders[order]
+            low, high = start[key:key + 2].tolist()
+            first, second, third = columns
+            block = {}
+            for row in zip(first[low:high].tolist(), second[low:high].tolist(), third[low:high].tolist()):
+                if row[1] in block:
+                    block[row[1]].append(row)
+                else:
+                    block[row[1]] = [row]
+            self._blocks[order][key] = block
+        return block
+
+    def _group(self, order, block, second):
+        """블록의 둘째 열 ID 묶음 → {셋째 열 ID: 해독한 (s, p, o)} (처음 물을 때 한 번만 해독)"""
+        group = block.get(second)
+        if type(group) is list:
+            s, p, o = self._orders[order][2]
+            term = self.term
+            group = block[second] = {row[2]: (term(row[s]), term(row[p]), term(row[o])) for row in group}
+        return group
+
+    def triples(self, s=None, p=None, o=None):
+        """
+        ID 패턴에 맞는 해독된 (s, p, o) 용어 튜플
+
+        첫 열 ID가 묶이면 그 범위를 둘째 열 ID별로 묶어 캐시하고, 물어본 묶음만 한 번 해독해 둔다.
+        같은 주어·술어·목적어로 거듭 묻는 SPARQL 조인은 배열을 다시 읽지 않고 사전 조회로 끝난다.
+        """
+        order = PATTERN_ORDERS[s is not None, p is not None, o is not None]
+        pattern = (s, p, o)
+        first, second, third = ORDERS[order]
+        first, second, third = pattern[first], pattern[second], pattern[third]
+        if first is None:
+            term = self.term
+            return [(term(s), term(p), term(o)) for s, p, o in self.triple_ids()]
+        block = self._blocks[order].get(first) or self._block(order, first)
+        if second is None:
+            return [triple for key in list(block) for triple in self._group(order, block, key).values()]
+        if second not in block:
+            return ()
+        group = self._group(order, block, second)
+        if third is None:
+            return group.values()
+        triple = group.get(third)
+        return () if triple is None else (triple,)
+
+    def graph(self):
+        """스냅샷을 읽는 rdflib Graph (읽기 전용)"""
+        return Graph(store=SnapshotStore(self))
+
+
+class SnapshotStore(Store):
+    """GraphSnapshot 위의 읽기 전용 rdflib 저장소"""
+
+    context_aware = False
+    formula_aware = False
+    graph_aware = False
+
+    def __init__(self, snapshot):
+        super().__init__()
+        self.snapshot = snapshot
+        self._namespaces = {prefix: URIRef(namespace) for prefix, namespace in snapshot.header['namespaces'].items()}
+        self._prefixes = {namespace: prefix for prefix, namespace in self._namespaces.items()}
+
+    def triples(self, triple_pattern, context=None):
+        term_id = self.snapshot.term_id
+        s, p, o = triple_pattern
+        if s is not None:
+            s = term_id(s)
+            if s is None:
+                return
+        if p is not None:
+            p = term_id(p)
+            if p is None:
+                return
+        if o is not None:
+            o = term_id(o)
+            if o is None:
+                return
+        yield from zip(self.snapshot.triples(s, p, o), repeat(()))
+
+    def __len__(self, context=None):
+        return len(self.snapshot)
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def add(self, triple, context, quoted=False):
+        raise TypeError("스냅샷 저장소는 읽기 전용")
+
+    def addN(self, quads):
+        raise TypeError("스냅샷 저장소는 읽기 전용")
+
+    def remove(self, triple, context=None):
+        raise TypeError("스냅샷 저장소는 읽기 전용")
+
+    def bind(self, prefix, namespace, override=True):
+        namespace = URIRef(namespace)
+        if not override and (prefix in self._namespaces or namespace in self._prefixes):
+            return
+        self._prefixes.pop(self._namespaces.get(prefix), None)
+        self._namespaces.pop(self._prefixes.get(namespace), None)
+        self._namespaces[prefix] = namespace
+        self._prefixes[namespace] = prefix
+
+    def namespace(self, prefix):
+        return self._namespaces.get(prefix)
+
+    def prefix(self, namespace):
+        return self._prefixes.get(URIRef(namespace))
+
+    def namespaces(self):
+        yield from self._namespaces.items()
+
+
+def open_graph(sources, snapshot=None):
+    """원본 RDF 파일 목록 → 최신 스냅샷을 읽는 Graph (필요하면 다시 컴파일)"""
+    return GraphSnapshot(ensure_snapshot(sources, snapshot)).graph()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OBI 그래프 이진 스냅샷")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help="원본이 바뀌었으면 스냅샷 컴파일")
+    build.add_argument('sources', nargs='*', help=f"RDF 파일 (기본: {GRAPH_FILE} {SCHEMA_FILE})")
+    build.add_argument('--output', help="스냅샷 파일 (기본: 첫 원본 + .snap)")
+    build.add_argument('--force', action='store_true', help="원본이 같아도 다시 컴파일")
+    info = sub.add_parser('info', help="스냅샷 헤더 출력")
+    info.add_argument('snapshot')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        sources = [Path(path) for path in (args.sources or [GRAPH_FILE, SCHEMA_FILE])]
+        output = args.output or sources[0].with_name(sources[0].name + SNAPSHOT_SUFFIX)
+        if args.force:
+            compile_snapshot(sources, output)
+        snapshot = ensure_snapshot(sources, output)
+        print(f"스냅샷: {snapshot} ({os.path.getsize(snapshot) / 1024:.0f}KB)")
+        return
+
+    started = time.perf_counter()
+    snapshot = GraphSnapshot(args.snapshot)
+    elapsed = time.perf_counter() - started
+    header = snapshot.header
+    print(f"{snapshot.path}: 트리플 {header['triples']}개, 용어 {header['terms']}개, "
+          f"{os.path.getsize(snapshot.path) / 1024:.0f}KB, 열기 {elapsed * 1000:.1f}ms (생성 {header['created']})")
+    for entry in header['sources']:
+        print(f"  원본 {entry['path']} ({entry['size']} bytes, sha1 {entry['sha1'][:12]})")
+    snapshot.close()
+
+
+if __name__ == "__main__":
+    main()
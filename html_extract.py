@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+알라딘 목록·상품 페이지 HTML 추출기
+
+연간 베스트 목록(wbest.aspx)과 상품 페이지(wproduct.aspx)에서 필요한 필드만
+뽑아 주는 공용 모듈. 파서는 설치된 것 중 빠른 순서로 고른다:
+    selectolax (lexbor) → lxml (미리 컴파일한 XPath) → BeautifulSoup(html.parser)
+
+상품 페이지 이미지(letslook 앞/뒷표지, cover500)는 파서 없이 정규식 한 번으로
+<img> 태그만 훑는 fast path를 쓴다. 주석·<script> 안의 태그는 건너뛰어
+BeautifulSoup 결과와 같은 순서·같은 URL을 돌려준다.
+
+추출 결과 (가공 전 원본 문자열):
+    extract_bestseller_items(html) → [{'item_id', 'rank_text', 'title', 'author', 'href', 'cover_src'}, ...]
+    extract_product_images(html)   → {'srcs': [img src, ...], 'main_cover': src 또는 None}
+"""
+
+import html as html_lib
+import re
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+try:
+    from lxml import etree
+    import lxml.html
+except ImportError:
+    lxml = None
+
+AUTHOR_MARKERS = ('지은이', '저자', '지음')
+MAIN_COVER_SELECTORS = ('img.cover_image', 'div.prd_img img', 'img#BigImage')
+
+
+def available_parsers():
+    parsers = []
+    if HTMLParser is not None:
+        parsers.append('selectolax')
+    if lxml is not None:
+        parsers.append('lxml')
+    parsers.append('bs4')
+    return parsers
+
+
+DEFAULT_PARSER = available_parsers()[0]
+
+
+def clean_author(text):
+    """'지은이: 홍길동 지음' 형태에서 저자만 남김"""
+    return text.replace('지은이:', '').replace('저자:', '').replace('지음', '').strip()
+
+
+def is_author_line(text):
+    return any(marker in text for marker in AUTHOR_MARKERS)
+
+
+# ---------------------------------------------------------------- BeautifulSoup
+
+def _bestseller_items_bs4(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    items = []
+
+    for box in soup.select('div.ss_book_box'):
+        rank_elem = box.select_one('td')
+        title_elem = box.select_one('a.bo3')
+        link_elem = box.select_one('a')
+        cover_elem = box.select_one('img.i_cover')
+
+        author = ""
+        book_list = box.select_one('div.ss_book_list')
+        if book_list:
+            for line in book_list.find_all(['li', 'span', 'div']):
+                text = line.get_text(strip=True)
+                if is_author_line(text):
+                    author = clean_author(text)
+                    break
+
+        items.append({
+            'item_id': box.get('itemid', ''),
+            'rank_text': rank_elem.get_text(strip=True) if rank_elem else None,
+            'title': title_elem.get_text(strip=True) if title_elem else None,
+            'author': author,
+            'href': link_elem.get('href') if link_elem else None,
+            'cover_src': cover_elem.get('src') if cover_elem else None,
+        })
+
+    return items
+
+
+def _product_images_bs4(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    srcs = [img.get('src') for img in soup.find_all('img') if img.get('src')]
+
+    main_cover = None
+    for selector in MAIN_COVER_SELECTORS:
+        elem = soup.select_one(selector)
+        if elem and elem.get('src'):
+            main_cover = elem['src']
+            break
+
+    return {'srcs': srcs, 'main_cover': main_cover}
+
+
+# ---------------------------------------------------------------- lxml
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if lxml is not None:
+    _XPATH = {
+        'boxes': etree.XPath(f"//div[{_has_class('ss_book_box')}]"),
+        'rank': etree.XPath("(.//td)[1]"),
+        'title': etree.XPath(f"(.//a[{_has_class('bo3')}])[1]"),
+        'link': etree.XPath("(.//a)[1]"),
+        'cover': etree.XPath(f"(.//img[{_has_class('i_cover')}])[1]"),
+        'book_list': etree.XPath(f"(.//div[{_has_class('ss_book_list')}])[1]"),
+        'lines': etree.XPath(".//*[self::li or self::span or self::div]"),
+        'img_srcs': etree.XPath("//img/@src"),
+        'main_cover': [
+            etree.XPath(f"//img[{_has_class('cover_image')}]"),
+            etree.XPath(f"//div[{_has_class('prd_img')}]//img"),
+            etree.XPath("//img[@id='BigImage']"),
+        ],
+    }
+
+
+def _lxml_strings(elem, strings):
+    # 주석 등 태그가 아닌 노드는 본문을 빼고 tail만 포함 (BeautifulSoup과 동일)
+    if isinstance(elem.tag, str) and elem.text:
+        strings.append(elem.text)
+    for child in elem:
+        _lxml_strings(child, strings)
+        if child.tail:
+            strings.append(child.tail)
+    return strings
+
+
+def _lxml_text(elem):
+    """BeautifulSoup get_text(strip=True)와 같은 텍스트"""
+    return ''.join(text.strip() for text in _lxml_strings(elem, []))
+
+
+def _lxml_document(html):
+    if not html.strip():
+        return None
+    return lxml.html.document_fromstring(html)
+
+
+def _first(xpath, node):
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def _bestseller_items_lxml(html):
+    doc = _lxml_document(html)
+    if doc is None:
+        return []
+
+    items = []
+    for box in _XPATH['boxes'](doc):
+        rank_elem = _first(_XPATH['rank'], box)
+        title_elem = _first(_XPATH['title'], box)
+        link_elem = _first(_XPATH['link'], box)
+        cover_elem = _first(_XPATH['cover'], box)
+
+        author = ""
+        book_list = _first(_XPATH['book_list'], box)
+        if book_list is not None:
+            for line in _XPATH['lines'](book_list):
+                text = _lxml_text(line)
+                if is_author_line(text):
+                    author = clean_author(text)
+                    break
+
+        items.append({
+            'item_id': box.get('itemid', ''),
+            'rank_text': _lxml_text(rank_elem) if rank_elem is not None else None,
+            'title': _lxml_text(title_elem) if title_elem is not None else None,
+            'author': author,
+            'href': link_elem.get('href') if link_elem is not None else None,
+            'cover_src': cover_elem.get('src') if cover_elem is not None else None,
+        })
+
+    return items
+
+
+def _product_images_lxml(html):
+    doc = _lxml_document(html)
+    if doc is None:
+        return {'srcs': [], 'main_cover': None}
+
+    main_cover = None
+    for xpath in _XPATH['main_cover']:
+        elem = _first(xpath, doc)
+        if elem is not None and elem.get('src'):
+            main_cover = elem.get('src')
+            break
+
+    return {'srcs': [str(src) for src in _XPATH['img_srcs'](doc) if src], 'main_cover': main_cover}
+
+
+# ---------------------------------------------------------------- selectolax
+
+def _selectolax_text(node):
+    return node.text(deep=True, separator='', strip=True)
+
+
+def _bestseller_items_selectolax(html):
+    tree = HTMLParser(html)
+    items = []
+
+    for box in tree.css('div.ss_book_box'):
+        rank_elem = box.css_first('td')
+        title_elem = box.css_first('a.bo3')
+        link_elem = box.css_first('a')
+        cover_elem = box.css_first('img.i_cover')
+
+        author = ""
+        book_list = box.css_first('div.ss_book_list')
+        if book_list is not None:
+            for line in book_list.css('li, span, div'):
+                # lexbor는 기준 노드 자신도 선택자 결과에 포함함
+                if line.mem_id == book_list.mem_id:
+                    continue
+                text = _selectolax_text(line)
+                if is_author_line(text):
+                    author = clean_author(text)
+                    break
+
+        items.append({
+            'item_id': box.attributes.get('itemid') or '',
+            'rank_text': _selectolax_text(rank_elem) if rank_elem is not None else None,
+            'title': _selectolax_text(title_elem) if title_elem is not None else None,
+            'author': author,
+            'href': link_elem.attributes.get('href') if link_elem is not None else None,
+            'cover_src': cover_elem.attributes.get('src') if cover_elem is not None else None,
+        })
+
+    return items
+
+
+def _product_images_selectolax(html):
+    tree = HTMLParser(html)
+    srcs = [img.attributes.get('src') for img in tree.css('img') if img.attributes.get('src')]
+
+    main_cover = None
+    for selector in MAIN_COVER_SELECTORS:
+        elem = tree.css_first(selector)
+        if elem is not None and elem.attributes.get('src'):
+            main_cover = elem.attributes['src']
+            break
+
+    return {'srcs': srcs, 'main_cover': main_cover}
+
+
+# ---------------------------------------------------------------- 정규식 fast path
+
+# 주석·script는 통째로 건너뛰고 <img> 태그만 잡음 (한 번의 스캔)
+_IMG_SCAN = re.compile(r'''<!--.*?-->|<script\b.*?</script\s*>|<img\b((?:[^>"']|"[^"]*"|'[^']*')*)>''', re.S | re.I)
+_SRC_ATTR = re.compile(r'''(?:^|\s)src\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.I)
+_CLASS_ATTR = re.compile(r'''(?:^|\s)class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.I)
+_BIG_IMAGE_ID = re.compile(r'''(?:^|\s)id\s*=\s*["']?BigImage["'\s>]''', re.I)
+
+
+def _attr(pattern, attrs):
+    match = pattern.search(attrs)
+    if not match:
+        return None
+    value = match.group(1) if match.group(1) is not None else match.group(2) or match.group(3) or ''
+    return html_lib.unescape(value) if '&' in value else value
+
+
+def _product_images_regex(html):
+    srcs = []
+    cover_image = big_image = None
+
+    for match in _IMG_SCAN.finditer(html):
+        attrs = match.group(1)
+        if attrs is None:
+            continue
+        src = _attr(_SRC_ATTR, attrs)
+        if not src:
+            continue
+        srcs.append(src)
+
+        if cover_image is None and 'cover_image' in attrs:
+            classes = _attr(_CLASS_ATTR, attrs) or ''
+            if 'cover_image' in classes.split():
+                cover_image = src
+        if big_image is None and 'BigImage' in attrs and _BIG_IMAGE_ID.search(attrs + '>'):
+            big_image = src
+
+    main_cover = cover_image
+    if main_cover is None:
+        if 'prd_img' in html:
+            # div.prd_img img는 구조를 봐야 하므로 이때만 파서 사용
+            main_cover = PRODUCT_IMAGES[DEFAULT_PARSER](html)['main_cover']
+        else:
+            main_cover = big_image
+
+    return {'srcs': srcs, 'main_cover': main_cover}
+
+
+BESTSELLER_ITEMS = {
+    'selectolax': _bestseller_items_selectolax,
+    'lxml': _bestseller_items_lxml,
+    'bs4': _bestseller_items_bs4,
+}
+
+PRODUCT_IMAGES = {
+    'selectolax': _product_images_selectolax,
+    'lxml': _product_images_lxml,
+    'bs4': _product_images_bs4,
+    'regex': _product_images_regex,
+}
+
+
+def extract_bestseller_items(html, parser=None):
+    """연간 베스트 목록 페이지의 div.ss_book_box별 원본 필드"""
+    return BESTSELLER_ITEMS[parser or DEFAULT_PARSER](html)
+
+
+def extract_product_images(html, parser='regex'):
+    """상품 페이지의 <img> src 목록(문서 순서)과 대표 표지 src"""
+    return PRODUCT_IMAGES[parser or DEFAULT_PARSER](html)
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+알라딘 페이지용 디스크 HTTP 응답 캐시
+
+공용 requests 세션(fetch_engine.create_session)에 어댑터로 장착되어
+재실행·부분 재시도 시 네트워크 요청을 생략한다.
+
+1. URL+파라미터(정렬된 쿼리) 해시를 키로 본문을 디스크에 저장
+2. URL 종류별 TTL (지난해 연간 베스트 목록은 길게, 상품 페이지는 7일 등)
+3. TTL 만료 시 ETag/Last-Modified 조건부 재검증 (304면 본문 재사용)
+4. 전체 크기 상한을 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DAY = 24 * 60 * 60
+
+
+def yearly_best_ttl(url):
+    """지난해 연간 베스트 목록은 1년, 올해 목록은 1일"""
+    match = re.search(r'[?&]Year=(\d{4})', url)
+    if match and int(match.group(1)) < datetime.now().year:
+        return 365 * DAY
+    return DAY
+
+
+# (URL 정규식, TTL 초 또는 url -> 초 함수) — 처음 일치하는 규칙 적용, 없으면 캐시 안 함
+DEFAULT_TTL_RULES = [
+    (r'wbest\.aspx\?.*BestType=YearlyBest', yearly_best_ttl),
+    (r'wbest\.aspx', DAY),
+    (r'wproduct\.aspx', 7 * DAY),
+    (r'/ttb/api/', DAY),
+]
+
+
+def canonical_url(url):
+    """쿼리 파라미터를 정렬해 같은 요청이 같은 키를 갖도록 정규화"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, query, ''))
+
+
+class HttpCache:
+    _default = None
+
+    def __init__(self, cache_dir=".http_cache", max_bytes=512 * 1024 * 1024, ttl_rules=None):
+        """
+        디스크 응답 캐시 초기화
+
+        Args:
+            cache_dir (str): 캐시 디렉토리 (본문 파일 + index.sqlite)
+            max_bytes (int): 본문 전체 크기 상한 (초과 시 LRU 삭제)
+            ttl_rules (list): (URL 정규식, TTL) 목록
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_rules = [(re.compile(pattern), ttl)
+                          for pattern, ttl in (ttl_rules or DEFAULT_TTL_RULES)]
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.cache_dir / "index.sqlite"), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)")
+        self._db.commit()
+
+        self.stats = {'hit': 0, 'revalidated': 0, 'miss': 0, 'stale': 0}
+
+    @classmethod
+    def default(cls):
+        """프로세스 공용 캐시 인스턴스"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def ttl_for(self, url):
+        """URL 종류별 TTL (캐시 대상이 아니면 None)"""
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl(url) if callable(ttl) else ttl
+        return None
+
+    def key_for(self, method, url):
+        return hashlib.sha256(f"{method} {canonical_url(url)}".encode('utf-8')).hexdigest()
+
+    def is_fresh(self, url, method='GET'):
+        """만료되지 않은 캐시 항목이 있는지 확인 (본문은 읽지 않음)"""
+        if self.ttl_for(url) is None:
+            return False
+        key = self.key_for(method, url)
+        with self._lock:
+            row = self._db.execute("SELECT expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None and row[0] > time.time() and self._body_path(key).exists()
+
+    def _body_path(self, key):
+        return self.cache_dir / key[:2] / key
+
+    def lookup(self, key):
+        """캐시 항목 조회 (본문 포함), 없으면 None"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, headers, etag, last_modified, expires_at FROM entries WHERE key = ?",
+                (key,)).fetchone()
+
+        if row is None:
+            return None
+
+        try:
+            body = self._body_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+        url, status, headers, etag, last_modified, expires_at = row
+        return {
+            'key': key,
+            'url': url,
+            'status': status,
+            'headers': json.loads(headers),
+            'etag': etag,
+            'last_modified': last_modified,
+            'expires_at': expires_at,
+            'body': body
+        }
+
+    def touch(self, key, ttl=None):
+        """마지막 사용 시각 갱신 (ttl 지정 시 만료 시각도 연장)"""
+        now = time.time()
+        with self._lock:
+            if ttl is None:
+                self._db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            else:
+                self._db.execute("UPDATE entries SET last_access = ?, expires_at = ? WHERE key = ?",
+                                 (now, now + ttl, key))
+            self._db.commit()
+
+    def store(self, key, url, response, ttl):
+        """200 응답 본문과 검증 헤더 저장"""
+        body = response.content
+        body_path = self._body_path(key)
+        body_path.parent.mkdir(exist_ok=True)
+
+        # 같은 URL을 여러 스레드가 동시에 받아도 겹치지 않게 고유한 임시 파일에 쓰고,
+        # 본문 교체와 검증 헤더 기록은 잠금 안에서 한 번에 (본문·ETag 짝이 어긋나지 않게)
+        with tempfile.NamedTemporaryFile(dir=body_path.parent, prefix=f"{key}.", suffix='.tmp',
+                                         delete=False) as tmp:
+            tmp.write(body)
+
+        headers = {k: v for k, v in response.headers.items()
+                   if k.lower() in ('content-type', 'etag', 'last-modified')}
+        now = time.time()
+
+        with self._lock:
+            try:
+                os.replace(tmp.name, body_path)
+            except OSError:
+                Path(tmp.name).unlink(missing_ok=True)
+                raise
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, response.status_code, json.dumps(headers),
+                 response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 now, now + ttl, now, len(body)))
+            self._db.commit()
+
+        self.evict()
+
+    def evict(self):
+        """크기 상한 초과 시 LRU 순서로 삭제 (상한의 90%까지)"""
+        with self._lock:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            target = self.max_bytes * 0.9
+            rows = self._db.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall()
+            removed = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                self._body_path(key).unlink(missing_ok=True)
+                removed.append((key,))
+                total -= size
+
+            self._db.executemany("DELETE FROM entries WHERE key = ?", removed)
+            self._db.commit()
+
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            keys = [row[0] for row in self._db.execute("SELECT key FROM entries")]
+            for key in keys:
+                self._body_path(key).unlink(missing_ok=True)
+            self._db.execute("DELETE FROM entries")
+            self._db.commit()
+
+
+class CachingAdapter(HTTPAdapter):
+    def __init__(self, cache, **kwargs):
+        """HttpCache를 거쳐 GET 요청을 처리하는 requests 어댑터"""
+        self.cache = cache
+        super().__init__(**kwargs)
+
+    def _cached_response(self, request, entry, source):
+        """캐시 항목으로 requests.Response 구성"""
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.headers['X-Cache'] = source
+        response._content = entry['body']
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def send(self, request, **kwargs):
+        # stream=True 요청은 본문을 조금씩 읽는 호출자(aladin_api.iter_pages)를 위해 캐시를 거치지 않음
+        if request.method != 'GET' or kwargs.get('stream'):
+            return super().send(request, **kwargs)
+
+        ttl = self.cache.ttl_for(request.url)
+        if ttl is None:
+            return super().send(request, **kwargs)
+
+        key = self.cache.key_for(request.method, request.url)
+        entry = self.cache.lookup(key)
+
+        # 1. 신선한 항목: 네트워크 생략
+        if entry and entry['expires_at'] > time.time():
+            self.cache.touch(key)
+            self.cache.stats['hit'] += 1
+            return self._cached_response(request, entry, 'HIT')
+
+        # 2. 만료된 항목: 조건부 요청으로 재검증
+        if entry:
+            if entry['etag']:
+                request.headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request.headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = super().send(request, **kwargs)
+        except requests.ConnectionError:
+            if entry is None:
+                raise
+            # 네트워크 오류 시 만료된 본문이라도 반환
+            self.cache.stats['stale'] += 1
+            return self._cached_response(request, entry, 'STALE')
+
+        if response.status_code == 304 and entry:
+            self.cache.touch(key, ttl)
+            self.cache.stats['revalidated'] += 1
+            return self._cached_response(request, entry, 'REVALIDATED')
+
+        if response.status_code == 200:
+            self.cache.store(key, request.url, response, ttl)
+
+        self.cache.stats['miss'] += 1
+        return response
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+표지 이미지 지각 해시(pHash/dHash) 색인: 중복·판본 변화 탐지
+
+같은 책이 여러 연도 목록에 오르고(예: 한강 작품), 순위가 바뀌면 파일명
+({rank:03d}_{item_id}_...)만 달라진 같은 표지를 다시 받고 다시 OCR한다.
+image_ingest가 카탈로그 image_meta에 기록한 pHash·dHash로 모든 covers/back_covers
+이미지를 BK-tree(해밍 거리)에 넣어
+1. 같은 이미지 찾기: 내용 해시가 같거나, 크기가 같고 pHash+dHash 거리 합이 IDENTICAL_DISTANCE 이하
+   → 띠지 OCR은 다른 디렉토리에 저장된 OCR 원본 결과(ocr_store.npz)를 재사용하되, 내용 해시가 같거나
+     같은 ItemId이고 화소 차이가 재인코딩 수준(PIXEL_TOLERANCE)일 때만 (시리즈 표지는 해시가 같을 수 있다)
+2. 비슷한 이미지 찾기: pHash 거리 NEAR_DISTANCE 이하 (재인코딩·크기 차이 포함 중복 묶음)
+3. 판본 변화: 같은 ItemId·종류의 연도별 pHash 거리가 EDITION_DISTANCE보다 크면(띠지 교체,
+   수상 스티커 등) 표시 — 크기만 다르거나 재인코딩된 이미지는 제외
+를 제공한다.
+
+사용 예:
+    python image_index.py duplicates            # 중복 묶음 출력
+    python image_index.py editions --output edition_changes.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+from collections import defaultdict
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from catalog import Catalog, image_key
+from fetch_engine import is_complete_image
+from ocr_store import STORE_FILE, OcrStore
+
+IDENTICAL_DISTANCE = 2   # pHash+dHash 거리 합 (재인코딩 오차)
+NEAR_DISTANCE = 8        # pHash 거리 (같은 표지의 다른 크기·약간의 보정)
+EDITION_DISTANCE = 4     # 같은 ItemId의 연도별 이미지 pHash 거리가 이보다 크면 판본 변화
+PIXEL_TOLERANCE = 2.0    # 회색조 평균 절대 차이 (재인코딩 오차, 0~255)
+BELLY_DIR = "belly_bands"
+KIND_DIRS = {'front': "covers", 'back': "back_covers"}
+
+
+def hamming(a, b):
+    """64비트 해시 사이 해밍 거리"""
+    return (a ^ b).bit_count()
+
+
+class BKTree:
+    def __init__(self):
+        """
+        해밍 거리 BK-tree (키: 64비트 정수, 같은 키의 값은 한 노드에 모음)
+
+        노드: [키, 값 목록, {거리: 자식 노드}]
+        """
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, key, value):
+        self.size += 1
+        if self.root is None:
+            self.root = [key, [value], {}]
+            return
+
+        node = self.root
+        while True:
+            distance = hamming(key, node[0])
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, [value], {}]
+                return
+            node = child
+
+    def search(self, key, radius):
+        """키에서 해밍 거리 radius 이하인 [(거리, 값), ...] (거리 순)"""
+        if self.root is None:
+            return []
+
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            distance = hamming(key, node[0])
+            if distance <= radius:
+                found.extend((distance, value) for value in node[1])
+            # 삼각 부등식: 자식 간선 거리가 [d - r, d + r] 안인 가지만 탐색
+            for edge, child in node[2].items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+
+        found.sort(key=lambda pair: pair[0])
+        return found
+
+
+def same_pixels(path_a, path_b, tolerance=PIXEL_TOLERANCE):
+    """두 이미지 파일의 회색조 화소가 크기가 같고 평균 절대 차이 tolerance 이하인지"""
+    images = []
+    for path in (path_a, path_b):
+        try:
+            data = np.fromfile(str(path), dtype=np.uint8)
+        except OSError:
+            return False
+        image = cv2.imdecode(data, cv2.IMREAD_GRAYSCALE) if data.size else None
+        if image is None:
+            return False
+        images.append(image)
+    if images[0].shape != images[1].shape:
+        return False
+    return float(cv2.absdiff(images[0], images[1]).mean()) <= tolerance
+
+
+def _hash_int(value):
+    return int(value, 16) if value else None
+
+
+class ImageHashIndex:
+    def __init__(self, catalog=None, year=None, kind=None):
+        """
+        카탈로그 image_meta의 해시로 색인 구성 (pHash가 있는 이미지만)
+
+        Args:
+            catalog (Catalog): 기본은 catalog.sqlite
+            year, kind: 주어지면 해당 연도·종류 이미지만
+        """
+        self.catalog = catalog or Catalog.default()
+        self.entries = {}
+        self.tree = BKTree()
+        self.by_sha256 = defaultdict(list)
+        self._ocr_stores = {}
+
+        for meta in self.catalog.image_metas(year=year, kind=kind):
+            self.add(meta)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, meta):
+        """image_meta 항목 추가 (같은 경로면 교체하지 않음)"""
+        phash = _hash_int(meta.get('phash'))
+        if phash is None or meta['path'] in self.entries:
+            return
+        entry = dict(meta, phash_int=phash, dhash_int=_hash_int(meta.get('dhash')))
+        self.entries[meta['path']] = entry
+        self.tree.add(phash, entry)
+        if meta.get('sha256'):
+            self.by_sha256[meta['sha256']].append(entry)
+
+    def entry(self, path):
+        return self.entries.get(image_key(path))
+
+    def near(self, path, radius=NEAR_DISTANCE):
+        """pHash 거리 radius 이하인 다른 이미지 [(거리, 항목), ...]"""
+        entry = self.entry(path)
+        if entry is None:
+            return []
+        return [(distance, other) for distance, other in self.tree.search(entry['phash_int'], radius)
+                if other['path'] != entry['path']]
+
+    @staticmethod
+    def is_identical(a, b, max_distance=IDENTICAL_DISTANCE):
+        """두 항목이 같은 이미지인지 (내용 해시 일치 또는 같은 크기·해시 거리 합 이하)"""
+        if a.get('sha256') and a.get('sha256') == b.get('sha256'):
+            return True
+        if (a['width'], a['height']) != (b['width'], b['height']):
+            return False
+        if a['dhash_int'] is None or b['dhash_int'] is None:
+            return False
+        return (hamming(a['phash_int'], b['phash_int'])
+                + hamming(a['dhash_int'], b['dhash_int'])) <= max_distance
+
+    def identical(self, path, max_distance=IDENTICAL_DISTANCE):
+        """같은 이미지로 볼 수 있는 다른 항목 목록 (내용 해시가 같은 것부터)"""
+        entry = self.entry(path)
+        if entry is None:
+            return []
+
+        same = [other for other in self.by_sha256.get(entry.get('sha256'), []) if other['path'] != entry['path']]
+        seen = {other['path'] for other in same}
+        for distance, other in self.near(path, radius=max_distance):
+            if other['path'] not in seen and self.is_identical(entry, other, max_distance):
+                same.append(other)
+                seen.add(other['path'])
+        return same
+
+    def duplicate_groups(self, radius=NEAR_DISTANCE):
+        """pHash 거리 radius 이하로 이어지는 이미지 묶음 (2개 이상, union-find)"""
+        parent = {path: path for path in self.entries}
+
+        def find(path):
+            while parent[path] != path:
+                parent[path] = parent[parent[path]]
+                path = parent[path]
+            return path
+
+        for path, entry in self.entries.items():
+            for _, other in self.tree.search(entry['phash_int'], radius):
+                root_a, root_b = find(path), find(other['path'])
+                if root_a != root_b:
+                    parent[root_b] = root_a
+
+        groups = defaultdict(list)
+        for path in self.entries:
+            groups[find(path)].append(path)
+        return sorted((sorted(paths) for paths in groups.values() if len(paths) > 1), key=lambda g: g[0])
+
+    # ----- OCR 결과 재사용 -----
+
+    def _ocr_store_for(self, image_path):
+        """이미지 디렉토리 옆 belly_bands/ocr_store.npz (연도 디렉토리 규칙)"""
+        store_file = Path(image_path).parent.parent / BELLY_DIR / STORE_FILE
+        if store_file not in self._ocr_stores:
+            self._ocr_stores[store_file] = OcrStore.load(store_file) if store_file.exists() else None
+        return self._ocr_stores[store_file]
+
+    def ocr_results(self, path):
+        """
+        같은 이미지의 저장된 OCR 원본 결과 (EasyOCR 형식, 없으면 None)
+
+        내용 해시가 이 이미지와 같으면 바로 쓴다. 해시(pHash·dHash)만 비슷한 이미지는 같은 ItemId이고
+        OCR 당시 이미지 크기가 같으며 화소까지 같을 때만(same_pixels) 쓴다 — "황금종이 1·2"처럼
+        시리즈 표지는 크기·해시가 같아도 다른 책이다. OCR 뒤 파일이 바뀐 항목(저장소 해시 ≠
+        image_meta 해시)은 건너뛴다.
+        """
+        entry = self.entry(path)
+        if entry is None:
+            return None
+        for other in self.identical(path):
+            other_path = Path(other['path'])
+            store = self._ocr_store_for(other_path)
+            if store is None or other_path.name not in store:
+                continue
+            stored_sha256 = store.sha256(other_path.name)
+            if stored_sha256 and other.get('sha256') and stored_sha256 != other['sha256']:
+                continue
+            sha256 = stored_sha256 or other.get('sha256')
+            if sha256 and sha256 == entry.get('sha256'):
+                return store.results_for(other_path.name)
+            if not entry.get('item_id') or other.get('item_id') != entry['item_id']:
+                continue
+            image_shape = store.get(other_path.name)[0]
+            if tuple(image_shape[:2]) == (entry['height'], entry['width']) and same_pixels(path, other_path):
+                return store.results_for(other_path.name)
+        return None
+
+    # ----- 판본 변화 -----
+
+    def edition_changes(self, min_distance=EDITION_DISTANCE):
+        """
+        같은 ItemId·종류의 연도별 이미지가 바뀐 경우 목록
+
+        Returns:
+            list: {'item_id', 'kind', 'title', 'years', 'changes': [{'from', 'to', 'phash_distance',
+                   'band_from', 'band_to'}]}
+        """
+        by_item = defaultdict(list)
+        for entry in self.entries.values():
+            if entry.get('item_id') and entry.get('year') is not None:
+                by_item[(entry['item_id'], entry['kind'])].append(entry)
+
+        changes = []
+        for (item_id, kind), entries in sorted(by_item.items()):
+            entries.sort(key=lambda entry: (entry['year'], entry['path']))
+            if len({entry['year'] for entry in entries}) < 2:
+                continue
+
+            steps = []
+            for previous, current in zip(entries, entries[1:]):
+                distance = hamming(previous['phash_int'], current['phash_int'])
+                if previous['year'] == current['year'] or distance <= min_distance:
+                    continue
+                band_from = self.catalog.belly_band(previous['path'])
+                band_to = self.catalog.belly_band(current['path'])
+                steps.append({
+                    'from': {'year': previous['year'], 'path': previous['path']},
+                    'to': {'year': current['year'], 'path': current['path']},
+                    'phash_distance': distance,
+                    'band_from': band_from['text'] if band_from and band_from['has_belly_band'] else None,
+                    'band_to': band_to['text'] if band_to and band_to['has_belly_band'] else None,
+                })
+
+            if steps:
+                book = self.catalog.book(item_id) or {}
+                changes.append({'item_id': item_id, 'kind': kind, 'title': book.get('title'),
+                                'years': sorted({entry['year'] for entry in entries}), 'changes': steps})
+        return changes
+
+
+def reusable_image(candidate, images, same_year, catalog):
+    """
+    reuse_previous_image 후보 검사
+
+    다른 연도 이미지는 image_ingest가 검증(status 'ok')했고 그 뒤 내용 해시가 바뀌지 않았으며,
+    같은 ItemId·종류의 검증된 이미지들과 크기가 같고 pHash 거리가 모두 EDITION_DISTANCE 이하
+    (판본 변화 없음)여야 한다.
+    같은 연도 이미지는 검증 전이어도 되지만 자리표시·빈 이미지로 판정된 것은 쓰지 않는다.
+    """
+    path = Path(candidate['path'])
+    if not is_complete_image(path):
+        return False
+    if same_year:
+        return candidate['status'] in (None, 'ok')
+
+    if candidate['status'] != 'ok' or not candidate['phash'] or candidate['meta_sha256'] != catalog.file_sha256(path):
+        return False
+    phash = _hash_int(candidate['phash'])
+    return all(hamming(phash, _hash_int(other['phash'])) <= EDITION_DISTANCE
+               and (other['width'], other['height']) == (candidate['width'], candidate['height'])
+               for other in images if other['status'] == 'ok' and other['phash'])
+
+
+def reuse_previous_image(job, year, kind, catalog=None):
+    """
+    같은 ItemId·종류의 완전한 이미지가 다른 파일명(이전 순위)이나 다른 연도로 이미 있으면 새 경로에 연결
+
+    같은 연도 이미지를 먼저, 없으면 최근 연도부터 reusable_image 검사를 통과한 이미지를 쓴다.
+    하드 링크가 안 되는 파일 시스템이면 복사한다. 연결했으면 True
+    """
+    catalog = catalog or Catalog.default()
+    path = Path(job['path'])
+    if path.exists() or not job.get('item_id'):
+        return False
+
+    images = [image for image in catalog.item_images(job['item_id'], kind) if Path(image['path']) != path]
+    images.sort(key=lambda image: image['year'] != year)
+    previous = next((Path(image['path']) for image in images
+                     if reusable_image(image, images, image['year'] == year, catalog)), None)
+    if previous is None:
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(previous, path)
+    except OSError:
+        shutil.copy2(previous, path)
+    job['reused_from'] = previous
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="표지 이미지 중복·판본 변화 탐지")
+    parser.add_argument('command', choices=['duplicates', 'editions'])
+    parser.add_argument('--radius', type=int, default=NEAR_DISTANCE, help="duplicates: pHash 거리 상한")
+    parser.add_argument('--kind', choices=list(KIND_DIRS))
+    parser.add_argument('--output', help="결과 JSON 파일")
+    args = parser.parse_args()
+
+    index = ImageHashIndex(kind=args.kind)
+    print(f"색인: 이미지 {len(index)}개")
+
+    if args.command == 'duplicates':
+        result = index.duplicate_groups(radius=args.radius)
+        for group in result:
+            print(f"\n[{len(group)}개]")
+            for path in group:
+                print(f"  {path}")
+        print(f"\n중복 묶음 {len(result)}개, 이미지 {sum(len(group) for group in result)}개")
+    else:
+        result = index.edition_changes()
+        for change in result:
+            print(f"\n{change['item_id']} ({change['kind']}) {change['title']} {change['years']}")
+            for step in change['changes']:
+                print(f"  {step['from']['year']} → {step['to']['year']}: pHash 거리 {step['phash_distance']}, "
+                      f"띠지 {step['band_from']!r} → {step['band_to']!r}")
+        print(f"\n판본 변화 {len(result)}건")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
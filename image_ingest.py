@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+표지 이미지 수집(ingest) 단계: 검증 → 메타데이터 → 정규화 파생본 → (선택) mmap 팩
+
+알라딘에서 받은 원본 JPEG를 후속 단계(OCR·띠지 검출·중복 탐지)가 매번
+전체 디코딩하지 않도록, 이미지마다 한 번만
+1. 검증: JPEG 시그니처(SOI/EOI)·SOF 헤더 파싱·디코딩 가능 여부, 자리표시 이미지 판별
+2. 메타데이터: 원본 크기(가로·세로), 지각 해시(pHash 64비트 DCT, dHash 64비트 밝기 차이)
+3. 정규화 파생본: 긴 변을 max_side 이하로 줄인 3채널 JPEG (normalized/{covers,back_covers}/)
+를 만들고 결과를 카탈로그 image_meta 테이블에 기록한다.
+내용 해시가 같고 파생본이 남아 있는 이미지는 다시 처리하지 않는다.
+
+--pack을 주면 연도·종류별 파생본을 하나의 팩 파일(normalized/{kind}.pack)과
+인덱스(.pack.json)로 묶는다. ImagePack은 팩을 mmap으로 열어 복사 없이
+이미지 바이트(memoryview)를 돌려주고, image()는 그 버퍼를 바로 디코딩한다.
+belly_band_detector는 원본 대신 팩(없으면 파생본 파일)에서 이미지를 읽는다.
+
+사용 예:
+    python image_ingest.py --years 2020-2024 --pack
+    with ImagePack("yearly_bestsellers_2023/normalized/covers.pack") as pack:
+        image = pack.image(name)
+"""
+
+import argparse
+import json
+import mmap
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from catalog import BASE_DIR, Catalog, image_key, parse_image_path, parse_years
+from fetch_engine import write_atomic
+
+# 검증·파생본 규칙이 바뀌면 올려서 기존 image_meta를 무효화
+INGEST_VERSION = "2"
+NORMALIZED_DIR = "normalized"
+MAX_SIDE = 1024          # 파생본 긴 변 상한 (px)
+JPEG_QUALITY = 90
+MIN_SIDE = 48            # 이보다 작으면 자리표시/아이콘으로 봄
+BLANK_STD = 4.0          # 밝기 표준편차가 이보다 작으면 빈 이미지
+PLACEHOLDER_SHARED = 3   # 서로 다른 도서 N권 이상이 같은 내용이면 자리표시 이미지
+PACK_ALIGN = 64
+
+KINDS = {'front': "covers", 'back': "back_covers"}
+
+# SOF 마커 (FFC0~FFCF 중 DHT·JPG·DAC 제외)
+_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# 길이 필드가 없는 마커
+_STANDALONE_MARKERS = {0x01} | set(range(0xD0, 0xD8))
+
+
+def jpeg_header(data):
+    """
+    JPEG SOF 헤더에서 (가로, 세로, 채널 수, progressive 여부) 읽기 (디코딩 없음)
+
+    JPEG가 아니거나 SOF 전에 데이터가 끝나면 None
+    """
+    if data[:2] != b'\xff\xd8':
+        return None
+
+    pos = 2
+    size = len(data)
+    while pos + 4 <= size:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker in _STANDALONE_MARKERS:
+            pos += 2
+            continue
+
+        length = int.from_bytes(data[pos + 2:pos + 4], 'big')
+        if marker in _SOF_MARKERS:
+            if pos + 10 > size:
+                return None
+            height = int.from_bytes(data[pos + 5:pos + 7], 'big')
+            width = int.from_bytes(data[pos + 7:pos + 9], 'big')
+            return width, height, data[pos + 9], marker == 0xC2
+        if marker == 0xDA:
+            return None
+        pos += 2 + length
+    return None
+
+
+def perceptual_hash(gray, hash_size=8, highfreq_factor=4):
+    """
+    pHash (64비트 정수): 32×32로 줄인 밝기의 DCT 좌상단 8×8 계수를 중앙값과 비교
+
+    DC 계수는 중앙값 계산에서 제외한다.
+    """
+    size = hash_size * highfreq_factor
+    small = cv2.resize(gray, (size, size), interpolation=cv2.INTER_AREA).astype(np.float32)
+    low = cv2.dct(small)[:hash_size, :hash_size]
+    bits = (low > np.median(low.flatten()[1:])).flatten()
+    return int(np.packbits(bits).view('>u8')[0])
+
+
+def difference_hash(gray, hash_size=8):
+    """dHash (64비트 정수): 9×8로 줄인 밝기에서 가로로 이웃한 픽셀 비교"""
+    small = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int(np.packbits(bits).view('>u8')[0])
+
+
+def phash_hex(value):
+    return f"{value:016x}"
+
+
+def inspect_bytes(data):
+    """
+    이미지 바이트 검증 + 메타데이터
+
+    Returns:
+        dict: status ('ok', 'not_jpeg', 'truncated', 'decode_error', 'too_small', 'blank'),
+              width, height, channels, progressive, phash·dhash(16진 문자열), image(BGR, 디코딩 성공 시)
+    """
+    info = {'status': 'ok', 'width': None, 'height': None, 'channels': None,
+            'progressive': None, 'phash': None, 'dhash': None, 'image': None}
+
+    header = jpeg_header(data)
+    if header is None:
+        info['status'] = 'not_jpeg' if data[:2] != b'\xff\xd8' else 'truncated'
+        return info
+    info['width'], info['height'], info['channels'], info['progressive'] = header
+
+    # EOI는 끝부분에 있어야 함 (뒤에 붙은 패딩 허용)
+    if b'\xff\xd9' not in data[-32:]:
+        info['status'] = 'truncated'
+        return info
+
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        info['status'] = 'decode_error'
+        return info
+    # EXIF 회전이 적용된 실제 크기
+    info['height'], info['width'] = image.shape[:2]
+
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    info['phash'] = phash_hex(perceptual_hash(gray))
+    info['dhash'] = phash_hex(difference_hash(gray))
+    if min(info['width'], info['height']) < MIN_SIDE:
+        info['status'] = 'too_small'
+    elif float(gray.std()) < BLANK_STD:
+        info['status'] = 'blank'
+    info['image'] = image
+    return info
+
+
+def normalized_bytes(image, data, info, max_side=MAX_SIDE, quality=JPEG_QUALITY):
+    """
+    정규화 파생본 JPEG 바이트와 (가로, 세로)
+
+    이미 상한 이하인 baseline 3채널 JPEG는 재인코딩 없이 원본 바이트를 그대로 쓴다.
+    """
+    height, width = image.shape[:2]
+    scale = min(1.0, max_side / max(height, width))
+    if scale == 1.0 and info['channels'] == 3 and not info['progressive']:
+        return data, (width, height)
+
+    if scale < 1.0:
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    ok, encoded = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("JPEG 인코딩 실패")
+    return encoded.tobytes(), (image.shape[1], image.shape[0])
+
+
+def normalized_path(image_path, base=NORMALIZED_DIR):
+    """yearly_bestsellers_2023/covers/x.jpg → yearly_bestsellers_2023/normalized/covers/x.jpg"""
+    image_path = Path(image_path)
+    return image_path.parent.parent / base / image_path.parent.name / image_path.name
+
+
+class ImageIngest:
+    def __init__(self, catalog=None, max_side=MAX_SIDE, quality=JPEG_QUALITY, workers=None):
+        """
+        표지 이미지 수집기
+
+        Args:
+            catalog (Catalog): 이미지 목록·해시·image_meta 기록 (기본: catalog.sqlite)
+            max_side (int): 파생본 긴 변 상한 (px)
+            quality (int): 파생본 JPEG 품질
+            workers (int): 디코딩·인코딩 스레드 수 (OpenCV는 GIL을 놓음)
+        """
+        self.catalog = catalog or Catalog.default()
+        self.max_side = max_side
+        self.quality = quality
+        self.workers = workers or min(8, os.cpu_count() or 1)
+
+    def params(self):
+        return {'version': INGEST_VERSION, 'max_side': self.max_side, 'quality': self.quality}
+
+    def is_current(self, path, sha256):
+        """같은 내용·같은 설정으로 처리했고 파생본이 남아 있으면 True"""
+        meta = self.catalog.image_meta(path)
+        if not meta or meta['sha256'] != sha256 or meta['params'] != self.params():
+            return False
+        return meta['normalized_path'] is None or Path(meta['normalized_path']).exists()
+
+    def ingest_file(self, path, sha256=None):
+        """이미지 하나 검증·메타데이터·파생본 (image_meta 형식 dict, 카탈로그 기록 전)"""
+        path = Path(path)
+        data = path.read_bytes()
+        info = inspect_bytes(data)
+
+        meta = {
+            'path': image_key(path),
+            'item_id': parse_image_path(path)['item_id'],
+            'sha256': sha256,
+            'status': info['status'],
+            'width': info['width'],
+            'height': info['height'],
+            'phash': info['phash'],
+            'dhash': info['dhash'],
+            'normalized_path': None,
+            'normalized_width': None,
+            'normalized_height': None,
+        }
+
+        if info['image'] is not None:
+            content, (width, height) = normalized_bytes(info['image'], data, info, self.max_side, self.quality)
+            target = normalized_path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(target, content)
+            meta.update(normalized_path=image_key(target), normalized_width=width, normalized_height=height)
+        return meta
+
+    def ingest_directory(self, directory, pattern="*.jpg", force=False):
+        """
+        디렉토리의 이미지를 병렬로 처리하고 image_meta 기록
+
+        Returns:
+            dict: 상태별 개수 + 'skipped'(변경 없음)
+        """
+        directory = Path(directory)
+        if not self.catalog.image_files(directory):
+            self.catalog.register_directory(directory, pattern)
+        files = [path for path in self.catalog.image_files(directory) if path.match(pattern)]
+        hashes = {path: self.catalog.file_sha256(path) for path in files}
+
+        todo = [path for path in files if force or not self.is_current(path, hashes[path])]
+        counts = defaultdict(int)
+        counts['skipped'] = len(files) - len(todo)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            metas = list(pool.map(lambda path: self.ingest_file(path, hashes[path]), todo))
+
+        for meta in metas:
+            self.catalog.put_image_meta(meta['path'], meta, self.params())
+        self.mark_placeholders()
+
+        for meta in metas:
+            counts[self.catalog.image_meta(meta['path'])['status']] += 1
+        return dict(counts)
+
+    def mark_placeholders(self, shared=PLACEHOLDER_SHARED):
+        """
+        서로 다른 도서 shared권 이상이 같은 내용(sha256)이면 자리표시 이미지로 표시
+
+        같은 도서가 여러 연도에 들어 있는 경우는 한 권으로 센다.
+        """
+        owners = defaultdict(set)
+        for meta in self.catalog.image_metas():
+            if meta['sha256'] and meta['status'] in ('ok', 'placeholder'):
+                owners[meta['sha256']].add(meta['item_id'] or meta['path'])
+
+        return self.catalog.mark_placeholders(sha256 for sha256, items in owners.items() if len(items) >= shared)
+
+
+class PackWriter:
+    def __init__(self, pack_path):
+        """
+        이미지 바이트를 한 파일에 이어 붙이는 팩 작성기 (close 시 인덱스 저장)
+
+        팩: 항목마다 PACK_ALIGN 바이트 경계에 맞춘 원본 바이트
+        인덱스(.pack.json): {'version', 'entries': [{'name', 'offset', 'length', ...메타}, ...]}
+        """
+        self.pack_path = Path(pack_path)
+        self.pack_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = self.pack_path.with_name(self.pack_path.name + '.part')
+        self._file = open(self._tmp_path, 'wb')
+        self.entries = []
+
+    def add(self, name, data, **meta):
+        offset = self._file.tell()
+        padding = -offset % PACK_ALIGN
+        if padding:
+            self._file.write(b'\0' * padding)
+            offset += padding
+        self._file.write(data)
+        self.entries.append(dict(meta, name=name, offset=offset, length=len(data)))
+
+    def close(self):
+        self._file.close()
+        os.replace(self._tmp_path, self.pack_path)
+        index_path = pack_index_path(self.pack_path)
+        write_atomic(index_path, json.dumps({
+            'version': INGEST_VERSION,
+            'created_at': datetime.now().isoformat(),
+            'entries': self.entries
+        }, ensure_ascii=False, indent=1).encode('utf-8'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def pack_index_path(pack_path):
+    pack_path = Path(pack_path)
+    return pack_path.with_name(pack_path.name + '.json')
+
+
+class ImagePack:
+    def __init__(self, pack_path):
+        """팩 파일을 mmap으로 열기 (읽기 전용)"""
+        self.pack_path = Path(pack_path)
+        with open(pack_index_path(self.pack_path), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        self.entries = {entry['name']: entry for entry in index['entries']}
+        self._file = open(self.pack_path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) \
+            if os.fstat(self._file.fileno()).st_size else None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def names(self):
+        return list(self.entries)
+
+    def meta(self, name):
+        return self.entries[name]
+
+    def bytes(self, name):
+        """항목 바이트 (mmap 위의 memoryview, 복사 없음)"""
+        entry = self.entries[name]
+        return memoryview(self._mmap)[entry['offset']:entry['offset'] + entry['length']]
+
+    def array(self, name):
+        """항목 바이트의 uint8 배열 뷰 (복사 없음)"""
+        entry = self.entries[name]
+        return np.frombuffer(self._mmap, dtype=np.uint8, count=entry['length'], offset=entry['offset'])
+
+    def image(self, name, flags=cv2.IMREAD_COLOR):
+        """팩 버퍼에서 바로 디코딩한 이미지"""
+        return cv2.imdecode(self.array(name), flags)
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def build_pack(catalog, directory, pack_path=None):
+    """
+    디렉토리 이미지의 정규화 파생본을 팩으로 묶기 (검증을 통과한 이미지만)
+
+    항목 이름은 원본 파일명이다.
+    """
+    directory = Path(directory)
+    pack_path = Path(pack_path) if pack_path else directory.parent / NORMALIZED_DIR / f"{directory.name}.pack"
+
+    count = 0
+    with PackWriter(pack_path) as writer:
+        for path in catalog.image_files(directory):
+            meta = catalog.image_meta(path)
+            if not meta or meta['status'] != 'ok' or not meta['normalized_path']:
+                continue
+            writer.add(path.name, Path(meta['normalized_path']).read_bytes(),
+                       item_id=meta['item_id'], sha256=meta['sha256'], phash=meta['phash'], dhash=meta['dhash'],
+                       width=meta['normalized_width'], height=meta['normalized_height'],
+                       original_width=meta['width'], original_height=meta['height'])
+            count += 1
+    return pack_path, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="표지 이미지 검증·정규화·팩 생성")
+    parser.add_argument('--years', nargs='+', default=['2020-2024'])
+    parser.add_argument('--kinds', nargs='+', choices=list(KINDS), default=list(KINDS))
+    parser.add_argument('--max-side', type=int, default=MAX_SIDE)
+    parser.add_argument('--quality', type=int, default=JPEG_QUALITY)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--pack', action='store_true', help="연도·종류별 mmap 팩 파일 생성")
+    parser.add_argument('--force', action='store_true', help="변경 없는 이미지도 다시 처리")
+    args = parser.parse_args()
+
+    catalog = Catalog.default()
+    ingest = ImageIngest(catalog, max_side=args.max_side, quality=args.quality, workers=args.workers)
+
+    for year in parse_years(args.years):
+        for kind in args.kinds:
+            directory = Path(f"{BASE_DIR}_{year}") / KINDS[kind]
+            if not directory.exists():
+                continue
+            counts = ingest.ingest_directory(directory, force=args.force)
+            summary = ', '.join(f"{status} {count}" for status, count in sorted(counts.items()) if count)
+            print(f"{year}년 {KINDS[kind]}: {summary or '이미지 없음'}")
+
+            if args.pack:
+                pack_path, count = build_pack(catalog, directory)
+                print(f"  팩: {pack_path} ({count}개, {pack_path.stat().st_size / 1024 / 1024:.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+띠지 검출용 OCR 백엔드
+
+BellyBandDetector는 EasyOCR Reader와 같은 인터페이스만 사용한다:
+    backend.device                            'cpu' / 'cuda'
+    backend.readtext(rgb_image)               [(bbox 4점, text, confidence 0~1), ...]
+    backend.readtext_batched(images, batch_size)
+
+백엔드는 처음 OCR할 때 모델을 로드하므로(lazy) re-score 모드나
+결과를 재사용하는 실행에서는 초기화 비용이 없다.
+
+설정 예 (ocr_backend.json):
+    {"backend": "tesseract", "options": {"lang": "kor+eng", "psm": 11}}
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+class OcrBackend:
+    name = None
+
+    def __init__(self):
+        self._engine = None
+
+    @property
+    def engine(self):
+        """백엔드 엔진 (처음 사용할 때 로드)"""
+        if self._engine is None:
+            self._engine = self.load()
+        return self._engine
+
+    @property
+    def loaded(self):
+        return self._engine is not None
+
+    @property
+    def device(self):
+        return 'cpu'
+
+    def load(self):
+        raise NotImplementedError
+
+    def limit_threads(self, threads):
+        """프로세스 풀 워커당 연산 스레드 수 제한"""
+
+    def readtext(self, image):
+        raise NotImplementedError
+
+    def readtext_batched(self, images, batch_size=8):
+        """배치 API가 없는 백엔드는 한 장씩 처리"""
+        return [self.readtext(image) for image in images]
+
+
+class EasyOcrBackend(OcrBackend):
+    name = 'easyocr'
+
+    def __init__(self, langs=('ko', 'en'), gpu=None):
+        """
+        EasyOCR 백엔드
+
+        Args:
+            langs: 인식 언어
+            gpu: True/False, None이면 CUDA 사용 가능 여부로 자동 결정
+        """
+        super().__init__()
+        self.langs = list(langs)
+        self.gpu = gpu
+
+    def use_gpu(self):
+        """gpu=None이면 CUDA 사용 가능 여부 확인"""
+        if self.gpu is None:
+            import torch
+            self.gpu = torch.cuda.is_available()
+        return self.gpu
+
+    @property
+    def device(self):
+        # 모델을 로드하지 않고도 워커 구성을 결정할 수 있게 함
+        if self.loaded:
+            return self.engine.device
+        return 'cuda' if self.use_gpu() else 'cpu'
+
+    def load(self):
+        import easyocr
+
+        gpu = self.use_gpu()
+        print(f"EasyOCR 초기화 중... ({'GPU' if gpu else 'CPU'})")
+        reader = easyocr.Reader(self.langs, gpu=gpu)
+        print("초기화 완료!")
+        return reader
+
+    def limit_threads(self, threads):
+        import torch
+        torch.set_num_threads(threads)
+
+    def readtext(self, image):
+        return self.engine.readtext(image)
+
+    def readtext_batched(self, images, batch_size=8):
+        return self.engine.readtext_batched(images, batch_size=batch_size)
+
+
+class TesseractBackend(OcrBackend):
+    name = 'tesseract'
+
+    def __init__(self, lang='kor+eng', psm=11, min_confidence=0):
+        """
+        Tesseract 백엔드 (pytesseract, CPU 전용, 모델 로드가 가벼움)
+
+        단어 단위 결과를 Tesseract의 (block, paragraph, line) 번호로 묶어
+        EasyOCR처럼 줄 단위 bbox·텍스트·0~1 신뢰도로 돌려준다.
+
+        Args:
+            lang: tesseract 언어 (kor, kor+eng 등)
+            psm: 페이지 분할 모드 (11 = 흩어진 텍스트, 표지에 적합)
+            min_confidence: 이보다 낮은 단어(0~100)는 버림
+        """
+        super().__init__()
+        self.lang = lang
+        self.psm = psm
+        self.min_confidence = min_confidence
+
+    def load(self):
+        import pytesseract
+
+        languages = pytesseract.get_languages(config='')
+        missing = [lang for lang in self.lang.split('+') if lang not in languages]
+        if missing:
+            raise RuntimeError(f"tesseract 언어 데이터 없음: {', '.join(missing)}")
+        return pytesseract
+
+    def limit_threads(self, threads):
+        os.environ['OMP_THREAD_LIMIT'] = str(threads)
+
+    def readtext(self, image):
+        pytesseract = self.engine
+        data = pytesseract.image_to_data(image, lang=self.lang, config=f'--psm {self.psm}',
+                                         output_type=pytesseract.Output.DICT)
+
+        lines = {}
+        for i, text in enumerate(data['text']):
+            confidence = float(data['conf'][i])
+            text = text.strip()
+            if not text or confidence < self.min_confidence:
+                continue
+
+            key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
+            line = lines.setdefault(key, {'words': [], 'confidences': [],
+                                          'box': [x, y, x + w, y + h]})
+            line['words'].append(text)
+            line['confidences'].append(confidence)
+            box = line['box']
+            line['box'] = [min(box[0], x), min(box[1], y), max(box[2], x + w), max(box[3], y + h)]
+
+        results = []
+        for line in lines.values():
+            x_min, y_min, x_max, y_max = line['box']
+            bbox = [[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]
+            confidence = sum(line['confidences']) / len(line['confidences']) / 100
+            results.append((bbox, ' '.join(line['words']), confidence))
+
+        return results
+
+
+BACKENDS = {
+    EasyOcrBackend.name: EasyOcrBackend,
+    TesseractBackend.name: TesseractBackend,
+}
+
+
+def create_backend(name='easyocr', **options):
+    """이름으로 OCR 백엔드 생성"""
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 OCR 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+    return BACKENDS[name](**options)
+
+
+def load_backend_config(config_file):
+    """설정 파일에서 (백엔드 이름, 옵션) 읽기"""
+    with open(Path(config_file), 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    return config.get('backend', 'easyocr'), config.get('options', {})
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EasyOCR 원본 결과 컬럼형 저장소
+
+OCR(텍스트·신뢰도·bbox)은 비싸고 띠지 후보 선택은 싸므로,
+OCR 결과를 한 번만 저장해 두고 y_threshold·너비 비율 등을 바꿔
+후보 선택만 다시 실행(re-score)할 수 있게 한다.
+
+저장 형식 (.npz, 이미지 M개 / 텍스트 블록 N개):
+    files        (M,)     이미지 파일명
+    sha256       (M,)     이미지 내용 해시 (없으면 빈 문자열)
+    shapes       (M, 3)   이미지 (높이, 너비, 채널)
+    offsets      (M+1,)   이미지 i의 블록 = offsets[i]:offsets[i+1]
+    bboxes       (N, 4, 2) float32
+    confidences  (N,)     float32
+    text_blob    (B,)     uint8, 모든 텍스트의 UTF-8 연결
+    text_offsets (N+1,)   블록 j의 텍스트 = text_blob[text_offsets[j]:text_offsets[j+1]]
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+STORE_FILE = "ocr_store.npz"
+
+
+class OcrStore:
+    def __init__(self):
+        """이미지 파일명 → (shape, bboxes, confidences, texts, sha256) 저장소"""
+        self.records = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, file_name):
+        return file_name in self.records
+
+    def files(self):
+        return sorted(self.records)
+
+    def add(self, file_name, image_shape, results, sha256=""):
+        """EasyOCR readtext 결과 [(bbox, text, confidence), ...] 저장 (기존 항목 교체)"""
+        bboxes = np.array([result[0] for result in results], dtype=np.float32).reshape(-1, 4, 2)
+        confidences = np.array([result[2] for result in results], dtype=np.float32)
+        texts = [str(result[1]) for result in results]
+        self.records[file_name] = (tuple(int(v) for v in image_shape), bboxes, confidences, texts, sha256)
+
+    def get(self, file_name):
+        """(image_shape, bboxes, confidences, texts) 반환"""
+        image_shape, bboxes, confidences, texts, _ = self.records[file_name]
+        return image_shape, bboxes, confidences, texts
+
+    def sha256(self, file_name):
+        return self.records[file_name][4]
+
+    def results_for(self, file_name):
+        """EasyOCR 형식 결과 목록으로 복원"""
+        _, bboxes, confidences, texts = self.get(file_name)
+        return [(bbox.tolist(), text, float(confidence))
+                for bbox, confidence, text in zip(bboxes, confidences, texts)]
+
+    def arrays(self, file_names=None):
+        """
+        여러 이미지의 결과를 연결한 컬럼 배열 반환 (score_ocr_batch 입력)
+
+        Returns:
+            (files, shapes (M, 3), offsets (M+1,), bboxes (N, 4, 2), confidences (N,), texts (N,))
+        """
+        files = self.files() if file_names is None else list(file_names)
+        shapes = np.zeros((len(files), 3), dtype=np.int32)
+        offsets = np.zeros(len(files) + 1, dtype=np.int64)
+        bboxes, confidences, texts = [], [], []
+
+        for i, name in enumerate(files):
+            image_shape, boxes, confs, record_texts, _ = self.records[name]
+            shapes[i, :len(image_shape)] = image_shape
+            offsets[i + 1] = offsets[i] + len(record_texts)
+            bboxes.append(boxes)
+            confidences.append(confs)
+            texts.extend(record_texts)
+
+        bboxes = np.concatenate(bboxes) if bboxes else np.zeros((0, 4, 2), dtype=np.float32)
+        confidences = np.concatenate(confidences) if confidences else np.zeros(0, dtype=np.float32)
+        return files, shapes, offsets, bboxes, confidences, texts
+
+    def merge(self, other):
+        """다른 저장소의 항목 병합 (프로세스 풀 워커 결과 합치기)"""
+        self.records.update(other.records)
+
+    def retain(self, file_names):
+        """주어진 파일명만 남기고 삭제"""
+        keep = set(file_names)
+        self.records = {name: record for name, record in self.records.items() if name in keep}
+
+    def save(self, path):
+        """컬럼형 .npz로 저장"""
+        files, shapes, offsets, bboxes, confidences, texts = self.arrays()
+        encoded = [text.encode('utf-8') for text in texts]
+
+        text_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in encoded], out=text_offsets[1:])
+
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp.npz')
+        np.savez_compressed(
+            tmp_path,
+            files=np.array(files, dtype=str),
+            sha256=np.array([self.records[name][4] for name in files], dtype=str),
+            shapes=shapes,
+            offsets=offsets,
+            bboxes=bboxes,
+            confidences=confidences,
+            text_blob=np.frombuffer(b''.join(encoded), dtype=np.uint8),
+            text_offsets=text_offsets
+        )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path):
+        """저장된 .npz 로드 (파일이 없으면 빈 저장소)"""
+        store = cls()
+        path = Path(path)
+        if not path.exists():
+            return store
+
+        with np.load(path, allow_pickle=False) as data:
+            blob = data['text_blob'].tobytes()
+            text_offsets = data['text_offsets']
+            offsets = data['offsets']
+            bboxes = data['bboxes']
+            confidences = data['confidences']
+
+            for i, name in enumerate(data['files']):
+                start, end = offsets[i], offsets[i + 1]
+                texts = [blob[text_offsets[j]:text_offsets[j + 1]].decode('utf-8') for j in range(start, end)]
+                store.records[str(name)] = (tuple(int(v) for v in data['shapes'][i] if v),
+                                            bboxes[start:end], confidences[start:end], texts,
+                                            str(data['sha256'][i]))
+
+        return store
+
+    @classmethod
+    def from_belly_json(cls, belly_dir, covers_dir):
+        """
+        기존 *_belly.json 파일의 all_texts로 저장소 구성
+
+        이미지 크기는 covers_dir의 원본 이미지에서 읽는다.
+        """
+        store = cls()
+        covers_dir = Path(covers_dir)
+
+        for json_file in sorted(Path(belly_dir).glob("*_belly.json")):
+            image_file = covers_dir / (json_file.name[:-len("_belly.json")] + ".jpg")
+            image = cv2.imread(str(image_file))
+            if image is None:
+                continue
+
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            results = [(text['bbox'], text['text'], text['confidence']) for text in data.get('all_texts', [])]
+            store.add(image_file.name, image.shape, results,
+                      sha256=hashlib.sha256(image_file.read_bytes()).hexdigest())
+
+        return store
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+알라딘 상품 페이지(wproduct.aspx) 이미지 URL 해석기
+
+상품 페이지를 한 번만 받아 한 번만 파싱하고, 이미지 역할별 URL을
+구조화된 레코드로 돌려준다. 레코드는 연도 디렉토리의
+product_images.json에 저장되어 앞/뒷표지 다운로드 단계가
+페이지를 다시 받지 않고 재사용한다.
+
+레코드 형식:
+    {
+        'item_id': '321294005',
+        'front': letslook 앞표지 (_f.jpg),
+        'back': letslook 뒷표지 (_b.jpg),
+        'cover500': cover500 (또는 cover) 표지,
+        'main_cover': img.cover_image / div.prd_img img / img#BigImage,
+        'letslook': 페이지의 모든 letslook 이미지 목록,
+        'isbn13': 기본정보·books:isbn 메타의 실제 ISBN-13 (없으면 None),
+        'fetched_at': 수집 시각
+    }
+"""
+
+import asyncio
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+from fetch_engine import FetchEngine, absolute_url
+from html_extract import extract_product_images
+
+PRODUCT_URL = "https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={item_id}"
+# 이 상품의 ISBN만: <meta property="books:isbn" content="9788954682152">, 없으면 기본정보 목록의
+# "ISBN : 9788954682152" — 관련 상품·시리즈 블록의 ISBN은 보지 않는다
+_META_TAG = re.compile(r'<meta\s[^>]*>', re.I)
+_META_ISBN = re.compile(r'property\s*=\s*["\']books:isbn["\']', re.I)
+_META_CONTENT = re.compile(r'content\s*=\s*["\']\s*(97[89]\d{10})\s*["\']', re.I)
+_BASIC_INFO = re.compile(r'기본\s*정보(.*?)</ul>', re.S)
+_INFO_ISBN13 = re.compile(r'ISBN\s*[:：]?\s*(97[89]\d{10})(?!\d)', re.I)
+
+
+def page_isbn13(html):
+    """상품 페이지의 ISBN-13: books:isbn 메타, 없으면 기본정보 목록의 ISBN 항목 (없으면 None)"""
+    for tag in _META_TAG.findall(html):
+        if _META_ISBN.search(tag):
+            match = _META_CONTENT.search(tag)
+            if match:
+                return match.group(1)
+    for section in _BASIC_INFO.findall(html):
+        match = _INFO_ISBN13.search(re.sub(r'<[^>]+>', ' ', section))
+        if match:
+            return match.group(1)
+    return None
+
+
+def parse_product_page(html, item_id="", parser='regex'):
+    """
+    상품 페이지 HTML에서 이미지 역할별 URL 추출
+
+    parser: html_extract 파서 ('regex' fast path 기본, 'selectolax', 'lxml', 'bs4')
+    """
+    images = extract_product_images(html, parser)
+
+    record = {
+        'item_id': item_id,
+        'front': None,
+        'back': None,
+        'cover500': None,
+        'main_cover': None,
+        'letslook': [],
+        'isbn13': None,
+        'fetched_at': datetime.now().isoformat()
+    }
+
+    record['isbn13'] = page_isbn13(html)
+
+    for src in images['srcs']:
+        if 'letslook' in src:
+            url = absolute_url(src)
+            if url not in record['letslook']:
+                record['letslook'].append(url)
+            if record['front'] is None and '_f.jpg' in src:
+                record['front'] = url
+            elif record['back'] is None and '_b.jpg' in src:
+                record['back'] = url
+
+        if record['cover500'] is None and ('cover500' in src or '/cover/' in src):
+            record['cover500'] = absolute_url(src.replace('cover200', 'cover500'))
+
+    if images['main_cover']:
+        record['main_cover'] = absolute_url(images['main_cover'])
+
+    return record
+
+
+def front_cover_url(record, book=None):
+    """앞표지 URL 결정 (letslook _f → cover500 → API 표지 순)"""
+    if record:
+        if record.get('front'):
+            return record['front']
+        if record.get('cover500'):
+            return record['cover500']
+
+    api_cover = (book or {}).get('cover_url', '')
+    if api_cover:
+        return api_cover.replace('cover200', 'cover500')
+
+    return None
+
+
+class ProductPageStore:
+    def __init__(self, json_file):
+        """
+        ItemId → 상품 페이지 이미지 레코드 저장소 (JSON 파일)
+        """
+        self.json_file = Path(json_file)
+        self.records = {}
+
+        if self.json_file.exists():
+            with open(self.json_file, 'r', encoding='utf-8') as f:
+                self.records = json.load(f)
+
+    @classmethod
+    def for_year(cls, year, base_dir="yearly_bestsellers"):
+        """연도 디렉토리의 product_images.json 저장소"""
+        return cls(Path(f"{base_dir}_{year}") / "product_images.json")
+
+    def get(self, item_id):
+        return self.records.get(str(item_id))
+
+    def put(self, record):
+        self.records[str(record['item_id'])] = record
+
+    def __contains__(self, item_id):
+        return str(item_id) in self.records
+
+    def save(self):
+        self.json_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.json_file, 'w', encoding='utf-8') as f:
+            json.dump(self.records, f, ensure_ascii=False, indent=2)
+
+    async def resolve(self, engine, item_ids):
+        """
+        저장소에 없는 ItemId의 상품 페이지만 동시에 받아 파싱
+
+        Returns:
+            dict: 처리 통계 (cached, fetched, failed)
+        """
+        valid_ids = []
+        for item_id in item_ids:
+            item_id = str(item_id or '')
+            if item_id and not item_id.startswith('book_') and item_id not in valid_ids:
+                valid_ids.append(item_id)
+
+        pending = [item_id for item_id in valid_ids if item_id not in self]
+
+        async def _resolve_one(item_id):
+            try:
+                html = await engine.fetch_text(PRODUCT_URL.format(item_id=item_id), timeout=15)
+            except Exception as e:
+                print(f"  상품 페이지 {item_id} 수집 오류: {e}")
+                return False
+
+            self.put(parse_product_page(html, item_id))
+            return True
+
+        results = await asyncio.gather(*(_resolve_one(item_id) for item_id in pending))
+
+        return {
+            'cached': len(valid_ids) - len(pending),
+            'fetched': sum(results),
+            'failed': len(results) - sum(results)
+        }
+
+    def resolve_all(self, item_ids, **engine_options):
+        """동기 코드용 resolve 진입점 (완료 후 JSON 저장)"""
+        async def _main():
+            engine = FetchEngine(**engine_options)
+            try:
+                return await self.resolve(engine, item_ids)
+            finally:
+                engine.close()
+
+        stats = asyncio.run(_main())
+        self.save()
+        return stats
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+OBI 그래프 로컬 SPARQL 엔드포인트
+
+abox_generator.py가 만든 통합 그래프(+ 스키마 OWL)를 한 번만 읽어 SPO/POS/OSP 3중 색인
+저장소(rdflib SimpleMemory: spo[s][p][o], pos[p][o][s], osp[o][s][p])에 올리고,
+docs/files/OBI_SPARQL질의.rq의 7개 질의는 시작할 때 파싱·대수 변환까지 끝낸 계획(prepareQuery)으로
+보관한다. 그 밖의 질의도 질의 문자열별로 준비된 계획을 LRU로 재사용한다.
+기본으로는 graph_snapshot.py 이진 스냅샷(원본이 바뀌면 다시 컴파일)을 mmap으로 열어 Turtle 파싱을
+건너뛰고, --no-snapshot이면 원본을 SimpleMemory로 파싱한다. 시작할 때 graph_materialize.py의 사전 집계를
+(바뀐 묶음만) 갱신해, 전체 그래프를 훑는 02·03·05·07은 /query/NN도 집계 테이블에서 답한다
+(07은 SPARQL 계획으로 1초 남짓, 집계로 1ms 미만). --no-aggregates면 모두 SPARQL로 평가하고,
+--materialized면 단언+추론 그래프를 읽는다.
+
+HTTP (SPARQL 1.1 Protocol 일부, 기본 127.0.0.1:3030):
+    GET  /                      준비된 질의 목록
+    GET  /query/01              준비된 질의 실행 (사전 집계가 있는 질의는 집계로)
+    GET  /aggregate/03          사전 집계로 답하기 (02·03·05·07)
+    GET  /sparql?query=...      임의 질의 (POST application/sparql-query 또는 form query=도 가능)
+    결과: SELECT/ASK → application/sparql-results+json, CONSTRUCT/DESCRIBE → text/turtle
+
+사용 예:
+    python sparql_endpoint.py --graph OBI_통합그래프_전수.ttl
+    python sparql_endpoint.py --run 01
+    curl 'http://127.0.0.1:3030/query/05'
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from rdflib import Graph
+from rdflib.plugins.sparql import prepareQuery
+
+from abox_generator import GRAPH_FILE, SCHEMA_FILE, ABoxGenerator
+from graph_materialize import AGGREGATES, aggregate, materialize
+from graph_snapshot import GraphSnapshot, ensure_snapshot, guess_format
+
+QUERY_FILE = "docs/files/OBI_SPARQL질의.rq"
+STORE = "SimpleMemory"  # spo/pos/osp 중첩 dict 색인
+
+_QUERY_HEADER = re.compile(r'^#\s*(\d{2})\.\s*(.+?)\s*$', re.M)
+_BLOCK_SEPARATOR = re.compile(r'\n#{20,}\n')
+
+
+def load_canned_queries(path=QUERY_FILE):
+    """질의 파일을 '#####' 구분선으로 나눠 {'01': {'title', 'text'}, ...}"""
+    text = Path(path).read_text(encoding='utf-8')
+    queries = OrderedDict()
+    for block in _BLOCK_SEPARATOR.split(text):
+        match = _QUERY_HEADER.search(block)
+        if match and re.search(r'^\s*(SELECT|CONSTRUCT|ASK|DESCRIBE)\b', block, re.M | re.I):
+            queries[match.group(1)] = {'title': match.group(2), 'text': block.strip() + '\n'}
+    return queries
+
+
+class ObiQueryService:
+    def __init__(self, graph_files=(GRAPH_FILE,), schema_file=SCHEMA_FILE, query_file=QUERY_FILE, store=STORE,
+                 cache_size=64, snapshot=None, aggregates=None):
+        """
+        그래프를 한 번 읽고 준비된 질의 계획을 만든다
+
+        Args:
+            graph_files: ABox 파일 목록 (.ttl/.nt)
+            schema_file (str): TBox (rdfs:subPropertyOf 경로 질의에 필요), None이면 생략
+            store (str): rdflib 저장소 플러그인 이름
+            cache_size (int): 임의 질의 계획 LRU 크기
+            snapshot (str): 주어지면 파싱 대신 graph_snapshot 스냅샷(ABox+스키마)을 mmap으로 열고 용어 사전을 해독해 둔다
+            aggregates (str): graph_materialize 집계 SQLite (주어지면 aggregate() 사용 가능)
+        """
+        self.aggregates = aggregates
+        self.lock = threading.Lock()
+        self.cache_size = cache_size
+        self._plans = OrderedDict()
+        self.stats = {'queries': 0, 'plan_hits': 0, 'plan_misses': 0}
+
+        started = time.perf_counter()
+        if snapshot is not None:
+            snapshot = GraphSnapshot(snapshot)
+            snapshot.load_terms()
+            self.graph = snapshot.graph()
+        else:
+            self.graph = Graph(store=store)
+            for path in list(graph_files) + ([schema_file] if schema_file else []):
+                self.graph.parse(str(path), format=guess_format(path))
+        self.load_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self.canned = load_canned_queries(query_file)
+        for query in self.canned.values():
+            query['plan'] = prepareQuery(query['text'])
+        self.prepare_time = time.perf_counter() - started
+
+    def __len__(self):
+        return len(self.graph)
+
+    def plan(self, text):
+        """질의 문자열의 준비된 계획 (LRU)"""
+        plan = self._plans.get(text)
+        if plan is not None:
+            self._plans.move_to_end(text)
+            self.stats['plan_hits'] += 1
+            return plan
+
+        self.stats['plan_misses'] += 1
+        plan = prepareQuery(text)
+        self._plans[text] = plan
+        if len(self._plans) > self.cache_size:
+            self._plans.popitem(last=False)
+        return plan
+
+    def run(self, name=None, text=None, bindings=None):
+        """
+        준비된 질의(name) 또는 임의 질의(text) 실행
+
+        Returns:
+            rdflib Result
+        """
+        if name is not None:
+            if name not in self.canned:
+                raise KeyError(f"준비된 질의 없음: {name}")
+            plan = self.canned[name]['plan']
+        else:
+            plan = self.plan(text)
+
+        # rdflib 질의 평가는 스레드 안전을 보장하지 않으므로 한 번에 하나씩
+        with self.lock:
+            self.stats['queries'] += 1
+            result = self.graph.query(plan, initBindings=bindings or {})
+            if result.type == 'SELECT':
+                # 결과를 락 안에서 모두 평가
+                result.bindings = list(result.bindings)
+            return result
+
+    def aggregate(self, name):
+        """사전 집계 테이블로 준비된 질의 답하기 → (변수, 행)"""
+        if self.aggregates is None or name not in AGGREGATES:
+            raise KeyError(f"사전 집계 없음: {name}")
+        return aggregate(self.aggregates, name)
+
+    def has_aggregate(self, name):
+        return self.aggregates is not None and name in AGGREGATES
+
+    def answer(self, name):
+        """
+        준비된 질의 답하기: 사전 집계가 있으면 집계 테이블, 없으면 준비된 SPARQL 계획
+
+        Returns:
+            (변수 이름 목록, 행 목록, 'aggregate' 또는 'sparql') — SELECT가 아닌 질의는 행 대신 rdflib Result
+        """
+        if self.has_aggregate(name):
+            with self.lock:
+                self.stats['queries'] += 1
+            variables, rows = self.aggregate(name)
+            return list(variables), rows, 'aggregate'
+        result = self.run(name=name)
+        if result.type != 'SELECT':
+            return [], result, 'sparql'
+        return [str(var) for var in result.vars], [tuple(row) for row in result], 'sparql'
+
+    @staticmethod
+    def serialize_rows(variables, rows):
+        """집계 행 → SPARQL JSON 결과 bytes"""
+        bindings = []
+        for row in rows:
+            binding = {}
+            for variable, value in zip(variables, row):
+                if value is None:
+                    continue
+                if isinstance(value, int):
+                    binding[variable] = {'type': 'literal', 'value': str(value),
+                                         'datatype': "http://www.w3.org/2001/XMLSchema#integer"}
+                elif value.startswith(('http://', 'https://')):
+                    binding[variable] = {'type': 'uri', 'value': value}
+                else:
+                    binding[variable] = {'type': 'literal', 'value': value}
+            bindings.append(binding)
+        return json.dumps({'head': {'vars': list(variables)}, 'results': {'bindings': bindings}},
+                          ensure_ascii=False).encode('utf-8')
+
+    @staticmethod
+    def serialize(result):
+        """결과 → (content-type, bytes)"""
+        if result.type in ('SELECT', 'ASK'):
+            return 'application/sparql-results+json', result.serialize(format='json')
+        return 'text/turtle; charset=utf-8', result.serialize(format='turtle')
+
+
+class SparqlHandler(BaseHTTPRequestHandler):
+    service = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+
+        if url.path == '/':
+            listing = {name: {'title': query['title'], 'path': f"/query/{name}"}
+                       for name, query in self.service.canned.items()}
+            return self.respond(200, 'application/json', json.dumps(
+                {'triples': len(self.service), 'queries': listing, 'stats': self.service.stats},
+                ensure_ascii=False).encode('utf-8'))
+        if url.path.startswith('/query/'):
+            name = url.path[len('/query/'):]
+            if self.service.has_aggregate(name):
+                variables, rows, _ = self.service.answer(name)
+                return self.respond(200, 'application/sparql-results+json',
+                                    self.service.serialize_rows(variables, rows))
+            return self.execute(name=name)
+        if url.path.startswith('/aggregate/'):
+            try:
+                body = self.service.serialize_rows(*self.service.aggregate(url.path[len('/aggregate/'):]))
+            except KeyError as e:
+                return self.respond(404, 'text/plain; charset=utf-8', f"{e.args[0]}\n".encode('utf-8'))
+            return self.respond(200, 'application/sparql-results+json', body)
+        if url.path == '/sparql' and 'query' in params:
+            return self.execute(text=params['query'][0])
+        self.respond(404, 'text/plain; charset=utf-8', "없는 경로\n".encode('utf-8'))
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0)).decode('utf-8')
+        if url.path != '/sparql':
+            return self.respond(404, 'text/plain; charset=utf-8', "없는 경로\n".encode('utf-8'))
+
+        content_type = self.headers.get('Content-Type', '')
+        if content_type.startswith('application/sparql-query'):
+            return self.execute(text=body)
+        query = parse_qs(body).get('query')
+        if not query:
+            return self.respond(400, 'text/plain; charset=utf-8', "query 없음\n".encode('utf-8'))
+        self.execute(text=query[0])
+
+    def execute(self, name=None, text=None):
+        try:
+            result = self.service.run(name=name, text=text)
+            content_type, body = self.service.serialize(result)
+        except KeyError as e:
+            return self.respond(404, 'text/plain; charset=utf-8', f"{e.args[0]}\n".encode('utf-8'))
+        except Exception as e:
+            return self.respond(400, 'text/plain; charset=utf-8', f"질의 오류: {e}\n".encode('utf-8'))
+        self.respond(200, content_type, body)
+
+    def respond(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(service, host='127.0.0.1', port=3030):
+    """서비스를 공유하는 HTTP 서버 (port=0이면 빈 포트)"""
+    handler = type('ObiSparqlHandler', (SparqlHandler,), {'service': service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def ensure_graph(graph_file=GRAPH_FILE):
+    """abox_generator로 그래프 생성 (있으면 바뀐 묶음만 갱신)"""
+    stats = ABoxGenerator.with_catalog(graph_file).generate()
+    if stats['written']:
+        print(f"ABox 갱신: 묶음 {stats['written']}개 재생성, 트리플 {stats['triples']}개")
+    return graph_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OBI 그래프 SPARQL 엔드포인트")
+    parser.add_argument('--graph', nargs='+', help=f"ABox 파일 (기본: {GRAPH_FILE}를 생성·갱신해 사용)")
+    parser.add_argument('--schema', default=SCHEMA_FILE)
+    parser.add_argument('--queries', default=QUERY_FILE)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3030)
+    parser.add_argument('--run', metavar='NAME', help="서버 없이 준비된 질의 하나만 실행해 출력")
+    parser.add_argument('--no-snapshot', action='store_true', help="스냅샷 대신 원본 파일 파싱")
+    parser.add_argument('--materialized', action='store_true', help="단언+추론 그래프를 읽음")
+    parser.add_argument('--no-aggregates', action='store_true', help="사전 집계 없이 모든 질의를 SPARQL로 평가")
+    args = parser.parse_args()
+
+    graph_files = args.graph or [ensure_graph()]
+    aggregates = None
+    if args.materialized or not args.no_aggregates:
+        output, db_file, stats = materialize(graph_files[0], args.schema)
+        print(f"추론·집계 갱신: 묶음 {stats['updated']}개 재계산, 추론 트리플 {stats['inferred']}개")
+        aggregates = None if args.no_aggregates else db_file
+        if args.materialized:
+            graph_files = [output] + list(graph_files[1:])
+    snapshot = None
+    if not args.no_snapshot:
+        snapshot = ensure_snapshot(list(graph_files) + ([args.schema] if args.schema else []))
+    service = ObiQueryService(graph_files, schema_file=args.schema, query_file=args.queries, snapshot=snapshot,
+                              aggregates=aggregates)
+    print(f"그래프 로드: 트리플 {len(service)}개 ({service.load_time:.2f}s), "
+          f"준비된 질의 {len(service.canned)}개 ({service.prepare_time * 1000:.0f}ms)")
+
+    if args.run:
+        started = time.perf_counter()
+        variables, rows, source = service.answer(args.run)
+        elapsed = time.perf_counter() - started
+        print(f"[{args.run}] {service.canned[args.run]['title']} "
+              f"({'사전 집계, ' if source == 'aggregate' else ''}{elapsed * 1000:.1f}ms)")
+        if not variables:
+            print(service.serialize(rows)[1].decode('utf-8'))
+            return
+        print('\t'.join(variables))
+        for row in rows:
+            print('\t'.join('' if value is None else str(value) for value in row))
+        if not rows:
+            print("(결과 없음)")
+        return
+
+    server = make_server(service, args.host, args.port)
+    print(f"SPARQL 엔드포인트: http://{args.host}:{server.server_address[1]}/sparql")
+    for name, query in service.canned.items():
+        print(f"  /query/{name}  {query['title']}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+수집 작업 영속 큐 (SQLite)
+
+목록 페이지·상품 페이지·이미지 작업의 상태를 디스크에 기록해
+수집이 중간에 죽어도 끝난 작업은 다시 요청하지 않고 멈춘 지점부터 재개한다.
+
+상태:
+    pending    등록됨, 아직 실행 안 함
+    in_flight  실행 중 (프로세스가 죽으면 다음 실행 시 pending으로 복구)
+    done       완료 (result에 목록 도서·상품 페이지 레코드 등 결과 저장)
+    failed     실패 (다음 실행에서 다시 시도)
+
+사용 예:
+    queue = WorkQueue()
+    if queue.is_done(key):
+        books = queue.result(key)
+    else:
+        queue.start(key, 'list')
+        ...
+        queue.complete(key, books)
+
+이미지 작업은 FetchEngine(queue=...)에 넘기면 엔진이 직접 상태를 기록한다.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+QUEUE_FILE = "work_queue.sqlite"
+STATES = ('pending', 'in_flight', 'done', 'failed')
+
+
+class WorkQueue:
+    def __init__(self, db_file=QUEUE_FILE):
+        """
+        작업 큐 열기 (이전 실행에서 in_flight로 남은 작업은 pending으로 복구)
+        """
+        self.db_file = Path(db_file)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                state TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                result TEXT,
+                error TEXT,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_tasks_kind_state ON tasks(kind, state)")
+        self._db.commit()
+
+        self.recovered = self._execute("UPDATE tasks SET state = 'pending' WHERE state = 'in_flight'").rowcount
+
+    def _execute(self, query, params=()):
+        with self._lock:
+            cursor = self._db.execute(query, params)
+            self._db.commit()
+            return cursor
+
+    def _row(self, key):
+        with self._lock:
+            return self._db.execute("SELECT state, result, attempts, updated_at FROM tasks WHERE key = ?",
+                                    (key,)).fetchone()
+
+    def add(self, key, kind):
+        """작업 등록 (이미 있으면 상태 유지)"""
+        self._execute("INSERT OR IGNORE INTO tasks (key, kind, state, updated_at) VALUES (?, ?, 'pending', ?)",
+                      (key, kind, datetime.now().isoformat()))
+
+    def start(self, key, kind):
+        """작업을 in_flight로 표시 (없으면 등록)"""
+        self.add(key, kind)
+        self._execute("UPDATE tasks SET state = 'in_flight', attempts = attempts + 1, updated_at = ? WHERE key = ?",
+                      (datetime.now().isoformat(), key))
+
+    def complete(self, key, result=None):
+        """작업 완료 및 결과 저장"""
+        self._execute("UPDATE tasks SET state = 'done', result = ?, error = NULL, updated_at = ? WHERE key = ?",
+                      (json.dumps(result, ensure_ascii=False, default=str), datetime.now().isoformat(), key))
+
+    def fail(self, key, error):
+        self._execute("UPDATE tasks SET state = 'failed', error = ?, updated_at = ? WHERE key = ?",
+                      (str(error), datetime.now().isoformat(), key))
+
+    def state(self, key):
+        row = self._row(key)
+        return row[0] if row else None
+
+    def is_done(self, key, max_age=None):
+        """
+        완료 작업인지 (max_age: 초, 주어지면 완료한 지 그보다 오래된 결과는 끝나지 않은 것으로 봄)
+        """
+        row = self._row(key)
+        if row is None or row[0] != 'done':
+            return False
+        if max_age is None:
+            return True
+        return (datetime.now() - datetime.fromisoformat(row[3])).total_seconds() <= max_age
+
+    def result(self, key):
+        """완료 작업의 저장된 결과 (없으면 None)"""
+        row = self._row(key)
+        return json.loads(row[1]) if row and row[1] is not None else None
+
+    def counts(self, kind=None):
+        """상태별 작업 수"""
+        query = "SELECT state, COUNT(*) FROM tasks"
+        params = ()
+        if kind:
+            query += " WHERE kind = ?"
+            params = (kind,)
+        with self._lock:
+            rows = dict(self._db.execute(query + " GROUP BY state", params).fetchall())
+        return {state: rows.get(state, 0) for state in STATES}
+
+    def keys(self, kind=None, state=None):
+        query = "SELECT key FROM tasks WHERE 1 = 1"
+        params = []
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        if state:
+            query += " AND state = ?"
+            params.append(state)
+        with self._lock:
+            return [row[0] for row in self._db.execute(query + " ORDER BY key", params)]
+
+    def close(self):
+        self._db.close()
@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import requests
 import json
 import os
 import time
 from pathlib import Path
-from bs4 import BeautifulSoup
 import re
 
+from catalog import Catalog
+from fetch_engine import absolute_url, create_session, download_all
+from html_extract import extract_bestseller_items
+from image_index import reuse_previous_image
+from work_queue import WorkQueue
+
 class YearlyBestsellerScraper:
     def __init__(self, ttb_key, year=2024, download_dir="yearly_bestsellers"):
         """
@@ -19,10 +23,9 @@ class YearlyBestsellerScraper:
         self.download_dir = Path(f"{download_dir}_{year}")
         self.download_dir.mkdir(exist_ok=True)
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.session = create_session()
+        self.catalog = Catalog.default()
+        self.queue = WorkQueue()
 
         print(f"다운로드 디렉토리: {self.download_dir}")
         print(f"대상 연도: {self.year}년 연간 베스트셀러")
@@ -39,18 +42,26 @@ class YearlyBestsellerScraper:
         pages_needed = (max_results + 49) // 50  # 올림 계산
 
         for page in range(1, pages_needed + 1):
+            # 이전 실행에서 완료한 페이지는 작업 큐에 저장된 결과 재사용
+            key = f"list:{self.year}:{page}"
+            if self.queue.is_done(key):
+                page_books = self.queue.result(key)
+                print(f"\n페이지 {page}: 이전 수집 결과 {len(page_books)}개 재사용")
+                all_books.extend(page_books)
+                continue
+
             print(f"\n페이지 {page} 수집 중...")
 
             url = f"https://www.aladin.co.kr/shop/common/wbest.aspx?BestType=YearlyBest&BranchType=1&Year={self.year}&CID=50917&page={page}"
+            self.queue.start(key, 'list')
+            page_books = []
 
             try:
                 response = self.session.get(url, timeout=10)
                 response.raise_for_status()
 
-                soup = BeautifulSoup(response.text, 'html.parser')
-
                 # 베스트셀러 아이템 찾기
-                items = soup.select('div.ss_book_box')
+                items = extract_bestseller_items(response.text)
 
                 if not items:
                     print(f"  페이지 {page}에서 아이템을 찾을 수 없습니다.")
@@ -61,59 +72,31 @@ class YearlyBestsellerScraper:
                 for idx, item in enumerate(items, 1):
                     try:
                         # 순위 추출 (테이블 첫 번째 td에서)
-                        rank_text = item.select_one('td')
                         rank = (page - 1) * 50 + idx
-                        if rank_text:
-                            rank_match = re.search(r'(\d+)\.', rank_text.get_text(strip=True))
+                        if item['rank_text']:
+                            rank_match = re.search(r'(\d+)\.', item['rank_text'])
                             if rank_match:
                                 rank = int(rank_match.group(1))
 
                         # 제목 추출
-                        title_elem = item.select_one('a.bo3')
-                        title = title_elem.get_text(strip=True) if title_elem else "제목 없음"
+                        title = item['title'] or "제목 없음"
                         # 하이픈 앞의 여분 텍스트 제거 (예: "제목 - 부제" -> "제목")
                         if ' - ' in title:
                             title = title.split(' - ')[0].strip()
 
-                        # 저자/출판사 정보 추출 (ss_book_list 내에서)
-                        book_list = item.select_one('div.ss_book_list')
-                        author = ""
+                        # 저자 정보 (ss_book_list의 지은이/저자 줄)
+                        author = item['author']
                         publisher = ""
                         pubdate = ""
 
-                        if book_list:
-                            # 저자 정보는 보통 a.bo3 다음의 텍스트에 있음
-                            text_content = book_list.get_text(' | ')
-                            # 파이프로 분리된 정보에서 추출 시도
-                            lines = book_list.find_all(['li', 'span', 'div'])
-                            for line in lines:
-                                txt = line.get_text(strip=True)
-                                if '지은이' in txt or '저자' in txt or '지음' in txt:
-                                    author = txt.replace('지은이:', '').replace('저자:', '').replace('지음', '').strip()
-                                    break
-
-                        # ItemId 추출 (더 신뢰성 있는 식별자)
-                        item_id = item.get('itemid', '')
-
-                        # 링크에서 ItemId 추출
-                        isbn13 = item_id  # ItemId를 ISBN 대신 사용
-                        link_elem = item.select_one('a')
-                        if link_elem and 'href' in link_elem.attrs:
-                            href = link_elem['href']
-                            itemid_match = re.search(r'ItemId=(\d+)', href)
-                            if itemid_match:
-                                isbn13 = itemid_match.group(1)
-
-                        # 표지 이미지 URL 추출
-                        cover_elem = item.select_one('img.i_cover')
-                        cover_url = ""
-                        if cover_elem and 'src' in cover_elem.attrs:
-                            cover_url = cover_elem['src']
-                            # 상대 경로를 절대 경로로 변환
-                            if cover_url.startswith('//'):
-                                cover_url = 'https:' + cover_url
-                            elif cover_url.startswith('/'):
-                                cover_url = 'https://www.aladin.co.kr' + cover_url
+                        # 링크에서 ItemId 추출 (없으면 div의 itemid 속성, ISBN 대신 사용)
+                        isbn13 = item['item_id']
+                        itemid_match = re.search(r'ItemId=(\d+)', item['href'] or '')
+                        if itemid_match:
+                            isbn13 = itemid_match.group(1)
+
+                        # 표지 이미지 URL 추출 (상대 경로를 절대 경로로 변환)
+                        cover_url = absolute_url(item['cover_src']) if item['cover_src'] else ""
 
                         book_info = {
                             'rank': rank,
@@ -125,15 +108,18 @@ class YearlyBestsellerScraper:
                             'pubdate': pubdate
                         }
 
-                        all_books.append(book_info)
+                        page_books.append(book_info)
 
                     except Exception as e:
                         print(f"  아이템 파싱 오류: {e}")
                         continue
 
+                all_books.extend(page_books)
+                self.queue.complete(key, page_books)
                 time.sleep(1)  # 서버 부하 방지
 
             except Exception as e:
+                self.queue.fail(key, e)
                 print(f"  페이지 {page} 수집 오류: {e}")
                 break
 
@@ -184,15 +170,15 @@ class YearlyBestsellerScraper:
         print(f"  [X] 다운로드 실패: {filename}")
         return False
 
-    def scrape_all_covers(self, bestsellers, delay=0.5):
+    def scrape_all_covers(self, bestsellers, delay=None, concurrency=4):
         """
-        모든 베스트셀러 표지 이미지 다운로드
+        모든 베스트셀러 표지 이미지 동시 다운로드
+
+        delay를 지정하면 호스트별 요청 속도를 초당 1/delay회로 제한
         """
         print(f"\n[*] {len(bestsellers)}개 베스트셀러 표지 이미지 다운로드 시작...")
 
-        success_count = 0
-        failed_count = 0
-
+        jobs = []
         for i, book in enumerate(bestsellers, 1):
             title = book.get('title', '').strip()
             author = book.get('author', '').strip()
@@ -219,25 +205,31 @@ class YearlyBestsellerScraper:
 
             filename = f"{rank:03d}_{isbn13}_{safe_title[:30]}_{safe_author[:20]}{ext}"
 
-            print(f"\n[{i}/{len(bestsellers)}] {rank}위: {title} - {author}")
-
-            # 이미지 다운로드
-            if self.download_cover_image(cover_url, filename):
-                success_count += 1
-            else:
-                failed_count += 1
-
-            # 요청 간 대기
-            if i < len(bestsellers):
-                time.sleep(delay)
+            job = {
+                'path': self.download_dir / filename,
+                'item_id': isbn13,
+                'url': cover_url,
+                'require_image': True,
+                'label': f"  [{i}/{len(bestsellers)}] {rank}위: {title}",
+                'not_found_message': "표지 URL 없음"
+            }
+            # 순위·연도만 바뀌어 파일명이 달라진 같은 표지는 다시 받지 않음
+            reuse_previous_image(job, self.year, 'front', self.catalog)
+            jobs.append(job)
+
+        engine_options = {'session': self.session, 'per_host_concurrency': concurrency, 'queue': self.queue}
+        if delay:
+            engine_options['per_host_rate'] = 1 / delay
+        stats = download_all(jobs, **engine_options)
+        self.catalog.register_jobs(jobs, self.year, 'front')
 
         result = {
-            'total': len(bestsellers),
-            'success': success_count,
-            'failed': failed_count
+            'total': stats['total'],
+            'success': stats['success'],
+            'failed': stats['failed'] + stats['not_found']
         }
 
-        print(f"\n[*] 다운로드 완료!")
+        print(f"\n[*] 다운로드 완료! ({stats['images_per_sec']:.1f} images/sec)")
         print(f"총 {result['total']}개 중 성공 {result['success']}개, 실패 {result['failed']}개")
 
         return result
@@ -270,7 +262,8 @@ class YearlyBestsellerScraper:
 
         print(f"[*] 리포트 저장: {report_file}")
 
-        # JSON 형식으로도 저장
+        # 카탈로그 저장 (JSON은 기존 도구용으로 함께 내보냄)
+        self.catalog.upsert_books(self.year, bestsellers)
         json_file = self.download_dir / "bestseller_data.json"
         with open(json_file, 'w', encoding='utf-8') as f:
             json.dump(bestsellers, f, ensure_ascii=False, indent=2)
@@ -298,7 +291,7 @@ def main():
     scraper.generate_report(bestsellers)
 
     # 표지 이미지 대량 다운로드
-    result = scraper.scrape_all_covers(bestsellers, delay=0.5)
+    result = scraper.scrape_all_covers(bestsellers)
 
     print(f"\n[*] 최종 결과:")
     print(f"  - 총 베스트셀러: {result['total']}개")